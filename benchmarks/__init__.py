@@ -0,0 +1 @@
+# Benchmark scripts (run from the repo root: python -m benchmarks.<name>)
@@ -0,0 +1,65 @@
+"""
+City gazetteer: load cost and per-lookup latency.
+
+- load:   building the Gazetteer (parse + trigram index) from the bundled
+          file vs. loading it from the compiled config cache
+- lookup: normalize_city, uncached, per kind of value: exact table hits,
+          known places, qualified names ("Göteborgs kommun"), misspellings
+          and unknown values (which search the index and find nothing)
+
+Usage:
+    python -m benchmarks.bench_city_gazetteer [--repeat 200]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from src.normalize.city_normalizer import _current_city_names, _normalize_city
+from src.normalize.gazetteer import compile_gazetteer, load_gazetteer
+from src.paths import GAZETTEER_PATH
+
+VALUES: Dict[str, List[str]] = {
+    "table": ["Göteborg", "Malmö", "Åbo", "Helsingfors"],
+    "known": ["Stockholm", "Täby", "Aarhus", "Bergen"],
+    "qualified": ["Göteborgs kommun", "Malmö C", "Stockholms stad", "Lunds kommun"],
+    "misspelled": ["Götebrog", "Jönköpping", "Helsinborg", "Sundsval"],
+    "unknown": ["Skärholmen", "Kungsholmen, Stockholm", "London", "Hammarby Sjöstad"],
+}
+
+
+def _time_us(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="Lookups per value")
+    args = parser.parse_args()
+
+    data = Path(GAZETTEER_PATH).read_bytes()
+    build_us = _time_us(lambda: compile_gazetteer(data), 20)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        load_gazetteer(cache_dir=Path(cache_dir))  # fill the cache
+        cached_us = _time_us(lambda: load_gazetteer(cache_dir=Path(cache_dir)), 20)
+    gazetteer = compile_gazetteer(data)
+    print(f"{len(gazetteer)} names; build {build_us / 1000:.2f} ms, from cache {cached_us / 1000:.2f} ms")
+
+    uncached = _normalize_city.__wrapped__
+    city_names = _current_city_names()
+    uncached("Stockholm", city_names)  # load the gazetteer before timing
+    print(f"{'kind':>10} {'median µs':>10} {'max µs':>8}  example")
+    for kind, values in VALUES.items():
+        samples = [_time_us(lambda v=v: uncached(v, city_names), args.repeat) for v in values]
+        example = f"{values[0]!r} -> {uncached(values[0], city_names)}"
+        print(f"{kind:>10} {statistics.median(samples):>10.1f} {max(samples):>8.1f}  {example}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Compact rows vs. dict rows: memory and time per 100k rows.
+
+Writes a synthetic inbound deal list TSV with every schema column (see
+bench_normalize_rows for the values) and measures, with dict rows and
+with CompactRows:
+
+- read:      read_tsv, rows held in memory (tracemalloc, values included)
+- normalize: normalize_inbound_rows output held in memory
+- rendered:  render_inbound_row output for every row (rendered rows are
+             CompactRows; the dict column converts them back)
+
+and the wall time of read + normalize + write_tsv over the whole file,
+the median of --repeat runs with dict and compact runs alternating (the
+first run of the process pays for loading the schema and mappings).
+
+Compact rows trade time for memory: each holds two objects the cyclic
+garbage collector keeps traversing (the row and its cells list), where a
+dict of strings is untracked after its first collection, so full
+collections get slower as the rows pile up.
+
+Usage:
+    python -m benchmarks.bench_compact_rows [--rows 100000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.bench_normalize_rows import build_deal_rows
+from src.ingest.read_tsv import read_tsv
+from src.normalize.memo import clear_memos
+from src.normalize.row_normalizer import normalize_inbound_rows
+from src.output.write_tsv import write_tsv
+from src.paths import INBOUND_SCHEMA_PATH
+from src.render.row_renderer import render_inbound_row
+from src.resources import get_property_map, get_schema
+
+
+def _held_bytes(build: Callable[[], Any]) -> Tuple[int, Any]:
+    """Bytes still allocated once build() returns (what its result holds)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held, result
+
+
+def _write_input(path: Path, columns: List[str], rows: List[Dict[str, Any]]) -> None:
+    lines = ["\t".join(columns)]
+    lines.extend("\t".join(str(row.get(c, "")) for c in columns) for row in rows)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    schema = get_schema(INBOUND_SCHEMA_PATH)
+    columns = [c["name"] for c in schema["columns"]]
+    property_map = get_property_map()
+    per_100k = 100_000 / args.rows
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tsv = Path(tmp) / "deals.tsv"
+        _write_input(tsv, columns, build_deal_rows(args.rows))
+
+        print(f"{args.rows:,} rows x {len(columns)} columns; MB per 100k rows")
+        print(f"{'':10} {'dict':>8} {'compact':>8} {'saved':>6}")
+        timings: Dict[bool, List[float]] = {False: [], True: []}
+        for run in range(args.repeat):
+            for compact in (False, True) if run % 2 == 0 else (True, False):
+                clear_memos()
+                gc.collect()
+                start = time.perf_counter()
+                rows = read_tsv(tsv, compact=compact)
+                normalized, _ = normalize_inbound_rows(rows, property_map)
+                write_tsv(Path(tmp) / "out.tsv", schema, normalized)
+                timings[compact].append(time.perf_counter() - start)
+                del rows, normalized
+        dict_secs, compact_secs = (statistics.median(timings[c]) for c in (False, True))
+
+        read = [_held_bytes(lambda c=c: read_tsv(tsv, compact=c)) for c in (False, True)]
+        normalized = [_held_bytes(lambda r=r: normalize_inbound_rows(r, property_map)[0]) for _, r in read]
+        rendered_compact = _held_bytes(lambda: [render_inbound_row(row.copy(), schema) for row in normalized[1][1]])
+        rendered_dict = _held_bytes(lambda: [dict(row) for row in rendered_compact[1]])
+
+        for name, (dict_bytes, _), (compact_bytes, _) in (
+            ("read", *read),
+            ("normalize", *normalized),
+            ("rendered", rendered_dict, rendered_compact),
+        ):
+            saved = 1 - compact_bytes / dict_bytes
+            print(f"{name:10} {dict_bytes * per_100k / 1e6:8.1f} {compact_bytes * per_100k / 1e6:8.1f} {saved:6.0%}")
+
+        print(
+            f"read + normalize + write (median of {args.repeat}): dict {dict_secs:.2f} s, "
+            f"compact {compact_secs:.2f} s ({compact_secs / dict_secs - 1:+.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
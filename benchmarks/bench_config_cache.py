@@ -0,0 +1,103 @@
+"""
+Compiled config cache: CLI startup and first-document config cost.
+
+The cost being cached (parsing YAML/JSON, building the synonym automaton)
+is paid once per process, so startup is measured in fresh interpreters:
+
+- cli --help:     wall time of `python -m src.cli --help`
+- first document: load the property map and both schemas and classify one
+                  property type, timed inside the child process
+- validate row:   validate_row per row, compiling the schema's checks on
+                  each call vs. the precompiled checks
+
+"no cache" sets DEAL_PIPELINE_CONFIG_CACHE=off; "warm cache" points it at a
+temporary directory that a first run has filled.
+
+Usage:
+    python -m benchmarks.bench_config_cache [--runs 10] [--rows 2000]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from src.paths import CONFIG_CACHE_ENV, INBOUND_SCHEMA_PATH, REPO_ROOT
+from src.resources import get_compiled_schema
+from src.validate.validators import validate_row
+
+FIRST_DOCUMENT = """
+import time
+start = time.perf_counter()
+from src.normalize.property_type import normalize_property_type
+from src.paths import INBOUND_SCHEMA_PATH, TRANSACTIONS_SCHEMA_PATH
+from src.resources import get_property_map, get_schema
+get_schema(INBOUND_SCHEMA_PATH)
+get_schema(TRANSACTIONS_SCHEMA_PATH)
+normalize_property_type("Kontor och handel", get_property_map())
+print(time.perf_counter() - start)
+"""
+
+
+def _run(args: List[str], env: Dict[str, str]) -> str:
+    return subprocess.run(
+        [sys.executable, *args], cwd=REPO_ROOT, env=env, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def _median_ms(samples: List[float]) -> float:
+    return statistics.median(samples) * 1000
+
+
+def _cli_startup(env: Dict[str, str], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(["-m", "src.cli", "--help"], env)
+        samples.append(time.perf_counter() - start)
+    return _median_ms(samples)
+
+
+def _first_document(env: Dict[str, str], runs: int) -> float:
+    return _median_ms([float(_run(["-c", FIRST_DOCUMENT], env)) for _ in range(runs)])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Fresh processes per measurement")
+    parser.add_argument("--rows", type=int, default=2000, help="Rows for the validate_row timing")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        no_cache = dict(os.environ, **{CONFIG_CACHE_ENV: "off"})
+        warm = dict(os.environ, **{CONFIG_CACHE_ENV: cache_dir})
+        _run(["-c", FIRST_DOCUMENT], warm)  # fill the cache
+
+        print(f"{'':16} {'no cache ms':>12} {'warm cache ms':>14}")
+        print(f"{'cli --help':16} {_cli_startup(no_cache, args.runs):>12.1f} {_cli_startup(warm, args.runs):>14.1f}")
+        print(f"{'first document':16} {_first_document(no_cache, args.runs):>12.2f} {_first_document(warm, args.runs):>14.2f}")
+
+    compiled = get_compiled_schema(INBOUND_SCHEMA_PATH)
+    schema, checks = compiled.schema, compiled.checks["columns"]
+    row = {name: "" for name in compiled.columns}
+
+    start = time.perf_counter()
+    for _ in range(args.rows):
+        validate_row(schema, row)
+    per_call_s = (time.perf_counter() - start) / args.rows
+
+    start = time.perf_counter()
+    for _ in range(args.rows):
+        validate_row(schema, row, checks)
+    precompiled_s = (time.perf_counter() - start) / args.rows
+
+    print(f"validate_row, checks compiled per call: {per_call_s * 1e6:8.1f} µs/row")
+    print(f"validate_row, precompiled checks:       {precompiled_s * 1e6:8.1f} µs/row")
+
+
+if __name__ == "__main__":
+    main()
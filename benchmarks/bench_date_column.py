@@ -0,0 +1,95 @@
+"""
+Date columns: per-cell cascade vs. inferred-format fast path.
+
+Builds a synthetic TSV-sized date column (mostly one format, a few
+outliers, some blanks; dates are high-cardinality, so factorizing alone
+helps less than for countries or property types) and normalizes it with:
+
+- cascade:   normalize_date per cell, uncached (the original cost)
+- factorize: each distinct value through normalize_date (the previous
+             normalize_date_column), memo caches cleared first
+- inferred:  normalize_date_column: format inferred once, one pattern per
+             distinct value, cascade only for outliers
+
+Usage:
+    python -m benchmarks.bench_date_column [--rows 20000] [--format dd.mm.yyyy] [--outliers 0.02]
+"""
+
+import argparse
+import datetime
+import random
+import time
+from typing import Any, List
+
+from src.normalize.column_normalizer import format_date_stats, normalize_column, normalize_date_column
+from src.normalize.date_normalizer import DATE_FORMATS, normalize_date
+from src.normalize.memo import clear_memos
+
+RENDER = {
+    "yyyy/mm/dd": "{d:%Y/%m/%d}",
+    "yyyy-mm-dd": "{d:%Y-%m-%d}",
+    "dd/mm/yyyy": "{d:%d/%m/%Y}",
+    "dd.mm.yyyy": "{d:%d.%m.%Y}",
+    "dd-mm-yyyy": "{d:%d-%m-%Y}",
+    "month dd, yyyy": "{d:%B} {d.day}, {d.year}",
+    "dd month yyyy": "{d.day} {d:%B} {d.year}",
+}
+
+OUTLIERS = ["Q3 2024", "15 januari 2024", "2024-01-15", "n/a", "2023/12/01"]
+
+
+def build_date_column(rows: int, fmt: str, outlier_share: float, seed: int = 11) -> List[Any]:
+    """rows date strings in fmt over ~10 years, with outliers and blanks mixed in."""
+    rnd = random.Random(seed)
+    start = datetime.date(2015, 1, 1)
+    column: List[Any] = []
+    for _ in range(rows):
+        roll = rnd.random()
+        if roll < 0.05:
+            column.append("")
+        elif roll < 0.05 + outlier_share:
+            column.append(rnd.choice(OUTLIERS))
+        else:
+            day = start + datetime.timedelta(days=rnd.randrange(3650))
+            column.append(RENDER[fmt].format(d=day))
+    return column
+
+
+def _best_of(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        clear_memos()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--format", default="dd.mm.yyyy", choices=list(DATE_FORMATS))
+    parser.add_argument("--outliers", type=float, default=0.02, help="Share of cells in other formats")
+    args = parser.parse_args()
+
+    column = build_date_column(args.rows, args.format, args.outliers)
+    uncached = normalize_date.__wrapped__
+
+    cascade_s = _best_of(lambda: [uncached(v) for v in column])
+    factorize_s = _best_of(lambda: normalize_column(column, normalize_date))
+    inferred_s = _best_of(lambda: normalize_date_column(column))
+
+    expected = [uncached(v) for v in column]
+    stats = {}
+    values, confs = normalize_date_column(column, stats)
+    same = list(zip(values, confs)) == expected
+
+    print(f"{args.rows:,} cells, {len(set(column)):,} distinct, format {args.format}")
+    for name, seconds in (("cascade", cascade_s), ("factorize", factorize_s), ("inferred", inferred_s)):
+        print(f"{name:>10}: {seconds * 1000:8.1f} ms  ({seconds / len(column) * 1e6:5.2f} µs/cell)")
+    print(f"Same results: {same}")
+    print(format_date_stats({"column": stats}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+csv-module reader vs. read_tsv on the "with IM" deal list export, scaled up.
+
+Repeats the records of data/csv_exports/"Deal list.xlsx - Deal list (with
+IM).csv" --scale times (2,587 rows x 100 by default) and writes it twice:
+
+- as CSV, as exported (quoted fields, commas and line breaks in cells)
+- as TSV, cells' tabs and line breaks replaced by spaces so read_tsv can
+  read it (it has no quoting)
+
+and times, best of --runs:
+
+- read_tsv:            the current reader, TSV only
+- read_delimited:      rows as dicts / CompactRows, TSV and CSV
+- iter_delimited:      streaming, rows counted and dropped
+- read_columns:        two columns only, and all columns
+
+Usage:
+    python -m benchmarks.bench_delimited_reader [--scale 100] [--runs 3]
+"""
+
+import argparse
+import csv
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from src.ingest.read_delimited import iter_delimited, iter_records, read_columns, read_delimited
+from src.ingest.read_tsv import read_tsv
+from src.paths import REPO_ROOT
+
+EXPORT = REPO_ROOT / "data" / "csv_exports" / "Deal list.xlsx - Deal list (with IM).csv"
+# Title and group rows above the header
+EXPORT_SKIP_ROWS = 2
+
+
+def _best(run: Callable[[], Any], runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    records = list(iter_records(EXPORT, ",", "utf-8", EXPORT_SKIP_ROWS))
+    header, data = records[0], records[1:]
+    rows = len(data) * args.scale
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "deals.csv"
+        tsv_path = Path(tmp) / "deals.tsv"
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for _ in range(args.scale):
+                writer.writerows(data)
+        with open(tsv_path, "w", encoding="utf-8") as f:
+            clean = ["\t".join(" ".join(cell.split()) for cell in record) + "\n" for record in data]
+            f.write("\t".join(header) + "\n")
+            for _ in range(args.scale):
+                f.writelines(clean)
+
+        cases = [
+            ("read_tsv", "tsv", lambda: read_tsv(tsv_path)),
+            ("read_tsv compact", "tsv", lambda: read_tsv(tsv_path, compact=True)),
+            ("read_delimited", "tsv", lambda: read_delimited(tsv_path)),
+            ("read_delimited", "csv", lambda: read_delimited(csv_path)),
+            ("read_delimited compact", "csv", lambda: read_delimited(csv_path, compact=True)),
+            ("iter_delimited (stream)", "csv", lambda: sum(1 for _ in iter_delimited(csv_path))),
+            ("read_columns (2 cols)", "csv", lambda: read_columns(csv_path, ["Country", "Location"])),
+            ("read_columns (all)", "csv", lambda: read_columns(csv_path)),
+        ]
+        sizes = {"csv": csv_path.stat().st_size / 1e6, "tsv": tsv_path.stat().st_size / 1e6}
+        print(f"{rows:,} rows x {len(header)} columns; CSV {sizes['csv']:.0f} MB, TSV {sizes['tsv']:.0f} MB")
+        print(f"{'':26} {'file':>4} {'seconds':>8} {'rows/s':>10}")
+        for name, kind, run in cases:
+            elapsed = _best(run, args.runs)
+            print(f"{name:26} {kind:>4} {elapsed:8.2f} {rows / elapsed:10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
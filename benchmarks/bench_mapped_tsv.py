@@ -0,0 +1,71 @@
+"""
+Reading a few rows of a large TSV: MappedTsv vs. read_tsv.
+
+Writes a synthetic inbound deal list TSV (see bench_normalize_rows for the
+values) and times:
+
+- read_tsv:        parse the whole file (what reading any row costs today)
+- index build:     first MappedTsv open, scanning the file for row offsets
+- cached open:     MappedTsv open with the index beside the file
+- random rows:     --sample random single rows
+- row range:       --sample consecutive rows from the middle
+
+Usage:
+    python -m benchmarks.bench_mapped_tsv [--rows 500000] [--sample 1000]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_compact_rows import _write_input
+from benchmarks.bench_normalize_rows import build_deal_rows
+from src.ingest.mapped_tsv import MappedTsv, index_path_for
+from src.ingest.read_tsv import read_tsv
+from src.paths import INBOUND_SCHEMA_PATH
+from src.resources import get_schema
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--sample", type=int, default=1000)
+    args = parser.parse_args()
+
+    columns = [c["name"] for c in get_schema(INBOUND_SCHEMA_PATH)["columns"]]
+    with tempfile.TemporaryDirectory() as tmp:
+        tsv = Path(tmp) / "deals.tsv"
+        _write_input(tsv, columns, build_deal_rows(args.rows))
+        print(f"{args.rows:,} rows, {tsv.stat().st_size / 1e6:.0f} MB")
+
+        start = time.perf_counter()
+        rows = read_tsv(tsv)
+        print(f"{'read_tsv (whole file)':24} {time.perf_counter() - start:8.3f} s")
+
+        start = time.perf_counter()
+        MappedTsv(tsv).close()
+        print(f"{'index build':24} {time.perf_counter() - start:8.3f} s "
+              f"({index_path_for(tsv).stat().st_size / 1e6:.1f} MB index)")
+
+        start = time.perf_counter()
+        mapped = MappedTsv(tsv)
+        print(f"{'cached open':24} {time.perf_counter() - start:8.3f} s")
+
+        picks = random.Random(0).sample(range(len(mapped)), args.sample)
+        start = time.perf_counter()
+        sample = [mapped[i] for i in picks]
+        print(f"{f'{args.sample} random rows':24} {time.perf_counter() - start:8.3f} s")
+        assert sample == [rows[i] for i in picks]
+
+        middle = len(mapped) // 2
+        start = time.perf_counter()
+        block = mapped[middle:middle + args.sample]
+        print(f"{f'{args.sample}-row range':24} {time.perf_counter() - start:8.3f} s")
+        assert block == rows[middle:middle + args.sample]
+        mapped.close()
+
+
+if __name__ == "__main__":
+    main()
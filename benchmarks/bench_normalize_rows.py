@@ -0,0 +1,108 @@
+"""
+Row-by-row vs. column-wise normalization of a deal list export.
+
+Generates a synthetic "Deal list (with IM)" export (2,648 rows by default,
+with the repetition real exports have: a few countries, cities, brokers,
+property types and date strings) and normalizes it with
+normalize_inbound_row per row and with normalize_inbound_rows, checking
+both give the same rows, reporting rows per second. Every run starts with
+empty memo caches; the cache hit rates of the row-by-row run are printed
+at the end. Both follow the inbound schema's normalization plan, compiled
+once (its compile time is printed too).
+
+Usage:
+    python -m benchmarks.bench_normalize_rows [--rows 2648] [--repeat 3]
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from src.normalize.memo import clear_memos, format_memo_stats
+from src.normalize.plan import compile_plan
+from src.normalize.row_normalizer import normalize_inbound_row, normalize_inbound_rows
+from src.paths import INBOUND_SCHEMA_PATH
+from src.resources import get_property_map, get_schema
+
+COUNTRIES = ["Sweden", "Sverige", "SE", "Denmark", "Danmark", "Finland", "Suomi"]
+CITIES = ["Stockholm", "Göteborg", "Malmö", "Uppsala", "Västerås", "Örebro", "København", "Århus", "Helsingfors", "Åbo"]
+USES = ["Office", "kontor", "Logistics", "lager/logistik", "Retail", "handel", "Residential", "bostäder", "Hotel", "kontor och handel"]
+BROKERS = ["Nordic Advisors", "CBRE", "JLL", "Newsec", "Cushman & Wakefield", "Savills"]
+DATES = ["2024/01/15", "15 januari 2024", "2024-02-01", "01.03.2024", "March 4, 2024", "2023/11/30"]
+
+
+def build_deal_rows(count: int, seed: int = 11) -> List[Dict[str, Any]]:
+    """Synthetic inbound deal-list rows, as read from a TSV export (all strings)."""
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(count):
+        area = rnd.choice([5_000, 8_200, 12_400, 15_000, 22_750, rnd.randint(1_000, 90_000)])
+        rows.append({
+            "Index": str(i + 1),
+            "Date received": rnd.choice(DATES),
+            "Type": rnd.choice(["IM", "Teaser"]),
+            "Project Name": f"Project {rnd.randint(1, 400)}",
+            "Broker": rnd.choice(BROKERS),
+            "Country": rnd.choice(COUNTRIES),
+            "Location": rnd.choice(CITIES),
+            "Use": rnd.choice(USES),
+            "Leasable area, sqm": f"{area:,}".replace(",", " ") + rnd.choice(["", " kvm", " m2"]),
+            "NOI, CCY": rnd.choice(["", f"{rnd.randint(5, 90)},{rnd.randint(0, 9)} MSEK", f"{rnd.randint(5, 90)}.5M"]),
+            "WAULT, years": rnd.choice(["", "3,5 år", "5 years", "4.2", "7"]),
+            "Economic occupancy rate, %": rnd.choice(["", "95%", "100 %", "92,5 %", "98%"]),
+            "Yield": rnd.choice(["", "4,5 %", "5.25%", "6%", "4,75 %", "5,0 %"]),
+            "Price, CCY": rnd.choice(["", f"{rnd.randint(50, 900)} mkr", f"SEK {rnd.randint(50, 900)} 000 000"]),
+            "Comment": "",
+        })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2648)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = build_deal_rows(args.rows)
+    property_map = get_property_map()
+
+    def row_wise():
+        return [normalize_inbound_row(row, property_map)[0] for row in rows]
+
+    def column_wise():
+        return normalize_inbound_rows(rows, property_map)[0]
+
+    timings = {}
+    results = {}
+    for name, fn in (("row-wise", row_wise), ("column-wise", column_wise)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            clear_memos()
+            start = time.perf_counter()
+            results[name] = fn()
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+
+    schema = get_schema(INBOUND_SCHEMA_PATH)
+    start = time.perf_counter()
+    steps = compile_plan(schema)
+    compile_s = time.perf_counter() - start
+
+    print(f"Rows:        {len(rows):,}")
+    print(f"Plan:        {len(steps)} steps, compiled in {compile_s * 1e6:.0f} µs")
+    for name, seconds in timings.items():
+        print(
+            f"{name + ':':<12} {seconds * 1000:8.1f} ms ({timings['row-wise'] / seconds:4.1f}x)"
+            f"  {len(rows) / seconds:>9,.0f} rows/s"
+        )
+    print(f"Identical:   {results['row-wise'] == results['column-wise']}")
+
+    clear_memos()
+    row_wise()
+    print("\nMemo caches (row-wise run):")
+    print(format_memo_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Per-value cost of normalize_number: one-pass tokenizer vs. the cascade.
+
+Runs a corpus of export-style values (prices, areas, yields, a few
+unparseable cells) through normalize_number three ways:
+
+- original:  the cascade with the old multiplier search (one freshly built
+             regex per MULTIPLIERS entry, up to twice per value)
+- cascade:   NUMBER_TOKENS switched off, so every value is stripped and parsed
+- tokenizer: as shipped
+
+and checks that all three give identical results.
+
+Usage:
+    python -m benchmarks.bench_number_normalizer [--values 20000] [--repeat 5]
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import List, Optional
+
+from src.normalize import number_normalizer
+from tests.fixtures.sample_numbers import AREA_TEST_CASES, PRICE_TEST_CASES, YIELD_TEST_CASES
+
+# Time the parser itself, not the memo cache in front of it
+normalize_number = number_normalizer.normalize_number.__wrapped__
+
+NEVER_MATCHES = re.compile(r"(?!)")
+
+
+def _original_parse_number_with_multiplier(text: str, decimal: Optional[str] = None) -> Optional[float]:
+    """The multiplier search as it was before NUMBER_TOKENS."""
+    text = text.strip().lower()
+    if not text:
+        return None
+    multiplier = 1
+    for suffix, mult in number_normalizer.MULTIPLIERS.items():
+        match = re.match(rf"([\d\s.,]+)\s*{re.escape(suffix)}$", text, re.IGNORECASE)
+        if match:
+            text, multiplier = match.group(1).strip(), mult
+            break
+    if multiplier == 1:
+        for suffix, mult in number_normalizer.MULTIPLIERS.items():
+            if len(suffix) > 2:
+                match = re.match(rf"([\d\s.,]+)\s+{re.escape(suffix)}s?$", text, re.IGNORECASE)
+                if match:
+                    text, multiplier = match.group(1).strip(), mult
+                    break
+    base_number = number_normalizer._parse_formatted_number(text, decimal)
+    return base_number * multiplier if base_number is not None else None
+
+
+def build_corpus(count: int, seed: int = 7) -> List[str]:
+    """Values in the shapes seen in historical CSV exports."""
+    rnd = random.Random(seed)
+    shapes = [
+        lambda: f"{rnd.randint(1, 999_999_999):,}".replace(",", " "),
+        lambda: f"{rnd.randint(10, 999)},{rnd.randint(0, 9)} MSEK",
+        lambda: f"SEK {rnd.randint(1, 999_999_999):,}",
+        lambda: f"{rnd.randint(1, 99)}.{rnd.randint(0, 9)}M",
+        lambda: f"{rnd.randint(1, 500)} mkr",
+        lambda: f"{rnd.randint(100, 90_000):,} kvm".replace(",", " "),
+        lambda: f"{rnd.randint(100, 90_000)} m2",
+        lambda: f"{rnd.randint(3, 8)},{rnd.randint(0, 99):02d} %",
+        lambda: f"{rnd.randint(3, 8)}.{rnd.randint(0, 99):02d}%",
+        lambda: f"€{rnd.randint(1, 900)}k",
+        lambda: f"{rnd.randint(1, 9)},{rnd.randint(0, 9)} mdr",
+        lambda: f"{rnd.randint(1, 30)} miljoner kronor",
+        lambda: f"{rnd.randint(1_000, 90_000)} kvm uthyrningsbar yta",
+        lambda: rnd.choice(["N/A", "-", "ej angivet", "TBD"]),
+    ]
+    fixtures = [c for c, _, _ in PRICE_TEST_CASES + YIELD_TEST_CASES + AREA_TEST_CASES if isinstance(c, str)]
+    return fixtures + [rnd.choice(shapes)() for _ in range(count)]
+
+
+def _time_per_value(values: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in values:
+            normalize_number(value)
+        best = min(best, time.perf_counter() - start)
+    return best / len(values)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--values", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values = build_corpus(args.values)
+    fast_hits = sum(1 for v in values if number_normalizer.NUMBER_TOKENS.fullmatch(v.strip()))
+
+    tokens = number_normalizer.NUMBER_TOKENS
+    parse = number_normalizer._parse_number_with_multiplier
+    results = {}
+    timings = {}
+    for mode in ("original", "cascade", "tokenizer"):
+        number_normalizer.NUMBER_TOKENS = tokens if mode == "tokenizer" else NEVER_MATCHES
+        number_normalizer._parse_number_with_multiplier = (
+            _original_parse_number_with_multiplier if mode == "original" else parse
+        )
+        try:
+            results[mode] = [normalize_number(v) for v in values]
+            timings[mode] = _time_per_value(values, args.repeat)
+        finally:
+            number_normalizer.NUMBER_TOKENS = tokens
+            number_normalizer._parse_number_with_multiplier = parse
+
+    mismatches = sum(
+        1
+        for row in zip(*results.values())
+        if len({(type(value), value, conf) for value, conf in row}) > 1
+    )
+
+    print(f"Values:     {len(values):,} ({fast_hits / len(values):.0%} on the tokenizer path)")
+    for mode, seconds in timings.items():
+        print(f"{mode + ':':<11} {seconds * 1e6:8.2f} µs/value ({timings['original'] / seconds:5.1f}x)")
+    print(f"Mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+normalize_tsv scaling from 1 to N worker processes.
+
+Writes a synthetic inbound deal list TSV (see bench_normalize_rows for the
+values), normalizes it with workers=1 (the serial streaming path) and with
+each requested worker count, and prints wall time and speedup. Every
+parallel output is checked to be byte-identical to the serial one.
+
+Scaling is bounded by the cores available and by the main process, which
+reads the input and writes the output for all workers.
+
+Usage:
+    python -m benchmarks.bench_parallel_normalize [--rows 100000] [--workers 1 2 4] [--chunk-rows 10000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from benchmarks.bench_compact_rows import _write_input
+from benchmarks.bench_normalize_rows import build_deal_rows
+from src.ingest.read_tsv import DEFAULT_CHUNK_ROWS
+from src.normalize.memo import clear_memos
+from src.paths import INBOUND_SCHEMA_PATH
+from src.pipelines.normalize_file import normalize_tsv
+from src.resources import get_schema
+
+
+def _default_workers() -> List[int]:
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=_default_workers())
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    schema = get_schema(INBOUND_SCHEMA_PATH)
+    columns = [c["name"] for c in schema["columns"]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tsv = Path(tmp) / "deals.tsv"
+        _write_input(tsv, columns, build_deal_rows(args.rows))
+        print(f"{args.rows:,} rows, chunk_rows {args.chunk_rows:,}, {os.cpu_count()} cores")
+        print(f"{'workers':>7} {'seconds':>8} {'rows/s':>9} {'speedup':>7}")
+
+        serial = Path(tmp) / "serial.tsv"
+        baseline = None
+        for workers in sorted(set([1] + args.workers)):
+            out = serial if workers == 1 else Path(tmp) / f"out_{workers}.tsv"
+            clear_memos()
+            start = time.perf_counter()
+            normalize_tsv(INBOUND_SCHEMA_PATH, tsv, out, "inbound", chunk_rows=args.chunk_rows, workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            if workers > 1 and out.read_bytes() != serial.read_bytes():
+                raise SystemExit(f"workers={workers}: output differs from the serial run")
+            print(f"{workers:7} {elapsed:8.2f} {args.rows / elapsed:9,.0f} {baseline / elapsed:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
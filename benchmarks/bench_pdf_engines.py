@@ -0,0 +1,187 @@
+"""
+Compare PDF text engines on speed, memory and text quality.
+
+Generates a local corpus of IM-style PDFs (prose pages plus key-figure
+tables with known values) unless --corpus points at a folder of PDFs.
+Each engine runs in its own subprocess so peak memory is measured per
+engine. Reported per engine:
+
+- pages/s:    pages extracted per second (whole corpus, probe included)
+- peak MB:    peak resident memory of the worker process
+- figures:    share of known table values found in the text
+- rows:       share of table rows whose label and value land on one line
+              (only for the generated corpus)
+
+Usage:
+    python -m benchmarks.bench_pdf_engines [--docs 5] [--pages 40] [--corpus DIR]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from src.fetch.pdf_engines import ENGINES, available_engines
+
+CITIES = ["Malmö", "Göteborg", "Västerås", "Örebro", "Jönköping", "Linköping", "Umeå", "Luleå"]
+
+
+def _table_rows(doc: int, page: int) -> List[Tuple[str, str]]:
+    seed = doc * 100 + page
+    return [
+        ("Uthyrbar area", f"{10_000 + seed * 37:,} kvm".replace(",", " ")),
+        ("Hyresvärde", f"{(seed * 13) % 90 + 10},{seed % 10} MSEK"),
+        ("Driftnetto", f"{(seed * 7) % 60 + 5},{(seed + 3) % 10} MSEK"),
+        ("Direktavkastning", f"{4 + seed % 3},{(seed * 5) % 100:02d} %"),
+        ("WAULT", f"{2 + seed % 8},{seed % 10} år"),
+    ]
+
+
+def build_corpus(folder: Path, docs: int, pages: int) -> Dict[str, List[Tuple[str, str]]]:
+    """Write the benchmark corpus; returns the expected table rows per file."""
+    from tests.fixtures.sample_pdfs import build_text_pdf, build_table_pdf
+    from pypdf import PdfWriter
+
+    expected: Dict[str, List[Tuple[str, str]]] = {}
+    for d in range(docs):
+        prose_path = folder / f"_prose_{d}.pdf"
+        table_path = folder / f"_table_{d}.pdf"
+        prose = [
+            [
+                "Nordic Advisors - Strictly confidential",
+                f"Logistikfastighet i {CITIES[(d + p) % len(CITIES)]}",
+                *[f"Fastigheten omfattar lager och kontor, avsnitt {p}.{k}, uppförd {1980 + k}." for k in range(25)],
+                f"Sida {p + 1}",
+            ]
+            for p in range(pages)
+        ]
+        tables = [_table_rows(d, p) for p in range(0, pages, 4)]
+        build_text_pdf(prose_path, prose)
+        build_table_pdf(table_path, tables)
+
+        # Interleave: every 4th page is a key-figure table
+        writer = PdfWriter()
+        writer.append(str(prose_path))
+        for t, page in enumerate(PdfWriter(clone_from=str(table_path)).pages):
+            writer.insert_page(page, index=t * 5)
+        out = folder / f"im_{d:02d}.pdf"
+        with open(out, "wb") as f:
+            writer.write(f)
+        prose_path.unlink()
+        table_path.unlink()
+        expected[out.name] = [row for table in tables for row in table]
+    return expected
+
+
+def _peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _worker(engine: str, files: List[str]) -> None:
+    """Run one engine over the corpus; print a JSON result line."""
+    from src.fetch.pdf_reader import extract_text_from_pdf
+
+    pages = 0
+    texts: Dict[str, str] = {}
+    failures = 0
+    start = time.perf_counter()
+    for path in files:
+        stats: Dict = {}
+        ok, msg, text = extract_text_from_pdf(path, stats=stats, engine=engine)
+        if not ok:
+            failures += 1
+            continue
+        pages += text.count("--- Page ")
+        texts[Path(path).name] = text
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        "pages": pages,
+        "seconds": elapsed,
+        "peak_mb": _peak_rss_mb(),
+        "failures": failures,
+        "texts": texts,
+    }))
+
+
+def score_quality(texts: Dict[str, str], expected: Dict[str, List[Tuple[str, str]]]) -> Tuple[float, float]:
+    """(share of values found, share of rows with label and value on one line)."""
+    found = 0
+    same_line = 0
+    total = 0
+    for name, rows in expected.items():
+        text = texts.get(name, "")
+        lines = [" ".join(ln.split()) for ln in text.splitlines()]
+        for label, value in rows:
+            total += 1
+            if value in text or value in " ".join(text.split()):
+                found += 1
+            if any(label in ln and value in ln for ln in lines):
+                same_line += 1
+    if not total:
+        return float("nan"), float("nan")
+    return found / total, same_line / total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--docs", type=int, default=5, help="Generated documents (default: 5)")
+    parser.add_argument("--pages", type=int, default=40, help="Pages per generated document (default: 40)")
+    parser.add_argument("--corpus", default=None, help="Folder of PDFs to use instead of the generated corpus")
+    parser.add_argument("--engines", default=None, help="Comma-separated engines (default: all installed)")
+    parser.add_argument("--worker", nargs=2, metavar=("ENGINE", "FILELIST"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        engine, file_list = args.worker
+        _worker(engine, Path(file_list).read_text(encoding="utf-8").splitlines())
+        return
+
+    engines = args.engines.split(",") if args.engines else available_engines()
+    missing = [e for e in ENGINES if e not in available_engines()]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        if args.corpus:
+            files = sorted(str(p) for p in Path(args.corpus).glob("*.pdf"))
+            expected: Dict[str, List[Tuple[str, str]]] = {}
+        else:
+            expected = build_corpus(tmp_path, args.docs, args.pages)
+            files = sorted(str(tmp_path / name) for name in expected)
+
+        file_list = tmp_path / "files.txt"
+        file_list.write_text("\n".join(files), encoding="utf-8")
+        print(f"Corpus: {len(files)} PDFs ({args.corpus or 'generated'})")
+        if missing:
+            print(f"Not installed: {', '.join(missing)}")
+        print(f"{'engine':<10} {'pages/s':>9} {'peak MB':>9} {'figures':>8} {'rows':>6} {'failed':>7}")
+
+        for engine in engines:
+            proc = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_pdf_engines", "--worker", engine, str(file_list)],
+                capture_output=True, text=True,
+            )
+            if proc.returncode != 0:
+                print(f"{engine:<10} worker failed: {proc.stderr.strip().splitlines()[-1:]}")
+                continue
+            result = json.loads(proc.stdout.strip().splitlines()[-1])
+            rate = result["pages"] / result["seconds"] if result["seconds"] else 0.0
+            figures, rows = score_quality(result["texts"], expected)
+            print(
+                f"{engine:<10} {rate:9.1f} {result['peak_mb']:9.1f} "
+                f"{figures:8.0%} {rows:6.0%} {result['failures']:7d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
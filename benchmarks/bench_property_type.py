@@ -0,0 +1,119 @@
+"""
+Property type matching: synonym loop vs. Aho-Corasick automaton.
+
+Enlarges property_type_map.yml synthetically (each canonical type gets
+extra made-up synonyms, --scale times the real vocabulary), writes it as a
+YAML file, loads it back and classifies a mix of realistic "Use" values with:
+
+- loop:      the previous implementation (lower/strip every synonym and
+             test `synonym in text`, per call)
+- automaton: normalize_property_type's compiled matcher
+
+The memo cache is bypassed so every value is matched from scratch.
+
+Usage:
+    python -m benchmarks.bench_property_type [--scale 1,10,50] [--values 5000]
+"""
+
+import argparse
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import yaml
+
+from src.normalize.load_mappings import load_yaml
+from src.normalize.memo import versioned_mapping
+from src.normalize.property_type import _normalize_property_type, property_type_matcher
+from src.resources import get_property_map
+
+USE_VALUES = [
+    "Office", "kontor", "Kontor och handel", "lager/logistik", "Logistikfastighet med kontorsdel",
+    "Residential", "bostäder", "Hotell", "Vård och omsorg", "Förskola", "Industri/verkstad",
+    "Mixed use: retail and residential", "Data center", "Life science campus", "Handelsplats",
+    "Samhällsfastighet (skola)", "Parkeringshus", "Mark", "",
+]
+
+
+def loop_normalize(raw_text: Any, mapping: Dict[str, Any]) -> Tuple[str, str]:
+    """The synonym loop normalize_property_type used before the automaton."""
+    if raw_text is None:
+        return ("", "low")
+    text = str(raw_text).strip().lower()
+    if text == "":
+        return ("", "low")
+    matches = []
+    for canonical, keys in mapping.get("synonyms", {}).items():
+        for k in keys or []:
+            k2 = str(k).strip().lower()
+            if k2 and k2 in text:
+                matches.append(canonical)
+                break
+    if not matches:
+        return ("Other", "low")
+    uniq = list(dict.fromkeys(matches))
+    if len(uniq) == 1:
+        return (uniq[0], "high")
+    if "Mixed Use" in uniq:
+        return ("Mixed Use", "medium")
+    return (uniq[0], "medium")
+
+
+def enlarged_mapping(scale: int, seed: int = 3) -> Dict[str, Any]:
+    """The real mapping plus (scale - 1) x its synonym count of synthetic synonyms."""
+    rnd = random.Random(seed)
+    mapping = get_property_map()
+    synonyms = {}
+    for canonical, keys in mapping["synonyms"].items():
+        keys = list(keys or [])
+        extra = [
+            "".join(rnd.choice(string.ascii_lowercase + "åäö") for _ in range(rnd.randint(5, 14)))
+            for _ in range(len(keys) * (scale - 1))
+        ]
+        synonyms[canonical] = keys + extra
+    return dict(mapping, synonyms=synonyms)
+
+
+def _time(fn, values: List[str]) -> float:
+    start = time.perf_counter()
+    for value in values:
+        fn(value)
+    return (time.perf_counter() - start) / len(values)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", default="1,10,50", help="Comma-separated vocabulary multipliers")
+    parser.add_argument("--values", type=int, default=5000)
+    args = parser.parse_args()
+
+    rnd = random.Random(5)
+    values = [rnd.choice(USE_VALUES) for _ in range(args.values)]
+    uncached = _normalize_property_type.__wrapped__
+
+    print(f"{'scale':>5} {'synonyms':>9} {'loop µs':>9} {'automaton µs':>13} {'speedup':>8} {'compile ms':>11}  same")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in (int(s) for s in args.scale.split(",")):
+            path = Path(tmp) / f"property_type_map_x{scale}.yml"
+            path.write_text(yaml.safe_dump(enlarged_mapping(scale), allow_unicode=True), encoding="utf-8")
+            mapping = load_yaml(str(path))
+            versioned = versioned_mapping(mapping)
+
+            start = time.perf_counter()
+            matcher = property_type_matcher(versioned)
+            compile_s = time.perf_counter() - start
+
+            loop_s = _time(lambda v: loop_normalize(v, mapping), values)
+            automaton_s = _time(lambda v: uncached(v, versioned), values)
+            same = all(loop_normalize(v, mapping) == uncached(v, versioned) for v in USE_VALUES)
+            print(
+                f"{scale:>5} {len(matcher.automaton):>9,} {loop_s * 1e6:>9.1f} {automaton_s * 1e6:>13.1f} "
+                f"{loop_s / automaton_s:>7.1f}x {compile_s * 1000:>11.1f}  {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
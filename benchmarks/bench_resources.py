@@ -0,0 +1,72 @@
+"""
+Per-document resource overhead: fresh load vs. the shared registry.
+
+Measures what each pipeline call used to pay before extraction starts
+(Extractor + Anthropic client, property_type_map.yml, schema JSON) against
+the cached lookups in src.resources.
+
+Usage:
+    python -m benchmarks.bench_resources [--iterations 200]
+"""
+
+import argparse
+import os
+import time
+
+from src.normalize.load_mappings import load_property_map
+from src.resources import (
+    INBOUND_SCHEMA_PATH,
+    ResourceRegistry,
+)
+from src.validate.schema_loader import load_schema
+
+
+def _time_per_call(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    # A dummy key is enough: constructing the client does no network I/O
+    os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-benchmark")
+
+    try:
+        from src.extract.extractor import Extractor
+        Extractor()
+        with_extractor = True
+    except ImportError:
+        with_extractor = False
+
+    def fresh() -> None:
+        if with_extractor:
+            Extractor()
+        load_property_map()
+        load_schema(INBOUND_SCHEMA_PATH)
+
+    registry = ResourceRegistry()
+
+    def shared() -> None:
+        if with_extractor:
+            registry.extractor()
+        registry.property_map()
+        registry.schema(INBOUND_SCHEMA_PATH)
+
+    shared()  # warm
+
+    fresh_s = _time_per_call(fresh, args.iterations)
+    shared_s = _time_per_call(shared, args.iterations)
+
+    print(f"Extractor included: {with_extractor}")
+    print(f"Fresh load per document:  {fresh_s * 1000:8.3f} ms")
+    print(f"Registry per document:    {shared_s * 1000:8.3f} ms")
+    print(f"Saved per document:       {(fresh_s - shared_s) * 1000:8.3f} ms ({fresh_s / shared_s:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
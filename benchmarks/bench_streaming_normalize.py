@@ -0,0 +1,78 @@
+"""
+Peak memory of normalize_tsv, streamed vs. whole-file, as the input grows.
+
+Writes synthetic inbound deal list TSVs (see bench_normalize_rows for the
+values) of increasing size and measures the peak traced allocation
+(tracemalloc) and wall time of:
+
+- whole:  read_tsv + normalize_inbound_rows + write_tsv (all rows held)
+- stream: normalize_tsv, chunk_rows rows at a time
+
+The streamed peak should stay flat as the row count grows.
+
+Usage:
+    python -m benchmarks.bench_streaming_normalize [--rows 20000 40000 80000] [--chunk-rows 10000]
+"""
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+from benchmarks.bench_compact_rows import _write_input
+from benchmarks.bench_normalize_rows import build_deal_rows
+from src.ingest.read_tsv import DEFAULT_CHUNK_ROWS, read_tsv
+from src.normalize.memo import clear_memos
+from src.normalize.row_normalizer import normalize_inbound_rows
+from src.output.write_tsv import write_tsv
+from src.paths import INBOUND_SCHEMA_PATH
+from src.pipelines.normalize_file import normalize_tsv
+from src.resources import get_property_map, get_schema
+
+
+def _peak(run: Callable[[], Any]) -> Tuple[int, float]:
+    """Peak traced bytes and seconds of run()."""
+    clear_memos()
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[20_000, 40_000, 80_000])
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    schema = get_schema(INBOUND_SCHEMA_PATH)
+    columns = [c["name"] for c in schema["columns"]]
+    property_map = get_property_map()
+
+    def whole(tsv: Path, out: Path) -> None:
+        rows, _ = normalize_inbound_rows(read_tsv(tsv, compact=True), property_map)
+        write_tsv(out, schema, rows)
+
+    def stream(tsv: Path, out: Path) -> None:
+        normalize_tsv(INBOUND_SCHEMA_PATH, tsv, out, "inbound", chunk_rows=args.chunk_rows)
+
+    print(f"chunk_rows {args.chunk_rows:,}; peak MB (seconds)")
+    print(f"{'rows':>8} {'file MB':>8} {'whole':>14} {'stream':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tsv = Path(tmp) / "deals.tsv"
+        for n in args.rows:
+            _write_input(tsv, columns, build_deal_rows(n))
+            results = [_peak(lambda run=run: run(tsv, Path(tmp) / "out.tsv")) for run in (whole, stream)]
+            cells = " ".join(f"{peak / 1e6:7.1f} ({secs:4.1f})" for peak, secs in results)
+            print(f"{n:8,} {tsv.stat().st_size / 1e6:8.1f} {cells}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+TSV writing: whole-file string vs. the streaming writer, plain and compressed.
+
+Writes --rows synthetic inbound deal rows (see bench_normalize_rows for the
+values, padded to every schema column) from a generator and times each
+writer, with its peak traced memory (tracemalloc, the rows themselves
+excluded) and output size:
+
+- joined:      the former write_tsv, one "\\n".join of every line + write_text
+- stream:      write_tsv (TsvWriter), plain file
+- stream .gz:  write_tsv to a .gz path
+- stream .zst: write_tsv to a .zst path (if zstandard is installed)
+
+Usage:
+    python -m benchmarks.bench_tsv_writer [--rows 200000]
+"""
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+from benchmarks.bench_normalize_rows import build_deal_rows
+from src.compact_row import row_values
+from src.compressed_io import ZSTD_AVAILABLE
+from src.output.write_tsv import write_tsv
+from src.paths import INBOUND_SCHEMA_PATH
+from src.resources import get_schema
+
+
+def _write_joined(out_path: Path, schema: Dict[str, Any], rows: Iterator[Dict[str, Any]]) -> None:
+    """write_tsv before streaming: every line in a list, one string, one write."""
+    cols = [c["name"] for c in schema["columns"]]
+    lines = ["\t".join(cols)]
+    for r in rows:
+        lines.append("\t".join("" if v is None else str(v) for v in row_values(r, cols)))
+    out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    schema = get_schema(INBOUND_SCHEMA_PATH)
+    base: List[Dict[str, Any]] = build_deal_rows(1000)
+
+    def rows() -> Iterator[Dict[str, Any]]:
+        for i in range(args.rows):
+            yield base[i % len(base)]
+
+    cases: List[Any] = [
+        ("joined", "deals.tsv", _write_joined),
+        ("stream", "deals.tsv", write_tsv),
+        ("stream .gz", "deals.tsv.gz", write_tsv),
+    ]
+    if ZSTD_AVAILABLE:
+        cases.append(("stream .zst", "deals.tsv.zst", write_tsv))
+
+    print(f"{args.rows:,} rows x {len(schema['columns'])} columns")
+    print(f"{'':12} {'seconds':>8} {'peak MB':>8} {'file MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, file_name, write in cases:
+            out = Path(tmp) / file_name
+            run: Callable[[], None] = lambda: write(out, schema, rows())
+            gc.collect()
+            tracemalloc.start()
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{name:12} {elapsed:8.2f} {peak / 1e6:8.1f} {out.stat().st_size / 1e6:8.1f}")
+    if not ZSTD_AVAILABLE:
+        print("(zstandard not installed: .zst skipped)")
+
+
+if __name__ == "__main__":
+    main()
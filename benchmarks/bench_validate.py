@@ -0,0 +1,84 @@
+"""
+Time and peak memory of validate_tsv, streamed vs. whole-file, as the input grows.
+
+Writes synthetic inbound deal list TSVs (raw values from
+bench_normalize_rows, so most rows have errors) and measures the peak
+traced allocation (tracemalloc) and wall time of:
+
+- whole:  read_tsv + validate_row per row, every message kept (the
+          validator before streaming)
+- stream: validate_tsv with max_errors messages kept and counts per
+          column and error type
+
+The streamed peak should stay flat as the row count grows.
+
+Usage:
+    python -m benchmarks.bench_validate [--rows 20000 40000 80000] [--max-errors 1000]
+"""
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.bench_compact_rows import _write_input
+from benchmarks.bench_normalize_rows import build_deal_rows
+from src.ingest.read_tsv import read_tsv
+from src.paths import INBOUND_SCHEMA_PATH
+from src.pipelines.validate_file import DEFAULT_MAX_ERRORS, validate_tsv
+from src.resources import get_compiled_schema, get_schema
+from src.validate.validators import validate_row
+
+
+def _peak(run: Callable[[], Any]) -> Tuple[int, float, Any]:
+    """Peak traced bytes, seconds and result of run()."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[20_000, 40_000, 80_000])
+    parser.add_argument("--max-errors", type=int, default=DEFAULT_MAX_ERRORS)
+    args = parser.parse_args()
+
+    schema = get_schema(INBOUND_SCHEMA_PATH)
+    columns = [c["name"] for c in schema["columns"]]
+    checks = get_compiled_schema(INBOUND_SCHEMA_PATH).checks["columns"]
+
+    def whole(tsv: Path) -> int:
+        errors: List[str] = []
+        for i, row in enumerate(read_tsv(tsv), start=1):
+            ok, errs = validate_row(schema, row, checks)
+            errors.extend(f"Row {i}: {e}" for e in errs)
+        return len(errors)
+
+    def stream(tsv: Path) -> int:
+        counts: Dict[str, Dict[str, int]] = {}
+        validate_tsv(INBOUND_SCHEMA_PATH, tsv, max_errors=args.max_errors, counts=counts)
+        return sum(n for kinds in counts.values() for n in kinds.values())
+
+    print(f"max_errors {args.max_errors:,}; peak MB (seconds)")
+    print(f"{'rows':>8} {'file MB':>8} {'errors':>9} {'whole':>14} {'stream':>14} {'rows/s':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tsv = Path(tmp) / "deals.tsv"
+        for n in args.rows:
+            _write_input(tsv, columns, build_deal_rows(n))
+            results = [_peak(lambda run=run: run(tsv)) for run in (whole, stream)]
+            assert results[0][2] == results[1][2], "whole and stream count different errors"
+            cells = " ".join(f"{peak / 1e6:7.1f} ({secs:4.1f})" for peak, secs, _ in results)
+            rate = n / results[1][1]
+            print(f"{n:8,} {tsv.stat().st_size / 1e6:8.1f} {results[1][2]:9,} {cells} {rate:9,.0f}")
+
+
+if __name__ == "__main__":
+    main()
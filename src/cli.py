@@ -3,8 +3,26 @@ import json
 from pathlib import Path
 
 from src.pipelines.scaffold import scaffold_inbound_tsv, scaffold_transactions_tsv
-from src.pipelines.validate_file import validate_tsv
+from src.pipelines.validate_file import DEFAULT_MAX_ERRORS, format_error_counts, validate_tsv
 from src.pipelines.normalize_file import normalize_tsv
+from src.paths import INBOUND_SCHEMA_PATH, TRANSACTIONS_SCHEMA_PATH
+
+# Names of src.fetch.pdf_engines.ENGINES, spelled out so building the parser
+# doesn't import every PDF library (tests check the two stay in sync)
+PDF_ENGINE_NAMES = ("pdfminer", "pymupdf", "pypdf")
+DEFAULT_PDF_ENGINE = "pypdf"
+
+
+def page_selection(spec: str) -> str:
+    """argparse type for --pages: rejects a malformed spec before any PDF is opened."""
+    # Imported here, only when --pages is given: pdf_reader imports the PDF engines
+    from src.fetch.pdf_reader import parse_page_selection
+
+    try:
+        parse_page_selection(spec, 0)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return spec
 
 
 def main() -> None:
@@ -35,6 +53,8 @@ def main() -> None:
     )
     p_val.add_argument("--schema", required=True, help="Path to schema JSON")
     p_val.add_argument("--tsv", required=True, help="Path to TSV file")
+    p_val.add_argument("--max-errors", type=int, default=DEFAULT_MAX_ERRORS, help=f"List at most this many errors, count the rest (default: {DEFAULT_MAX_ERRORS})")
+    p_val.add_argument("--fail-fast", action="store_true", help="Stop at the first invalid row")
 
     # ---------- Normalization commands (Phase 3) ----------
     p_nin = sub.add_parser(
@@ -43,6 +63,8 @@ def main() -> None:
     )
     p_nin.add_argument("--tsv", required=True, help="Path to inbound TSV")
     p_nin.add_argument("--out", default="output/inbound_rows.normalized.tsv")
+    p_nin.add_argument("--stats", action="store_true", help="Print normalizer cache hit rates, date format and number separator stats")
+    p_nin.add_argument("--workers", type=int, default=1, help="Normalize chunks in this many processes (default: 1)")
 
     p_ntx = sub.add_parser(
         "normalize-transactions",
@@ -50,6 +72,8 @@ def main() -> None:
     )
     p_ntx.add_argument("--tsv", required=True, help="Path to transactions TSV")
     p_ntx.add_argument("--out", default="output/transaction_rows.normalized.tsv")
+    p_ntx.add_argument("--stats", action="store_true", help="Print normalizer cache hit rates, date format and number separator stats")
+    p_ntx.add_argument("--workers", type=int, default=1, help="Normalize chunks in this many processes (default: 1)")
 
     # ---------- Extraction commands (Phase 4) ----------
     p_ext = sub.add_parser(
@@ -100,6 +124,10 @@ def main() -> None:
     p_pdf_direct.add_argument("--input", required=True, help="Path to PDF file")
     p_pdf_direct.add_argument("--out", default=None, help="Output TSV/Excel path (optional)")
     p_pdf_direct.add_argument("--date", default="", help="Date received (yyyy/mm/dd)")
+    p_pdf_direct.add_argument("--keep-boilerplate", action="store_true", help="Don't strip repeated headers/footers/page numbers")
+    p_pdf_direct.add_argument("--pages", type=page_selection, default=None, help="Only read these pages, e.g. 1-10,15 (default: all)")
+    p_pdf_direct.add_argument("--max-input-tokens", type=int, default=None, help="Stop reading pages after this many input tokens")
+    p_pdf_direct.add_argument("--pdf-engine", choices=PDF_ENGINE_NAMES, default=DEFAULT_PDF_ENGINE, help="PDF text engine (default: pypdf)")
 
     p_extract_pdf = sub.add_parser(
         "extract-pdf-text",
@@ -107,6 +135,8 @@ def main() -> None:
     )
     p_extract_pdf.add_argument("--input", required=True, help="Path to PDF file")
     p_extract_pdf.add_argument("--out", default=None, help="Output text file path")
+    p_extract_pdf.add_argument("--clean", action="store_true", help="Strip repeated headers/footers/page numbers")
+    p_extract_pdf.add_argument("--pdf-engine", choices=PDF_ENGINE_NAMES, default=DEFAULT_PDF_ENGINE, help="PDF text engine (default: pypdf)")
 
     # ---------- Batch processing commands ----------
     p_batch_pdf = sub.add_parser(
@@ -116,7 +146,34 @@ def main() -> None:
     p_batch_pdf.add_argument("--folder", required=True, help="Path to folder containing PDF files")
     p_batch_pdf.add_argument("--out", default="output/deals.xlsx", help="Output Excel file path")
     p_batch_pdf.add_argument("--date", default="", help="Date received for all PDFs (yyyy/mm/dd)")
-    p_batch_pdf.add_argument("--max", type=int, default=20, help="Maximum PDFs to process (default: 20)")
+    p_batch_pdf.add_argument("--max", type=int, default=20, help="Maximum new PDFs to process per run (default: 20)")
+    p_batch_pdf.add_argument("--keep-boilerplate", action="store_true", help="Don't strip repeated headers/footers/page numbers")
+    p_batch_pdf.add_argument("--pages", type=page_selection, default=None, help="Only read these pages of each PDF, e.g. 1-10 (default: all)")
+    p_batch_pdf.add_argument("--max-input-tokens", type=int, default=None, help="Per-PDF limit: stop reading pages after this many input tokens")
+    p_batch_pdf.add_argument("--pdf-engine", choices=PDF_ENGINE_NAMES, default=DEFAULT_PDF_ENGINE, help="PDF text engine (default: pypdf)")
+    p_batch_pdf.add_argument("--retry-failed", action="store_true", help="Also reprocess PDFs that failed on an earlier run")
+    p_batch_pdf.add_argument("--reprocess-all", action="store_true", help="Ignore the manifest and process every PDF again")
+    p_batch_pdf.add_argument("--manifest", default=None, help="Manifest file (default: <folder>/.deal_manifest.json)")
+    p_batch_pdf.add_argument("--recursive", action="store_true", help="Also process PDFs in subfolders")
+    p_batch_pdf.add_argument("--archives", action="store_true", help="Also process PDFs inside .zip archives and saved .eml emails")
+
+    p_watch = sub.add_parser(
+        "watch",
+        help="Watch a folder and process new PDFs as they arrive -> Excel (requires ANTHROPIC_API_KEY)"
+    )
+    p_watch.add_argument("--folder", required=True, help="Folder to watch for PDF files")
+    p_watch.add_argument("--out", default="output/deals.xlsx", help="Output Excel file path")
+    p_watch.add_argument("--date", default="", help="Date received for all PDFs (yyyy/mm/dd)")
+    p_watch.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between folder checks (default: 1)")
+    p_watch.add_argument("--settle", type=float, default=2.0, help="Seconds a file must be unchanged before it is read (default: 2)")
+    p_watch.add_argument("--flush-interval", type=float, default=30.0, help="Save waiting rows at least this often, in seconds (default: 30)")
+    p_watch.add_argument("--batch-size", type=int, default=10, help="Save as soon as this many rows are waiting (default: 10)")
+    p_watch.add_argument("--polling", action="store_true", help="Poll the folder even if watchdog is installed")
+    p_watch.add_argument("--reload-interval", type=float, default=2.0, help="Seconds between checks for edited mapping files; 0 disables reloading (default: 2)")
+    p_watch.add_argument("--keep-boilerplate", action="store_true", help="Don't strip repeated headers/footers/page numbers")
+    p_watch.add_argument("--pages", type=page_selection, default=None, help="Only read these pages of each PDF, e.g. 1-10 (default: all)")
+    p_watch.add_argument("--max-input-tokens", type=int, default=None, help="Per-PDF limit: stop reading pages after this many input tokens")
+    p_watch.add_argument("--pdf-engine", choices=PDF_ENGINE_NAMES, default=DEFAULT_PDF_ENGINE, help="PDF text engine (default: pypdf)")
 
     args = parser.parse_args()
 
@@ -128,33 +185,72 @@ def main() -> None:
         scaffold_transactions_tsv(Path(args.out))
 
     elif args.command == "validate":
-        ok, errors = validate_tsv(args.schema, Path(args.tsv))
+        error_counts = {}
+        ok, errors = validate_tsv(
+            args.schema,
+            Path(args.tsv),
+            max_errors=args.max_errors,
+            fail_fast=args.fail_fast,
+            counts=error_counts,
+        )
         if ok:
             print("VALID ✅")
         else:
             print("INVALID ❌")
             for e in errors:
                 print(f"  - {e}")
+            if error_counts:
+                print("Errors by column:")
+                for line in format_error_counts(error_counts).splitlines():
+                    print(f"  {line}")
 
     elif args.command == "normalize-inbound":
+        date_stats = {} if args.stats else None
+        number_profiles = {}
         ok, msg = normalize_tsv(
-            "config/schemas/inbound_purple.schema.json",
+            INBOUND_SCHEMA_PATH,
             Path(args.tsv),
             Path(args.out),
             mode="inbound",
+            date_stats=date_stats,
+            number_profiles=number_profiles,
+            workers=args.workers,
         )
         print("OK ✅" if ok else "FAILED ❌")
         print(msg)
+        if args.stats:
+            from src.normalize.column_normalizer import format_date_stats
+            from src.normalize.memo import format_memo_stats
+            from src.normalize.number_profile import format_number_profiles
+            print(format_memo_stats())
+            if date_stats:
+                print(format_date_stats(date_stats))
+            if number_profiles:
+                print(format_number_profiles(number_profiles))
 
     elif args.command == "normalize-transactions":
+        date_stats = {} if args.stats else None
+        number_profiles = {}
         ok, msg = normalize_tsv(
-            "config/schemas/transactions.schema.json",
+            TRANSACTIONS_SCHEMA_PATH,
             Path(args.tsv),
             Path(args.out),
             mode="transactions",
+            date_stats=date_stats,
+            number_profiles=number_profiles,
+            workers=args.workers,
         )
         print("OK ✅" if ok else "FAILED ❌")
         print(msg)
+        if args.stats:
+            from src.normalize.column_normalizer import format_date_stats
+            from src.normalize.memo import format_memo_stats
+            from src.normalize.number_profile import format_number_profiles
+            print(format_memo_stats())
+            if date_stats:
+                print(format_date_stats(date_stats))
+            if number_profiles:
+                print(format_number_profiles(number_profiles))
 
     elif args.command == "extract-transaction":
         from src.pipelines.extract_pipeline import process_transaction_file
@@ -257,8 +353,13 @@ def main() -> None:
             Path(args.input),
             out_path,
             args.date,
+            clean_text=not args.keep_boilerplate,
+            pages=args.pages,
+            max_tokens=args.max_input_tokens,
+            pdf_engine=args.pdf_engine,
         )
         if ok:
+            print(msg)
             print(f"Done. Added to sheet '{SHEET_DEAL_LIST}' in {out_path}")
         else:
             print(f"FAILED: {msg}")
@@ -266,7 +367,7 @@ def main() -> None:
     elif args.command == "extract-pdf-text":
         from src.fetch.pdf_reader import extract_text_from_pdf
 
-        ok, msg, text = extract_text_from_pdf(Path(args.input))
+        ok, msg, text = extract_text_from_pdf(Path(args.input), clean=args.clean, engine=args.pdf_engine)
         if ok:
             print(f"EXTRACTED ✅ ({msg})")
             print("-" * 40)
@@ -294,6 +395,15 @@ def main() -> None:
                 out_path,
                 args.date,
                 max_files=args.max,
+                clean_text=not args.keep_boilerplate,
+                pages=args.pages,
+                max_tokens=args.max_input_tokens,
+                pdf_engine=args.pdf_engine,
+                incremental=not args.reprocess_all,
+                retry_failed=args.retry_failed,
+                manifest_path=Path(args.manifest) if args.manifest else None,
+                recursive=args.recursive,
+                include_archives=args.archives,
             )
             if ok:
                 print(f"Done. {msg}")
@@ -301,6 +411,34 @@ def main() -> None:
             else:
                 print(f"FAILED: {msg}")
 
+    elif args.command == "watch":
+        from src.pipelines.watch import FolderWatcher
+
+        folder = Path(args.folder)
+        if not folder.is_dir():
+            print(f"FAILED: Not a directory: {folder}")
+        else:
+            try:
+                watcher = FolderWatcher(
+                    folder,
+                    Path(args.out),
+                    args.date,
+                    poll_interval=args.poll_interval,
+                    settle_seconds=args.settle,
+                    flush_interval=args.flush_interval,
+                    batch_size=args.batch_size,
+                    clean_text=not args.keep_boilerplate,
+                    pages=args.pages,
+                    max_tokens=args.max_input_tokens,
+                    pdf_engine=args.pdf_engine,
+                    use_watchdog=not args.polling,
+                    reload_interval=args.reload_interval,
+                )
+            except Exception as e:
+                print(f"FAILED: Failed to load resources: {e}")
+            else:
+                watcher.run()
+
 
 if __name__ == "__main__":
     main()
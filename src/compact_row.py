@@ -0,0 +1,226 @@
+"""
+Compact rows: a row's values in a list, its column names resolved once per table.
+
+A dict row carries its own hash table of column names; a 100k-row export
+of the 29-column deal list holds 100k of them, each larger than the values
+it indexes. A CompactRow holds only a list of values and a reference to a
+RowLayout (column name -> index) shared by every row of the table.
+
+CompactRow is a MutableMapping, so code written for dict rows keeps
+working: row.get(col, ""), row[col] = value, col in row, dict(row),
+comparison with a dict. Keys outside the layout (e.g. the extractor's
+"NOI" before render_inbound_row maps it to "NOI, CCY") go into a small
+per-row dict, created only when such a key is set.
+
+row_values() reads a list of columns from any row; for compact rows the
+column indexes are resolved once per (layout, column list).
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+class _Unset:
+    """Type of UNSET."""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "UNSET"
+
+    def __reduce__(self) -> str:
+        return "UNSET"
+
+
+# A column with no value (a missing key, not an empty string); falsy
+UNSET = _Unset()
+
+
+class RowLayout:
+    """
+    Column names of a table and their positions.
+
+    Use row_layout() to get one, so tables with the same columns share it.
+    """
+
+    __slots__ = ("columns", "index", "_positions")
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns: Tuple[str, ...] = tuple(columns)
+        # A repeated column name resolves to its last position, as in a dict built from the row
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.columns)}
+        self._positions: Dict[Tuple[str, ...], List[Optional[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __repr__(self) -> str:
+        return f"RowLayout({list(self.columns)!r})"
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Tuple[str, ...]]]:
+        # Unpickled layouts are shared again in the receiving process
+        return (row_layout, (self.columns,))
+
+    def row(self, values: Optional[List[Any]] = None) -> "CompactRow":
+        """
+        A row over this layout.
+
+        Args:
+            values: Values in column order, used as is (not copied); shorter
+                lists are padded with unset columns. None for an empty row.
+        """
+        if values is None:
+            values = [UNSET] * len(self.columns)
+        elif len(values) < len(self.columns):
+            values = values + [UNSET] * (len(self.columns) - len(values))
+        return CompactRow(self, values)
+
+    def from_mapping(self, mapping: Any) -> "CompactRow":
+        """A row over this layout with mapping's items (keys outside the layout included)."""
+        row = self.row()
+        for key, value in mapping.items():
+            row[key] = value
+        return row
+
+    def positions(self, columns: Sequence[str]) -> List[Optional[int]]:
+        """Index of each column (None if not in the layout), cached per column list."""
+        key = tuple(columns)
+        positions = self._positions.get(key)
+        if positions is None:
+            positions = self._positions[key] = [self.index.get(name) for name in key]
+        return positions
+
+
+_layouts: Dict[Tuple[str, ...], RowLayout] = {}
+
+
+def row_layout(columns: Sequence[str]) -> RowLayout:
+    """The shared RowLayout for these columns (in this order)."""
+    key = tuple(columns)
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = _layouts.setdefault(key, RowLayout(key))
+    return layout
+
+
+class CompactRow(MutableMapping):
+    """
+    A row as a values list over a shared RowLayout, usable as a dict.
+
+    Attributes:
+        cells: Values in layout order, UNSET for columns without one. Bulk
+            code may read and write it by layout.index position.
+    """
+
+    __slots__ = ("_layout", "cells", "_extra")
+
+    def __init__(self, layout: RowLayout, cells: List[Any], extra: Optional[Dict[str, Any]] = None):
+        self._layout = layout
+        self.cells = cells
+        self._extra = extra
+
+    @property
+    def layout(self) -> RowLayout:
+        return self._layout
+
+    def __getitem__(self, key: str) -> Any:
+        i = self._layout.index.get(key)
+        if i is not None:
+            value = self.cells[i]
+            if value is not UNSET:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = self._layout.index.get(key)
+        if i is not None:
+            value = self.cells[i]
+            return default if value is UNSET else value
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        i = self._layout.index.get(key)  # type: ignore[call-overload]
+        if i is not None:
+            return self.cells[i] is not UNSET
+        return self._extra is not None and key in self._extra
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        i = self._layout.index.get(key)
+        if i is not None:
+            self.cells[i] = value
+        elif self._extra is None:
+            self._extra = {key: value}
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        i = self._layout.index.get(key)
+        if i is not None and self.cells[i] is not UNSET:
+            self.cells[i] = UNSET
+        elif i is None and self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        values = self.cells
+        for name, i in self._layout.index.items():
+            if values[i] is not UNSET:
+                yield name
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        count = len(self._layout.index) - sum(1 for i in self._layout.index.values() if self.cells[i] is UNSET)
+        return count + (len(self._extra) if self._extra is not None else 0)
+
+    def copy(self) -> "CompactRow":
+        """Shallow copy sharing the layout (like dict.copy)."""
+        return CompactRow(self._layout, list(self.cells), dict(self._extra) if self._extra is not None else None)
+
+    def __repr__(self) -> str:
+        return f"CompactRow({dict(self)!r})"
+
+
+def shared_layout(rows: Sequence[Any]) -> Optional[RowLayout]:
+    """The layout of rows if they are all CompactRows over one layout, else None."""
+    if not rows or type(rows[0]) is not CompactRow:
+        return None
+    layout = rows[0]._layout
+    for row in rows:
+        if type(row) is not CompactRow or row._layout is not layout:
+            return None
+    return layout
+
+
+def row_values(row: Any, columns: Sequence[str], default: Any = "") -> List[Any]:
+    """
+    row.get(column, default) for each column, for dict and compact rows.
+
+    Args:
+        row: Row mapping
+        columns: Column names in output order
+        default: Value for missing columns
+    """
+    if type(row) is not CompactRow:
+        return [row.get(name, default) for name in columns]
+
+    values = row.cells
+    extra = row._extra
+    out = []
+    for name, i in zip(columns, row._layout.positions(columns)):
+        if i is not None:
+            value = values[i]
+        elif extra is not None:
+            value = extra.get(name, UNSET)
+        else:
+            value = UNSET
+        out.append(default if value is UNSET else value)
+    return out
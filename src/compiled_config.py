@@ -0,0 +1,219 @@
+"""
+Compiled config: parsed mapping/schema files plus their derived lookups,
+cached on disk in pickled form.
+
+Parsing property_type_map.yml with PyYAML and building the synonym
+automaton costs more than everything else a short CLI run does with its
+config. The compiled form is built once and cached per source file:
+
+- CompiledMapping: the mapping dict, its content fingerprint and the
+  property type matcher (Aho-Corasick automaton over all synonyms)
+- CompiledSchema: the schema dict, column names per layout ("columns",
+  "columns_sweden", ...), the type check per column and the normalization
+  plan (see src.normalize.plan)
+
+Cache entries live in .cache/config/ (see src.paths.config_cache_dir) and
+are keyed by the source file's (mtime, size) and SHA-256: a touched but
+unchanged file is re-hashed and the entry reused; a changed file is
+recompiled. Entries written by another compiled-config format or Python
+version, and unreadable entries, are rebuilt. Writes are atomic (temp
+file + rename); a read-only cache directory, or a compiled form that
+can't be pickled, just means no caching.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from src.normalize.memo import mapping_fingerprint, versioned_mapping
+from src.normalize.plan import PlanStep, compile_plan, schema_layouts
+from src.normalize.property_type import PropertyTypeMatcher
+from src.paths import config_cache_dir, resolve_config_path
+from src.validate.validators import ColumnCheck, compile_column_checks
+
+# Writing an entry fails with these for a compiled form that can't be pickled
+# (a lambda, a lock, ...); AttributeError is what local functions raise
+_UNPICKLABLE_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+
+# Bump when CompiledMapping/CompiledSchema (or what they hold) change shape
+COMPILED_CONFIG_VERSION = 3
+
+_CACHE_KEY = f"{COMPILED_CONFIG_VERSION}:{sys.version_info[0]}.{sys.version_info[1]}"
+
+
+class CompiledMapping:
+    """A mapping YAML file, parsed, with its derived lookups."""
+
+    def __init__(self, mapping: Dict[str, Any]):
+        self.mapping = mapping
+        self.fingerprint = mapping_fingerprint(mapping)
+        self.property_types = PropertyTypeMatcher(mapping)
+
+    def activate(self) -> Dict[str, Any]:
+        """
+        Register the precompiled lookups for this mapping dict (so
+        normalize_property_type doesn't rebuild them) and return the dict.
+        """
+        versioned_mapping(self.mapping, self.fingerprint, {"property_types": self.property_types})
+        return self.mapping
+
+
+class CompiledSchema:
+    """A schema JSON file, parsed, with column lists and type checks per layout and its normalization plan."""
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        # "columns" for inbound; "columns_sweden" etc. for transactions
+        layouts = schema_layouts(schema)
+        self.column_names: Dict[str, List[str]] = {
+            key: [c["name"] for c in columns] for key, columns in layouts.items()
+        }
+        self.checks: Dict[str, List[ColumnCheck]] = {
+            key: compile_column_checks(columns) for key, columns in layouts.items()
+        }
+        self.plan: List[PlanStep] = compile_plan(schema)
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names of the main layout ("columns")."""
+        return self.column_names.get("columns", [])
+
+    def transaction_columns(self, country: str) -> List[str]:
+        """Column names for a country's transactions sheet (Sweden's if unknown)."""
+        names = self.column_names.get(f"columns_{country.lower()}")
+        if names is None:
+            names = self.column_names.get("columns_sweden", [])
+        return names
+
+
+def compile_mapping(data: bytes) -> CompiledMapping:
+    import yaml
+
+    return CompiledMapping(yaml.safe_load(data.decode("utf-8")) or {})
+
+
+def compile_schema(data: bytes) -> CompiledSchema:
+    return CompiledSchema(json.loads(data.decode("utf-8")))
+
+
+def _cache_file(cache_dir: Path, source: Path, kind: str) -> Path:
+    digest = hashlib.sha1(str(source.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{source.stem}.{kind}.{digest}.pickle"
+
+
+def _read_entry(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as f:
+            entry = pickle.load(f)
+    except Exception:  # missing, truncated, or pickled by incompatible code
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != _CACHE_KEY:
+        return None
+    return entry
+
+
+def _write_entry(path: Path, entry: Dict[str, Any]) -> bool:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return True
+    except (OSError, *_UNPICKLABLE_ERRORS):
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+
+
+def load_compiled(
+    path: Union[str, Path],
+    compiler: Callable[[bytes], Any],
+    kind: str,
+    cache_dir: Optional[Path] = None,
+    stats: Optional[Dict[str, int]] = None,
+    label: str = "Config file",
+) -> Any:
+    """
+    Compiled form of a config file, from the on-disk cache when it is current.
+
+    Args:
+        path: Source file (relative paths resolve via src.paths.resolve_config_path)
+        compiler: Builds the compiled object from the file's bytes
+        kind: Short tag for the cache file name ("mapping", "schema")
+        cache_dir: Cache directory; defaults to config_cache_dir(). Caching is
+            skipped when that is None.
+        stats: Optional dict; "cache_hits", "cache_rehashed" or "compiled" is incremented
+        label: What the file is, for the not-found message
+
+    Raises:
+        FileNotFoundError: If the source file doesn't exist
+    """
+    if stats is None:
+        stats = {}
+    source = resolve_config_path(path)
+    if not source.exists():
+        raise FileNotFoundError(f"{label} not found: {source.resolve()}")
+    if cache_dir is None:
+        cache_dir = config_cache_dir()
+
+    st = source.stat()
+    cache_file = _cache_file(cache_dir, source, kind) if cache_dir is not None else None
+    entry = _read_entry(cache_file) if cache_file is not None else None
+
+    if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+        stats["cache_hits"] = stats.get("cache_hits", 0) + 1
+        return entry["compiled"]
+
+    data = source.read_bytes()
+    sha = hashlib.sha256(data).hexdigest()
+
+    if entry and entry["sha256"] == sha:
+        # Touched (e.g. checked out again) but unchanged: keep the compiled form
+        stats["cache_rehashed"] = stats.get("cache_rehashed", 0) + 1
+        compiled = entry["compiled"]
+    else:
+        stats["compiled"] = stats.get("compiled", 0) + 1
+        compiled = compiler(data)
+
+    if cache_file is not None:
+        _write_entry(cache_file, {
+            "key": _CACHE_KEY,
+            "source": str(source.resolve()),
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": sha,
+            "compiled": compiled,
+        })
+    return compiled
+
+
+def load_compiled_mapping(path: Union[str, Path], **kwargs: Any) -> CompiledMapping:
+    """CompiledMapping for a mapping YAML file (see load_compiled)."""
+    return load_compiled(path, compile_mapping, "mapping", label="Mapping file", **kwargs)
+
+
+def load_compiled_schema(path: Union[str, Path], **kwargs: Any) -> CompiledSchema:
+    """CompiledSchema for a schema JSON file (see load_compiled)."""
+    return load_compiled(path, compile_schema, "schema", label="Schema", **kwargs)
+
+
+def clear_config_cache(cache_dir: Optional[Path] = None) -> int:
+    """Delete cached compiled config files; returns how many were removed."""
+    cache_dir = cache_dir if cache_dir is not None else config_cache_dir()
+    if cache_dir is None or not cache_dir.is_dir():
+        return 0
+    removed = 0
+    for path in cache_dir.glob("*.pickle"):
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
@@ -0,0 +1,109 @@
+"""
+Text files that may be compressed, chosen by extension.
+
+"deals.tsv.gz" is read and written through gzip, "deals.tsv.zst" through
+zstandard (optional dependency); any other name is a plain file. Readers
+and writers open files with open_text (or open_binary) and don't need to
+know which.
+
+Writers get a large buffer (WRITE_BUFFER_BYTES): the normalized outputs
+are written in big batches, and a gzip stream compresses better and
+faster fed in large pieces. flush() reaches the disk through the
+compressor too (a sync point in the stream), so a flushed prefix of a
+compressed file decompresses.
+"""
+
+import gzip
+import io
+from pathlib import Path
+from typing import IO, Optional, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Extension -> compression
+COMPRESSED_SUFFIXES = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+
+WRITE_BUFFER_BYTES = 1024 * 1024
+
+# Fast levels: these are working files, not long-term archives
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def compression_for(path: Union[str, Path]) -> Optional[str]:
+    """"gzip", "zstd", or None for a plain file, from the file name's last suffix."""
+    return COMPRESSED_SUFFIXES.get(Path(path).suffix.lower())
+
+
+class _FlushThroughWriter(io.BufferedWriter):
+    """A write buffer in front of a compressor; flush() also flushes the compressor."""
+
+    def flush(self) -> None:
+        super().flush()
+        self.raw.flush()
+
+
+def uncompressed_suffix(path: Union[str, Path]) -> str:
+    """The suffix of the file inside the compression: ".csv" for "deals.csv.gz"."""
+    p = Path(path)
+    if compression_for(p) is not None:
+        p = p.with_suffix("")
+    return p.suffix.lower()
+
+
+def _require_zstd() -> None:
+    if not ZSTD_AVAILABLE:
+        raise ImportError("zstandard not installed. Run: pip install zstandard")
+
+
+def open_binary(path: Union[str, Path], mode: str = "rb") -> IO[bytes]:
+    """
+    Open a file for binary reading ("rb") or writing ("wb"), (de)compressing by extension.
+
+    Raises:
+        ImportError: For .zst files without zstandard installed
+    """
+    compression = compression_for(path)
+    writing = "w" in mode
+    if compression == "gzip":
+        if writing:
+            # GzipFile compresses each write as it comes; hand it large pieces
+            return _FlushThroughWriter(gzip.open(path, "wb", GZIP_LEVEL), WRITE_BUFFER_BYTES)  # type: ignore[arg-type]
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    if compression == "zstd":
+        _require_zstd()
+        if writing:
+            return zstandard.open(path, "wb", cctx=zstandard.ZstdCompressor(level=ZSTD_LEVEL))
+        return zstandard.open(path, "rb")
+    return open(path, "wb" if writing else "rb", buffering=WRITE_BUFFER_BYTES if writing else -1)
+
+
+def open_text(
+    path: Union[str, Path],
+    mode: str = "r",
+    encoding: str = "utf-8",
+    newline: Optional[str] = None,
+) -> IO[str]:
+    """
+    Open a text file for reading ("r") or writing ("w"), (de)compressing by extension.
+
+    Plain files are opened as open(path, mode, encoding=..., newline=...),
+    with a larger write buffer.
+
+    Raises:
+        ImportError: For .zst files without zstandard installed
+    """
+    writing = "w" in mode
+    if compression_for(path) is None:
+        buffering = WRITE_BUFFER_BYTES if writing else -1
+        return open(path, "w" if writing else "r", buffering=buffering, encoding=encoding, newline=newline)
+    return io.TextIOWrapper(open_binary(path, "wb" if writing else "rb"), encoding=encoding, newline=newline)
@@ -21,6 +21,8 @@ from src.extract.prompts import (
     INBOUND_USER_PROMPT,
 )
 
+DEFAULT_MODEL = "claude-sonnet-4-20250514"
+
 
 class ExtractionError(Exception):
     """Raised when extraction fails."""
@@ -30,7 +32,7 @@ class ExtractionError(Exception):
 class Extractor:
     """LLM-based extractor for real estate deal information."""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-sonnet-4-20250514"):
+    def __init__(self, api_key: Optional[str] = None, model: str = DEFAULT_MODEL):
         """
         Initialize the extractor.
 
@@ -207,11 +209,15 @@ class Extractor:
 
 def extract_transaction(article_text: str, source_url: str = "", api_key: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """Convenience function for extracting a single transaction."""
-    extractor = Extractor(api_key=api_key)
+    from src.resources import get_extractor
+
+    extractor = get_extractor(api_key)
     return extractor.extract_transaction(article_text, source_url)
 
 
 def extract_inbound(document_text: str, date_received: str = "", api_key: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """Convenience function for extracting a single inbound deal."""
-    extractor = Extractor(api_key=api_key)
+    from src.resources import get_extractor
+
+    extractor = get_extractor(api_key)
     return extractor.extract_inbound(document_text, date_received)
@@ -1,6 +1,15 @@
 """Fetch modules for URL and PDF content extraction."""
 
-from src.fetch.url_fetcher import fetch_article_from_url
-from src.fetch.pdf_reader import extract_text_from_pdf
-
 __all__ = ["fetch_article_from_url", "extract_text_from_pdf"]
+
+
+def __getattr__(name):
+    # Imported on first use: requests and the PDF libraries are slow to load,
+    # and importing any src.fetch submodule runs this file
+    if name == "fetch_article_from_url":
+        from src.fetch.url_fetcher import fetch_article_from_url
+        return fetch_article_from_url
+    if name == "extract_text_from_pdf":
+        from src.fetch.pdf_reader import extract_text_from_pdf
+        return extract_text_from_pdf
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,245 @@
+"""
+Clean extracted PDF text before it is sent to the LLM.
+
+Broker IMs repeat the same header, footer, disclaimer and page-number lines
+on every page. This module removes them with a cross-page pass:
+
+- Lines that appear on most pages are treated as boilerplate and dropped.
+  Page counters are masked first, so "Page 3 of 40" matches "Page 4 of 40"
+  and "Confidential | 3" matches "Confidential | 4". Only explicit counters
+  ("Page 3", "3 / 40", "3 of 40") and numbers at either end of a line no
+  higher than the page count are masked: "Year built 1985" and "Year built
+  1992" stay different lines
+- Page-number lines ("Page 12", "12 / 40", "- 12 -", a bare "12" no higher
+  than the page count) at the top or bottom of a page are dropped, so a
+  year alone on the last line is kept
+- Words hyphenated across a line break are rejoined ("fastig-\\nheten"),
+  except before a conjunction ("kontors-\\noch bostadshus")
+- Runs of spaces and blank lines are collapsed
+
+clean_pdf_pages_stream works on a page iterator: repeated lines are learned
+from the first DETECTION_WINDOW pages and applied to the rest as they
+stream past, so memory stays bounded for very long documents.
+"""
+
+import re
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Rough token estimate used for reporting (≈4 characters per token)
+CHARS_PER_TOKEN = 4
+
+# A line is boilerplate if it appears on at least this share of pages...
+MIN_PAGE_RATIO = 0.6
+# ...and the document has at least this many pages
+MIN_PAGES = 3
+
+# Streaming mode learns repeated lines from this many leading pages
+DETECTION_WINDOW = 12
+
+# Page numbers are only looked for in this many lines at each end of a page
+PAGE_NUMBER_EDGE_LINES = 2
+
+# A whole line that is a page number; "bare" numbers only count up to the page count
+PAGE_NUMBER_RE = re.compile(
+    r"^(?:[-–—]\s*(?P<dashed>\d{1,4})\s*[-–—]"
+    r"|(?:page|sida|side|sivu|s\.)\s*\d{1,4}(?:\s*(?:/|of|av|af|\|)\s*\d{1,4})?"
+    r"|\d{1,4}\s*(?:/|of|av|af|\|)\s*\d{1,4}"
+    r"|(?P<bare>\d{1,4}))$",
+    re.IGNORECASE,
+)
+# Explicit page counters in a line key (lower-case): "page 3", "3 / 40", "3 of 40"
+PAGE_COUNTER_RE = re.compile(
+    r"\b(?:page|sida|side|sivu) \d{1,4}(?: ?(?:/|of|av|af) ?\d{1,4})?\b"
+    r"|\b\d{1,4} ?(?:/|of|av|af) ?\d{1,4}\b",
+)
+# A number at either end of a line key: a page counter if no higher than the page count
+EDGE_NUMBER_RE = re.compile(r"^\d{1,4}\b|\b\d{1,4}$")
+DIGITS_RE = re.compile(r"\d+")
+SPACES_RE = re.compile(r"[ \t\u00a0]+")
+# Not before a conjunction: "kontors- och bostadshus" is two words
+HYPHEN_BREAK_RE = re.compile(r"(\w)-\n(?!(?:och|og|eller|samt|and|or)\b)(?=[a-zäöåæøü])")
+BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate LLM token count for a text."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _line_key(line: str, page_count: int) -> str:
+    """Comparison key for a line: trimmed, lower-case, page counters masked."""
+    key = PAGE_COUNTER_RE.sub(_mask_digits, SPACES_RE.sub(" ", line.strip()).lower())
+    return EDGE_NUMBER_RE.sub(lambda m: "#" if int(m.group(0)) <= page_count else m.group(0), key)
+
+
+def _mask_digits(match: "re.Match[str]") -> str:
+    return DIGITS_RE.sub("#", match.group(0))
+
+
+def _is_page_number(line: str, page_count: Optional[int]) -> bool:
+    """True for a page-number line; a bare number only if page_count is known and it is no higher."""
+    match = PAGE_NUMBER_RE.match(line)
+    if match is None:
+        return False
+    bare = match.group("bare") or match.group("dashed")
+    return bare is None or (page_count is not None and int(bare) <= page_count)
+
+
+def find_repeated_lines(
+    pages: List[str],
+    min_page_ratio: float = MIN_PAGE_RATIO,
+    min_pages: int = MIN_PAGES,
+    page_count: Optional[int] = None,
+) -> Set[str]:
+    """
+    Find line keys that repeat on most pages (headers, footers, disclaimers).
+
+    Args:
+        pages: Text of each page
+        min_page_ratio: Share of pages a line must appear on
+        min_pages: Minimum page count before detection is applied
+        page_count: Pages in the document, the highest number masked as a
+            page counter (default: len(pages))
+
+    Returns:
+        Set of line keys (see _line_key) to drop
+    """
+    if len(pages) < min_pages:
+        return set()
+
+    if page_count is None:
+        page_count = len(pages)
+    page_counts: Dict[str, int] = {}
+    for page in pages:
+        keys = {_line_key(ln, page_count) for ln in page.splitlines()}
+        keys.discard("")
+        for key in keys:
+            page_counts[key] = page_counts.get(key, 0) + 1
+
+    threshold = max(2, int(len(pages) * min_page_ratio + 0.999))
+    return {key for key, count in page_counts.items() if count >= threshold}
+
+
+def clean_page_text(text: str, repeated: Set[str], page_count: Optional[int] = None) -> Tuple[str, int]:
+    """
+    Clean a single page's text.
+
+    Args:
+        text: Raw page text
+        repeated: Line keys to drop (from find_repeated_lines)
+        page_count: Pages in the document; bare numbers up to it are page
+            numbers (default: unknown, bare numbers are kept)
+
+    Returns:
+        Tuple of (cleaned_text, lines_removed)
+    """
+    lines = [SPACES_RE.sub(" ", ln).strip() for ln in text.splitlines()]
+    non_empty = [i for i, ln in enumerate(lines) if ln]
+    edges = set(non_empty[:PAGE_NUMBER_EDGE_LINES] + non_empty[-PAGE_NUMBER_EDGE_LINES:])
+
+    kept = []
+    removed = 0
+
+    for i, line in enumerate(lines):
+        if line and (
+            _line_key(line, page_count or 0) in repeated or (i in edges and _is_page_number(line, page_count))
+        ):
+            removed += 1
+            continue
+        kept.append(line)
+
+    cleaned = "\n".join(kept)
+    cleaned = HYPHEN_BREAK_RE.sub(r"\1", cleaned)
+    cleaned = BLANK_LINES_RE.sub("\n\n", cleaned).strip()
+    return cleaned, removed
+
+
+def clean_pdf_pages_stream(
+    pages: Iterable[Tuple[int, str]],
+    stats: Optional[Dict[str, Any]] = None,
+    window: int = DETECTION_WINDOW,
+    min_page_ratio: float = MIN_PAGE_RATIO,
+    min_pages: int = MIN_PAGES,
+    page_count: Optional[int] = None,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Remove repeated boilerplate from a stream of (page_number, text) pairs.
+
+    Only the first `window` pages are buffered for detection; later pages are
+    cleaned one at a time against the lines learned from that window.
+
+    Args:
+        pages: Iterable of (page_number, text) in document order
+        stats: Optional dict updated in place with lines_removed,
+            tokens_before and tokens_after as pages are consumed
+        window: Number of leading pages used to detect repeated lines
+        page_count: Pages in the document, the highest bare number taken
+            for a page number (default: the number of pages seen so far)
+
+    Yields:
+        (page_number, cleaned_text)
+    """
+    if stats is None:
+        stats = {}
+    for key in ("lines_removed", "tokens_before", "tokens_after"):
+        stats.setdefault(key, 0)
+
+    it = iter(pages)
+    head = list(islice(it, window))
+    seen = len(head)
+    known = max(page_count or 0, seen)
+    repeated = find_repeated_lines([text for _, text in head], min_page_ratio, min_pages, known)
+
+    for page_num, text in head:
+        yield _clean_counted(page_num, text, repeated, known, stats)
+    del head
+    for page_num, text in it:
+        seen += 1
+        yield _clean_counted(page_num, text, repeated, max(known, seen), stats)
+
+
+def _clean_counted(
+    page_num: int, text: str, repeated: Set[str], page_count: int, stats: Dict[str, Any]
+) -> Tuple[int, str]:
+    cleaned, removed = clean_page_text(text, repeated, page_count)
+    stats["lines_removed"] += removed
+    stats["tokens_before"] += estimate_tokens(text)
+    stats["tokens_after"] += estimate_tokens(cleaned)
+    return page_num, cleaned
+
+
+def clean_pdf_pages(
+    pages: List[str],
+    min_page_ratio: float = MIN_PAGE_RATIO,
+    min_pages: int = MIN_PAGES,
+) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Remove repeated boilerplate from a document's pages (whole document in memory).
+
+    Args:
+        pages: Text of each page, in order
+        min_page_ratio: Share of pages a line must appear on to be boilerplate
+        min_pages: Minimum page count before cross-page detection is applied
+
+    Returns:
+        Tuple of (cleaned_pages, stats)
+        - stats: lines_removed, tokens_before, tokens_after
+    """
+    stats: Dict[str, int] = {}
+    cleaned = clean_pdf_pages_stream(
+        enumerate(pages), stats, window=len(pages),
+        min_page_ratio=min_page_ratio, min_pages=min_pages, page_count=len(pages),
+    )
+    return [text for _, text in cleaned], stats
+
+
+def format_cleanup_stats(stats: Dict[str, int]) -> str:
+    """One-line summary, e.g. 'removed 48 boilerplate lines, ~5,200 -> ~3,900 tokens (-25%)'."""
+    before = stats.get("tokens_before", 0)
+    after = stats.get("tokens_after", 0)
+    pct = round(100 * (before - after) / before) if before else 0
+    return (
+        f"removed {stats.get('lines_removed', 0)} boilerplate lines, "
+        f"~{before:,} -> ~{after:,} tokens (-{pct}%)"
+    )
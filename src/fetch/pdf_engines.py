@@ -0,0 +1,353 @@
+"""
+Pluggable PDF text engines.
+
+pypdf is the default (pure Python, always installed). Other local engines
+are optional and selected per run with --pdf-engine:
+
+- pymupdf:  PyMuPDF (C-backed MuPDF), ~3x faster, keeps table rows together
+- pdfminer: pdfminer.six (pure Python), layout analysis, slowest
+
+Engines open a path or a binary file-like object (e.g. a PDF read out of a
+zip archive into memory) and expose the same small interface:
+page_count, iter_pages(indices) -> (page_number, text), and probe() for the
+image-only check. Use benchmarks/bench_pdf_engines.py to compare engines
+on speed, memory and text quality.
+"""
+
+import gc
+import re
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    from pypdf import PdfReader
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    try:
+        import fitz as pymupdf  # PyMuPDF < 1.24
+        PYMUPDF_AVAILABLE = True
+    except ImportError:
+        PYMUPDF_AVAILABLE = False
+
+try:
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.layout import LAParams, LTTextContainer
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdfparser import PDFParser
+    from pdfminer.pdftypes import resolve1
+    PDFMINER_AVAILABLE = True
+except ImportError:
+    PDFMINER_AVAILABLE = False
+
+
+# Document kinds returned by probes
+PDF_KIND_TEXT = "text"
+PDF_KIND_IMAGE_ONLY = "image-only"
+PDF_KIND_MIXED = "mixed"
+
+# How many leading pages a probe inspects (the last page is always added)
+PROBE_SAMPLE_PAGES = 3
+
+DEFAULT_ENGINE = "pypdf"
+
+# pypdf: the reference cycles its text extractor leaves behind are collected
+# after every this many pages (a collection per page costs time on every page)
+PYPDF_COLLECT_EVERY_PAGES = 10
+
+# Words whose baselines differ by less than this (pt) are on the same line
+LINE_Y_TOLERANCE = 2.0
+
+_TEXT_OBJECT_RE = re.compile(rb"(?:^|\s)BT(?:\s|$)")
+
+
+def _is_stream(source) -> bool:
+    return hasattr(source, "read")
+
+
+def _probe_sample(page_count: int, sample_pages: int) -> List[int]:
+    sample = list(range(min(sample_pages, page_count)))
+    if page_count > len(sample):
+        sample.append(page_count - 1)
+    return sample
+
+
+def classify_pages(layers: Iterable[Tuple[bool, bool]]) -> str:
+    """
+    Classify a document from per-page (has_text, has_images) flags.
+
+    Pages with neither (blank pages) don't count either way.
+    """
+    text_pages = 0
+    image_pages = 0
+    for has_text, has_images in layers:
+        if has_text:
+            text_pages += 1
+        elif has_images:
+            image_pages += 1
+
+    if image_pages and not text_pages:
+        return PDF_KIND_IMAGE_ONLY
+    if image_pages:
+        return PDF_KIND_MIXED
+    return PDF_KIND_TEXT
+
+
+class PdfDocument(ABC):
+    """An open PDF. Engines subclass this; a subclass missing a method can't be instantiated."""
+
+    page_count: int = 0
+
+    @abstractmethod
+    def iter_pages(self, indices: Iterable[int]) -> Iterator[Tuple[int, str]]:
+        """Yield (page_number, text) for the given 0-based page indices."""
+
+    @abstractmethod
+    def probe(self, sample_pages: int = PROBE_SAMPLE_PAGES) -> str:
+        """Classify as text/image-only/mixed without full text extraction."""
+
+
+class PdfTextEngine(ABC):
+    """A PDF text extraction backend; a subclass missing a method can't be instantiated."""
+
+    name = ""
+    package = ""  # pip package, for the install hint
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        """True if the engine's package is installed."""
+
+    @abstractmethod
+    def open(self, source: Union[str, Path, BinaryIO]):
+        """Context manager yielding a PdfDocument for a path or binary stream."""
+
+    @property
+    def install_hint(self) -> str:
+        return f"{self.package} not installed. Run: pip install {self.package}"
+
+
+# ---------- pypdf (default) ----------
+
+class _PypdfDocument(PdfDocument):
+    def __init__(self, reader):
+        self.reader = reader
+        self.page_count = len(reader.pages)
+
+    def iter_pages(self, indices):
+        # Parsed content streams, fonts and images are dropped after each page
+        # so the reader's object cache doesn't grow with the page count.
+        # resolved_objects is private to PdfReader (checked against pypdf
+        # 6.20.1); a pypdf without it keeps its cache.
+        cache = getattr(self.reader, "resolved_objects", None)
+        clear_cache = cache.clear if isinstance(cache, dict) else None
+        for done, index in enumerate(indices, start=1):
+            text = self.reader.pages[index].extract_text() or ""
+            if clear_cache is not None:
+                clear_cache()
+            if done % PYPDF_COLLECT_EVERY_PAGES == 0:
+                gc.collect(1)
+            yield index + 1, text.strip()
+
+    def probe(self, sample_pages=PROBE_SAMPLE_PAGES):
+        sample = _probe_sample(self.page_count, sample_pages)
+        return classify_pages(self._page_layers(self.reader.pages[i]) for i in sample)
+
+    @staticmethod
+    def _page_layers(page) -> Tuple[bool, bool]:
+        """Inspect a page's content stream and resources: (has_text, has_images)."""
+        resources = page.get("/Resources")
+        resources = resources.get_object() if resources is not None else {}
+
+        has_fonts = bool(resources.get("/Font"))
+        contents = page.get_contents()
+        has_text = has_fonts and contents is not None and bool(_TEXT_OBJECT_RE.search(contents.get_data()))
+        has_images = False
+
+        xobjects = resources.get("/XObject")
+        for ref in (xobjects.get_object().values() if xobjects is not None else []):
+            xobj = ref.get_object()
+            subtype = xobj.get("/Subtype")
+            if subtype == "/Image":
+                has_images = True
+            elif subtype == "/Form" and not has_text:
+                # Text can live in a form XObject (one level deep is enough for a probe)
+                form_resources = xobj.get("/Resources")
+                form_fonts = form_resources.get_object().get("/Font") if form_resources is not None else None
+                if form_fonts and _TEXT_OBJECT_RE.search(xobj.get_data()):
+                    has_text = True
+
+        return has_text, has_images
+
+
+class PypdfEngine(PdfTextEngine):
+    name = "pypdf"
+    package = "pypdf"
+
+    def is_available(self):
+        return PYPDF_AVAILABLE
+
+    @contextmanager
+    def open(self, source):
+        if _is_stream(source):
+            yield _PypdfDocument(PdfReader(source))
+            return
+        # Pass a file handle so pypdf reads on demand instead of loading the whole file
+        with open(source, "rb") as fh:
+            yield _PypdfDocument(PdfReader(fh))
+
+
+# ---------- PyMuPDF (optional, C-backed) ----------
+
+class _PymupdfDocument(PdfDocument):
+    def __init__(self, doc):
+        self.doc = doc
+        self.page_count = doc.page_count
+
+    def iter_pages(self, indices):
+        for index in indices:
+            yield index + 1, self._page_text(self.doc[index])
+
+    @staticmethod
+    def _page_text(page) -> str:
+        """
+        Rebuild lines from word positions so table rows come out as
+        label ... value on one line. Much cheaper than get_text(sort=True),
+        which sorts whole blocks and is ~10x slower on long pages.
+        """
+        words = sorted(page.get_text("words"), key=lambda w: (w[3], w[0]))
+        lines: List[List[Tuple[float, str]]] = []
+        line_y = None
+        for x0, _y0, _x1, y1, word, *_ in words:
+            if line_y is None or abs(y1 - line_y) > LINE_Y_TOLERANCE:
+                lines.append([])
+                line_y = y1
+            lines[-1].append((x0, word))
+        return "\n".join(" ".join(word for _, word in sorted(line)) for line in lines).strip()
+
+    def probe(self, sample_pages=PROBE_SAMPLE_PAGES):
+        layers = []
+        for index in _probe_sample(self.page_count, sample_pages):
+            page = self.doc[index]
+            has_text = bool(page.get_fonts()) and bool(_TEXT_OBJECT_RE.search(page.read_contents()))
+            layers.append((has_text, bool(page.get_images())))
+        return classify_pages(layers)
+
+
+class PymupdfEngine(PdfTextEngine):
+    name = "pymupdf"
+    package = "pymupdf"
+
+    def is_available(self):
+        return PYMUPDF_AVAILABLE
+
+    @contextmanager
+    def open(self, source):
+        if _is_stream(source):
+            doc = pymupdf.open(stream=source.read(), filetype="pdf")
+        else:
+            doc = pymupdf.open(str(source))
+        try:
+            yield _PymupdfDocument(doc)
+        finally:
+            doc.close()
+
+
+# ---------- pdfminer.six (optional) ----------
+
+class _PdfminerDocument(PdfDocument):
+    def __init__(self, document):
+        self.document = document
+        self.page_count = int(resolve1(resolve1(document.catalog["Pages"])["Count"]))
+
+    def _pages(self) -> Iterator[Tuple[int, object]]:
+        return enumerate(PDFPage.create_pages(self.document))
+
+    def iter_pages(self, indices):
+        wanted = sorted(set(indices))
+        if not wanted:
+            return
+        last = wanted[-1]
+        wanted_set = set(wanted)
+
+        rsrcmgr = PDFResourceManager()
+        device = PDFPageAggregator(rsrcmgr, laparams=LAParams())
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+
+        for index, page in self._pages():
+            if index > last:
+                break
+            if index not in wanted_set:
+                continue
+            interpreter.process_page(page)
+            layout = device.get_result()
+            text = "".join(obj.get_text() for obj in layout if isinstance(obj, LTTextContainer))
+            yield index + 1, text.strip()
+
+    def probe(self, sample_pages=PROBE_SAMPLE_PAGES):
+        sample = set(_probe_sample(self.page_count, sample_pages))
+        layers = []
+        for index, page in self._pages():
+            if index not in sample:
+                continue
+            resources = resolve1(page.resources) or {}
+            has_fonts = bool(resolve1(resources.get("Font")))
+            data = b"".join(resolve1(stream).get_data() for stream in (page.contents or []))
+            xobjects = resolve1(resources.get("XObject")) or {}
+            has_images = any(
+                getattr(resolve1(x), "attrs", {}).get("Subtype") is not None
+                and resolve1(x).attrs["Subtype"].name == "Image"
+                for x in xobjects.values()
+            )
+            layers.append((has_fonts and bool(_TEXT_OBJECT_RE.search(data)), has_images))
+            if len(layers) == len(sample):
+                break
+        return classify_pages(layers)
+
+
+class PdfminerEngine(PdfTextEngine):
+    name = "pdfminer"
+    package = "pdfminer.six"
+
+    def is_available(self):
+        return PDFMINER_AVAILABLE
+
+    @contextmanager
+    def open(self, source):
+        if _is_stream(source):
+            yield _PdfminerDocument(PDFDocument(PDFParser(source)))
+            return
+        with open(source, "rb") as fh:
+            yield _PdfminerDocument(PDFDocument(PDFParser(fh)))
+
+
+ENGINES: Dict[str, PdfTextEngine] = {
+    engine.name: engine
+    for engine in (PypdfEngine(), PymupdfEngine(), PdfminerEngine())
+}
+
+
+def get_engine(name: Optional[str] = None) -> PdfTextEngine:
+    """
+    Look up an engine by name (default: pypdf).
+
+    Raises:
+        ValueError: Unknown engine name
+    """
+    name = name or DEFAULT_ENGINE
+    if name not in ENGINES:
+        raise ValueError(f"Unknown PDF engine: {name} (choose from: {', '.join(ENGINES)})")
+    return ENGINES[name]
+
+
+def available_engines() -> List[str]:
+    """Names of engines whose package is installed."""
+    return [name for name, engine in ENGINES.items() if engine.is_available()]
@@ -1,53 +1,230 @@
 """
 Extract text from PDF files.
+
+Scanned documents without a text layer are detected up front by a cheap
+probe (probe_pdf_text_layer) so they fail fast instead of running text
+extraction over every page.
+
+Pages are read through a streaming iterator (iter_pdf_pages) that releases
+parsed page objects as it goes; page selection, boilerplate stripping and
+the token budget all consume it lazily, so memory stays bounded for
+300-500 page IMs.
+
+The text engine (pypdf by default) is pluggable, see src.fetch.pdf_engines.
 """
 
 from pathlib import Path
-from typing import Tuple, Union
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-try:
-    from pypdf import PdfReader
-    PYPDF_AVAILABLE = True
-except ImportError:
-    PYPDF_AVAILABLE = False
+from src.fetch.pdf_cleanup import CHARS_PER_TOKEN, clean_pdf_pages_stream, estimate_tokens, format_cleanup_stats
+from src.fetch.pdf_engines import (
+    get_engine,
+    PDF_KIND_TEXT,
+    PDF_KIND_IMAGE_ONLY,
+    PDF_KIND_MIXED,
+    PROBE_SAMPLE_PAGES,
+)
+from src.ingest.pdf_walker import iter_pdf_paths
+from src.ingest.manifest import ProcessingManifest, STATUS_SUCCESS, STATUS_FAILED, STATUS_IMAGE_ONLY
 
+# Manifest kept in the output folder by extract_text_from_pdf_folder
+TEXT_MANIFEST_NAME = ".pdf_text_manifest.json"
 
-def extract_text_from_pdf(pdf_path: Union[str, Path]) -> Tuple[bool, str, str]:
+IMAGE_ONLY_MESSAGE = "Image-only PDF (scanned, no text layer) - needs OCR"
+
+
+def probe_pdf_text_layer(
+    pdf_path: Union[str, Path],
+    sample_pages: int = PROBE_SAMPLE_PAGES,
+    engine: Optional[str] = None,
+) -> str:
     """
-    Extract text from a PDF file.
+    Classify a PDF as text, image-only or mixed by sampling a few pages.
+
+    Only content streams and font/image resources are inspected - no text
+    extraction - so this is cheap even for long scans. Pages that have
+    neither text nor images (blank pages) don't count either way.
+
+    Returns:
+        PDF_KIND_TEXT, PDF_KIND_IMAGE_ONLY or PDF_KIND_MIXED
+    """
+    with get_engine(engine).open(pdf_path) as doc:
+        return doc.probe(sample_pages)
+
+
+def _page_number(text: str, spec: str) -> int:
+    try:
+        number = int(text)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise ValueError(f"Invalid page selection {spec!r}: {text.strip()!r} is not a page number (e.g. 1-5,8,20-)")
+    return number
+
+
+def parse_page_selection(spec: Optional[str], page_count: int) -> List[int]:
+    """
+    Parse a page selection like "1-5,8,20-" into 0-based page indices.
+
+    Page numbers are 1-based and inclusive; open ranges ("20-", "-3") run to
+    the end/start of the document. Out-of-range pages are ignored.
+    None or "" selects every page. With page_count 0 this only checks the
+    syntax.
+
+    Raises:
+        ValueError: For a malformed spec (not a page number, a page below 1,
+            a range running backwards), naming the spec
+    """
+    if not spec:
+        return list(range(page_count))
+
+    selected = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start_s, end_s = part.split("-", 1)
+            start = _page_number(start_s, spec) if start_s.strip() else 1
+            end = _page_number(end_s, spec) if end_s.strip() else None
+            if end is not None and end < start:
+                raise ValueError(f"Invalid page selection {spec!r}: range {part!r} runs backwards")
+            if end is None:
+                end = page_count
+        else:
+            start = end = _page_number(part, spec)
+        selected.update(range(start - 1, min(end, page_count)))
+    return sorted(selected)
+
+
+def iter_pdf_pages(
+    pdf_path: Union[str, Path],
+    pages: Optional[str] = None,
+    engine: Optional[str] = None,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Stream (page_number, text) for each page of a PDF, one page at a time.
+
+    The file is read on demand rather than loaded whole, and parsed page
+    objects are released after each page.
 
     Args:
         pdf_path: Path to the PDF file
+        pages: Optional page selection (see parse_page_selection)
+        engine: Text engine name (see src.fetch.pdf_engines, default pypdf)
+    """
+    with get_engine(engine).open(pdf_path) as doc:
+        yield from doc.iter_pages(parse_page_selection(pages, doc.page_count))
+
+
+def limit_to_token_budget(
+    pages: Iterable[Tuple[int, str]],
+    max_tokens: Optional[int],
+    stats: Optional[Dict[str, Any]] = None,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Pass pages through until the (estimated) token budget is used up.
+
+    The page that crosses the budget is truncated and iteration stops, so
+    the remaining pages are never read. Sets stats["truncated_at_page"].
+    """
+    if not max_tokens:
+        yield from pages
+        return
+
+    remaining = max_tokens
+    for page_num, text in pages:
+        tokens = estimate_tokens(text)
+        if tokens <= remaining:
+            remaining -= tokens
+            yield page_num, text
+            continue
+
+        if stats is not None:
+            stats["truncated_at_page"] = page_num
+        if remaining > 0:
+            yield page_num, text[: remaining * CHARS_PER_TOKEN].rstrip()
+        return
+
+
+def extract_text_from_pdf(
+    pdf_path: Union[str, Path, BinaryIO],
+    clean: bool = False,
+    stats: Optional[Dict[str, Any]] = None,
+    pages: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+    engine: Optional[str] = None,
+) -> Tuple[bool, str, str]:
+    """
+    Extract text from a PDF file.
+
+    Args:
+        pdf_path: Path to the PDF file, or a binary file-like object (e.g. a
+            PDF read from a zip archive or email attachment into memory)
+        clean: Remove repeated headers/footers/page numbers and collapse
+            whitespace (see src.fetch.pdf_cleanup)
+        stats: Optional dict that receives the cleanup statistics and the
+            probe result ("pdf_kind")
+        pages: Optional page selection, e.g. "1-10,15" (see parse_page_selection)
+        max_tokens: Optional input token budget; pages past it are not read
+        engine: Text engine name (see src.fetch.pdf_engines, default pypdf)
 
     Returns:
         Tuple of (success, message, extracted_text)
+        - image-only PDFs fail immediately with IMAGE_ONLY_MESSAGE
     """
-    if not PYPDF_AVAILABLE:
-        return False, "pypdf not installed. Run: pip install pypdf", ""
+    try:
+        pdf_engine = get_engine(engine)
+    except ValueError as e:
+        return False, str(e), ""
+    if not pdf_engine.is_available():
+        return False, pdf_engine.install_hint, ""
+
+    if not hasattr(pdf_path, "read"):
+        pdf_path = Path(pdf_path)
 
-    pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            return False, f"PDF file not found: {pdf_path}", ""
 
-    if not pdf_path.exists():
-        return False, f"PDF file not found: {pdf_path}", ""
+        if not pdf_path.suffix.lower() == ".pdf":
+            return False, f"File is not a PDF: {pdf_path}", ""
 
-    if not pdf_path.suffix.lower() == ".pdf":
-        return False, f"File is not a PDF: {pdf_path}", ""
+    if stats is None:
+        stats = {}
 
     try:
-        reader = PdfReader(pdf_path)
-        text_parts = []
+        with pdf_engine.open(pdf_path) as doc:
+            page_count = doc.page_count
+
+            pdf_kind = doc.probe()
+            stats["pdf_kind"] = pdf_kind
+            if pdf_kind == PDF_KIND_IMAGE_ONLY:
+                return False, IMAGE_ONLY_MESSAGE, ""
 
-        for page_num, page in enumerate(reader.pages, start=1):
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(f"--- Page {page_num} ---")
-                text_parts.append(page_text.strip())
+            # Lazy chain: read page -> strip boilerplate -> apply budget
+            page_stream = doc.iter_pages(parse_page_selection(pages, page_count))
+            page_stream = (p for p in page_stream if p[1])
+            if clean:
+                page_stream = clean_pdf_pages_stream(page_stream, stats, page_count=page_count)
+            page_stream = limit_to_token_budget(page_stream, max_tokens, stats)
+
+            text_parts = []
+            for page_num, page_text in page_stream:
+                if page_text:
+                    text_parts.append(f"--- Page {page_num} ---")
+                    text_parts.append(page_text)
 
         if not text_parts:
             return False, "No text could be extracted from PDF", ""
 
+        message = f"Extracted {page_count} pages"
+        if clean:
+            message += f" ({format_cleanup_stats(stats)})"
+        if "truncated_at_page" in stats:
+            message += f" (token budget reached at page {stats['truncated_at_page']})"
+
         full_text = "\n\n".join(text_parts)
-        return True, f"Extracted {len(reader.pages)} pages", full_text
+        return True, message, full_text
 
     except Exception as e:
         return False, f"Error reading PDF: {e}", ""
@@ -56,17 +233,27 @@ def extract_text_from_pdf(pdf_path: Union[str, Path]) -> Tuple[bool, str, str]:
 def extract_text_from_pdf_folder(
     folder_path: Union[str, Path],
     output_folder: Union[str, Path, None] = None,
+    engine: Optional[str] = None,
+    incremental: bool = True,
+    retry_failed: bool = False,
 ) -> Tuple[int, int, list]:
     """
-    Extract text from all PDFs in a folder.
+    Extract text from new PDFs in a folder.
+
+    A manifest keyed by content hash (.pdf_text_manifest.json in the output
+    folder) records each outcome, so reruns skip PDFs whose text was already
+    extracted (as long as the .txt file is still there).
 
     Args:
         folder_path: Path to folder containing PDFs
         output_folder: Optional folder to save .txt files (defaults to same folder)
+        engine: Text engine name (default pypdf)
+        incremental: Skip PDFs already recorded in the manifest (default)
+        retry_failed: Also retry PDFs whose last extraction failed
 
     Returns:
         Tuple of (success_count, fail_count, results_list)
-        results_list contains dicts with {pdf_path, success, message, text_path}
+        results_list contains dicts with {pdf_path, success, message, pdf_kind, text_path}
     """
     folder_path = Path(folder_path)
     if not folder_path.is_dir():
@@ -75,22 +262,34 @@ def extract_text_from_pdf_folder(
     output_folder = Path(output_folder) if output_folder else folder_path
     output_folder.mkdir(parents=True, exist_ok=True)
 
-    pdf_files = list(folder_path.glob("*.pdf")) + list(folder_path.glob("*.PDF"))
+    pdf_files = list(iter_pdf_paths(folder_path, recursive=False))
 
     if not pdf_files:
         return 0, 0, [{"pdf_path": str(folder_path), "success": False, "message": "No PDF files found"}]
 
+    manifest = None
+    if incremental:
+        manifest = ProcessingManifest.load(output_folder / TEXT_MANIFEST_NAME)
+        pdf_files = [
+            p for p in pdf_files
+            if manifest.needs_processing(p, retry_failed) or (
+                manifest.status(p) == STATUS_SUCCESS and not (output_folder / f"{p.stem}.txt").exists()
+            )
+        ]
+
     success_count = 0
     fail_count = 0
     results = []
 
     for pdf_file in pdf_files:
-        ok, msg, text = extract_text_from_pdf(pdf_file)
+        pdf_stats: Dict[str, Any] = {}
+        ok, msg, text = extract_text_from_pdf(pdf_file, stats=pdf_stats, engine=engine)
 
         result = {
             "pdf_path": str(pdf_file),
             "success": ok,
             "message": msg,
+            "pdf_kind": pdf_stats.get("pdf_kind"),
         }
 
         if ok:
@@ -101,6 +300,18 @@ def extract_text_from_pdf_folder(
         else:
             fail_count += 1
 
+        if manifest is not None:
+            if ok:
+                status = STATUS_SUCCESS
+            elif result["pdf_kind"] == PDF_KIND_IMAGE_ONLY:
+                status = STATUS_IMAGE_ONLY
+            else:
+                status = STATUS_FAILED
+            manifest.record(pdf_file, status, "" if ok else msg)
+
         results.append(result)
 
+    if manifest is not None:
+        manifest.save()
+
     return success_count, fail_count, results
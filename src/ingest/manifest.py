@@ -0,0 +1,149 @@
+"""
+Persistent manifest of processed files, keyed by content hash.
+
+Batch runs over a growing folder (the shared deal inbox) record each PDF's
+SHA-256 and outcome here, so a rerun only processes new or changed files:
+
+- a file whose hash has an entry is skipped (renaming it doesn't matter)
+- an edited file gets a new hash and is processed again
+- failed files are retried only on request (retry_failed)
+- image-only files need OCR, so retrying them is pointless and they stay
+  skipped until the file changes
+
+Hashes are cached by (size, mtime) per file path, so unchanged files are
+not re-read on every run. Documents that don't live on disk as their own
+file (zip members, email attachments) are recorded by hash directly with
+record_hash.
+
+The manifest is a JSON file written atomically (temp file + rename).
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+MANIFEST_VERSION = 1
+
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+STATUS_IMAGE_ONLY = "image-only"
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """SHA-256 of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ProcessingManifest:
+    """
+    Outcome of every processed file, keyed by content hash.
+
+    Usage:
+        manifest = ProcessingManifest.load(folder / ".deal_manifest.json")
+        for path in manifest.pending(pdf_files):
+            ...
+            manifest.record(path, STATUS_SUCCESS)
+        manifest.save()
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        # sha256 -> {"file", "status", "message", "processed_at"}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # absolute file path -> {"size", "mtime_ns", "sha256"} (hash cache)
+        self.files: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ProcessingManifest":
+        """Load a manifest; a missing or unreadable file gives an empty one."""
+        manifest = cls(path)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return manifest
+        if data.get("version") == MANIFEST_VERSION:
+            manifest.entries = data.get("entries", {})
+            manifest.files = data.get("files", {})
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": MANIFEST_VERSION, "entries": self.entries, "files": self.files}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=1, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def cached_hash(self, path: Union[str, Path]) -> Optional[str]:
+        """Cached content hash if the file is unchanged since it was hashed, else None."""
+        path = Path(path)
+        cached = self.files.get(str(path.absolute()))
+        if not cached:
+            return None
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        if cached["size"] == st.st_size and cached["mtime_ns"] == st.st_mtime_ns:
+            return cached["sha256"]
+        return None
+
+    def hash_of(self, path: Union[str, Path]) -> str:
+        """Content hash of a file, reusing the cached hash if size and mtime match."""
+        sha = self.cached_hash(path)
+        if sha is not None:
+            return sha
+        path = Path(path)
+        st = path.stat()
+        sha = file_sha256(path)
+        self.files[str(path.absolute())] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": sha}
+        return sha
+
+    def status(self, path: Union[str, Path]) -> Optional[str]:
+        """Recorded status for the file's current content, or None if unseen."""
+        return self.status_of_hash(self.hash_of(path))
+
+    def status_of_hash(self, sha256: str) -> Optional[str]:
+        entry = self.entries.get(sha256)
+        return entry["status"] if entry else None
+
+    def needs_processing(self, path: Union[str, Path], retry_failed: bool = False) -> bool:
+        return self.hash_needs_processing(self.hash_of(path), retry_failed)
+
+    def hash_needs_processing(self, sha256: str, retry_failed: bool = False) -> bool:
+        status = self.status_of_hash(sha256)
+        return status is None or (retry_failed and status == STATUS_FAILED)
+
+    def pending(self, paths: Iterable[Path], retry_failed: bool = False) -> List[Path]:
+        """Files (in the given order) that are new, changed, or failed and being retried."""
+        return [p for p in paths if self.needs_processing(p, retry_failed)]
+
+    def record(self, path: Union[str, Path], status: str, message: str = "") -> None:
+        """Record the outcome for the file's current content."""
+        path = Path(path)
+        self.record_hash(self.hash_of(path), path.name, status, message)
+
+    def record_hash(self, sha256: str, name: str, status: str, message: str = "") -> None:
+        """Record the outcome for a document by content hash (e.g. an archive member)."""
+        self.entries[sha256] = {
+            "file": name,
+            "status": status,
+            "message": message,
+            "processed_at": datetime.now().isoformat(timespec="seconds"),
+        }
+
+    def counts(self) -> Dict[str, int]:
+        """Number of entries per status."""
+        counts: Dict[str, int] = {}
+        for entry in self.entries.values():
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return counts
@@ -0,0 +1,274 @@
+"""
+Random access to the rows of a large TSV through a memory map and a row offset index.
+
+Re-checking a few rows of a consolidated deal TSV shouldn't mean parsing
+all of it. MappedTsv maps the file and keeps the byte offset where each
+row starts in an array of 64-bit integers (8 bytes per row); a row or a
+range of rows is decoded on demand, the rest of the file is never read.
+
+The rows are read_tsv's rows: lines are split as str.splitlines splits
+them, blank lines are skipped, the first line is the header and short
+rows are padded. Row 0 is the first data row.
+
+Building the index reads the file once. It is cached beside the file
+(<name>.rowidx) with the file's size and mtime, and rebuilt when either
+changes. Writes are atomic (temp file + rename); if the directory is
+read-only the index is only kept in memory.
+
+Compressed (.gz, .zst) files can't be mapped; read them with iter_tsv.
+"""
+
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from src.compact_row import row_layout
+from src.compressed_io import compression_for
+from src.ingest.read_tsv import parse_tsv_line
+
+# Bump when the index file layout changes
+ROW_INDEX_VERSION = 1
+
+INDEX_SUFFIX = ".rowidx"
+
+# magic, version, source size, source mtime_ns, offset count
+_INDEX_HEADER = struct.Struct("<8sqqqq")
+_INDEX_MAGIC = b"ROWINDEX"
+
+# What str.splitlines splits on, as UTF-8 bytes (\r\n first: one boundary)
+_LINE_END = re.compile(rb"\r\n|[\n\r\v\f\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+
+def index_path_for(path: Path) -> Path:
+    """Where the row index of a TSV is cached: beside it, <name>.rowidx."""
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+# Line ends other than \n and \r\n
+_RARE_LINE_ENDS = (b"\v", b"\f", b"\x1c", b"\x1d", b"\x1e", b"\xc2\x85", b"\xe2\x80\xa8", b"\xe2\x80\xa9")
+
+# ASCII characters str.strip() removes
+_ASCII_SPACES = b" \t\n\r\v\f\x1c\x1d\x1e\x1f"
+
+# Bytes scanned at a time; blocks end after a \n
+_SCAN_BLOCK = 8 * 1024 * 1024
+
+
+def _has_content(line: bytes) -> bool:
+    """Not blank as read_tsv sees it (str.strip() also strips \x1f and non-ASCII spaces)."""
+    stripped = line.strip()
+    if not stripped:
+        return False
+    if stripped.isascii():
+        return bool(stripped.translate(None, _ASCII_SPACES))
+    return bool(stripped.decode("utf-8").strip())
+
+
+def _only_newlines(block: bytes) -> bool:
+    """True if every line end in block is \n or \r\n."""
+    return block.count(b"\r") == block.count(b"\r\n") and not any(end in block for end in _RARE_LINE_ENDS)
+
+
+def build_row_offsets(data: Any) -> array:
+    """
+    Start offsets of a TSV's non-blank lines, the header's first.
+
+    Args:
+        data: The file's bytes (bytes or an mmap)
+
+    Returns:
+        array("q") of byte offsets
+    """
+    offsets = array("q")
+    end_of_data = len(data)
+    start = 0
+    while start < end_of_data:
+        cut = data.rfind(b"\n", start, start + _SCAN_BLOCK)
+        stop = cut + 1 if cut >= 0 and start + _SCAN_BLOCK < end_of_data else end_of_data
+        block = data[start:stop]
+        if _only_newlines(block):
+            # Common case: split in C; a \r before the \n is stripped as space
+            pos = start
+            for line in block.split(b"\n"):
+                if _has_content(line):
+                    offsets.append(pos)
+                pos += len(line) + 1
+        else:
+            pos = 0
+            while pos < len(block):
+                match = _LINE_END.search(block, pos)
+                end = match.start() if match else len(block)
+                if _has_content(block[pos:end]):
+                    offsets.append(start + pos)
+                pos = match.end() if match else len(block)
+        start = stop
+    return offsets
+
+
+def _read_index(index_path: Path, size: int, mtime_ns: int) -> Optional[array]:
+    try:
+        with open(index_path, "rb") as f:
+            header = f.read(_INDEX_HEADER.size)
+            magic, version, idx_size, idx_mtime, count = _INDEX_HEADER.unpack(header)
+            if (magic, version, idx_size, idx_mtime) != (_INDEX_MAGIC, ROW_INDEX_VERSION, size, mtime_ns):
+                return None
+            offsets = array("q")
+            offsets.fromfile(f, count)
+    except (OSError, struct.error, EOFError):  # missing, truncated or foreign
+        return None
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return offsets
+
+
+def _write_index(index_path: Path, offsets: array, size: int, mtime_ns: int) -> bool:
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    data = array("q", offsets)
+    if sys.byteorder != "little":
+        data.byteswap()
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, ROW_INDEX_VERSION, size, mtime_ns, len(data)))
+            data.tofile(f)
+        os.replace(tmp_path, index_path)
+        return True
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+
+
+def load_row_offsets(
+    path: Path,
+    data: Optional[Any] = None,
+    index_path: Optional[Path] = None,
+    stats: Optional[Dict[str, int]] = None,
+) -> array:
+    """
+    The row offsets of a TSV (see build_row_offsets), from the cached index when current.
+
+    Args:
+        path: TSV file
+        data: The file's bytes or mmap, if already open (else read here
+            when the index has to be built)
+        index_path: Index file (default: index_path_for(path))
+        stats: Optional dict; "index_hits" or "index_built" is incremented
+
+    Returns:
+        array("q") of byte offsets, the header's first
+    """
+    if stats is None:
+        stats = {}
+    if index_path is None:
+        index_path = index_path_for(path)
+    st = path.stat()
+
+    offsets = _read_index(index_path, st.st_size, st.st_mtime_ns)
+    if offsets is not None:
+        stats["index_hits"] = stats.get("index_hits", 0) + 1
+        return offsets
+
+    stats["index_built"] = stats.get("index_built", 0) + 1
+    offsets = build_row_offsets(data if data is not None else path.read_bytes())
+    _write_index(index_path, offsets, st.st_size, st.st_mtime_ns)
+    return offsets
+
+
+class MappedTsv:
+    """
+    A TSV's rows by number, decoded on demand from a memory map.
+
+    mapped[i] is a row, mapped[i:j] a list of rows, len(mapped) the row
+    count. Use as a context manager (or call close()) to release the map.
+
+    Attributes:
+        path: The TSV file
+        headers: Column names
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        compact: bool = False,
+        index_path: Optional[Path] = None,
+        stats: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Args:
+            path: TSV file
+            compact: Return CompactRows (sharing the header's layout) instead of dicts
+            index_path: Index file (default: <path>.rowidx beside the file)
+            stats: Optional dict, see load_row_offsets
+
+        Raises:
+            ValueError: For a compressed file
+        """
+        self.path = Path(path)
+        if compression_for(self.path) is not None:
+            raise ValueError(f"Can't memory-map a compressed file, read it with iter_tsv: {self.path}")
+        self._file = open(self.path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # An empty file can't be mapped; it has no header and no rows
+        self._data: Any = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._offsets = load_row_offsets(self.path, self._data, index_path, stats)
+
+        self.headers: List[str] = self._line(0).split("\t") if self._offsets else []
+        self._layout = row_layout(self.headers) if compact else None
+
+    def __len__(self) -> int:
+        return max(len(self._offsets) - 1, 0)
+
+    def _line(self, k: int) -> str:
+        """The k-th non-blank line (0 = header), without its line end."""
+        start = self._offsets[k]
+        match = _LINE_END.search(self._data, start)
+        end = match.start() if match else len(self._data)
+        return self._data[start:end].decode("utf-8")
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self.rows(start, stop)
+        i = key + len(self) if key < 0 else key
+        if not 0 <= i < len(self):
+            raise IndexError("row index out of range")
+        return parse_tsv_line(self._line(i + 1), self.headers, self._layout)
+
+    def rows(self, start: int, stop: int) -> List[Any]:
+        """
+        Rows start..stop-1, decoded in one piece.
+
+        Args:
+            start: First row number (0-based, clamped to the file)
+            stop: Row number after the last (clamped)
+        """
+        start, stop = max(start, 0), min(stop, len(self))
+        if start >= stop:
+            return []
+        begin = self._offsets[start + 1]
+        last = self._offsets[stop]
+        match = _LINE_END.search(self._data, last)
+        end = match.start() if match else len(self._data)
+        text = self._data[begin:end].decode("utf-8")
+        lines = [ln for ln in text.splitlines() if ln.strip() != ""]
+        return [parse_tsv_line(ln, self.headers, self._layout) for ln in lines]
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedTsv":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
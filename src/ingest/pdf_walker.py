@@ -0,0 +1,248 @@
+"""
+Bulk PDF discovery: nested folders, zip archives and saved emails.
+
+iter_pdf_documents walks a folder tree and yields every PDF it finds as a
+PdfSource, lazily, in a stable (sorted) order:
+
+- plain .pdf files (suffix matched case-insensitively, so each file is
+  found once on any filesystem)
+- .pdf members of .zip archives, including zips nested in zips
+- .pdf attachments of saved .eml files, including zipped attachments
+  and forwarded messages
+
+Archive members and attachments are read into memory and never written to
+disk. Every document is hashed (SHA-256) and duplicates are dropped, so the
+same teaser arriving as a file, in a zip and attached to an email is only
+yielded once.
+
+Files that can't be read (permissions, vanished mid-walk, broken links)
+and archives that can't be parsed are counted as skipped; the walk goes on.
+"""
+
+import email
+import email.errors
+import email.policy
+import hashlib
+import io
+import os
+import zipfile
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, Set, Union
+
+from src.ingest.manifest import file_sha256
+
+# Separator between an archive and a member in PdfSource.name
+MEMBER_SEP = "!"
+
+# Zip members larger than this (uncompressed) are skipped, not read into memory
+MAX_MEMBER_BYTES = 200 * 1024 * 1024
+
+# How deep zips/emails may nest inside each other
+MAX_ARCHIVE_DEPTH = 3
+
+PDF_MAGIC = b"%PDF-"
+
+# What a malformed .eml can raise while parsed or decoded
+EML_ERRORS = (email.errors.MessageError, ValueError, LookupError)
+
+
+class PdfSource:
+    """
+    A discovered PDF: either a file on disk (path) or bytes in memory (data).
+
+    name is a display name relative to the walk root; archive members look
+    like "2024/deals.zip!Teaser Solna.pdf".
+    """
+
+    def __init__(self, name: str, sha256: str, path: Optional[Path] = None, data: Optional[bytes] = None):
+        self.name = name
+        self.sha256 = sha256
+        self.path = path
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"PdfSource({self.name!r})"
+
+    @property
+    def in_memory(self) -> bool:
+        return self.data is not None
+
+    def pdf_input(self) -> Union[Path, BinaryIO]:
+        """What to hand to extract_text_from_pdf: the path, or a stream over the bytes."""
+        if self.path is not None:
+            return self.path
+        return io.BytesIO(self.data)
+
+
+def _suffix(name: str) -> str:
+    return os.path.splitext(name)[1].lower()
+
+
+def iter_pdf_paths(root: Union[str, Path], recursive: bool = True) -> Iterator[Path]:
+    """
+    Yield .pdf files under root (any case), sorted per directory.
+
+    Hidden files and directories (".name") are skipped.
+    """
+    return (path for path in _iter_files(Path(root), recursive) if _suffix(path.name) == ".pdf")
+
+
+def iter_pdf_documents(
+    root: Union[str, Path],
+    recursive: bool = True,
+    include_archives: bool = True,
+    seen: Optional[Set[str]] = None,
+    stats: Optional[Dict[str, Any]] = None,
+    hasher: Callable[[Path], str] = file_sha256,
+) -> Iterator[PdfSource]:
+    """
+    Stream every unique PDF under root, including those inside zips and emails.
+
+    Args:
+        root: Folder to walk (a single .pdf/.zip/.eml file also works)
+        recursive: Descend into subfolders (default)
+        include_archives: Look inside .zip and .eml files (default)
+        seen: Hashes already seen; duplicates of these are skipped. Updated
+            in place, so it can be shared across calls.
+        stats: Optional dict updated with found, duplicates and skipped counts
+        hasher: Hash function for files on disk (e.g. ProcessingManifest.hash_of
+            to reuse its cache)
+
+    Yields:
+        PdfSource, in discovery order
+    """
+    root = Path(root)
+    if seen is None:
+        seen = set()
+    if stats is None:
+        stats = {}
+    for key in ("found", "duplicates", "skipped"):
+        stats.setdefault(key, 0)
+
+    if root.is_file():
+        files = [root]
+        base = root.parent
+    else:
+        base = root
+        files = _iter_files(root, recursive)
+
+    for path in files:
+        suffix = _suffix(path.name)
+        name = path.relative_to(base).as_posix()
+        if suffix == ".pdf":
+            try:
+                sha256 = hasher(path)
+            except OSError:
+                stats["skipped"] += 1
+                continue
+            yield from _emit(PdfSource(name, sha256, path=path), seen, stats)
+        elif include_archives and suffix == ".zip":
+            try:
+                with zipfile.ZipFile(path) as zf:
+                    yield from _iter_zip(zf, name, 1, seen, stats)
+            except (zipfile.BadZipFile, OSError):
+                stats["skipped"] += 1
+        elif include_archives and suffix == ".eml":
+            try:
+                with open(path, "rb") as fh:
+                    yield from _iter_eml(fh, name, 1, seen, stats)
+            except (OSError, *EML_ERRORS):
+                stats["skipped"] += 1
+
+
+def _iter_files(root: Path, recursive: bool) -> Iterator[Path]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith(".")) if recursive else []
+        for filename in sorted(filenames):
+            if not filename.startswith("."):
+                yield Path(dirpath) / filename
+
+
+def _emit(source: PdfSource, seen: Set[str], stats: Dict[str, Any]) -> Iterator[PdfSource]:
+    if source.sha256 in seen:
+        stats["duplicates"] += 1
+        return
+    seen.add(source.sha256)
+    stats["found"] += 1
+    yield source
+
+
+def _memory_source(name: str, data: bytes, seen: Set[str], stats: Dict[str, Any]) -> Iterator[PdfSource]:
+    if not data.startswith(PDF_MAGIC):
+        stats["skipped"] += 1
+        return
+    yield from _emit(PdfSource(name, hashlib.sha256(data).hexdigest(), data=data), seen, stats)
+
+
+def _iter_zip(zf: zipfile.ZipFile, name: str, depth: int, seen: Set[str], stats: Dict[str, Any]) -> Iterator[PdfSource]:
+    for info in sorted(zf.infolist(), key=lambda i: i.filename):
+        if info.is_dir():
+            continue
+        suffix = _suffix(info.filename)
+        if suffix not in (".pdf", ".zip", ".eml"):
+            continue
+        if info.file_size > MAX_MEMBER_BYTES or (suffix != ".pdf" and depth >= MAX_ARCHIVE_DEPTH):
+            stats["skipped"] += 1
+            continue
+
+        member_name = f"{name}{MEMBER_SEP}{info.filename}"
+        try:
+            data = zf.read(info)
+        except (zipfile.BadZipFile, RuntimeError, OSError):  # corrupt or encrypted
+            stats["skipped"] += 1
+            continue
+
+        if suffix == ".pdf":
+            yield from _memory_source(member_name, data, seen, stats)
+        elif suffix == ".zip":
+            try:
+                with zipfile.ZipFile(io.BytesIO(data)) as inner:
+                    yield from _iter_zip(inner, member_name, depth + 1, seen, stats)
+            except zipfile.BadZipFile:
+                stats["skipped"] += 1
+        else:
+            try:
+                yield from _iter_eml(io.BytesIO(data), member_name, depth + 1, seen, stats)
+            except EML_ERRORS:
+                stats["skipped"] += 1
+
+
+def _iter_eml(fh: BinaryIO, name: str, depth: int, seen: Set[str], stats: Dict[str, Any]) -> Iterator[PdfSource]:
+    message = email.message_from_binary_file(fh, policy=email.policy.default)
+    # walk() also descends into attached (forwarded) messages
+    for part in message.walk():
+        if part.is_multipart():
+            continue
+        filename = part.get_filename() or ""
+        suffix = _suffix(filename)
+        content_type = part.get_content_type()
+        if content_type == "application/pdf" and not suffix:
+            suffix = ".pdf"
+            filename = filename or "attachment.pdf"
+        if suffix not in (".pdf", ".zip"):
+            continue
+
+        data = part.get_payload(decode=True)
+        if not data:
+            continue
+        member_name = f"{name}{MEMBER_SEP}{filename}"
+        if suffix == ".pdf":
+            yield from _memory_source(member_name, data, seen, stats)
+        elif depth < MAX_ARCHIVE_DEPTH:
+            try:
+                with zipfile.ZipFile(io.BytesIO(data)) as inner:
+                    yield from _iter_zip(inner, member_name, depth + 1, seen, stats)
+            except zipfile.BadZipFile:
+                stats["skipped"] += 1
+        else:
+            stats["skipped"] += 1
+
+
+def format_walk_stats(stats: Dict[str, Any]) -> str:
+    """One-line summary, e.g. '12 PDFs found, 3 duplicates dropped'."""
+    text = f"{stats.get('found', 0)} PDFs found"
+    if stats.get("duplicates"):
+        text += f", {stats['duplicates']} duplicates dropped"
+    if stats.get("skipped"):
+        text += f", {stats['skipped']} unreadable files or archive entries skipped"
+    return text
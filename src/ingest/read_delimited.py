@@ -0,0 +1,228 @@
+"""
+Delimited text exports (CSV, TSV, semicolon-separated) read with the csv module.
+
+read_tsv splits lines on tabs as written by write_tsv, which never quotes.
+Spreadsheet exports do quote: "Price, MSEK" in a comma-separated file, a
+comment with a line break or a tab inside quotes. These are read here with
+the C csv reader, one record at a time:
+
+- iter_delimited: streaming rows (dicts or CompactRows), like iter_tsv
+- read_delimited: the same rows as a list
+- read_columns: columnar, field -> list of values, optionally only some fields
+
+The delimiter and the encoding are detected from the start of the file
+unless given (sniff_format); .gz and .zst files are decompressed as they
+are read (see src.compressed_io). Records whose cells are all blank are skipped
+and short records padded, as read_tsv does. Exports with title or group
+rows above the header (the "Deal list" sheets) take skip_rows.
+"""
+
+import codecs
+import csv
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.compact_row import row_layout
+from src.compressed_io import open_binary, open_text, uncompressed_suffix
+
+# Delimiters tried by sniff_format, preferred in this order on a tie
+DELIMITERS = ("\t", ",", ";", "|")
+
+# Bytes read from the start of a file to detect its format
+SNIFF_BYTES = 64 * 1024
+
+# Records of the sample used to pick the delimiter
+SNIFF_RECORDS = 50
+
+# Byte order marks, longest first (UTF-32 LE starts with the UTF-16 LE mark)
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Fallback for files that aren't UTF-8: Excel's "CSV" on Western European Windows
+FALLBACK_ENCODING = "cp1252"
+
+
+def detect_encoding(sample: bytes) -> str:
+    """
+    Encoding of a file from its first bytes: the byte order mark if any,
+    else UTF-8 if the sample decodes as UTF-8, else cp1252.
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    try:
+        # Incremental: a character cut off at the end of the sample is not an error
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+    return "utf-8"
+
+
+def detect_delimiter(sample: str, default: str = "\t") -> str:
+    """
+    The delimiter that splits the sample's records into the most consistent
+    number of fields (more than one).
+
+    Args:
+        sample: Start of the file's text; a last, cut-off line is ignored
+        default: Returned if no candidate splits any record
+
+    Returns:
+        One of DELIMITERS, or default
+    """
+    lines = sample.splitlines(keepends=True)
+    if len(lines) > 1 and not lines[-1].endswith(("\n", "\r")):
+        lines.pop()
+    best: Tuple[float, int, int] = (0.0, 0, 0)
+    choice = default
+    for rank, delimiter in enumerate(DELIMITERS):
+        try:
+            widths = [len(record) for _, record in zip(range(SNIFF_RECORDS), csv.reader(lines, delimiter=delimiter))]
+        except csv.Error:
+            continue
+        if not widths:
+            continue
+        width, count = Counter(widths).most_common(1)[0]
+        if width < 2:
+            continue
+        # Most records with the modal width, then more fields, then DELIMITERS order
+        score = (count / len(widths), width, -rank)
+        if score > best:
+            best, choice = score, delimiter
+    return choice
+
+
+def sniff_format(path: Path) -> Tuple[str, str]:
+    """
+    Detect a delimited file's format from its first SNIFF_BYTES bytes.
+
+    Returns:
+        (delimiter, encoding); the delimiter defaults to "," for .csv files
+        and to a tab otherwise
+    """
+    with open_binary(path) as f:
+        raw = f.read(SNIFF_BYTES)
+    encoding = detect_encoding(raw)
+    sample = codecs.getincrementaldecoder(encoding)(errors="replace").decode(raw, final=False)
+    default = "," if uncompressed_suffix(path) == ".csv" else "\t"
+    return detect_delimiter(sample, default), encoding
+
+
+def iter_records(
+    path: Path,
+    delimiter: Optional[str] = None,
+    encoding: Optional[str] = None,
+    skip_rows: int = 0,
+) -> Iterator[List[str]]:
+    """
+    Yields a delimited file's records as lists of strings, the header first.
+
+    Args:
+        path: CSV/TSV file
+        delimiter: Field delimiter (default: detected)
+        encoding: Text encoding (default: detected)
+        skip_rows: Records to skip before the header (title or group rows)
+
+    Records whose cells are all blank are skipped (after skip_rows).
+    """
+    if delimiter is None or encoding is None:
+        sniffed_delimiter, sniffed_encoding = sniff_format(path)
+        delimiter = delimiter or sniffed_delimiter
+        encoding = encoding or sniffed_encoding
+    with open_text(path, encoding=encoding, newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        for _ in zip(range(skip_rows), reader):
+            pass
+        for record in reader:
+            if "".join(record).strip():
+                yield record
+
+
+def iter_delimited(
+    path: Path,
+    delimiter: Optional[str] = None,
+    encoding: Optional[str] = None,
+    skip_rows: int = 0,
+    compact: bool = False,
+) -> Iterator[Any]:
+    """
+    Yields the rows of a delimited file whose first (non-skipped) record is
+    the header, one at a time: dicts of strings, or CompactRows sharing the
+    header's layout with compact=True. Arguments as in iter_records.
+    """
+    records = iter_records(path, delimiter, encoding, skip_rows)
+    headers = next(records, None)
+    if headers is None:
+        return
+    width = len(headers)
+    layout = row_layout(headers) if compact else None
+    for record in records:
+        # pad to length
+        if len(record) < width:
+            record += [""] * (width - len(record))
+        if layout is not None:
+            yield layout.row(record[:width])
+        else:
+            yield dict(zip(headers, record))
+
+
+def read_delimited(
+    path: Path,
+    delimiter: Optional[str] = None,
+    encoding: Optional[str] = None,
+    skip_rows: int = 0,
+    compact: bool = False,
+) -> List[Any]:
+    """All rows of a delimited file; see iter_delimited."""
+    return list(iter_delimited(path, delimiter, encoding, skip_rows, compact))
+
+
+def read_columns(
+    path: Path,
+    columns: Optional[Sequence[str]] = None,
+    delimiter: Optional[str] = None,
+    encoding: Optional[str] = None,
+    skip_rows: int = 0,
+) -> Dict[str, List[str]]:
+    """
+    A delimited file by column: field -> values in row order.
+
+    Only the requested columns are kept, so reading two columns of a wide
+    export holds two lists, not every row.
+
+    Args:
+        path: CSV/TSV file
+        columns: Fields to read, in the returned order (default: all, in
+            header order)
+        delimiter, encoding, skip_rows: As in iter_records
+
+    Returns:
+        field -> list of values ("" where a record is short)
+
+    Raises:
+        ValueError: A requested column is not in the header
+    """
+    records = iter_records(path, delimiter, encoding, skip_rows)
+    headers = next(records, None) or []
+    # A repeated column name resolves to its last position, as in a row dict
+    index = {name: i for i, name in enumerate(headers)}
+    wanted = list(index) if columns is None else list(columns)
+    missing = [name for name in wanted if name not in index]
+    if missing:
+        raise ValueError(f"Columns not in the header of {path}: {', '.join(map(repr, missing))}")
+
+    positions = [index[name] for name in wanted]
+    values: List[List[str]] = [[] for _ in wanted]
+    width = len(headers)
+    for record in records:
+        if len(record) < width:
+            record += [""] * (width - len(record))
+        for column, i in zip(values, positions):
+            column.append(record[i])
+    return dict(zip(wanted, values))
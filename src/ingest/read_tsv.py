@@ -1,26 +1,78 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Iterator, List, Optional
 
+from src.compact_row import RowLayout, row_layout
+from src.compressed_io import open_text
 
-def read_tsv(path: Path) -> List[Dict[str, str]]:
+# Rows per chunk when streaming a TSV (iter_tsv_chunks)
+DEFAULT_CHUNK_ROWS = 10_000
+
+
+def iter_tsv_lines(path: Path) -> Iterator[str]:
     """
-    Reads a TSV where the first row is headers.
-    Returns list of row dicts (all values as strings).
+    Yields the non-blank lines of a TSV, header first, without line endings.
+    A .gz or .zst file is decompressed as it is read.
     """
-    text = path.read_text(encoding="utf-8")
-    lines = [ln for ln in text.splitlines() if ln.strip() != ""]
-    if not lines:
-        return []
+    with open_text(path) as f:
+        for physical in f:
+            # Split like str.splitlines on the whole text (\v, \f, \x1c, \u2028, ...)
+            for ln in physical.splitlines():
+                if ln.strip() != "":
+                    yield ln
+
 
-    headers = lines[0].split("\t")
-    rows: List[Dict[str, str]] = []
+def parse_tsv_line(ln: str, headers: List[str], layout: Optional[RowLayout] = None) -> Any:
+    """
+    One data line as a row dict, or a CompactRow if layout (the header's) is given.
+    Short lines are padded with empty values.
+    """
+    parts = ln.split("\t")
+    # pad to length
+    if len(parts) < len(headers):
+        parts += [""] * (len(headers) - len(parts))
+    if layout is not None:
+        return layout.row(parts[:len(headers)])
+    return {h: parts[i] for i, h in enumerate(headers)}
+
+
+def iter_tsv(path: Path, compact: bool = False) -> Iterator[Any]:
+    """
+    Yields the rows of a TSV where the first row is headers, one at a time.
+    Same rows as read_tsv, without holding the file in memory.
+    """
+    lines = iter_tsv_lines(path)
+    header = next(lines, None)
+    if header is None:
+        return
+    headers = header.split("\t")
+    layout = row_layout(headers) if compact else None
+    for ln in lines:
+        yield parse_tsv_line(ln, headers, layout)
 
-    for ln in lines[1:]:
-        parts = ln.split("\t")
-        # pad to length
-        if len(parts) < len(headers):
-            parts += [""] * (len(headers) - len(parts))
-        row = {h: parts[i] for i, h in enumerate(headers)}
-        rows.append(row)
 
-    return rows
+def iter_tsv_chunks(path: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS, compact: bool = True) -> Iterator[List[Any]]:
+    """
+    Yields the rows of a TSV in lists of up to chunk_rows rows.
+
+    Compact rows by default: the chunks of a file share one layout.
+    """
+    chunk: List[Any] = []
+    for row in iter_tsv(path, compact):
+        chunk.append(row)
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def read_tsv(path: Path, compact: bool = False) -> List[Any]:
+    """
+    Reads a TSV where the first row is headers.
+    Returns list of row dicts (all values as strings).
+
+    With compact=True the rows are CompactRows sharing one layout (the
+    header): same dict interface, a fraction of the memory for large files.
+    .gz and .zst files are decompressed (see iter_tsv_lines).
+    """
+    return list(iter_tsv(path, compact))
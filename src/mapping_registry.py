@@ -0,0 +1,191 @@
+"""
+Hot-reloadable normalization mappings for long-running processes.
+
+The watcher runs for days; without this, edits to property_type_map.yml,
+city_names.yml or country_synonyms.yml need a restart, which drops queued
+rows and every warm cache. MappingRegistry instead:
+
+- checks the files' (mtime, size) on a background thread
+- rebuilds a changed snapshot there (YAML parse, synonym automaton,
+  city/country tables), off the normalization path
+- swaps the new snapshot in with one reference assignment and bumps its
+  version number
+
+Readers never lock. The property map is read once per document
+(property_map()), so a document started with snapshot N finishes with
+snapshot N's property types. The city and country tables are installed
+process-wide (install_city_names, install_country_synonyms) and swapped
+at once: rows normalized after a reload use the new tables, even within a
+document already in progress. Without a registry, the normalizers read
+the override files once, at first use (see src.resources). Memoized
+normalizer results are keyed by mapping content
+(see src.normalize.memo.VersionedMapping), so results computed from an old
+version are simply never looked up again and age out of the LRU; nothing
+has to be cleared while rows are in flight.
+
+A file that fails to load (e.g. a YAML syntax error mid-edit) is reported
+and the previous snapshot stays in use until the file is fixed.
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.compiled_config import load_compiled_mapping
+from src.normalize.city_normalizer import compile_city_names, install_city_names
+from src.normalize.country_normalizer import compile_country_synonyms, install_country_synonyms
+from src.normalize.load_mappings import load_overrides
+from src.normalize.memo import VersionedMapping
+from src.paths import CITY_NAMES_PATH, COUNTRY_SYNONYMS_PATH, PROPERTY_MAP_PATH, resolve_config_path
+
+# Seconds between change checks on the background thread
+DEFAULT_RELOAD_INTERVAL = 2.0
+
+
+def _signature(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size), or None for a missing file."""
+    try:
+        st = os.stat(resolve_config_path(path))
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class MappingSnapshot:
+    """One consistent set of mappings. Not modified after it is published."""
+
+    __slots__ = ("version", "property_map", "city_names", "country_synonyms", "signatures")
+
+    def __init__(
+        self,
+        version: int,
+        property_map: Dict[str, Any],
+        city_names: VersionedMapping,
+        country_synonyms: VersionedMapping,
+        signatures: Dict[str, Optional[Tuple[int, int]]],
+    ):
+        self.version = version
+        self.property_map = property_map
+        self.city_names = city_names
+        self.country_synonyms = country_synonyms
+        self.signatures = signatures
+
+
+class MappingRegistry:
+    """
+    The current mapping snapshot, reloaded when its files change.
+
+    Call check() to reload on demand, or start() to check every interval
+    seconds on a daemon thread (stop() ends it). Snapshots are installed
+    process-wide: normalize_city/normalize_country use the registry's
+    tables, and property_map() is what callers pass to the row normalizers.
+    """
+
+    def __init__(
+        self,
+        property_map_path: str = PROPERTY_MAP_PATH,
+        city_names_path: str = CITY_NAMES_PATH,
+        country_synonyms_path: str = COUNTRY_SYNONYMS_PATH,
+        log: Callable[[str], None] = print,
+    ):
+        self.paths = {
+            "property_map": property_map_path,
+            "city_names": city_names_path,
+            "country_synonyms": country_synonyms_path,
+        }
+        self.log = log
+        self.stats = {"checks": 0, "reloads": 0, "errors": 0}
+        self.last_error: Optional[str] = None
+
+        # Serializes rebuilds; readers never take it
+        self._reload_lock = threading.Lock()
+        # Signatures of files that failed to load, so they are retried only once changed again
+        self._failed: Optional[Dict[str, Optional[Tuple[int, int]]]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Raises on a broken file: there is no previous version to fall back to
+        self._snapshot = self._build(self._signatures(), version=1)
+        self._install(self._snapshot)
+
+    @property
+    def snapshot(self) -> MappingSnapshot:
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def property_map(self) -> Dict[str, Any]:
+        """The current property type mapping (read once per document)."""
+        return self._snapshot.property_map
+
+    def _signatures(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        return {name: _signature(path) for name, path in self.paths.items()}
+
+    def _build(self, signatures: Dict[str, Optional[Tuple[int, int]]], version: int) -> MappingSnapshot:
+        compiled = load_compiled_mapping(self.paths["property_map"])
+        return MappingSnapshot(
+            version,
+            # Registers the precompiled matcher for this dict
+            compiled.activate(),
+            compile_city_names(load_overrides(self.paths["city_names"], "city_names")),
+            compile_country_synonyms(load_overrides(self.paths["country_synonyms"], "country_synonyms")),
+            signatures,
+        )
+
+    @staticmethod
+    def _install(snapshot: MappingSnapshot) -> None:
+        install_city_names(snapshot.city_names)
+        install_country_synonyms(snapshot.country_synonyms)
+
+    def check(self) -> bool:
+        """
+        Reload if any mapping file changed since the current snapshot.
+
+        Returns:
+            True if a new snapshot was published
+        """
+        with self._reload_lock:
+            self.stats["checks"] += 1
+            signatures = self._signatures()
+            if signatures == self._snapshot.signatures or signatures == self._failed:
+                return False
+
+            try:
+                snapshot = self._build(signatures, self._snapshot.version + 1)
+            except Exception as e:
+                self._failed = signatures
+                self.stats["errors"] += 1
+                self.last_error = str(e)
+                self.log(f"Mapping reload failed, keeping version {self._snapshot.version}: {e}")
+                return False
+
+            self._failed = None
+            self._install(snapshot)
+            self._snapshot = snapshot
+            self.stats["reloads"] += 1
+            self.log(f"Mappings reloaded (version {snapshot.version})")
+            return True
+
+    def start(self, interval: float = DEFAULT_RELOAD_INTERVAL) -> None:
+        """Check for changes every interval seconds on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="mapping-reload", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.check()
+
+    def stop(self) -> None:
+        """Stop the background thread (if started)."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._thread = None
@@ -0,0 +1,82 @@
+"""
+Aho-Corasick multi-pattern substring matching.
+
+Finds every pattern that occurs anywhere in a text with one left-to-right
+scan, however many patterns there are. Used to match property type
+synonyms: the cost of a lookup depends on the length of the text, not on
+the size of property_type_map.yml.
+
+Matching is exact (case-sensitive, no word boundaries); callers normalize
+case on both sides, as `pattern in text` would require.
+"""
+
+from collections import deque
+from typing import Any, Dict, FrozenSet, Iterable, List, Set, Tuple
+
+
+class AhoCorasick:
+    """
+    Automaton over (pattern, payload) pairs.
+
+    search(text) returns the payloads of all patterns that occur in text.
+    Several patterns may share a payload, and one pattern may be given
+    several payloads. Instances are plain lists and dicts, so they pickle.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        # Trie: goto[node] maps a character to the child node; node 0 is the root
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        outputs: List[Set[Any]] = [set()]
+        self.pattern_count = 0
+
+        for pattern, payload in patterns:
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                child = self.goto[node].get(ch)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][ch] = child
+                    self.goto.append({})
+                    self.fail.append(0)
+                    outputs.append(set())
+                node = child
+            outputs[node].add(payload)
+            self.pattern_count += 1
+
+        # Breadth-first: a node's failure link is the longest proper suffix of
+        # its path that is also in the trie; it inherits that node's outputs
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self.goto[node].items():
+                queue.append(child)
+                state = self.fail[node]
+                while state and ch not in self.goto[state]:
+                    state = self.fail[state]
+                target = self.goto[state].get(ch, 0)
+                self.fail[child] = target if target != child else 0
+                outputs[child] |= outputs[self.fail[child]]
+
+        # Empty output sets become None so the scan loop can skip them cheaply
+        self.outputs: List[FrozenSet[Any]] = [frozenset(out) if out else None for out in outputs]
+
+    def search(self, text: str) -> Set[Any]:
+        """Payloads of every pattern occurring in text."""
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        found: Set[Any] = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if outputs[node] is not None:
+                found |= outputs[node]
+        return found
+
+    def __len__(self) -> int:
+        return self.pattern_count
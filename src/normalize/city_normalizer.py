@@ -2,9 +2,21 @@
 City name normalization: Swedish city names to English equivalents.
 
 Standardizes location names for consistent output across all extractions.
+Extra spellings can be added in config/mappings/city_names.yml without a
+code change; the file is read at first use (see src.resources), and a
+running watcher reloads it when edited (see src.mapping_registry).
+
+Values not in the table are looked up in the Nordic gazetteer
+(src.normalize.gazetteer): with qualifiers stripped ("Göteborgs kommun",
+"Malmö C"), then by nearest spelling ("Götebrog"). Anything else is
+transliterated to ASCII, the form the table uses ("Skärholmen" ->
+"Skarholmen").
 """
 
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
+
+from src.normalize.gazetteer import get_gazetteer, place_name_candidates, transliterate
+from src.normalize.memo import mapping_fingerprint, memoize, VersionedMapping
 
 # Swedish city names -> English equivalents
 # Only includes cities where the spelling differs
@@ -101,6 +113,46 @@ CITY_NAME_MAP = {
 }
 
 
+def compile_city_names(overrides: Optional[Dict[str, Any]] = None) -> VersionedMapping:
+    """
+    CITY_NAME_MAP plus overrides, as a lookup table for install_city_names.
+
+    Args:
+        overrides: Extra or replacement entries (name -> English name);
+            names are matched case-insensitively
+    """
+    table = dict(CITY_NAME_MAP)
+    for name, english in (overrides or {}).items():
+        key = str(name).strip().lower()
+        if key and english is not None and str(english).strip():
+            table[key] = str(english).strip()
+    return VersionedMapping(table, mapping_fingerprint(table))
+
+
+# The table normalize_city uses; None until first use. Replaced as a whole,
+# so a call sees either the old or the new table; memoized results are keyed
+# by table version.
+_city_names: Optional[VersionedMapping] = None
+
+
+def install_city_names(table: Optional[VersionedMapping]) -> None:
+    """Make normalize_city use this table (from compile_city_names); None reloads city_names.yml at next use."""
+    global _city_names
+    _city_names = table
+
+
+def _current_city_names() -> VersionedMapping:
+    """The installed table, else CITY_NAME_MAP plus city_names.yml (loaded once)."""
+    global _city_names
+    table = _city_names
+    if table is None:
+        # Imported here: src.resources imports this module
+        from src.resources import get_city_names
+
+        table = _city_names = get_city_names()
+    return table
+
+
 def normalize_city(raw_value: str) -> Tuple[str, str]:
     """
     Normalize city names from Swedish to English spelling.
@@ -110,8 +162,14 @@ def normalize_city(raw_value: str) -> Tuple[str, str]:
 
     Returns:
         Tuple of (normalized_name, confidence)
-        - confidence: "high" if mapped, "medium" if passed through unchanged
+        - confidence: "high" if mapped or a known place, "medium" if matched
+          by nearest spelling or passed through (transliterated)
     """
+    return _normalize_city(raw_value, _current_city_names())
+
+
+@memoize(name="normalize_city")
+def _normalize_city(raw_value: str, names: VersionedMapping) -> Tuple[str, str]:
     if not raw_value or not isinstance(raw_value, str):
         return ("", "low")
 
@@ -121,9 +179,36 @@ def normalize_city(raw_value: str) -> Tuple[str, str]:
 
     # Check for exact match (case-insensitive)
     lookup = raw_value.lower()
-    if lookup in CITY_NAME_MAP:
-        return (CITY_NAME_MAP[lookup], "high")
+    english = names.mapping.get(lookup)
+    if english is not None:
+        return (english, "high")
+
+    # Known place, possibly qualified ("Göteborgs kommun", "Malmö C")
+    gazetteer = get_gazetteer()
+    candidates = place_name_candidates(raw_value)
+    for candidate in candidates:
+        english = names.mapping.get(candidate)
+        if english is not None:
+            return (english, "high")
+        place = gazetteer.get(candidate)
+        if place is not None:
+            return (_place_name(place, names), "high")
+
+    # Misspelled place: nearest name over all candidates
+    closest = None
+    for candidate in candidates:
+        match = gazetteer.closest(candidate)
+        if match is not None and (closest is None or match[1] < closest[1]):
+            closest = match
+    if closest is not None:
+        return (_place_name(closest[0], names), "medium")
 
-    # No mapping found - return as-is with medium confidence
+    # No mapping found - return as-is (transliterated) with medium confidence
     # (it might already be in English or be a city we don't have mapped)
-    return (raw_value, "medium")
+    return (transliterate(raw_value), "medium")
+
+
+def _place_name(place: str, names: VersionedMapping) -> str:
+    """Output spelling of a gazetteer place: the table's English name, else transliterated."""
+    english = names.mapping.get(place.lower())
+    return english if english is not None else transliterate(place)
@@ -0,0 +1,257 @@
+"""
+Column normalization: apply a field normalizer to a whole column at once.
+
+Exports repeat the same raw values over and over (countries, property
+types, "4,5 %", the same handful of dates), so each column is factorized
+first: every distinct raw value is normalized once and the result is
+broadcast back to all rows holding it.
+
+Each *_column function returns (normalized_values, confidences), two lists
+in input order, identical to calling the scalar normalizer per value.
+Numeric columns can also be returned as a NumPy float array (NaN where a
+value could not be parsed) with as_array=True; NumPy is optional.
+
+Date columns are parsed with the column's dominant format (inferred from a
+sample) and fall back to normalize_date's full cascade only for outliers.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from src.compact_row import RowLayout
+from src.normalize.city_normalizer import normalize_city
+from src.normalize.country_normalizer import normalize_country
+from src.normalize.date_normalizer import infer_date_format, normalize_date, parse_date_as
+from src.normalize.designation_normalizer import normalize_property_designation
+from src.normalize.number_normalizer import normalize_area, normalize_number, normalize_price, normalize_yield
+from src.normalize.property_type import normalize_property_type
+
+Normalizer = Callable[[Any], Tuple[Any, str]]
+
+
+def factorize_column(values: Iterable[Any], normalizer: Normalizer) -> Tuple[List[Tuple[Any, str]], List[int]]:
+    """
+    Normalize each distinct value once.
+
+    Values are distinct by type and value, so 1, 1.0 and "1" are normalized
+    separately (the normalizers treat them differently). Unhashable values
+    are normalized individually.
+
+    Returns:
+        (results, codes): results[codes[i]] is the (value, confidence)
+        for the i-th input value
+    """
+    positions: Dict[Tuple[type, Any], int] = {}
+    results: List[Tuple[Any, str]] = []
+    codes: List[int] = []
+    for value in values:
+        key = (value.__class__, value)
+        try:
+            code = positions.get(key)
+        except TypeError:  # unhashable
+            code = None
+        else:
+            if code is None:
+                positions[key] = len(results)
+        if code is None:
+            code = len(results)
+            results.append(normalizer(value))
+        codes.append(code)
+    return results, codes
+
+
+def normalize_column(values: Iterable[Any], normalizer: Normalizer) -> Tuple[List[Any], List[str]]:
+    """
+    Apply a scalar normalizer to a column, normalizing each distinct value once.
+
+    Args:
+        values: Raw column values
+        normalizer: Scalar normalizer returning (value, confidence)
+
+    Returns:
+        (normalized_values, confidences) in input order
+    """
+    results, codes = factorize_column(values, normalizer)
+    return [results[c][0] for c in codes], [results[c][1] for c in codes]
+
+
+def _numeric_column(values: Iterable[Any], normalizer: Normalizer, as_array: bool) -> Tuple[Any, List[str]]:
+    if not as_array:
+        return normalize_column(values, normalizer)
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+
+    results, codes = factorize_column(values, normalizer)
+    distinct = np.array([np.nan if value == "" else value for value, _ in results], dtype=np.float64)
+    return distinct[np.asarray(codes, dtype=np.intp)], [results[c][1] for c in codes]
+
+
+def normalize_number_column(
+    values: Iterable[Any], as_integer: bool = True, as_array: bool = False, decimal: Optional[str] = None
+) -> Tuple[Any, List[str]]:
+    """
+    normalize_number over a column.
+
+    Args:
+        values: Raw column values
+        as_integer: Passed to normalize_number
+        as_array: Return the values as a float64 NumPy array, NaN where unparsed
+        decimal: The column's decimal mark, e.g. from number_profile.profile_number_column
+            (passed to normalize_number)
+
+    Returns:
+        (normalized_values, confidences)
+    """
+    return _numeric_column(values, lambda value: normalize_number(value, as_integer, decimal), as_array)
+
+
+def normalize_price_column(
+    values: Iterable[Any], as_array: bool = False, decimal: Optional[str] = None
+) -> Tuple[Any, List[str]]:
+    """normalize_price over a column; see normalize_number_column."""
+    return _numeric_column(values, lambda value: normalize_price(value, decimal), as_array)
+
+
+def normalize_area_column(
+    values: Iterable[Any], as_array: bool = False, decimal: Optional[str] = None
+) -> Tuple[Any, List[str]]:
+    """normalize_area over a column; see normalize_number_column."""
+    return _numeric_column(values, lambda value: normalize_area(value, decimal), as_array)
+
+
+def normalize_yield_column(
+    values: Iterable[Any], as_array: bool = False, decimal: Optional[str] = None
+) -> Tuple[Any, List[str]]:
+    """normalize_yield over a column; see normalize_number_column."""
+    return _numeric_column(values, lambda value: normalize_yield(value, decimal), as_array)
+
+
+def normalize_date_column(
+    values: Iterable[Any], stats: Optional[Dict[str, Any]] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    normalize_date over a column, parsing with the column's dominant format.
+
+    The format is inferred once from a sample of the column (see
+    infer_date_format). Each distinct value is parsed with that format's
+    pattern alone; values that don't fit go through normalize_date. Results
+    are identical to normalize_date per value.
+
+    Args:
+        values: Raw column values
+        stats: Optional dict, filled with per-cell counts: "format" (the
+            inferred format or None), "cells", "blank", "fast" (parsed with
+            the inferred format), "slow" (went through the full cascade)
+            and "failed" (unparseable, a subset of slow)
+
+    Returns:
+        (normalized_values, confidences)
+    """
+    values = values if isinstance(values, list) else list(values)
+    fmt = infer_date_format(values)
+    # Per distinct value: "blank", "fast" or "slow"
+    paths: List[str] = []
+
+    def normalize(value: Any) -> Tuple[str, str]:
+        if value is None or not str(value).strip():
+            paths.append("blank")
+            return ("", "low")
+        if fmt is not None:
+            parsed = parse_date_as(value, fmt)
+            if parsed is not None:
+                paths.append("fast")
+                return (parsed, "high")
+        paths.append("slow")
+        return normalize_date(value)
+
+    results, codes = factorize_column(values, normalize)
+
+    if stats is not None:
+        counts = {"blank": 0, "fast": 0, "slow": 0, "failed": 0}
+        for code in codes:
+            path = paths[code]
+            counts[path] += 1
+            if path == "slow" and not results[code][0]:
+                counts["failed"] += 1
+        stats.update(format=fmt, cells=len(codes), **counts)
+
+    return [results[c][0] for c in codes], [results[c][1] for c in codes]
+
+
+def merge_date_stats(total: Dict[str, Dict[str, Any]], chunk: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Add the date stats of one chunk of rows into total, in place.
+
+    Counts are summed. Each chunk infers its own format; if they differ,
+    the formats are listed in order of appearance, separated by "; ".
+    """
+    for field, s in chunk.items():
+        merged = total.get(field)
+        if merged is None:
+            total[field] = dict(s)
+            continue
+        for key in ("cells", "blank", "fast", "slow", "failed"):
+            merged[key] += s[key]
+        if s["format"] and s["format"] not in (merged["format"] or "").split("; "):
+            merged["format"] = f"{merged['format']}; {s['format']}" if merged["format"] else s["format"]
+
+
+def format_date_stats(stats: Dict[str, Dict[str, Any]]) -> str:
+    """One line per date column: inferred format and how many cells took the slow path."""
+    lines = []
+    for field, s in stats.items():
+        lines.append(
+            f"{field}: format {s['format'] or 'unknown'}, {s['cells']} cells - "
+            f"{s['fast']} fast, {s['slow']} slow ({s['failed']} unparseable), {s['blank']} blank"
+        )
+    return "\n".join(lines)
+
+
+def normalize_country_column(values: Iterable[Any]) -> Tuple[List[str], List[str]]:
+    """normalize_country over a column."""
+    return normalize_column(values, normalize_country)
+
+
+def normalize_city_column(values: Iterable[Any]) -> Tuple[List[str], List[str]]:
+    """normalize_city over a column."""
+    return normalize_column(values, normalize_city)
+
+
+def normalize_designation_column(values: Iterable[Any]) -> Tuple[List[str], List[str]]:
+    """normalize_property_designation over a column."""
+    return normalize_column(values, normalize_property_designation)
+
+
+def normalize_property_type_column(values: Iterable[Any], mapping: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """normalize_property_type over a column, with the given property type mapping."""
+    return normalize_column(values, lambda value: normalize_property_type(value, mapping))
+
+
+def column_values(
+    rows: Sequence[Dict[str, Any]], field: str, layout: Optional[RowLayout] = None
+) -> Tuple[List[int], List[Any]]:
+    """
+    Non-empty values of a field across rows.
+
+    Args:
+        rows: Row dicts or CompactRows
+        field: Column name
+        layout: The rows' shared layout, if they are CompactRows over one
+            (see shared_layout): cells are then read by position
+
+    Returns:
+        (row_indexes, values) for the rows where the field is present and truthy
+    """
+    position = layout.index.get(field) if layout is not None else None
+    if position is None:
+        indexes = [i for i, row in enumerate(rows) if row.get(field)]
+        return indexes, [rows[i][field] for i in indexes]
+    # UNSET cells are falsy
+    cells = [row.cells[position] for row in rows]
+    indexes = [i for i, value in enumerate(cells) if value]
+    return indexes, [cells[i] for i in indexes]
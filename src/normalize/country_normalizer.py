@@ -5,9 +5,15 @@ Handles:
 - Native language names: Sverige, Danmark, Suomi
 - Common abbreviations: SE, DK, FI
 - Case variations
+
+Extra synonyms can be added in config/mappings/country_synonyms.yml without
+a code change; the file is read at first use (see src.resources), and a
+running watcher reloads it when edited (see src.mapping_registry).
 """
 
-from typing import Any, Tuple
+from typing import Any, Dict, Optional, Tuple
+
+from src.normalize.memo import mapping_fingerprint, memoize, VersionedMapping
 
 # Canonical country names (must match schema allowed_values)
 ALLOWED_COUNTRIES = {"Sweden", "Denmark", "Finland"}
@@ -37,6 +43,47 @@ COUNTRY_SYNONYMS = {
 }
 
 
+def compile_country_synonyms(overrides: Optional[Dict[str, Any]] = None) -> VersionedMapping:
+    """
+    COUNTRY_SYNONYMS plus overrides, as a lookup table for install_country_synonyms.
+
+    Args:
+        overrides: Extra or replacement entries (synonym -> canonical name);
+            synonyms are matched case-insensitively. Canonical names should
+            be schema allowed_values.
+    """
+    table = dict(COUNTRY_SYNONYMS)
+    for synonym, canonical in (overrides or {}).items():
+        key = str(synonym).strip().lower()
+        if key and canonical is not None and str(canonical).strip():
+            table[key] = str(canonical).strip()
+    return VersionedMapping(table, mapping_fingerprint(table))
+
+
+# The table normalize_country uses; None until first use. Replaced as a
+# whole, so a call sees either the old or the new table; memoized results
+# are keyed by table version.
+_country_synonyms: Optional[VersionedMapping] = None
+
+
+def install_country_synonyms(table: Optional[VersionedMapping]) -> None:
+    """Make normalize_country use this table (from compile_country_synonyms); None reloads country_synonyms.yml at next use."""
+    global _country_synonyms
+    _country_synonyms = table
+
+
+def _current_country_synonyms() -> VersionedMapping:
+    """The installed table, else COUNTRY_SYNONYMS plus country_synonyms.yml (loaded once)."""
+    global _country_synonyms
+    table = _country_synonyms
+    if table is None:
+        # Imported here: src.resources imports this module
+        from src.resources import get_country_synonyms
+
+        table = _country_synonyms = get_country_synonyms()
+    return table
+
+
 def normalize_country(raw_value: Any) -> Tuple[str, str]:
     """
     Normalize a country name to canonical form.
@@ -45,6 +92,11 @@ def normalize_country(raw_value: Any) -> Tuple[str, str]:
     - confidence: "high" if matched, "low" if not
     - Returns ("", "low") if input is empty or unrecognized
     """
+    return _normalize_country(raw_value, _current_country_synonyms())
+
+
+@memoize(name="normalize_country")
+def _normalize_country(raw_value: Any, synonyms: VersionedMapping) -> Tuple[str, str]:
     if raw_value is None:
         return ("", "low")
 
@@ -57,7 +109,7 @@ def normalize_country(raw_value: Any) -> Tuple[str, str]:
         return (text, "high")
 
     # Look up in synonyms
-    canonical = COUNTRY_SYNONYMS.get(text.lower())
+    canonical = synonyms.mapping.get(text.lower())
     if canonical:
         return (canonical, "high")
 
@@ -9,7 +9,10 @@ Handles:
 """
 
 import re
-from typing import Any, Optional, Tuple
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional, Pattern, Tuple
+
+from src.normalize.memo import memoize
 
 # Month name mappings (English + Swedish)
 MONTH_MAP = {
@@ -53,6 +56,27 @@ MONTH_MAP = {
 }
 
 
+# Formats normalize_date tries, in order: name -> (pattern, field order, text format).
+# Numeric formats must match the whole value; text formats match a prefix
+# of the lowercased value. A value can match at most one of them, so
+# parsing with the right format alone gives the same result as the cascade.
+DATE_FORMATS: Dict[str, Tuple[Pattern[str], str, bool]] = {
+    "yyyy/mm/dd": (re.compile(r"(\d{4})/(\d{1,2})/(\d{1,2})"), "ymd", False),
+    "yyyy-mm-dd": (re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})"), "ymd", False),
+    "dd/mm/yyyy": (re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})"), "dmy", False),
+    "dd.mm.yyyy": (re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})"), "dmy", False),
+    "dd-mm-yyyy": (re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})"), "dmy", False),
+    # "January 15, 2024" / "January 15 2024"
+    "month dd, yyyy": (re.compile(r"([a-zäöå]+)\s+(\d{1,2}),?\s+(\d{4})"), "mdy", True),
+    # "15 januari 2024"
+    "dd month yyyy": (re.compile(r"(\d{1,2})\s+([a-zäöå]+)\s+(\d{4})"), "dmy", True),
+}
+
+# Non-blank values inspected by infer_date_format
+DATE_SAMPLE_SIZE = 64
+
+
+@memoize()
 def normalize_date(raw_value: Any) -> Tuple[str, str]:
     """
     Normalize a date value to yyyy/mm/dd format.
@@ -68,73 +92,78 @@ def normalize_date(raw_value: Any) -> Tuple[str, str]:
     if not text:
         return ("", "low")
 
-    # Already in target format? yyyy/mm/dd
-    match = re.match(r"^(\d{4})/(\d{1,2})/(\d{1,2})$", text)
-    if match:
-        y, m, d = match.groups()
-        if _is_valid_date(int(y), int(m), int(d)):
-            return (f"{y}/{int(m):02d}/{int(d):02d}", "high")
-
-    # ISO format: yyyy-mm-dd
-    match = re.match(r"^(\d{4})-(\d{1,2})-(\d{1,2})$", text)
-    if match:
-        y, m, d = match.groups()
-        if _is_valid_date(int(y), int(m), int(d)):
-            return (f"{y}/{int(m):02d}/{int(d):02d}", "high")
-
-    # European with slashes: dd/mm/yyyy
-    match = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{4})$", text)
-    if match:
-        d, m, y = match.groups()
-        if _is_valid_date(int(y), int(m), int(d)):
-            return (f"{y}/{int(m):02d}/{int(d):02d}", "high")
-
-    # European with dots: dd.mm.yyyy
-    match = re.match(r"^(\d{1,2})\.(\d{1,2})\.(\d{4})$", text)
-    if match:
-        d, m, y = match.groups()
-        if _is_valid_date(int(y), int(m), int(d)):
-            return (f"{y}/{int(m):02d}/{int(d):02d}", "high")
-
-    # European with dashes: dd-mm-yyyy
-    match = re.match(r"^(\d{1,2})-(\d{1,2})-(\d{4})$", text)
-    if match:
-        d, m, y = match.groups()
-        if _is_valid_date(int(y), int(m), int(d)):
-            return (f"{y}/{int(m):02d}/{int(d):02d}", "high")
-
-    # Text format: "January 15, 2024" or "15 January 2024"
-    parsed = _parse_text_date(text)
-    if parsed:
-        return (parsed, "high")
+    for fmt in DATE_FORMATS:
+        parsed = _parse_as(text, fmt)
+        if parsed:
+            return (parsed, "high")
 
     # Could not parse - return empty with low confidence
     return ("", "low")
 
 
-def _parse_text_date(text: str) -> Optional[str]:
-    """Parse text-based dates like 'January 15, 2024' or '15 januari 2024'."""
-    text_lower = text.lower()
+def _parse_as(text: str, fmt: str) -> Optional[str]:
+    """Parse stripped, non-empty text in one format; None if it doesn't fit."""
+    pattern, order, is_text = DATE_FORMATS[fmt]
+    match = pattern.match(text.lower()) if is_text else pattern.fullmatch(text)
+    if not match:
+        return None
 
-    # Pattern: "Month day, year" or "Month day year"
-    match = re.match(r"([a-zäöå]+)\s+(\d{1,2}),?\s+(\d{4})", text_lower)
-    if match:
-        month_str, day, year = match.groups()
-        month = MONTH_MAP.get(month_str)
-        if month and _is_valid_date(int(year), month, int(day)):
-            return f"{year}/{month:02d}/{int(day):02d}"
-
-    # Pattern: "day Month year"
-    match = re.match(r"(\d{1,2})\s+([a-zäöå]+)\s+(\d{4})", text_lower)
-    if match:
-        day, month_str, year = match.groups()
-        month = MONTH_MAP.get(month_str)
-        if month and _is_valid_date(int(year), month, int(day)):
-            return f"{year}/{month:02d}/{int(day):02d}"
+    if order == "ymd":
+        year, month, day = match.groups()
+    elif order == "dmy":
+        day, month, year = match.groups()
+    else:
+        month, day, year = match.groups()
 
+    month_number = MONTH_MAP.get(month) if is_text else int(month)
+    if month_number and _is_valid_date(int(year), month_number, int(day)):
+        return f"{year}/{month_number:02d}/{int(day):02d}"
     return None
 
 
+def parse_date_as(raw_value: Any, fmt: str) -> Optional[str]:
+    """
+    normalize_date restricted to one of DATE_FORMATS.
+
+    Returns:
+        The yyyy/mm/dd date, or None if raw_value isn't a valid date in fmt
+    """
+    if raw_value is None:
+        return None
+    text = str(raw_value).strip()
+    return _parse_as(text, fmt) if text else None
+
+
+def infer_date_format(values: Iterable[Any], sample_size: int = DATE_SAMPLE_SIZE) -> Optional[str]:
+    """
+    The dominant format of a column.
+
+    Args:
+        values: Raw column values
+        sample_size: How many non-blank values to inspect (from the start)
+
+    Returns:
+        The DATE_FORMATS name that parses most sampled values, or None if
+        none of them parse
+    """
+    counts: Counter = Counter()
+    sampled = 0
+    for value in values:
+        if sampled >= sample_size:
+            break
+        text = "" if value is None else str(value).strip()
+        if not text:
+            continue
+        sampled += 1
+        for fmt in DATE_FORMATS:
+            if _parse_as(text, fmt):
+                counts[fmt] += 1
+                break
+    if not counts:
+        return None
+    return counts.most_common(1)[0][0]
+
+
 def _is_valid_date(year: int, month: int, day: int) -> bool:
     """Basic date validation."""
     if year < 1900 or year > 2100:
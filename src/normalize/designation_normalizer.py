@@ -12,7 +12,10 @@ Example:
 import re
 from typing import Tuple
 
+from src.normalize.memo import memoize
 
+
+@memoize()
 def normalize_property_designation(raw_value: str) -> Tuple[str, str]:
     """
     Normalize property designations by abbreviating repeated prefixes.
@@ -0,0 +1,209 @@
+"""
+Gazetteer of Nordic place names, for matching city values that are not
+spelled exactly as in CITY_NAME_MAP.
+
+The bundled list (config/gazetteer/nordic_municipalities.tsv) is compiled
+once into a Gazetteer and cached on disk like the other config files (see
+src.compiled_config). A Gazetteer answers:
+
+- get(): exact match on a match key (lower-case, transliterated, hyphens
+  as spaces), so "Goteborg", "GÖTEBORG" and "Göteborg" are one name
+- closest(): the nearest name within a small edit distance ("Götebrog",
+  "Jönköpping"), found through a trigram index: only names sharing enough
+  trigrams with the value are compared, so a lookup touches a handful of
+  the ~600 names instead of all of them
+
+place_name_candidates() strips qualifiers around a place name ("Göteborgs
+kommun", "Malmö C", "Stockholms stad") before either lookup.
+"""
+
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.compiled_config import load_compiled
+from src.paths import GAZETTEER_PATH
+
+# Letters NFKD doesn't decompose into a base letter + diacritic
+_TRANSLITERATION = str.maketrans({
+    "æ": "ae", "Æ": "Ae",
+    "ø": "o", "Ø": "O",
+    "ð": "d", "Ð": "D",
+    "þ": "th", "Þ": "Th",
+    "ß": "ss",
+})
+
+# Trailing words that qualify a place name ("Göteborgs kommun", "Malmö C")
+PLACE_SUFFIXES = frozenset({
+    "kommun", "kommune", "stad", "kaupunki", "kunta", "municipality",
+    "c", "central", "centrum", "city",
+})
+
+# Shorter values are only matched exactly: too many short names are one edit apart
+FUZZY_MIN_LENGTH = 5
+
+# Match keys of this length or more may be 2 edits from a name, shorter ones 1
+FUZZY_LONG_LENGTH = 9
+
+
+def transliterate(text: str) -> str:
+    """Replace diacritics and Nordic letters with ASCII ("Malmö" -> "Malmo", "Næstved" -> "Naestved")."""
+    decomposed = unicodedata.normalize("NFKD", text.translate(_TRANSLITERATION))
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def match_key(text: str) -> str:
+    """Lower-case, transliterated, with hyphens as spaces and whitespace collapsed."""
+    return " ".join(transliterate(text.lower()).replace("-", " ").split())
+
+
+def place_name_candidates(value: str) -> List[str]:
+    """
+    Lower-case forms of a value to look up, most literal first.
+
+    "Göteborgs kommun" -> ["göteborgs kommun", "göteborgs", "göteborg"]
+    """
+    words = value.lower().replace(".", " ").split()
+    candidates = [" ".join(words)]
+    while len(words) > 1 and words[-1] in PLACE_SUFFIXES:
+        words = words[:-1]
+    if len(words) < len(candidates[0].split()):
+        stripped = " ".join(words)
+        candidates.append(stripped)
+        # Genitive before the qualifier: "Lunds kommun", "Stockholms stad"
+        if stripped.endswith("s") and len(stripped) > 3:
+            candidates.append(stripped[:-1])
+    return candidates
+
+
+def _trigrams(key: str) -> List[str]:
+    padded = f"  {key} "
+    return list({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Edit distance counting adjacent transpositions as one edit, or
+    limit + 1 once it is known to exceed limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+class Gazetteer:
+    """
+    Place names by match key, with a trigram index over the keys.
+
+    Attributes:
+        names: match key -> place name as listed (aliases map to their place)
+    """
+
+    def __init__(self, places: List[Tuple[str, List[str]]]):
+        self.names: Dict[str, str] = {}
+        for name, aliases in places:
+            for spelling in [name, *aliases]:
+                # First listed wins if two places share a key
+                self.names.setdefault(match_key(spelling), name)
+
+        self._keys: List[str] = list(self.names)
+        self._gram_counts: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        for index, key in enumerate(self._keys):
+            grams = _trigrams(key)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def get(self, value: str) -> Optional[str]:
+        """The place named exactly value (up to case, diacritics and hyphens), or None."""
+        return self.names.get(match_key(value))
+
+    def closest(self, value: str) -> Optional[Tuple[str, int]]:
+        """
+        The place whose name is fewest edits from value, within the allowed distance.
+
+        Args:
+            value: City value (one candidate from place_name_candidates)
+
+        Returns:
+            (place name, edit distance), or None if nothing is close enough
+            or two places are equally close
+        """
+        key = match_key(value)
+        if len(key) < FUZZY_MIN_LENGTH:
+            return None
+        limit = 2 if len(key) >= FUZZY_LONG_LENGTH else 1
+
+        grams = _trigrams(key)
+        shared: Counter = Counter()
+        for gram in grams:
+            for index in self._postings.get(gram, ()):
+                shared[index] += 1
+
+        # An edit (or transposition) changes at most 4 of either key's trigrams
+        min_shared = len(grams) - 4 * limit
+        best: Optional[str] = None
+        best_distance = limit + 1
+        tied = False
+        for index, count in shared.most_common():
+            if count < min_shared:
+                break
+            if count < self._gram_counts[index] - 4 * min(limit, best_distance):
+                continue
+            distance = _edit_distance(key, self._keys[index], min(limit, best_distance))
+            name = self.names[self._keys[index]]
+            if distance < best_distance:
+                best, best_distance, tied = name, distance, False
+            elif distance == best_distance and distance <= limit and name != best:
+                tied = True
+        if best is None or tied:
+            return None
+        return (best, best_distance)
+
+
+def parse_gazetteer(text: str) -> List[Tuple[str, List[str]]]:
+    """(name, aliases) per line of a gazetteer file; # starts a comment."""
+    places = []
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        fields = [field.strip() for field in line.split("\t") if field.strip()]
+        places.append((fields[0], fields[1:]))
+    return places
+
+
+def compile_gazetteer(data: bytes) -> Gazetteer:
+    return Gazetteer(parse_gazetteer(data.decode("utf-8")))
+
+
+def load_gazetteer(path: Union[str, Path] = GAZETTEER_PATH, **kwargs: Any) -> Gazetteer:
+    """Gazetteer for a gazetteer file, from the compiled config cache when current (see load_compiled)."""
+    return load_compiled(path, compile_gazetteer, "gazetteer", label="Gazetteer", **kwargs)
+
+
+_gazetteer: Optional[Gazetteer] = None
+
+
+def get_gazetteer() -> Gazetteer:
+    """The bundled gazetteer, loaded on first use."""
+    global _gazetteer
+    if _gazetteer is None:
+        _gazetteer = load_gazetteer()
+    return _gazetteer
@@ -1,16 +1,36 @@
-from pathlib import Path
 from typing import Any, Dict
 
-import yaml
+from src.paths import PROPERTY_MAP_PATH, resolve_config_path
 
 
 def load_yaml(path: str) -> Dict[str, Any]:
-    p = Path(path)
+    # Imported here: with a warm compiled-config cache, PyYAML is never needed
+    import yaml
+
+    p = resolve_config_path(path)
     if not p.exists():
         raise FileNotFoundError(f"Mapping file not found: {p.resolve()}")
     return yaml.safe_load(p.read_text(encoding="utf-8")) or {}
 
 
+def load_overrides(path: str, key: str) -> Dict[str, Any]:
+    """
+    The `key:` section of an optional override file, e.g. city_names.yml.
+
+    Returns:
+        name -> value ({} if the file is missing or the section empty)
+
+    Raises:
+        ValueError: If the section is not a mapping
+    """
+    if not resolve_config_path(path).exists():
+        return {}
+    section = load_yaml(path).get(key) or {}
+    if not isinstance(section, dict):
+        raise ValueError(f"{path}: '{key}' must be a mapping of name: value")
+    return section
+
+
 def load_property_map() -> Dict[str, Any]:
     """Load the property type mapping file."""
-    return load_yaml("config/mappings/property_type_map.yml")
+    return load_yaml(PROPERTY_MAP_PATH)
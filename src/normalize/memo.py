@@ -0,0 +1,165 @@
+"""
+Memoization for the field normalizers.
+
+Deal lists repeat the same countries, cities, property types and date and
+number strings thousands of times, and every normalizer is a pure function
+of its input. Each public normalizer in src/normalize is wrapped with
+@memoize, a bounded LRU cache (functools.lru_cache) with per-normalizer
+hit/miss counters:
+
+    memo_stats()        -> {"normalize_number": {"hits": ..., "misses": ...}, ...}
+    format_memo_stats() -> one line per normalizer
+    clear_memos()       -> empty every cache and reset the counters
+
+Arguments are cached by type and value (1, 1.0 and "1" are separate
+entries). Unhashable arguments bypass the cache.
+
+Mapping dicts (the property type map) are not hashable. Normalizers that
+take one pass versioned_mapping(mapping) to the cached function instead:
+a stand-in that compares by a fingerprint of the mapping's content. A
+changed YAML file is loaded as a new dict with a new fingerprint, so results
+computed under the old mapping are never returned. Mappings are treated as
+read-only; mutating one in place is not detected.
+"""
+
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+# Entries kept per normalizer
+DEFAULT_MEMO_SIZE = 8192
+
+# Fingerprints kept for recently used mapping dicts
+_MAX_MAPPING_VERSIONS = 16
+
+_memos: Dict[str, Any] = {}
+
+
+def memoize(maxsize: int = DEFAULT_MEMO_SIZE, name: str = "") -> Callable[[Callable], Callable]:
+    """
+    Decorator: bounded LRU cache with hit/miss counters for a normalizer.
+
+    Args:
+        maxsize: Maximum cached entries (least recently used are evicted)
+        name: Name in memo_stats(); defaults to the function name
+    """
+    def decorate(func: Callable) -> Callable:
+        cached = functools.lru_cache(maxsize=maxsize, typed=True)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return cached(*args, **kwargs)
+            except TypeError:
+                # Unhashable argument (or a TypeError from the function itself,
+                # which the direct call raises again)
+                return func(*args, **kwargs)
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        _memos[name or func.__name__] = cached
+        return wrapper
+
+    return decorate
+
+
+def memo_stats() -> Dict[str, Dict[str, Any]]:
+    """Hits, misses, hit rate and size per memoized normalizer."""
+    stats: Dict[str, Dict[str, Any]] = {}
+    for name, cached in sorted(_memos.items()):
+        info = cached.cache_info()
+        calls = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": info.hits / calls if calls else 0.0,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
+    return stats
+
+
+def format_memo_stats() -> str:
+    """One line per normalizer that has been called, e.g. 'normalize_date: 2,600 hits / 48 misses (98%)'."""
+    lines = []
+    for name, s in memo_stats().items():
+        if s["hits"] or s["misses"]:
+            lines.append(f"{name}: {s['hits']:,} hits / {s['misses']:,} misses ({s['hit_rate']:.0%})")
+    return "\n".join(lines)
+
+
+def clear_memos() -> None:
+    """Empty every normalizer cache and reset the counters."""
+    for cached in _memos.values():
+        cached.cache_clear()
+
+
+class VersionedMapping:
+    """
+    Hashable stand-in for a mapping dict, equal to another when their
+    content fingerprints are equal. The dict itself is in .mapping.
+
+    derived holds structures compiled from the mapping (e.g. the property
+    type matcher), so they are built once per mapping version.
+    """
+
+    __slots__ = ("mapping", "version", "derived", "_hash")
+
+    def __init__(self, mapping: Dict[str, Any], version: str, derived: Optional[Dict[str, Any]] = None):
+        self.mapping = mapping
+        self.version = version
+        self.derived: Dict[str, Any] = derived if derived is not None else {}
+        self._hash = hash(version)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, VersionedMapping) and other.version == self.version
+
+    def __repr__(self) -> str:
+        return f"VersionedMapping({self.version})"
+
+
+def mapping_fingerprint(mapping: Dict[str, Any]) -> str:
+    """Short content hash of a mapping (key order doesn't matter)."""
+    data = json.dumps(mapping, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+
+
+# id(mapping) -> VersionedMapping; holding .mapping keeps the id from being reused
+_versions: "OrderedDict[int, VersionedMapping]" = OrderedDict()
+_versions_lock = threading.Lock()
+
+
+def versioned_mapping(
+    mapping: Dict[str, Any], fingerprint: Optional[str] = None, derived: Optional[Dict[str, Any]] = None
+) -> VersionedMapping:
+    """
+    The cache key for a mapping dict.
+
+    The fingerprint is computed once per dict object, so the per-call cost
+    is a dict lookup.
+
+    Args:
+        mapping: The mapping dict
+        fingerprint: Its fingerprint, if already known (e.g. from compiled config)
+        derived: Structures already compiled from it, if the dict is new here
+    """
+    key = id(mapping)
+    with _versions_lock:
+        versioned = _versions.get(key)
+        if versioned is not None and versioned.mapping is mapping:
+            _versions.move_to_end(key)
+            return versioned
+
+    versioned = VersionedMapping(mapping, fingerprint or mapping_fingerprint(mapping), derived)
+    with _versions_lock:
+        _versions[key] = versioned
+        while len(_versions) > _MAX_MAPPING_VERSIONS:
+            _versions.popitem(last=False)
+    return versioned
+
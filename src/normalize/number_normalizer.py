@@ -7,11 +7,22 @@ Handles:
 - Currency prefixes/suffixes: SEK 1,500,000, €500k, 1.5M EUR
 - Percentage values: 95%, 4.5%
 - Decimal handling: preserves decimals for yields/percentages, integers for prices/areas
+
+Common shapes ("SEK 1 500 000", "150 MSEK", "4,5 %", "12 400 kvm") are split
+into currency, number, multiplier and unit by one precompiled tokenizer
+(NUMBER_TOKENS). Anything it doesn't recognise goes through the general
+strip-and-parse cascade, which gives the same result, just more slowly.
+
+"1.500" and "1,500" are ambiguous (thousands or decimal). On their own they
+are read as thousands; pass decimal="," or "." when the convention is
+known, e.g. from a column profile (see number_profile).
 """
 
 import re
 from typing import Any, Optional, Tuple, Union
 
+from src.normalize.memo import memoize
+
 # Multiplier mappings (case-insensitive)
 MULTIPLIERS = {
     # Thousands
@@ -47,15 +58,18 @@ MULTIPLIERS = {
     "miljardia": 1_000_000_000,  # Finnish
 }
 
+_CURRENCIES = r"SEK|DKK|EUR|USD|NOK|GBP|€|\$|£"
+_UNITS = r"m2|m²|sqm|kvm|square\s*meters?|kvadratmeter|år|years?|procent|percent"
+
 # Currency symbols/codes to strip (use word boundaries for "kr" to avoid matching "tkr")
 CURRENCY_PATTERNS = re.compile(
-    r"(?:SEK|DKK|EUR|USD|NOK|GBP|\bkr\b|€|\$|£)\s*",
+    rf"(?:{_CURRENCIES}|\bkr\b)\s*",
     re.IGNORECASE
 )
 
 # Unit suffixes to strip (area, percentage, etc.)
 UNIT_PATTERNS = re.compile(
-    r"\s*(?:m2|m²|sqm|kvm|square\s*meters?|kvadratmeter|år|years?|procent|percent)\s*$",
+    rf"\s*(?:{_UNITS})\s*$",
     re.IGNORECASE
 )
 
@@ -66,14 +80,55 @@ TRAILING_TEXT_PATTERNS = re.compile(
     re.IGNORECASE
 )
 
+# One-pass tokenizer for the common shapes:
+#   [currency] number [multiplier] [%] [currency] [unit]
+# Multipliers are tried longest first ("msek" before "m"). "kr" must be
+# separated from the number by whitespace, as CURRENCY_PATTERNS requires.
+# ASCII-only matching keeps case folding identical to str.lower(); other
+# input falls back to the cascade.
+_MULTIPLIERS_LONGEST_FIRST = "|".join(re.escape(k) for k in sorted(MULTIPLIERS, key=len, reverse=True))
+NUMBER_TOKENS = re.compile(
+    rf"(?:(?:{_CURRENCIES})\s*|kr\s+)?"
+    r"(?P<number>\d+(?:[ \u00a0.,]\d+)*)"
+    rf"(?:\s*(?P<multiplier>{_MULTIPLIERS_LONGEST_FIRST}))?"
+    r"(?:\s*%)?"
+    rf"(?:\s*(?:{_CURRENCIES})|\s+kr)?"
+    rf"(?:\s*(?:{_UNITS}))?",
+    re.IGNORECASE | re.ASCII
+)
 
-def normalize_number(raw_value: Any, as_integer: bool = True) -> Tuple[Union[str, int, float], str]:
+# Cascade helpers: split "1,5 mkr" into number and trailing word, then look
+# the word up with one match (lastindex gives the multiplier's position)
+_NUMBER_AND_WORD = re.compile(r"([\d\s.,]+)([^\d\s.,]+)")
+_MULTIPLIER_WORDS = re.compile(
+    "|".join(f"({re.escape(k)})" for k in MULTIPLIERS),
+    re.IGNORECASE
+)
+_MULTIPLIER_VALUES = list(MULTIPLIERS.values())
+# Word-length multipliers also match with a plural "s" ("5 mills")
+_LONG_MULTIPLIERS = {k: v for k, v in MULTIPLIERS.items() if len(k) > 2}
+_LONG_MULTIPLIER_WORDS = re.compile(
+    "(?:" + "|".join(f"({re.escape(k)})" for k in _LONG_MULTIPLIERS) + ")s?",
+    re.IGNORECASE
+)
+_LONG_MULTIPLIER_VALUES = list(_LONG_MULTIPLIERS.values())
+
+# separator_evidence result for "1.500" / "1,500"
+AMBIGUOUS = "ambiguous"
+
+
+@memoize()
+def normalize_number(
+    raw_value: Any, as_integer: bool = True, decimal: Optional[str] = None
+) -> Tuple[Union[str, int, float], str]:
     """
     Normalize a number value, expanding abbreviations to full numbers.
 
     Args:
         raw_value: The raw input (string, int, float, etc.)
         as_integer: If True, return integer for whole numbers; if False, preserve decimals
+        decimal: The decimal mark ("," or ".") to read ambiguous values like
+            "1.500" with; None reads them as thousands
 
     Returns: (normalized_value, confidence)
     - normalized_value: The parsed number (int or float), or "" if unparseable
@@ -92,6 +147,14 @@ def normalize_number(raw_value: Any, as_integer: bool = True) -> Tuple[Union[str
     if not text:
         return ("", "low")
 
+    tokens = NUMBER_TOKENS.fullmatch(text)
+    if tokens:
+        parsed = _parse_formatted_number(tokens.group("number"), decimal)
+        if parsed is not None and tokens.group("multiplier"):
+            parsed *= MULTIPLIERS[tokens.group("multiplier").lower()]
+        # "%" only marks the value as a percentage, which rounds the same way
+        return _finish_number(parsed, as_integer)
+
     # Pre-process: strip common Swedish trailing descriptive phrases
     # This handles cases like "47,696 kvm uthyrningsbar yta" -> "47,696 kvm"
     text = TRAILING_TEXT_PATTERNS.sub("", text).strip()
@@ -107,7 +170,13 @@ def normalize_number(raw_value: Any, as_integer: bool = True) -> Tuple[Union[str
     text = text.replace("%", "").strip()
 
     # Try to parse
-    parsed = _parse_number_with_multiplier(text)
+    return _finish_number(_parse_number_with_multiplier(text, decimal), as_integer, is_percentage)
+
+
+def _finish_number(
+    parsed: Optional[float], as_integer: bool, is_percentage: bool = False
+) -> Tuple[Union[str, int, float], str]:
+    """Turn a parsed float into the (value, confidence) result."""
     if parsed is not None:
         # For percentages and yields, keep decimals
         if is_percentage or not as_integer:
@@ -120,35 +189,35 @@ def normalize_number(raw_value: Any, as_integer: bool = True) -> Tuple[Union[str
     return ("", "low")
 
 
-def normalize_yield(raw_value: Any) -> Tuple[Union[str, float], str]:
+def normalize_yield(raw_value: Any, decimal: Optional[str] = None) -> Tuple[Union[str, float], str]:
     """
     Normalize yield/percentage values. Always preserves decimals.
     Returns value as-is (e.g., 4.5 means 4.5%, not 0.045).
     """
-    return normalize_number(raw_value, as_integer=False)
+    return normalize_number(raw_value, False, decimal)
 
 
-def normalize_area(raw_value: Any) -> Tuple[Union[str, int], str]:
+def normalize_area(raw_value: Any, decimal: Optional[str] = None) -> Tuple[Union[str, int], str]:
     """
     Normalize area values (sqm). Always returns integer.
     """
-    result, conf = normalize_number(raw_value, as_integer=True)
+    result, conf = normalize_number(raw_value, True, decimal)
     if isinstance(result, float):
         return (int(round(result)), conf)
     return (result, conf)
 
 
-def normalize_price(raw_value: Any) -> Tuple[Union[str, int], str]:
+def normalize_price(raw_value: Any, decimal: Optional[str] = None) -> Tuple[Union[str, int], str]:
     """
     Normalize price values. Always returns integer (full number, no decimals).
     """
-    result, conf = normalize_number(raw_value, as_integer=True)
+    result, conf = normalize_number(raw_value, True, decimal)
     if isinstance(result, float):
         return (int(round(result)), conf)
     return (result, conf)
 
 
-def _parse_number_with_multiplier(text: str) -> Optional[float]:
+def _parse_number_with_multiplier(text: str, decimal: Optional[str] = None) -> Optional[float]:
     """
     Parse a number string that may contain multipliers.
 
@@ -165,35 +234,66 @@ def _parse_number_with_multiplier(text: str) -> Optional[float]:
 
     # Check for multiplier suffix
     multiplier = 1
-    for suffix, mult in MULTIPLIERS.items():
-        # Match suffix at end of string (with optional space)
-        pattern = rf"([\d\s.,]+)\s*{re.escape(suffix)}$"
-        match = re.match(pattern, text, re.IGNORECASE)
-        if match:
-            text = match.group(1).strip()
-            multiplier = mult
-            break
-
-    # Also check for standalone multiplier words
-    if multiplier == 1:
-        for suffix, mult in MULTIPLIERS.items():
-            if len(suffix) > 2:  # Only check word-length multipliers
-                pattern = rf"([\d\s.,]+)\s+{re.escape(suffix)}s?$"
-                match = re.match(pattern, text, re.IGNORECASE)
-                if match:
-                    text = match.group(1).strip()
-                    multiplier = mult
-                    break
+    match = _NUMBER_AND_WORD.fullmatch(text)
+    if match:
+        number, word = match.groups()
+        multiplier_match = _MULTIPLIER_WORDS.fullmatch(word)
+        if multiplier_match:
+            multiplier = _MULTIPLIER_VALUES[multiplier_match.lastindex - 1]
+            text = number.strip()
+        elif number[-1].isspace():
+            # Also check for standalone multiplier words
+            multiplier_match = _LONG_MULTIPLIER_WORDS.fullmatch(word)
+            if multiplier_match:
+                multiplier = _LONG_MULTIPLIER_VALUES[multiplier_match.lastindex - 1]
+                text = number.strip()
 
     # Now parse the numeric part
-    base_number = _parse_formatted_number(text)
+    base_number = _parse_formatted_number(text, decimal)
     if base_number is not None:
         return base_number * multiplier
 
     return None
 
 
-def _parse_formatted_number(text: str) -> Optional[float]:
+def _is_ambiguous_group(before: str, after: str) -> bool:
+    """True for "1.500" / "1,500": one separator that could group thousands or mark decimals."""
+    return len(after) == 3 and 1 <= len(before) <= 3
+
+
+def separator_evidence(text: str) -> Optional[str]:
+    """
+    What the separators in a number say about its decimal mark.
+
+    Returns:
+        "," or "." when the separators can only be read one way ("1 500,5",
+        "1.500.000", "1,500,000.50", "4.25"), AMBIGUOUS for "1.500" /
+        "1,500", None when there are no separators or they say nothing
+        reliable (e.g. "1.5000")
+    """
+    text = text.replace(" ", "").replace("\u00a0", "")
+    dot_count = text.count(".")
+    comma_count = text.count(",")
+
+    if dot_count and comma_count:
+        return "," if text.rfind(",") > text.rfind(".") else "."
+    if dot_count > 1:
+        return ","
+    if comma_count > 1:
+        return "."
+    if dot_count + comma_count == 0:
+        return None
+
+    separator = "." if dot_count else ","
+    before, after = text.split(separator)
+    if _is_ambiguous_group(before, after):
+        return AMBIGUOUS
+    if len(after) <= 2:
+        return separator
+    return None
+
+
+def _parse_formatted_number(text: str, decimal: Optional[str] = None) -> Optional[float]:
     """
     Parse a formatted number string.
 
@@ -230,6 +330,12 @@ def _parse_formatted_number(text: str) -> Optional[float]:
     if dot_count == 1 and comma_count == 0:
         # Could be decimal (1500.50) or European thousands (1.500)
         parts = text.split(".")
+        if decimal is not None and _is_ambiguous_group(parts[0], parts[1]):
+            # "1.500": the caller knows the convention
+            try:
+                return float(text if decimal == "." else text.replace(".", ""))
+            except ValueError:
+                return None
         if len(parts[1]) <= 2:
             # Likely decimal
             try:
@@ -246,6 +352,12 @@ def _parse_formatted_number(text: str) -> Optional[float]:
     if comma_count == 1 and dot_count == 0:
         # Could be European decimal (1500,50) or US thousands (1,500)
         parts = text.split(",")
+        if decimal is not None and _is_ambiguous_group(parts[0], parts[1]):
+            # "1,500": the caller knows the convention
+            try:
+                return float(text.replace(",", "." if decimal == "," else ""))
+            except ValueError:
+                return None
         if len(parts[1]) <= 2:
             # Likely European decimal
             try:
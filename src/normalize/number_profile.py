@@ -0,0 +1,269 @@
+"""
+Separator conventions of numeric columns.
+
+"1.500" and "1,500" are 1500 or 1.5 depending on the writer's locale, and
+normalize_number on its own always reads them as thousands. A column mixing
+"1,500" with "4,5" is then half wrong. profile_number_column decides each
+column's decimal mark once:
+
+from the cells whose separators can only be read one way ("1 500,5",
+"1.500.000", "4.25"), by majority, if the majority has at least as many
+cells as there are ambiguous ones to read with it: one stray "43,5" among
+two hundred "46,412" prices per sqm is a typo, not the column's locale.
+
+With no such cells (a tie, or too few) the column stays undecided and its ambiguous
+cells are read as thousands, as normalize_number reads them, and counted
+as guessed. Neither the other columns nor the country are a signal: a
+price in MSEK ("127,5"), an area ("2,500") and a price per sqm ("112,732")
+in the same row are written with different conventions, and Nordic
+sources quote areas as "2,500" as often as "2 500". Borrowing a decimal
+comma from either would turn an area into 2.5.
+
+The column is then parsed with that decimal mark (normalize_number's
+decimal argument). Cells whose separators contradict the column's mark are
+parsed as written and listed as conflicts.
+
+A file normalized in chunks is profiled in a first pass with
+NumberEvidence, which only counts readings, so every chunk is parsed with
+the decimal marks the whole file would get (profile_number_columns'
+decisions argument) and the chunk profiles add up (merge_number_profiles).
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.normalize.number_normalizer import AMBIGUOUS, separator_evidence
+
+# Conflicting rows listed per column in summaries
+MAX_CONFLICT_EXAMPLES = 5
+
+_NUMBER_RUN = re.compile(r"\d+(?:[ \u00a0.,]\d+)*")
+
+
+def number_part(value: Any) -> Optional[str]:
+    """The first digit run of a raw value, with its separators ("SEK 1 500,5 m" -> "1 500,5")."""
+    if value is None or isinstance(value, (int, float)):
+        return None
+    match = _NUMBER_RUN.search(str(value))
+    return match.group(0) if match else None
+
+
+class NumberColumnProfile:
+    """
+    The decimal mark chosen for one column, and why.
+
+    Attributes:
+        field: Column name
+        decimal: "," or ".", or None if undecided (values are read one by one)
+        source: "values" or "undecided"
+        votes: Cells per unambiguous reading, {",": n, ".": m}
+        ambiguous: Cells like "1.500" read with the column's decimal mark
+        guessed: Ambiguous cells read as thousands because the column is undecided
+        conflicts: (row, raw value) of cells contradicting the decimal mark
+    """
+
+    def __init__(
+        self,
+        field: str,
+        decimal: Optional[str],
+        source: str,
+        votes: Dict[str, int],
+        ambiguous: int,
+        guessed: int,
+        conflicts: List[Tuple[int, Any]],
+    ):
+        self.field = field
+        self.decimal = decimal
+        self.source = source
+        self.votes = votes
+        self.ambiguous = ambiguous
+        self.guessed = guessed
+        self.conflicts = conflicts
+
+    def summary(self) -> str:
+        """One-line diagnostic, e.g. `Price: decimal ',' (values); 3 ambiguous; 1 conflicting (row 7: '1,500.25')`."""
+        mark = f"'{self.decimal}'" if self.decimal else "undecided"
+        text = f"{self.field}: decimal {mark} ({self.source})"
+        if self.ambiguous:
+            text += f"; {self.ambiguous} ambiguous"
+        if self.guessed:
+            text += f"; {self.guessed} ambiguous read as thousands"
+        if self.conflicts:
+            examples = ", ".join(f"row {row}: {value!r}" for row, value in self.conflicts[:MAX_CONFLICT_EXAMPLES])
+            more = ", ..." if len(self.conflicts) > MAX_CONFLICT_EXAMPLES else ""
+            text += f"; {len(self.conflicts)} conflicting ({examples}{more})"
+        return text
+
+
+def _column_readings(values: Sequence[Any]) -> List[Optional[str]]:
+    """separator_evidence of each value, classifying each distinct value once."""
+    evidence: Dict[Any, Optional[str]] = {}
+    cells: List[Optional[str]] = []
+    for value in values:
+        try:
+            reading = evidence[value]
+        except KeyError:
+            part = number_part(value)
+            reading = evidence[value] = separator_evidence(part) if part else None
+        except TypeError:  # unhashable
+            part = number_part(value)
+            reading = separator_evidence(part) if part else None
+        cells.append(reading)
+    return cells
+
+
+def _majority(votes: Dict[str, int]) -> Optional[str]:
+    if votes[","] == votes["."]:
+        return None
+    return "," if votes[","] > votes["."] else "."
+
+
+# (decimal mark or None, source) as in NumberColumnProfile
+Decision = Tuple[Optional[str], str]
+
+
+def _decide(votes: Dict[str, int], ambiguous: int) -> Decision:
+    decimal = _majority(votes)
+    if decimal is None or votes[decimal] < ambiguous:
+        return (None, "undecided")
+    return (decimal, "values")
+
+
+def profile_number_column(
+    values: Sequence[Any],
+    field: str = "",
+    rows: Optional[Sequence[int]] = None,
+    readings: Optional[List[Optional[str]]] = None,
+    decision: Optional[Decision] = None,
+) -> NumberColumnProfile:
+    """
+    Choose a column's decimal mark from its own values.
+
+    Args:
+        values: Raw column values
+        field: Column name, for diagnostics
+        rows: Row number of each value, for diagnostics (default: 1, 2, ...)
+        readings: separator_evidence per value, if already computed
+        decision: (decimal, source) made elsewhere (NumberEvidence), instead
+            of deciding from these values
+
+    Returns:
+        The column's NumberColumnProfile
+    """
+    cells = readings if readings is not None else _column_readings(values)
+    counts = Counter(cells)
+    votes = {",": counts[","], ".": counts["."]}
+
+    ambiguous = counts[AMBIGUOUS]
+    decimal, source = decision if decision is not None else _decide(votes, ambiguous)
+
+    conflicts: List[Tuple[int, Any]] = []
+    if decimal is not None:
+        other = "." if decimal == "," else ","
+        row_numbers: Iterable[int] = rows if rows is not None else range(1, len(values) + 1)
+        conflicts = [
+            (row, value) for row, value, reading in zip(row_numbers, values, cells) if reading == other
+        ]
+
+    return NumberColumnProfile(
+        field,
+        decimal,
+        source,
+        votes,
+        ambiguous if decimal is not None else 0,
+        ambiguous if decimal is None else 0,
+        conflicts,
+    )
+
+
+def profile_number_columns(
+    columns: Dict[str, Tuple[Sequence[int], Sequence[Any]]],
+    decisions: Optional[Dict[str, Decision]] = None,
+) -> Dict[str, NumberColumnProfile]:
+    """
+    Profile a batch's numeric columns, each on its own evidence.
+
+    Args:
+        columns: field -> (row numbers, raw values)
+        decisions: field -> (decimal, source) decided over a whole file
+            (NumberEvidence.decisions); other fields are decided here
+
+    Returns:
+        field -> NumberColumnProfile
+    """
+    decisions = decisions or {}
+    return {
+        field: profile_number_column(values, field, rows, decision=decisions.get(field))
+        for field, (rows, values) in columns.items()
+    }
+
+
+class NumberEvidence:
+    """
+    Unambiguous and ambiguous readings per numeric column, counted chunk by
+    chunk over a file too large to profile at once. Memory is constant: only
+    counts are kept.
+    """
+
+    def __init__(self) -> None:
+        self.votes: Dict[str, Dict[str, int]] = {}
+        self.ambiguous: Dict[str, int] = {}
+
+    def add(self, columns: Dict[str, Sequence[Any]]) -> None:
+        """
+        Count one chunk.
+
+        Args:
+            columns: field -> non-empty raw values of the chunk
+        """
+        for field, values in columns.items():
+            counts = Counter(_column_readings(values))
+            votes = self.votes.setdefault(field, {",": 0, ".": 0})
+            votes[","] += counts[","]
+            votes["."] += counts["."]
+            self.ambiguous[field] = self.ambiguous.get(field, 0) + counts[AMBIGUOUS]
+
+    def merge(self, other: "NumberEvidence") -> None:
+        """Add the counts of another chunk's (later in the file) evidence."""
+        for field, votes in other.votes.items():
+            merged = self.votes.setdefault(field, {",": 0, ".": 0})
+            merged[","] += votes[","]
+            merged["."] += votes["."]
+        for field, ambiguous in other.ambiguous.items():
+            self.ambiguous[field] = self.ambiguous.get(field, 0) + ambiguous
+
+    def decisions(self) -> Dict[str, Decision]:
+        """field -> (decimal, source), as profile_number_columns would decide for all chunks at once."""
+        return {field: _decide(votes, self.ambiguous.get(field, 0)) for field, votes in self.votes.items()}
+
+
+def merge_number_profiles(
+    total: Dict[str, NumberColumnProfile], chunk: Dict[str, NumberColumnProfile]
+) -> None:
+    """Add a chunk's profiles (made with the same decisions) into total, in place."""
+    for field, profile in chunk.items():
+        merged = total.get(field)
+        if merged is None:
+            total[field] = NumberColumnProfile(
+                field,
+                profile.decimal,
+                profile.source,
+                dict(profile.votes),
+                profile.ambiguous,
+                profile.guessed,
+                list(profile.conflicts),
+            )
+            continue
+        for mark, count in profile.votes.items():
+            merged.votes[mark] = merged.votes.get(mark, 0) + count
+        merged.ambiguous += profile.ambiguous
+        merged.guessed += profile.guessed
+        merged.conflicts.extend(profile.conflicts)
+
+
+def format_number_profiles(profiles: Dict[str, NumberColumnProfile], conflicts_only: bool = False) -> str:
+    """One summary line per profiled column (or per column with conflicts)."""
+    return "\n".join(
+        profile.summary() for profile in profiles.values() if profile.conflicts or not conflicts_only
+    )
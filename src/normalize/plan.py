@@ -0,0 +1,71 @@
+"""
+Normalization plans: which normalizer runs on which field, read from a schema.
+
+A column in a schema JSON may name its normalizer with a "normalize" hint;
+columns without one get their type's default (date -> "date", number ->
+"number"), and "none" turns normalization off. Fields rows carry that are
+not output columns (the LLM's raw "Price" in transactions) are listed in
+the schema's "normalize_fields" object, field -> hint.
+
+compile_plan flattens a schema into (field, hint) steps, once per schema
+file (it is part of src.compiled_config.CompiledSchema); the row
+normalizer runs the steps. A new column with a hint, or of type date or
+number, is normalized without a code change.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+# Hints the row normalizer knows (see src.normalize.row_normalizer)
+NORMALIZER_HINTS = ("date", "number", "yield", "property_type", "country", "city", "designation", "none")
+
+# Hint for columns without one, by column type
+TYPE_DEFAULT_HINTS = {"date": "date", "number": "number"}
+
+# Steps whose columns are profiled for their decimal mark first
+NUMBER_HINTS = ("number", "yield")
+
+PlanStep = Tuple[str, str]
+
+
+def schema_layouts(schema: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Column lists of a schema by key: "columns" for inbound; "columns_sweden" etc. for transactions."""
+    return {
+        key: value
+        for key, value in schema.items()
+        if (key == "columns" or key.startswith("columns_")) and isinstance(value, list)
+    }
+
+
+def compile_plan(schema: Dict[str, Any]) -> List[PlanStep]:
+    """
+    Normalization steps for a schema, in column order.
+
+    A field in several layouts (transactions' per-country column lists)
+    gets one step.
+
+    Args:
+        schema: Parsed schema JSON
+
+    Returns:
+        List of (field, hint)
+
+    Raises:
+        ValueError: On an unknown hint, or a field with different hints in two places
+    """
+    name = schema.get("schema_name", "schema")
+    hints: Dict[str, str] = {}
+
+    def add(field: str, hint: Any, where: str) -> None:
+        if hint not in NORMALIZER_HINTS:
+            raise ValueError(f"{name}: {where} '{field}': unknown normalize hint {hint!r}")
+        if hints.setdefault(field, hint) != hint:
+            raise ValueError(f"{name}: {where} '{field}': normalize hint {hint!r} conflicts with {hints[field]!r}")
+
+    for key, columns in schema_layouts(schema).items():
+        for column in columns:
+            hint = column.get("normalize", TYPE_DEFAULT_HINTS.get(column.get("type"), "none"))
+            add(column["name"], hint, f"{key} column")
+    for field, hint in (schema.get("normalize_fields") or {}).items():
+        add(field, hint, "normalize_fields entry")
+
+    return [(field, hint) for field, hint in hints.items() if hint != "none"]
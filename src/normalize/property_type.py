@@ -1,4 +1,40 @@
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Tuple, Union
+
+from src.normalize.aho_corasick import AhoCorasick
+from src.normalize.memo import memoize, versioned_mapping, VersionedMapping
+
+
+class PropertyTypeMatcher:
+    """
+    The synonyms of a property type mapping, compiled into one automaton.
+
+    match(text) gives the canonical types with a synonym occurring in text
+    (lower-cased), in mapping order - what checking every synonym with
+    `synonym in text` gives, in a single scan of the text.
+    """
+
+    def __init__(self, mapping: Dict[str, Any]):
+        synonyms = mapping.get("synonyms", {})
+        self.canonical_types: List[str] = list(synonyms)
+        self.automaton = AhoCorasick(
+            (str(k).strip().lower(), index)
+            for index, keys in enumerate(synonyms.values())
+            for k in keys or []
+        )
+
+    def match(self, text: str) -> List[str]:
+        """Matching canonical types, in mapping order, without duplicates."""
+        return [self.canonical_types[index] for index in sorted(self.automaton.search(text))]
+
+
+def property_type_matcher(mapping: Union[Dict[str, Any], VersionedMapping]) -> PropertyTypeMatcher:
+    """The compiled matcher for a mapping, built once per mapping version."""
+    if not isinstance(mapping, VersionedMapping):
+        mapping = versioned_mapping(mapping)
+    matcher = mapping.derived.get("property_types")
+    if matcher is None:
+        matcher = mapping.derived["property_types"] = PropertyTypeMatcher(mapping.mapping)
+    return matcher
 
 
 def normalize_property_type(raw_text: Any, mapping: Dict[str, Any]) -> Tuple[str, str]:
@@ -9,7 +45,15 @@ def normalize_property_type(raw_text: Any, mapping: Dict[str, Any]) -> Tuple[str
     - high: exact/single strong match
     - medium: multiple matches or weaker cues
     - low: nothing matched
+
+    Results are memoized per mapping version, so an edited mapping file
+    never returns results computed under the old one.
     """
+    return _normalize_property_type(raw_text, versioned_mapping(mapping))
+
+
+@memoize(name="normalize_property_type")
+def _normalize_property_type(raw_text: Any, mapping: VersionedMapping) -> Tuple[str, str]:
     if raw_text is None:
         return ("", "low")
 
@@ -17,30 +61,12 @@ def normalize_property_type(raw_text: Any, mapping: Dict[str, Any]) -> Tuple[str
     if text == "":
         return ("", "low")
 
-    synonyms = mapping.get("synonyms", {})
-    matches = []
-
-    for canonical, keys in synonyms.items():
-        for k in keys or []:
-            k2 = str(k).strip().lower()
-            if not k2:
-                continue
-            if k2 in text:
-                matches.append(canonical)
-                break
+    uniq = property_type_matcher(mapping).match(text)
 
-    if not matches:
+    if not uniq:
         # If no match, keep original but flag low confidence? For now return Other/low.
         return ("Other", "low")
 
-    # de-dup while preserving order
-    seen = set()
-    uniq = []
-    for m in matches:
-        if m not in seen:
-            uniq.append(m)
-            seen.add(m)
-
     if len(uniq) == 1:
         return (uniq[0], "high")
 
@@ -5,49 +5,217 @@ Each normalizer returns (normalized_value, confidence) where confidence is:
 - "high": successfully parsed/matched
 - "medium": partial match or ambiguous
 - "low": could not parse, returned empty or fallback
+
+Which fields are normalized, and how, comes from the schema JSON (a
+"normalize" hint per column, see src.normalize.plan), compiled once per
+schema file into a list of (field, hint) steps.
+
+Rows are normalized column by column (see column_normalizer), so a batch of
+rows normalizes each distinct raw value of a field only once. Numeric
+columns are profiled first, so ambiguous values like "1,500" are read with
+the column's decimal mark (see number_profile).
+
+A file too large to hold is normalized in chunks: number_evidence decides
+the decimal marks over the whole file first, and each chunk is normalized
+with those decisions, so the output is the same as for one batch.
 """
 
-from typing import Any, Dict, Tuple
-
-from src.normalize.property_type import normalize_property_type
-from src.normalize.date_normalizer import normalize_date
-from src.normalize.number_normalizer import normalize_number, normalize_price, normalize_area, normalize_yield
-from src.normalize.country_normalizer import normalize_country
-from src.normalize.designation_normalizer import normalize_property_designation
-from src.normalize.city_normalizer import normalize_city
-
-
-# Field definitions for each schema type
-# Maps field names to their normalization function
-
-INBOUND_DATE_FIELDS = ["Date received"]
-INBOUND_NUMBER_FIELDS = [
-    "Leasable area, sqm",
-    "Base rent incl. index, CCY/sqm",
-    "NOI, CCY",
-    "NOI, CCY/sqm",
-    "WAULT, years",
-    "Deal value, CCY",
-    "Deal value, CCY/sqm",
-    "Price, CCY",
-    "Price, CCY/sqm",
-]
-INBOUND_YIELD_FIELDS = ["Yield", "Yield2", "Economic occupancy rate, %"]
-INBOUND_PROPERTY_TYPE_FIELDS = ["Use"]
-
-TRANSACTIONS_DATE_FIELDS = ["Date"]
-TRANSACTIONS_NUMBER_FIELDS = [
-    "Area, m2",
-    "Price",  # Raw price in millions from LLM
-    "Price, MSEK",
-    "Price, MDKK",
-    "Price, MEUR",
-    "Price, SEK/m2",
-    "Price, DKK/m2",
-    "Price, EUR/m2",
-]
-TRANSACTIONS_YIELD_FIELDS = ["Yield"]
-TRANSACTIONS_PROPERTY_TYPE_FIELDS = ["Property type", "Property type 2"]
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.compact_row import shared_layout
+from src.normalize.column_normalizer import (
+    column_values,
+    normalize_city_column,
+    normalize_country_column,
+    normalize_date_column,
+    normalize_designation_column,
+    normalize_price_column,
+    normalize_property_type_column,
+    normalize_yield_column,
+)
+from src.normalize.number_profile import Decision, NumberColumnProfile, NumberEvidence, profile_number_columns
+from src.normalize.plan import NUMBER_HINTS, PlanStep
+from src.resources import INBOUND_SCHEMA_PATH, TRANSACTIONS_SCHEMA_PATH, get_compiled_schema
+
+
+ColumnRule = Tuple[Callable[[List[Any]], Tuple[List[Any], List[str]]], Callable[[Any], bool]]
+Column = Tuple[List[int], List[Any]]
+
+
+def _if_found(canon: Any) -> bool:
+    """Replace the raw value only if the normalizer returned something."""
+    return bool(canon)
+
+
+def _if_parsed(canon: Any) -> bool:
+    """Replace the raw value only if the number parsed (0 is a valid number)."""
+    return canon != ""
+
+
+def _always(canon: Any) -> bool:
+    return True
+
+
+# Hints whose normalizer needs nothing but the column
+_COLUMN_RULES: Dict[str, ColumnRule] = {
+    "country": (normalize_country_column, _if_found),
+    "city": (normalize_city_column, _if_found),
+    # Property designation (abbreviate repeated prefixes)
+    "designation": (normalize_designation_column, _if_found),
+}
+
+
+def _date_rule(field: str, date_stats: Optional[Dict[str, Dict[str, Any]]]) -> ColumnRule:
+    if date_stats is None:
+        return (normalize_date_column, _if_found)
+    return (lambda values: normalize_date_column(values, date_stats.setdefault(field, {})), _if_found)
+
+
+def _number_rule(normalize_column: Callable[..., Tuple[Any, List[str]]], decimal: Optional[str]) -> ColumnRule:
+    if decimal is None:
+        return (normalize_column, _if_parsed)
+    return (lambda values: normalize_column(values, decimal=decimal), _if_parsed)
+
+
+def _step_rule(
+    field: str,
+    hint: str,
+    property_map: Dict[str, Any],
+    date_stats: Optional[Dict[str, Dict[str, Any]]],
+    decimals: Dict[str, Optional[str]],
+) -> ColumnRule:
+    """The column normalizer for one plan step, bound to this batch's settings."""
+    if hint == "date":
+        return _date_rule(field, date_stats)
+    if hint == "number":
+        return _number_rule(normalize_price_column, decimals.get(field))
+    if hint == "yield":
+        return _number_rule(normalize_yield_column, decimals.get(field))
+    if hint == "property_type":
+        return (lambda values: normalize_property_type_column(values, property_map), _always)
+    return _COLUMN_RULES[hint]
+
+
+def normalize_rows(
+    rows: Sequence[Dict[str, Any]],
+    plan: List[PlanStep],
+    property_map: Dict[str, Any],
+    date_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    number_profiles: Optional[Dict[str, NumberColumnProfile]] = None,
+    number_decisions: Optional[Dict[str, Decision]] = None,
+    first_row: int = 1,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Normalize a batch of rows, column by column, following a plan.
+
+    Args:
+        rows: Rows as dicts or CompactRows (not modified)
+        plan: (field, hint) steps, e.g. CompiledSchema.plan
+        property_map: Property type mapping, for "property_type" steps
+        date_stats: Optional dict; filled with the inferred format and
+            fast/slow path counts per date field (see normalize_date_column)
+        number_profiles: Optional dict; filled with the separator profile
+            (decimal mark, conflicting cells) per numeric field
+        number_decisions: Decimal marks decided beforehand per numeric
+            field (NumberEvidence.decisions), for a chunk of a larger file;
+            by default they are decided from this batch
+        first_row: Row number of rows[0] in conflict diagnostics
+
+    Returns: (normalized_rows, metadata), one entry per input row
+    - metadata contains confidence scores for each normalized field
+    """
+    # Compact rows over one layout are read and written by cell position
+    layout = shared_layout(rows)
+
+    # Each field's non-empty cells, gathered once; a step only rewrites its own field
+    columns: Dict[str, Column] = {}
+    for field, _ in plan:
+        indexes, values = column_values(rows, field, layout)
+        if indexes:
+            columns[field] = (indexes, values)
+
+    number_columns = {
+        field: ([first_row + i for i in columns[field][0]], columns[field][1])
+        for field, hint in plan
+        if hint in NUMBER_HINTS and field in columns
+    }
+    profiles = profile_number_columns(number_columns, number_decisions)
+    if number_profiles is not None:
+        number_profiles.update(profiles)
+    decimals = {field: profile.decimal for field, profile in profiles.items()}
+
+    # dict.copy / CompactRow.copy: compact rows stay compact
+    out = [row.copy() for row in rows]
+    meta: List[Dict[str, Any]] = [{} for _ in rows]
+    for field, hint in plan:
+        # Empty cells are left alone and get no confidence entry
+        if field not in columns:
+            continue
+        indexes, values = columns[field]
+        normalize, replace = _step_rule(field, hint, property_map, date_stats, decimals)
+        canons, confs = normalize(values)
+        position = layout.index.get(field) if layout is not None else None
+        for i, canon in zip(indexes, canons):
+            if replace(canon):
+                if position is None:
+                    out[i][field] = canon
+                else:
+                    out[i].cells[position] = canon
+        key = f"{field}_confidence"
+        for i, conf in zip(indexes, confs):
+            meta[i][key] = conf
+
+    return out, meta
+
+
+def number_evidence(chunks: Iterable[Sequence[Dict[str, Any]]], plan: List[PlanStep]) -> NumberEvidence:
+    """
+    Count the separator evidence of a plan's numeric fields over chunks of rows.
+
+    Args:
+        chunks: Batches of rows (e.g. iter_tsv_chunks of a file)
+        plan: (field, hint) steps
+
+    Returns:
+        NumberEvidence; its decisions() are normalize_rows' number_decisions
+        for every chunk
+    """
+    evidence = NumberEvidence()
+    number_fields = [field for field, hint in plan if hint in NUMBER_HINTS]
+    for rows in chunks:
+        layout = shared_layout(rows)
+        evidence.add({field: column_values(rows, field, layout)[1] for field in number_fields})
+    return evidence
+
+
+def inbound_plan() -> List[PlanStep]:
+    """Normalization plan of the inbound deal list schema."""
+    return get_compiled_schema(INBOUND_SCHEMA_PATH).plan
+
+
+def transactions_plan() -> List[PlanStep]:
+    """Normalization plan of the transactions schema (all countries' columns)."""
+    return get_compiled_schema(TRANSACTIONS_SCHEMA_PATH).plan
+
+
+def normalize_inbound_rows(
+    rows: Sequence[Dict[str, Any]],
+    property_map: Dict[str, Any],
+    date_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    number_profiles: Optional[Dict[str, NumberColumnProfile]] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Normalize a batch of inbound deal rows (see normalize_rows)."""
+    return normalize_rows(rows, inbound_plan(), property_map, date_stats, number_profiles)
+
+
+def normalize_transactions_rows(
+    rows: Sequence[Dict[str, Any]],
+    property_map: Dict[str, Any],
+    date_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    number_profiles: Optional[Dict[str, NumberColumnProfile]] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Normalize a batch of transactions rows (see normalize_rows)."""
+    return normalize_rows(rows, transactions_plan(), property_map, date_stats, number_profiles)
 
 
 def normalize_inbound_row(row: Dict[str, Any], property_map: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -57,62 +225,8 @@ def normalize_inbound_row(row: Dict[str, Any], property_map: Dict[str, Any]) ->
     Returns: (normalized_row, metadata)
     - metadata contains confidence scores for each normalized field
     """
-    out = dict(row)
-    meta: Dict[str, Any] = {}
-
-    # Date fields
-    for field in INBOUND_DATE_FIELDS:
-        if field in out and out[field]:
-            canon, conf = normalize_date(out[field])
-            if canon:  # Only update if we got a valid result
-                out[field] = canon
-            meta[f"{field}_confidence"] = conf
-
-    # Property type fields
-    for field in INBOUND_PROPERTY_TYPE_FIELDS:
-        if field in out and out[field]:
-            canon, conf = normalize_property_type(out[field], property_map)
-            meta[f"{field}_confidence"] = conf
-            out[field] = canon
-
-    # Country field
-    if "Country" in out and out["Country"]:
-        canon, conf = normalize_country(out["Country"])
-        if canon:
-            out["Country"] = canon
-        meta["Country_confidence"] = conf
-
-    # Location field (city name normalization)
-    if "Location" in out and out["Location"]:
-        canon, conf = normalize_city(out["Location"])
-        if canon:
-            out["Location"] = canon
-        meta["Location_confidence"] = conf
-
-    # Number fields (prices, areas, etc.)
-    for field in INBOUND_NUMBER_FIELDS:
-        if field in out and out[field]:
-            canon, conf = normalize_price(out[field])
-            if canon != "":
-                out[field] = canon
-            meta[f"{field}_confidence"] = conf
-
-    # Yield/percentage fields
-    for field in INBOUND_YIELD_FIELDS:
-        if field in out and out[field]:
-            canon, conf = normalize_yield(out[field])
-            if canon != "":
-                out[field] = canon
-            meta[f"{field}_confidence"] = conf
-
-    # Property designation (abbreviate repeated prefixes)
-    if "Property designation" in out and out["Property designation"]:
-        canon, conf = normalize_property_designation(out["Property designation"])
-        if canon:
-            out["Property designation"] = canon
-        meta["Property designation_confidence"] = conf
-
-    return out, meta
+    out, meta = normalize_inbound_rows([row], property_map)
+    return out[0], meta[0]
 
 
 def normalize_transactions_row(row: Dict[str, Any], property_map: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -122,52 +236,5 @@ def normalize_transactions_row(row: Dict[str, Any], property_map: Dict[str, Any]
     Returns: (normalized_row, metadata)
     - metadata contains confidence scores for each normalized field
     """
-    out = dict(row)
-    meta: Dict[str, Any] = {}
-
-    # Date fields
-    for field in TRANSACTIONS_DATE_FIELDS:
-        if field in out and out[field]:
-            canon, conf = normalize_date(out[field])
-            if canon:  # Only update if we got a valid result
-                out[field] = canon
-            meta[f"{field}_confidence"] = conf
-
-    # Property type fields
-    for field in TRANSACTIONS_PROPERTY_TYPE_FIELDS:
-        if field in out and out[field]:
-            canon, conf = normalize_property_type(out[field], property_map)
-            meta[f"{field}_confidence"] = conf
-            out[field] = canon
-
-    # Country field
-    if "Country" in out and out["Country"]:
-        canon, conf = normalize_country(out["Country"])
-        if canon:
-            out["Country"] = canon
-        meta["Country_confidence"] = conf
-
-    # Location field (city name normalization)
-    if "Location" in out and out["Location"]:
-        canon, conf = normalize_city(out["Location"])
-        if canon:
-            out["Location"] = canon
-        meta["Location_confidence"] = conf
-
-    # Number fields (prices, areas)
-    for field in TRANSACTIONS_NUMBER_FIELDS:
-        if field in out and out[field]:
-            canon, conf = normalize_price(out[field])
-            if canon != "":
-                out[field] = canon
-            meta[f"{field}_confidence"] = conf
-
-    # Yield fields
-    for field in TRANSACTIONS_YIELD_FIELDS:
-        if field in out and out[field]:
-            canon, conf = normalize_yield(out[field])
-            if canon != "":
-                out[field] = canon
-            meta[f"{field}_confidence"] = conf
-
-    return out, meta
+    out, meta = normalize_transactions_rows([row], property_map)
+    return out[0], meta[0]
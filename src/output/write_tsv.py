@@ -1,23 +1,84 @@
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 
+from src.compact_row import row_values
+from src.compressed_io import open_text
 
-def write_tsv(out_path: Path, schema: Dict[str, Any], rows: List[Dict[str, Any]]) -> None:
+# Lines formatted before each write to the file
+WRITE_BATCH_ROWS = 10_000
+
+
+def _tsv_line(row: Dict[str, Any], cols: List[str]) -> str:
+    vals = []
+    for v in row_values(row, cols):
+        if v is None:
+            v = ""
+        vals.append(str(v))
+    return "\t".join(vals)
+
+
+def format_tsv_rows(rows: Iterable[Dict[str, Any]], cols: List[str]) -> str:
+    """Rows as TSV lines in cols order, each ending in a newline (no header)."""
+    return "".join([_tsv_line(r, cols) + "\n" for r in rows])
+
+
+class TsvWriter:
     """
-    Writes TSV with columns in the exact schema order.
+    Writes a TSV incrementally: the header on open, then batches of rows.
+
+    Each write_rows call is flushed to the file, so an interrupted run
+    leaves every batch written so far. The output is the same as
+    write_tsv's for the same rows. Use as a context manager.
+
+    Blocks formatted elsewhere (format_tsv_rows, e.g. in a worker process)
+    are written with write_block, in the order they are passed.
+
+    A .gz or .zst out_path is compressed (see src.compressed_io).
     """
-    cols = [c["name"] for c in schema["columns"]]
 
-    lines = []
-    lines.append("\t".join(cols))
+    def __init__(self, out_path: Path, schema: Dict[str, Any]):
+        self.out_path = out_path
+        self.cols = [c["name"] for c in schema["columns"]]
+        self.rows_written = 0
+        self._file: Optional[Any] = None
 
-    for r in rows:
-        vals = []
-        for c in cols:
-            v = r.get(c, "")
-            if v is None:
-                v = ""
-            vals.append(str(v))
-        lines.append("\t".join(vals))
+    def __enter__(self) -> "TsvWriter":
+        self._file = open_text(self.out_path, "w")
+        self._file.write("\t".join(self.cols) + "\n")
+        return self
 
-    out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Write rows in schema column order and flush them.
+
+        rows may be any iterable (a generator over a large file); lines
+        are formatted and written WRITE_BATCH_ROWS at a time.
+        """
+        cols = self.cols
+        batch: List[str] = []
+        for r in rows:
+            batch.append(_tsv_line(r, cols) + "\n")
+            if len(batch) >= WRITE_BATCH_ROWS:
+                self._file.write("".join(batch))
+                self.rows_written += len(batch)
+                batch = []
+        self.write_block("".join(batch), len(batch))
+
+    def write_block(self, block: str, row_count: int) -> None:
+        """Write row_count rows already formatted by format_tsv_rows, and flush them."""
+        self._file.write(block)
+        self._file.flush()
+        self.rows_written += row_count
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._file.close()
+
+
+def write_tsv(out_path: Path, schema: Dict[str, Any], rows: Iterable[Dict[str, Any]]) -> None:
+    """
+    Writes TSV with columns in the exact schema order.
+
+    rows may be a list or any iterable of rows; .gz/.zst paths are compressed.
+    """
+    with TsvWriter(out_path, schema) as writer:
+        writer.write_rows(rows)
@@ -0,0 +1,49 @@
+"""
+Locations of the bundled config files.
+
+Paths are anchored at the repository root, not the current working
+directory, so the CLI and pipelines work when started from anywhere.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONFIG_DIR = REPO_ROOT / "config"
+
+PROPERTY_MAP_PATH = str(CONFIG_DIR / "mappings" / "property_type_map.yml")
+CITY_NAMES_PATH = str(CONFIG_DIR / "mappings" / "city_names.yml")
+COUNTRY_SYNONYMS_PATH = str(CONFIG_DIR / "mappings" / "country_synonyms.yml")
+INBOUND_SCHEMA_PATH = str(CONFIG_DIR / "schemas" / "inbound_purple.schema.json")
+TRANSACTIONS_SCHEMA_PATH = str(CONFIG_DIR / "schemas" / "transactions.schema.json")
+GAZETTEER_PATH = str(CONFIG_DIR / "gazetteer" / "nordic_municipalities.tsv")
+
+# Compiled (pickled) config files; set the variable to "off" to disable the cache
+CONFIG_CACHE_ENV = "DEAL_PIPELINE_CONFIG_CACHE"
+DEFAULT_CONFIG_CACHE_DIR = REPO_ROOT / ".cache" / "config"
+
+
+def resolve_config_path(path: Union[str, Path]) -> Path:
+    """
+    Resolve a config path.
+
+    Absolute paths and paths that exist relative to the working directory are
+    used as given; other relative paths (e.g. "config/schemas/...") are looked
+    up under the repository root.
+    """
+    p = Path(path)
+    if p.is_absolute() or p.exists():
+        return p
+    candidate = REPO_ROOT / p
+    return candidate if candidate.exists() else p
+
+
+def config_cache_dir() -> Optional[Path]:
+    """Where compiled config is cached, or None if caching is disabled."""
+    value = os.environ.get(CONFIG_CACHE_ENV)
+    if value is None:
+        return DEFAULT_CONFIG_CACHE_DIR
+    if value.strip().lower() in ("", "0", "off", "false", "no"):
+        return None
+    return Path(value)
@@ -8,9 +8,9 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from src.extract.extractor import Extractor, ExtractionError
+from src.extract.extractor import ExtractionError
 from src.normalize.row_normalizer import normalize_transactions_row, normalize_inbound_row
-from src.normalize.load_mappings import load_property_map
+from src.resources import get_extractor, get_property_map
 
 
 def extract_and_normalize_transaction(
@@ -25,8 +25,8 @@ def extract_and_normalize_transaction(
         Tuple of (normalized_row, metadata)
         - metadata includes extraction info and normalization confidence
     """
-    extractor = Extractor(api_key=api_key)
-    property_map = load_property_map()
+    extractor = get_extractor(api_key)
+    property_map = get_property_map()
 
     # Extract
     raw_row, extract_meta = extractor.extract_transaction(article_text, source_url)
@@ -54,8 +54,8 @@ def extract_and_normalize_inbound(
     Returns:
         Tuple of (normalized_row, metadata)
     """
-    extractor = Extractor(api_key=api_key)
-    property_map = load_property_map()
+    extractor = get_extractor(api_key)
+    property_map = get_property_map()
 
     # Extract
     raw_row, extract_meta = extractor.extract_inbound(document_text, date_received)
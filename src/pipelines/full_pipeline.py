@@ -5,18 +5,29 @@ This is the end-to-end flow for processing articles or PDFs.
 Supports: text files, URLs, and direct PDF files.
 """
 
+import itertools
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from src.extract.extractor import Extractor, ExtractionError
+from src.extract.extractor import ExtractionError
 from src.normalize.row_normalizer import normalize_transactions_row, normalize_inbound_row
-from src.normalize.load_mappings import load_property_map
 from src.render.row_renderer import row_to_tsv_line, render_transaction_row, render_inbound_row, get_transaction_columns
-from src.render.excel_writer import write_excel, append_to_excel, get_sheet_name_for_country, SHEET_DEAL_LIST
-from src.validate.schema_loader import load_schema
+from src.render.excel_writer import write_excel, append_to_excel, append_rows_to_excel, get_sheet_name_for_country, SHEET_DEAL_LIST
+from src.resources import (
+    get_extractor,
+    get_property_map,
+    get_schema,
+    INBOUND_SCHEMA_PATH,
+    TRANSACTIONS_SCHEMA_PATH,
+)
 from src.fetch.url_fetcher import fetch_article_from_url
-from src.fetch.pdf_reader import extract_text_from_pdf
+from src.fetch.pdf_reader import extract_text_from_pdf, PDF_KIND_IMAGE_ONLY
+from src.ingest.manifest import file_sha256, ProcessingManifest, STATUS_SUCCESS, STATUS_FAILED, STATUS_IMAGE_ONLY
+from src.ingest.pdf_walker import iter_pdf_documents, PdfSource
+
+# Default manifest file for process_pdf_folder, kept inside the PDF folder
+DEAL_MANIFEST_NAME = ".deal_manifest.json"
 
 
 def process_article_to_tsv(
@@ -34,9 +45,9 @@ def process_article_to_tsv(
     """
     try:
         # Load resources
-        extractor = Extractor(api_key=api_key)
-        property_map = load_property_map()
-        schema = load_schema("config/schemas/transactions.schema.json")
+        extractor = get_extractor(api_key)
+        property_map = get_property_map()
+        schema = get_schema(TRANSACTIONS_SCHEMA_PATH)
 
         # Extract
         raw_row, extract_meta = extractor.extract_transaction(article_text, source_url)
@@ -74,9 +85,9 @@ def process_pdf_to_tsv(
     """
     try:
         # Load resources
-        extractor = Extractor(api_key=api_key)
-        property_map = load_property_map()
-        schema = load_schema("config/schemas/inbound_purple.schema.json")
+        extractor = get_extractor(api_key)
+        property_map = get_property_map()
+        schema = get_schema(INBOUND_SCHEMA_PATH)
 
         # Extract
         raw_row, extract_meta = extractor.extract_inbound(document_text, date_received)
@@ -120,9 +131,9 @@ def process_article_file(
 
     try:
         # Load resources
-        extractor = Extractor(api_key=api_key)
-        property_map = load_property_map()
-        schema = load_schema("config/schemas/transactions.schema.json")
+        extractor = get_extractor(api_key)
+        property_map = get_property_map()
+        schema = get_schema(TRANSACTIONS_SCHEMA_PATH)
 
         # Extract
         raw_row, extract_meta = extractor.extract_transaction(article_text, source_url)
@@ -174,9 +185,9 @@ def process_pdf_file(
 
     try:
         # Load resources
-        extractor = Extractor(api_key=api_key)
-        property_map = load_property_map()
-        schema = load_schema("config/schemas/inbound_purple.schema.json")
+        extractor = get_extractor(api_key)
+        property_map = get_property_map()
+        schema = get_schema(INBOUND_SCHEMA_PATH)
         columns = [c["name"] for c in schema["columns"]]
 
         # Extract
@@ -232,9 +243,9 @@ def process_article_url(
 
     try:
         # Load resources
-        extractor = Extractor(api_key=api_key)
-        property_map = load_property_map()
-        schema = load_schema("config/schemas/transactions.schema.json")
+        extractor = get_extractor(api_key)
+        property_map = get_property_map()
+        schema = get_schema(TRANSACTIONS_SCHEMA_PATH)
 
         # Extract (use the URL as source)
         raw_row, extract_meta = extractor.extract_transaction(article_text, url)
@@ -279,6 +290,10 @@ def process_pdf_direct(
     date_received: str = "",
     api_key: Optional[str] = None,
     append: bool = True,
+    clean_text: bool = True,
+    pages: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+    pdf_engine: Optional[str] = None,
 ) -> Tuple[bool, str, str]:
     """
     Full pipeline: PDF file -> extract text -> extract deal -> normalize -> TSV.
@@ -289,20 +304,27 @@ def process_pdf_direct(
         date_received: Date the PDF was received (yyyy/mm/dd)
         api_key: Optional Anthropic API key
         append: If True, append to existing Excel file (default). If False, create new file.
+        clean_text: Strip repeated headers/footers/page numbers before extraction (default)
+        pages: Only read these pages, e.g. "1-10" (default: all)
+        max_tokens: Stop reading pages once this many input tokens are collected
+        pdf_engine: PDF text engine name (default pypdf, see src.fetch.pdf_engines)
 
     Returns:
         Tuple of (success, message, tsv_output)
+        - on success, message is the PDF text extraction summary
     """
     # Extract text from PDF
-    ok, msg, document_text = extract_text_from_pdf(pdf_path)
+    ok, msg, document_text = extract_text_from_pdf(
+        pdf_path, clean=clean_text, pages=pages, max_tokens=max_tokens, engine=pdf_engine
+    )
     if not ok:
         return False, f"Failed to read PDF: {msg}", ""
 
     try:
         # Load resources
-        extractor = Extractor(api_key=api_key)
-        property_map = load_property_map()
-        schema = load_schema("config/schemas/inbound_purple.schema.json")
+        extractor = get_extractor(api_key)
+        property_map = get_property_map()
+        schema = get_schema(INBOUND_SCHEMA_PATH)
         columns = [c["name"] for c in schema["columns"]]
 
         # Extract
@@ -329,7 +351,7 @@ def process_pdf_direct(
             else:
                 output_path.write_text(tsv + "\n", encoding="utf-8")
 
-        return True, "Success", tsv
+        return True, msg, tsv
 
     except ExtractionError as e:
         return False, f"Extraction failed: {e}", ""
@@ -337,90 +359,216 @@ def process_pdf_direct(
         return False, f"Error: {e}", ""
 
 
+def process_inbound_pdf(
+    pdf_path: Path,
+    extractor: Any,
+    property_map: Dict[str, Any],
+    schema: Dict[str, Any],
+    date_received: str = "",
+    clean_text: bool = True,
+    pages: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+    pdf_engine: Optional[str] = None,
+    stats: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    One PDF through the inbound pipeline with already-loaded resources.
+
+    Shared by the batch (process_pdf_folder) and watch-folder pipelines.
+
+    Args:
+        pdf_path: Path to PDF file
+        extractor: Extractor instance (see src.resources.get_extractor)
+        property_map: Property type mappings
+        schema: Inbound schema
+        stats: Optional dict that receives the PDF text statistics
+
+    Returns:
+        Tuple of (status, message, normalized_row, rendered_row)
+        - status is STATUS_SUCCESS, STATUS_FAILED or STATUS_IMAGE_ONLY
+        - rows are None unless status is STATUS_SUCCESS
+    """
+    if stats is None:
+        stats = {}
+
+    ok, msg, document_text = extract_text_from_pdf(
+        pdf_path, clean=clean_text, stats=stats, pages=pages, max_tokens=max_tokens,
+        engine=pdf_engine,
+    )
+    if not ok:
+        image_only = stats.get("pdf_kind") == PDF_KIND_IMAGE_ONLY
+        return (STATUS_IMAGE_ONLY if image_only else STATUS_FAILED), msg, None, None
+
+    try:
+        # Extract deal data
+        raw_row, extract_meta = extractor.extract_inbound(document_text, date_received)
+
+        # Normalize
+        normalized_row, norm_meta = normalize_inbound_row(raw_row, property_map)
+
+        # Render
+        rendered_row = render_inbound_row(normalized_row, schema)
+
+    except ExtractionError as e:
+        return STATUS_FAILED, f"Extraction failed: {e}", None, None
+    except Exception as e:
+        return STATUS_FAILED, f"Error: {e}", None, None
+
+    return STATUS_SUCCESS, msg, normalized_row, rendered_row
+
+
 def process_pdf_folder(
     folder_path: Path,
     output_path: Optional[Path] = None,
     date_received: str = "",
     api_key: Optional[str] = None,
     max_files: int = 20,
+    clean_text: bool = True,
+    pages: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+    pdf_engine: Optional[str] = None,
+    incremental: bool = True,
+    retry_failed: bool = False,
+    manifest_path: Optional[Path] = None,
+    recursive: bool = False,
+    include_archives: bool = False,
 ) -> Tuple[bool, str, List[Dict[str, Any]]]:
     """
-    Batch process all PDF files in a folder -> single Excel output.
+    Batch process new PDF files in a folder -> single Excel output.
+
+    PDFs are discovered as a stream (see src.ingest.pdf_walker), optionally
+    through subfolders and inside zip archives and saved .eml emails, and
+    identical documents are only processed once.
+
+    Outcomes are recorded in a manifest keyed by content hash (see
+    src.ingest.manifest), so reruns only process new or changed PDFs.
+    max_files limits each run to that many *pending* files; run again to
+    continue through a large folder.
 
     Args:
         folder_path: Path to folder containing PDF files
         output_path: Output Excel file path (.xlsx)
         date_received: Date the PDFs were received (yyyy/mm/dd)
         api_key: Optional Anthropic API key
-        max_files: Maximum number of PDFs to process (default 20)
+        max_files: Maximum number of pending PDFs to process in this run (default 20)
+        clean_text: Strip repeated headers/footers/page numbers before extraction (default)
+        pages: Only read these pages of each PDF, e.g. "1-10" (default: all)
+        max_tokens: Per-PDF input token budget; later pages are not read
+        pdf_engine: PDF text engine name (default pypdf, see src.fetch.pdf_engines)
+        incremental: Skip PDFs already recorded in the manifest (default). If
+            False, every PDF is processed and the manifest is not touched.
+        retry_failed: Also reprocess PDFs whose last attempt failed
+        manifest_path: Manifest file (default: <folder>/.deal_manifest.json)
+        recursive: Also process PDFs in subfolders
+        include_archives: Also process PDFs inside .zip and .eml files
 
     Returns:
         Tuple of (success, message, list_of_results)
-        - Each result is {"file": filename, "success": bool, "row": dict or None, "error": str or None}
+        - Each result is {"file": name relative to the folder (archive members
+          as "archive.zip!member.pdf"), "success": bool, "row": dict or None,
+          "error": str or None, "image_only": bool}
+        - Image-only (scanned) PDFs are skipped without an LLM call and counted
+          separately from failures
     """
-    # Find all PDF files in folder
-    pdf_files = sorted(folder_path.glob("*.pdf"))
-    if not pdf_files:
-        return False, f"No PDF files found in {folder_path}", []
+    manifest = None
+    hasher = file_sha256
+    if incremental:
+        manifest = ProcessingManifest.load(manifest_path or folder_path / DEAL_MANIFEST_NAME)
+        hasher = manifest.hash_of
+
+    # Discovered lazily: files are hashed and archives opened only as the run reaches them
+    walk_stats: Dict[str, Any] = {}
+    documents = iter_pdf_documents(
+        folder_path, recursive=recursive, include_archives=include_archives,
+        stats=walk_stats, hasher=hasher,
+    )
+    skipped = {"already_done": 0}
+
+    def pending_documents() -> Iterator[PdfSource]:
+        for doc in documents:
+            if manifest is None or manifest.hash_needs_processing(doc.sha256, retry_failed):
+                yield doc
+            else:
+                skipped["already_done"] += 1
 
-    if len(pdf_files) > max_files:
-        pdf_files = pdf_files[:max_files]
+    pending = pending_documents()
+    first = next(pending, None)
+    if first is None:
+        if not walk_stats["found"]:
+            return False, f"No PDF files found in {folder_path}", []
+        return True, f"Nothing new: all {walk_stats['found']} PDFs already processed", []
 
-    # Load resources once (shared across all PDFs)
+    # Shared resources (cached process-wide by src.resources)
     try:
-        extractor = Extractor(api_key=api_key)
-        property_map = load_property_map()
-        schema = load_schema("config/schemas/inbound_purple.schema.json")
+        extractor = get_extractor(api_key)
+        property_map = get_property_map()
+        schema = get_schema(INBOUND_SCHEMA_PATH)
         columns = [c["name"] for c in schema["columns"]]
     except Exception as e:
         return False, f"Failed to load resources: {e}", []
 
     results: List[Dict[str, Any]] = []
     rendered_rows: List[Dict[str, Any]] = []
+    # (sha256, name, status, message); not the documents, so their bytes can be freed
+    outcomes: List[Tuple[str, str, str, str]] = []
     success_count = 0
     fail_count = 0
+    image_only_count = 0
+    tokens_before = 0
+    tokens_after = 0
+
+    processed = 0
+    for doc in itertools.chain([first], pending):
+        processed += 1
+        print(f"[{processed}] {doc.name}", end=" ... ", flush=True)
+
+        pdf_stats: Dict[str, Any] = {}
+        status, msg, normalized_row, rendered_row = process_inbound_pdf(
+            doc.pdf_input(), extractor, property_map, schema, date_received,
+            clean_text=clean_text, pages=pages, max_tokens=max_tokens,
+            pdf_engine=pdf_engine, stats=pdf_stats,
+        )
+        tokens_before += pdf_stats.get("tokens_before", 0)
+        tokens_after += pdf_stats.get("tokens_after", 0)
+        outcomes.append((doc.sha256, doc.name, status, msg))
 
-    for i, pdf_path in enumerate(pdf_files, 1):
-        print(f"[{i}/{len(pdf_files)}] {pdf_path.name}", end=" ... ", flush=True)
-
-        # Extract text from PDF
-        ok, msg, document_text = extract_text_from_pdf(pdf_path)
-        if not ok:
-            print("FAILED")
-            results.append({"file": pdf_path.name, "success": False, "row": None, "error": msg})
-            fail_count += 1
-            continue
-
-        try:
-            # Extract deal data
-            raw_row, extract_meta = extractor.extract_inbound(document_text, date_received)
-
-            # Normalize
-            normalized_row, norm_meta = normalize_inbound_row(raw_row, property_map)
-
-            # Render
-            rendered_row = render_inbound_row(normalized_row, schema)
+        if status == STATUS_SUCCESS:
             rendered_rows.append(rendered_row)
-
-            results.append({"file": pdf_path.name, "success": True, "row": normalized_row, "error": None})
+            results.append({"file": doc.name, "success": True, "row": normalized_row, "error": None, "image_only": False})
             success_count += 1
             print("OK")
-
-        except ExtractionError as e:
-            print("FAILED")
-            results.append({"file": pdf_path.name, "success": False, "row": None, "error": str(e)})
+        elif status == STATUS_IMAGE_ONLY:
+            results.append({"file": doc.name, "success": False, "row": None, "error": msg, "image_only": True})
+            image_only_count += 1
+            print("SKIPPED (image-only)")
+        else:
+            results.append({"file": doc.name, "success": False, "row": None, "error": msg, "image_only": False})
             fail_count += 1
-        except Exception as e:
             print("FAILED")
-            results.append({"file": pdf_path.name, "success": False, "row": None, "error": str(e)})
-            fail_count += 1
 
-    # Write output file
-    if output_path and rendered_rows:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        # Use append mode to add to Deal list sheet
-        for rendered_row in rendered_rows:
-            append_to_excel(rendered_row, columns, output_path, SHEET_DEAL_LIST)
+        if processed >= max_files:
+            break
+    more_pending = next(pending, None) is not None
 
-    summary = f"Processed {len(pdf_files)} PDFs: {success_count} success, {fail_count} failed"
+    # Write output file (one workbook load/save for the whole batch)
+    if output_path and rendered_rows:
+        append_rows_to_excel(rendered_rows, columns, output_path, SHEET_DEAL_LIST)
+
+    # Record outcomes only once the rows are safely written
+    if manifest is not None:
+        for sha256, name, status, message in outcomes:
+            manifest.record_hash(sha256, name, status, message)
+        manifest.save()
+
+    summary = f"Processed {processed} PDFs: {success_count} success, {fail_count} failed"
+    if image_only_count:
+        summary += f", {image_only_count} image-only skipped (need OCR)"
+    if skipped["already_done"]:
+        summary += f", {skipped['already_done']} already processed"
+    if walk_stats["duplicates"]:
+        summary += f", {walk_stats['duplicates']} duplicates skipped"
+    if clean_text and tokens_before:
+        summary += f" (boilerplate removal: ~{tokens_before:,} -> ~{tokens_after:,} input tokens)"
+    if more_pending:
+        summary += "; more PDFs pending - run again to continue"
     return success_count > 0, summary, results
\ No newline at end of file
@@ -1,36 +1,225 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from src.ingest.read_tsv import read_tsv
-from src.output.write_tsv import write_tsv
-from src.validate.schema_loader import load_schema
+from src.compact_row import row_layout
+from src.ingest.read_tsv import DEFAULT_CHUNK_ROWS, iter_tsv_chunks, iter_tsv_lines, parse_tsv_line
+from src.output.write_tsv import TsvWriter, format_tsv_rows
+from src.resources import get_property_map, get_schema
+from src.normalize.column_normalizer import merge_date_stats
+from src.normalize.number_profile import (
+    Decision,
+    NumberColumnProfile,
+    NumberEvidence,
+    format_number_profiles,
+    merge_number_profiles,
+)
+from src.normalize.plan import PlanStep
+from src.normalize.row_normalizer import inbound_plan, normalize_rows, number_evidence, transactions_plan
 
-from src.normalize.load_mappings import load_yaml
-from src.normalize.row_normalizer import normalize_inbound_row, normalize_transactions_row
+# Chunks queued or running per worker; bounds memory like the serial path
+TASKS_PER_WORKER = 2
 
+# Set in each worker process by _init_worker
+_worker_state: Dict[str, Any] = {}
 
-def normalize_tsv(schema_path: str, tsv_path: Path, out_path: Path, mode: str) -> Tuple[bool, str]:
+
+def normalize_tsv(
+    schema_path: str,
+    tsv_path: Path,
+    out_path: Path,
+    mode: str,
+    date_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    number_profiles: Optional[Dict[str, NumberColumnProfile]] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    workers: int = 1,
+) -> Tuple[bool, str]:
     """
     mode: inbound | transactions
+
+    date_stats, if given, is filled with the inferred format and slow-path
+    counts per date column; number_profiles with the decimal mark chosen
+    per numeric column. Cells whose separators conflict with their column's
+    decimal mark are listed in the returned message.
+
+    The file is streamed in chunks of chunk_rows rows, so memory stays flat
+    however large it is. A first pass only counts the numeric columns'
+    separators (decimal marks are decided over the whole file); the second
+    normalizes each chunk and appends it to out_path, flushed, so an
+    interrupted run leaves the rows done so far. An out_path that is
+    tsv_path itself is written to a temporary file next to it, which
+    replaces the input once every row is written.
+
+    With workers > 1 both passes run in a pool of that many processes, a
+    few chunks at a time; chunks are written in input order and the output
+    is byte-identical to workers=1. Normalizer cache stats (--stats) then
+    only cover the main process.
     """
-    schema: Dict[str, Any] = load_schema(schema_path)
-    rows = read_tsv(tsv_path)
+    if number_profiles is None:
+        number_profiles = {}
+    schema: Dict[str, Any] = get_schema(schema_path)
 
-    if not rows:
+    # Compact rows: one shared header layout instead of a dict per row
+    if next(iter_tsv_chunks(tsv_path, 1), None) is None:
         return False, f"No data rows found in TSV: {tsv_path}"
 
-    prop_map = load_yaml("config/mappings/property_type_map.yml")
+    if mode == "inbound":
+        plan = inbound_plan()
+    elif mode == "transactions":
+        plan = transactions_plan()
+    else:
+        return False, f"Unknown mode: {mode}"
 
-    normalized_rows: List[Dict[str, Any]] = []
-    for r in rows:
-        if mode == "inbound":
-            nr, _meta = normalize_inbound_row(r, prop_map)
-        elif mode == "transactions":
-            nr, _meta = normalize_transactions_row(r, prop_map)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # Opening out_path truncates it: never while it is still being read
+    in_place = out_path.resolve() == tsv_path.resolve()
+    write_path = out_path.with_name(f"{out_path.stem}.{os.getpid()}.tmp{out_path.suffix}") if in_place else out_path
+    try:
+        if workers > 1:
+            _normalize_parallel(schema, plan, tsv_path, write_path, date_stats, number_profiles, chunk_rows, workers)
         else:
-            return False, f"Unknown mode: {mode}"
-        normalized_rows.append(nr)
+            _normalize_serial(schema, plan, tsv_path, write_path, date_stats, number_profiles, chunk_rows)
+    except BaseException:
+        if in_place:
+            write_path.unlink(missing_ok=True)
+        raise
+    if in_place:
+        os.replace(write_path, out_path)
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    write_tsv(out_path, schema, normalized_rows)
-    return True, f"Wrote normalized TSV: {out_path.resolve()}"
+    msg = f"Wrote normalized TSV: {out_path.resolve()}"
+    conflicts = format_number_profiles(number_profiles, conflicts_only=True)
+    if conflicts:
+        msg += "\nNumber separator conflicts (parsed as written):\n" + conflicts
+    return True, msg
+
+
+def _normalize_serial(
+    schema: Dict[str, Any],
+    plan: List[PlanStep],
+    tsv_path: Path,
+    out_path: Path,
+    date_stats: Optional[Dict[str, Dict[str, Any]]],
+    number_profiles: Dict[str, NumberColumnProfile],
+    chunk_rows: int,
+) -> None:
+    prop_map = get_property_map()
+    decisions = number_evidence(iter_tsv_chunks(tsv_path, chunk_rows), plan).decisions()
+
+    first_row = 1
+    with TsvWriter(out_path, schema) as writer:
+        for rows in iter_tsv_chunks(tsv_path, chunk_rows):
+            chunk_dates: Optional[Dict[str, Dict[str, Any]]] = {} if date_stats is not None else None
+            chunk_profiles: Dict[str, NumberColumnProfile] = {}
+            # Column-wise: each distinct raw value of a field is normalized once per chunk
+            normalized_rows, _meta = normalize_rows(
+                rows, plan, prop_map, chunk_dates, chunk_profiles, decisions, first_row
+            )
+            writer.write_rows(normalized_rows)
+            first_row += len(rows)
+            if chunk_dates:
+                merge_date_stats(date_stats, chunk_dates)
+            merge_number_profiles(number_profiles, chunk_profiles)
+
+
+def _line_chunks(tsv_path: Path, chunk_rows: int) -> Iterator[Tuple[int, List[str]]]:
+    """(first row number, raw data lines) chunks of a TSV: what workers are sent."""
+    lines = iter_tsv_lines(tsv_path)
+    next(lines)  # header
+    first_row = 1
+    while True:
+        chunk = list(islice(lines, chunk_rows))
+        if not chunk:
+            return
+        yield first_row, chunk
+        first_row += len(chunk)
+
+
+def _init_worker(headers: List[str], plan: List[PlanStep], cols: List[str], collect_dates: bool) -> None:
+    """
+    Pool initializer: per-process state, sent once per worker rather than
+    with every chunk. The compiled mappings are loaded here (inherited from
+    the parent when forked, else from the compiled config cache).
+    """
+    _worker_state.update(
+        layout=row_layout(headers),
+        headers=headers,
+        plan=plan,
+        cols=cols,
+        collect_dates=collect_dates,
+        property_map=get_property_map(),
+    )
+
+
+def _worker_rows(lines: List[str]) -> List[Any]:
+    layout, headers = _worker_state["layout"], _worker_state["headers"]
+    return [parse_tsv_line(ln, headers, layout) for ln in lines]
+
+
+def _evidence_task(task: Tuple[int, List[str]]) -> NumberEvidence:
+    _, lines = task
+    return number_evidence([_worker_rows(lines)], _worker_state["plan"])
+
+
+def _normalize_task(
+    task: Tuple[int, List[str]], decisions: Dict[str, Decision]
+) -> Tuple[str, int, Optional[Dict[str, Dict[str, Any]]], Dict[str, NumberColumnProfile]]:
+    """Normalize one chunk; returns (its TSV lines, row count, date stats, number profiles)."""
+    first_row, lines = task
+    state = _worker_state
+    chunk_dates: Optional[Dict[str, Dict[str, Any]]] = {} if state["collect_dates"] else None
+    chunk_profiles: Dict[str, NumberColumnProfile] = {}
+    normalized_rows, _meta = normalize_rows(
+        _worker_rows(lines), state["plan"], state["property_map"],
+        chunk_dates, chunk_profiles, decisions, first_row,
+    )
+    return format_tsv_rows(normalized_rows, state["cols"]), len(lines), chunk_dates, chunk_profiles
+
+
+def _ordered_map(
+    pool: ProcessPoolExecutor, fn: Callable[..., Any], tasks: Iterable[Any], window: int, *args: Any
+) -> Iterator[Any]:
+    """
+    fn(task, *args) for each task in the pool, results in task order.
+
+    At most window tasks are submitted ahead of the result being consumed,
+    so the input is read no faster than the output is written.
+    """
+    pending: Deque[Future] = deque()
+    for task in tasks:
+        pending.append(pool.submit(fn, task, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _normalize_parallel(
+    schema: Dict[str, Any],
+    plan: List[PlanStep],
+    tsv_path: Path,
+    out_path: Path,
+    date_stats: Optional[Dict[str, Dict[str, Any]]],
+    number_profiles: Dict[str, NumberColumnProfile],
+    chunk_rows: int,
+    workers: int,
+) -> None:
+    cols = [c["name"] for c in schema["columns"]]
+    headers = next(iter_tsv_lines(tsv_path)).split("\t")
+    window = workers * TASKS_PER_WORKER
+    init_args = (headers, plan, cols, date_stats is not None)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=init_args) as pool:
+        evidence = NumberEvidence()
+        for chunk_evidence in _ordered_map(pool, _evidence_task, _line_chunks(tsv_path, chunk_rows), window):
+            evidence.merge(chunk_evidence)
+        decisions = evidence.decisions()
+
+        with TsvWriter(out_path, schema) as writer:
+            results = _ordered_map(pool, _normalize_task, _line_chunks(tsv_path, chunk_rows), window, decisions)
+            for block, row_count, chunk_dates, chunk_profiles in results:
+                writer.write_block(block, row_count)
+                if chunk_dates:
+                    merge_date_stats(date_stats, chunk_dates)
+                merge_number_profiles(number_profiles, chunk_profiles)
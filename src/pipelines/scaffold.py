@@ -1,11 +1,12 @@
 from pathlib import Path
 
-from src.validate.schema_loader import load_schema
+from src.paths import INBOUND_SCHEMA_PATH, TRANSACTIONS_SCHEMA_PATH
 from src.output.write_tsv import write_tsv
+from src.validate.schema_loader import load_schema
 
 
 def scaffold_inbound_tsv(out_path: Path) -> None:
-    schema = load_schema("config/schemas/inbound_purple.schema.json")
+    schema = load_schema(INBOUND_SCHEMA_PATH)
     row = {col["name"]: "" for col in schema["columns"]}
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -22,7 +23,7 @@ def scaffold_transactions_tsv(out_path: Path, country: str = "Sweden") -> None:
         out_path: Output file path
         country: Country for column layout (Sweden, Denmark, Finland)
     """
-    schema = load_schema("config/schemas/transactions.schema.json")
+    schema = load_schema(TRANSACTIONS_SCHEMA_PATH)
 
     # Get country-specific columns (default to Sweden)
     columns_key = f"columns_{country.lower()}"
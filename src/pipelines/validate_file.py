@@ -1,26 +1,82 @@
+"""
+Validate a TSV against a schema, streaming.
+
+The schema is compiled once (CompiledSchema.checks: one ColumnCheck per
+column, enum values in a frozenset) and the rows are checked as they are
+read, so memory doesn't grow with the file: only the first max_errors
+messages are kept, the rest are counted per column and error type.
+"""
+
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from src.ingest.read_tsv import read_tsv
-from src.validate.schema_loader import load_schema
-from src.validate.validators import validate_row
+from src.ingest.read_tsv import iter_tsv
+from src.resources import get_compiled_schema
+from src.validate.validators import row_errors
 
+# Messages kept by the validate command; the rest are only counted
+DEFAULT_MAX_ERRORS = 1000
 
-def validate_tsv(schema_path: str, tsv_path: Path) -> Tuple[bool, List[str]]:
-    schema: Dict[str, Any] = load_schema(schema_path)
-    rows = read_tsv(tsv_path)
 
-    if not rows:
-        return False, [f"No data rows found in TSV: {tsv_path}"]
+def validate_tsv(
+    schema_path: str,
+    tsv_path: Path,
+    max_errors: Optional[int] = None,
+    fail_fast: bool = False,
+    counts: Optional[Dict[str, Dict[str, int]]] = None,
+) -> Tuple[bool, List[str]]:
+    """
+    Validate every row of a TSV against a schema.
+
+    Args:
+        schema_path: Schema JSON
+        tsv_path: TSV file (.gz/.zst are decompressed as read)
+        max_errors: Keep at most this many messages, followed by a
+            "... N more errors" line (default: all)
+        fail_fast: Stop after the first invalid row
+        counts: Optional dict, filled with column -> {error type: count};
+            error types are "missing" and the column types
+
+    Returns:
+        (all rows valid, messages like "Row 3: Missing required field: Date")
+    """
+    checks = get_compiled_schema(schema_path).checks.get("columns", [])
+    if counts is None:
+        counts = {}
 
-    all_errors: List[str] = []
+    messages: List[str] = []
+    dropped = 0
     ok_all = True
+    seen_rows = False
+
+    for i, row in enumerate(iter_tsv(tsv_path, compact=True), start=1):
+        seen_rows = True
+        errors = row_errors(row, checks)
+        if not errors:
+            continue
+        ok_all = False
+        for column, kind, message in errors:
+            per_column = counts.setdefault(column, {})
+            per_column[kind] = per_column.get(kind, 0) + 1
+            if max_errors is None or len(messages) < max_errors:
+                messages.append(f"Row {i}: {message}")
+            else:
+                dropped += 1
+        if fail_fast:
+            break
+
+    if not seen_rows:
+        return False, [f"No data rows found in TSV: {tsv_path}"]
+
+    if dropped:
+        messages.append(f"... {dropped} more errors")
+    return ok_all, messages
 
-    for i, row in enumerate(rows, start=1):
-        ok, errs = validate_row(schema, row)
-        if not ok:
-            ok_all = False
-            for e in errs:
-                all_errors.append(f"Row {i}: {e}")
 
-    return ok_all, all_errors
+def format_error_counts(counts: Dict[str, Dict[str, int]]) -> str:
+    """One line per column with errors, e.g. "Date: 12 (date: 9, missing: 3)", most errors first."""
+    lines = []
+    for column, kinds in sorted(counts.items(), key=lambda item: -sum(item[1].values())):
+        detail = ", ".join(f"{kind}: {n}" for kind, n in sorted(kinds.items(), key=lambda item: (-item[1], item[0])))
+        lines.append(f"{column}: {sum(kinds.values())} ({detail})")
+    return "\n".join(lines)
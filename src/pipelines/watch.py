@@ -0,0 +1,414 @@
+"""
+Watch-folder daemon: process PDFs as they land in a folder.
+
+A long-running alternative to rerunning process-pdf-folder. Resources
+(extractor, property map, schema) are loaded once and stay warm, and the
+workbook is written in periodic batches instead of once per file.
+
+- New files are noticed through watchdog (inotify on Linux) when it is
+  installed, otherwise by polling the folder
+- A file is only picked up once its size and mtime have been stable for
+  settle_seconds, so half-copied PDFs are not read
+- Rows are appended to the Deal list sheet when batch_size rows are
+  waiting or flush_interval seconds have passed, whichever comes first
+- Outcomes go to the same content-hash manifest as process-pdf-folder,
+  so restarting the watcher (or running the batch command) never
+  processes a file twice
+- Pickup-to-row latency (first seen -> row saved) is reported per file
+- A failed pass or workbook save (e.g. the workbook is open in Excel) is
+  logged and the watcher keeps going; unsaved rows stay queued and are
+  retried on the next pass
+- Edits to the mapping files (property types, city names, country
+  synonyms) are picked up without a restart (see src.mapping_registry)
+"""
+
+import statistics
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+from src.ingest.manifest import ProcessingManifest, STATUS_SUCCESS, STATUS_IMAGE_ONLY
+from src.mapping_registry import DEFAULT_RELOAD_INTERVAL, MappingRegistry
+from src.pipelines.full_pipeline import DEAL_MANIFEST_NAME, process_inbound_pdf
+from src.render.excel_writer import append_rows_to_excel, SHEET_DEAL_LIST
+from src.resources import get_extractor, get_schema, INBOUND_SCHEMA_PATH
+
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_SETTLE_SECONDS = 2.0
+DEFAULT_FLUSH_INTERVAL = 30.0
+DEFAULT_BATCH_SIZE = 10
+
+# With watchdog, still rescan the folder this often to catch missed events
+WATCHDOG_RESCAN_INTERVAL = 60.0
+
+
+class StableFileTracker:
+    """
+    Debounce files that are still being written.
+
+    A file is ready once the same (size, mtime) has been observed for at
+    least settle_seconds. Empty files are never ready.
+    """
+
+    def __init__(self, settle_seconds: float = DEFAULT_SETTLE_SECONDS):
+        self.settle_seconds = settle_seconds
+        # path -> (size, mtime_ns, stable_since, first_seen)
+        self._pending: Dict[Path, Tuple[int, int, float, float]] = {}
+
+    def __contains__(self, path: Path) -> bool:
+        return path in self._pending
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def observe(self, path: Path, now: float) -> None:
+        """Record the file's current size/mtime (restarts the clock if it changed)."""
+        try:
+            st = path.stat()
+        except OSError:
+            self._pending.pop(path, None)
+            return
+        previous = self._pending.get(path)
+        first_seen = previous[3] if previous else now
+        if previous and (previous[0], previous[1]) == (st.st_size, st.st_mtime_ns):
+            return
+        self._pending[path] = (st.st_size, st.st_mtime_ns, now, first_seen)
+
+    def ready(self, now: float) -> List[Tuple[Path, float]]:
+        """
+        Re-check pending files and pop those that have settled.
+
+        Returns:
+            List of (path, first_seen) in the order they were first seen
+        """
+        for path in list(self._pending):
+            self.observe(path, now)
+
+        ready = [
+            (path, first_seen)
+            for path, (size, _mtime, stable_since, first_seen) in self._pending.items()
+            if size > 0 and now - stable_since >= self.settle_seconds
+        ]
+        ready.sort(key=lambda item: item[1])
+        for path, _ in ready:
+            del self._pending[path]
+        return ready
+
+
+class BatchedExcelWriter:
+    """
+    Collect rendered rows and append them to the workbook in batches.
+
+    Each flush is one workbook load/save however many rows are waiting.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        columns: List[str],
+        sheet_name: str = SHEET_DEAL_LIST,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.output_path = output_path
+        self.columns = columns
+        self.sheet_name = sheet_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.clock = clock
+        # (row, payload) waiting to be written; payload is returned by flush()
+        self._rows: List[Tuple[Dict[str, Any], Any]] = []
+        self._oldest: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, row: Dict[str, Any], payload: Any = None) -> None:
+        if not self._rows:
+            self._oldest = self.clock()
+        self._rows.append((row, payload))
+
+    def due(self) -> bool:
+        """True when the batch is full or its oldest row has waited flush_interval."""
+        if not self._rows:
+            return False
+        return len(self._rows) >= self.batch_size or self.clock() - self._oldest >= self.flush_interval
+
+    def pending(self) -> List[Any]:
+        """Payloads of the rows waiting, in order."""
+        return [payload for _, payload in self._rows]
+
+    def flush(self) -> List[Any]:
+        """
+        Write all waiting rows.
+
+        If the write raises, the rows stay queued for the next flush.
+
+        Returns:
+            Payloads of the rows written, in order
+        """
+        if not self._rows:
+            return []
+        append_rows_to_excel([row for row, _ in self._rows], self.columns, self.output_path, self.sheet_name)
+        payloads = [payload for _, payload in self._rows]
+        self._rows = []
+        self._oldest = None
+        return payloads
+
+
+class FolderWatcher:
+    """
+    Process PDFs dropped into a folder through a warm inbound pipeline.
+
+    Use run() for the daemon loop, or call poll() repeatedly (tests, or
+    embedding in another loop) followed by close().
+    """
+
+    def __init__(
+        self,
+        folder: Path,
+        output_path: Path,
+        date_received: str = "",
+        api_key: Optional[str] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        clean_text: bool = True,
+        pages: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        pdf_engine: Optional[str] = None,
+        manifest_path: Optional[Path] = None,
+        use_watchdog: bool = True,
+        reload_interval: Optional[float] = DEFAULT_RELOAD_INTERVAL,
+        log: Callable[[str], None] = print,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.folder = Path(folder)
+        self.date_received = date_received
+        self.poll_interval = poll_interval
+        self.pdf_options = {
+            "clean_text": clean_text,
+            "pages": pages,
+            "max_tokens": max_tokens,
+            "pdf_engine": pdf_engine,
+        }
+        self.log = log
+        self.clock = clock
+
+        # Warm resources: loaded once for the lifetime of the watcher
+        self.extractor = get_extractor(api_key)
+        # Mappings are the exception: reloaded in the background when edited
+        self.mappings = MappingRegistry(log=log)
+        if reload_interval:
+            self.mappings.start(reload_interval)
+        self.schema = get_schema(INBOUND_SCHEMA_PATH)
+        columns = [c["name"] for c in self.schema["columns"]]
+
+        self.manifest = ProcessingManifest.load(manifest_path or self.folder / DEAL_MANIFEST_NAME)
+        self.tracker = StableFileTracker(settle_seconds)
+        self.writer = BatchedExcelWriter(
+            output_path, columns, batch_size=batch_size, flush_interval=flush_interval, clock=clock,
+        )
+
+        self.latencies: List[float] = []
+        self.counts = {"success": 0, "failed": 0, "image_only": 0}
+        self.errors = {"poll": 0, "flush": 0}
+        # Files already handled in this session whose outcome isn't saved yet
+        self._in_flight: Set[Path] = set()
+
+        self._events: Set[Path] = set()
+        self._events_lock = threading.Lock()
+        self._observer = None
+        self._last_scan = float("-inf")
+        if use_watchdog and WATCHDOG_AVAILABLE:
+            self._start_observer()
+
+    @property
+    def mode(self) -> str:
+        return "watchdog" if self._observer is not None else "polling"
+
+    def _start_observer(self) -> None:
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                for attr in ("src_path", "dest_path"):
+                    path = getattr(event, attr, None)
+                    if path:
+                        watcher._notify(Path(path))
+
+        self._observer = Observer()
+        self._observer.schedule(_Handler(), str(self.folder), recursive=False)
+        self._observer.daemon = True
+        self._observer.start()
+
+    def _notify(self, path: Path) -> None:
+        if path.suffix.lower() == ".pdf":
+            with self._events_lock:
+                self._events.add(path)
+
+    def _candidates(self, now: float) -> Set[Path]:
+        """Paths worth (re)checking: filesystem events, plus a rescan when due."""
+        with self._events_lock:
+            paths, self._events = self._events, set()
+
+        rescan_every = WATCHDOG_RESCAN_INTERVAL if self._observer is not None else self.poll_interval
+        if now - self._last_scan >= rescan_every:
+            self._last_scan = now
+            paths.update(p for p in self.folder.iterdir() if p.suffix.lower() == ".pdf")
+        return paths
+
+    def poll(self) -> int:
+        """
+        One pass: pick up settled files, process them, flush rows if due.
+
+        Returns:
+            Number of files processed in this pass
+        """
+        now = self.clock()
+
+        for path in self._candidates(now):
+            if path in self.tracker or path in self._in_flight or not path.exists():
+                continue
+            # Only files with a cached hash are checked here; new files are
+            # hashed once they have settled, not on every pass while copying
+            sha = self.manifest.cached_hash(path)
+            if sha is not None and not self.manifest.hash_needs_processing(sha):
+                continue
+            self.tracker.observe(path, now)
+
+        processed = 0
+        for path, first_seen in self.tracker.ready(now):
+            if not self.manifest.needs_processing(path):
+                continue
+            self._process(path, first_seen)
+            processed += 1
+
+        if self.writer.due():
+            self.flush()
+        return processed
+
+    def _process(self, path: Path, first_seen: float) -> None:
+        # Hashed now, so the outcome is recorded for the content that was read
+        # even if the file is moved or edited before its row is flushed
+        try:
+            sha = self.manifest.hash_of(path)
+        except OSError as e:
+            self.log(f"{path.name} ... SKIPPED (gone before processing): {e}")
+            return
+        self._in_flight.add(path)
+        status, msg, _normalized, rendered_row = process_inbound_pdf(
+            path, self.extractor, self.mappings.property_map(), self.schema, self.date_received,
+            **self.pdf_options,
+        )
+        if status == STATUS_SUCCESS:
+            self.counts["success"] += 1
+            # Outcome is recorded when the row is flushed to the workbook
+            self.writer.add(rendered_row, (path, sha, first_seen, msg))
+            self.log(f"{path.name} ... OK (queued, {len(self.writer)} waiting)")
+            return
+
+        key = "image_only" if status == STATUS_IMAGE_ONLY else "failed"
+        self.counts[key] += 1
+        self.log(f"{path.name} ... {'SKIPPED (image-only)' if key == 'image_only' else 'FAILED'}: {msg}")
+        self.manifest.record_hash(sha, path.name, status, msg)
+        self._in_flight.discard(path)
+        self._save_manifest()
+
+    def flush(self) -> bool:
+        """
+        Write waiting rows to the workbook and record them in the manifest.
+
+        A failed write is logged and the rows stay queued, to be retried
+        on the next poll.
+
+        Returns:
+            True if no rows are left waiting
+        """
+        try:
+            payloads = self.writer.flush()
+        except Exception as e:
+            self.errors["flush"] += 1
+            self.log(f"Could not save {len(self.writer)} rows to {self.writer.output_path}, will retry: {e}")
+            return False
+        if not payloads:
+            return True
+        saved_at = self.clock()
+        for path, sha, first_seen, msg in payloads:
+            latency = saved_at - first_seen
+            self.latencies.append(latency)
+            self.manifest.record_hash(sha, path.name, STATUS_SUCCESS, "")
+            self._in_flight.discard(path)
+            self.log(f"{path.name} -> row saved ({latency:.1f}s after pickup)")
+        self.log(f"Saved {len(payloads)} rows to '{self.writer.sheet_name}' in {self.writer.output_path}")
+        self._save_manifest()
+        return True
+
+    def _save_manifest(self) -> None:
+        try:
+            self.manifest.save()
+        except OSError as e:
+            # Recorded in memory; the next save writes it
+            self.log(f"Could not save the manifest, will retry: {e}")
+
+    def close(self) -> None:
+        """
+        Flush remaining rows and stop the filesystem observer and mapping reloads.
+
+        Rows that still can't be written are reported, not raised; their
+        files are not in the manifest, so the next run processes them again.
+        """
+        if not self.flush():
+            names = ", ".join(payload[0].name for payload in self.writer.pending())
+            self.log(f"{len(self.writer)} rows could not be saved; processed again next run: {names}")
+        self.mappings.stop()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+
+    def run(self, stop_event: Optional[threading.Event] = None) -> None:
+        """Watch until Ctrl+C (or stop_event is set), then flush and report."""
+        stop_event = stop_event or threading.Event()
+        self.log(f"Watching {self.folder} ({self.mode}); Ctrl+C to stop")
+        try:
+            while not stop_event.is_set():
+                try:
+                    self.poll()
+                except Exception as e:
+                    # Files of the failed pass are picked up again by a later scan
+                    self.errors["poll"] += 1
+                    self.log(f"Poll failed, continuing: {e}")
+                stop_event.wait(self.poll_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+            self.log(self.summary())
+
+    def summary(self) -> str:
+        """Counts plus pickup-to-row latency (median / max)."""
+        text = (
+            f"{self.counts['success']} success, {self.counts['failed']} failed, "
+            f"{self.counts['image_only']} image-only skipped"
+        )
+        if self.latencies:
+            text += (
+                f"; pickup-to-row latency median {statistics.median(self.latencies):.1f}s, "
+                f"max {max(self.latencies):.1f}s"
+            )
+        if self.writer:
+            text += f"; {len(self.writer)} rows not saved"
+        return text
@@ -7,6 +7,8 @@ Supports both creating new files and appending to existing files with multiple s
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from src.compact_row import row_values
+
 try:
     from openpyxl import Workbook, load_workbook
     from openpyxl.styles import Font, PatternFill
@@ -67,8 +69,7 @@ def write_excel(
 
     # Data rows
     for row_idx, row in enumerate(rows, start=2):
-        for col_idx, col_name in enumerate(columns, start=1):
-            value = row.get(col_name, "")
+        for col_idx, value in enumerate(row_values(row, columns), start=1):
             ws.cell(row=row_idx, column=col_idx, value=value)
 
     # Auto-adjust column widths (approximate)
@@ -103,6 +104,30 @@ def append_to_excel(
     Returns:
         Row number where the data was written
     """
+    return append_rows_to_excel([row], columns, output_path, sheet_name)
+
+
+def append_rows_to_excel(
+    rows: List[Dict[str, Any]],
+    columns: List[str],
+    output_path: Path,
+    sheet_name: str,
+) -> int:
+    """
+    Append rows to an Excel file with a single load/save, creating file/sheet if needed.
+
+    Loading and saving the workbook dominates the cost of an append, so
+    batch callers should collect rows and write them here in one go.
+
+    Args:
+        rows: Row dicts (already rendered/formatted)
+        columns: Column names in order
+        output_path: Path to .xlsx file
+        sheet_name: Name of the worksheet to append to
+
+    Returns:
+        Row number where the first row was written
+    """
     if Workbook is None:
         raise ImportError("openpyxl not installed. Run: pip install openpyxl")
 
@@ -139,19 +164,19 @@ def append_to_excel(
             ws.column_dimensions[get_column_letter(col_idx)].width = min(len(col_name) + 2, 50)
 
     # Find next empty row
-    next_row = ws.max_row + 1
+    first_row = ws.max_row + 1
     if not has_headers:
-        next_row = 2  # First data row after headers
+        first_row = 2  # First data row after headers
 
-    # Write the row
-    for col_idx, col_name in enumerate(columns, start=1):
-        value = row.get(col_name, "")
-        ws.cell(row=next_row, column=col_idx, value=value)
+    # Write the rows
+    for row_idx, row in enumerate(rows, start=first_row):
+        for col_idx, value in enumerate(row_values(row, columns), start=1):
+            ws.cell(row=row_idx, column=col_idx, value=value)
 
     # Save
     wb.save(output_path)
 
-    return next_row
+    return first_row
 
 
 def init_deals_workbook(
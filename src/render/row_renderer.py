@@ -6,13 +6,21 @@ Handles:
 - Country-specific column layouts for transactions
 - Derived field computation (price per m2)
 - Value formatting for Excel compatibility
+
+Rendered rows are CompactRows over the output columns (see
+src.compact_row): they read like dicts, without a dict per row.
 """
 
 from datetime import date
-from typing import Any, Dict, List, Optional
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 import json
 from pathlib import Path
 
+from src.compact_row import row_layout, row_values
+from src.compressed_io import open_text
+from src.output.write_tsv import WRITE_BATCH_ROWS
+
 
 def get_transaction_columns(schema: Dict[str, Any], country: str) -> List[str]:
     """Get the column names for a specific country's transaction sheet."""
@@ -35,8 +43,6 @@ def render_transaction_row(
     - Computes Price/m2 if price and area are present
     - Returns dict with all schema columns (empty string for missing)
     """
-    out = {}
-
     # Determine country for column layout
     country = country or row.get("Country", "Sweden")
     columns = get_transaction_columns(schema, country)
@@ -66,11 +72,7 @@ def render_transaction_row(
             row["Price, EUR/m2"] = price_per_m2
 
     # Build output with all columns in order
-    for col in columns:
-        val = row.get(col, "")
-        out[col] = _format_value(val)
-
-    return out
+    return row_layout(columns).row([_format_value(val) for val in row_values(row, columns)])
 
 
 def render_inbound_row(
@@ -84,7 +86,6 @@ def render_inbound_row(
     - Computes Week nr. from Date received
     - Returns dict with all schema columns
     """
-    out = {}
     columns = [c["name"] for c in schema["columns"]]
 
     # Map extraction field names to schema field names
@@ -127,11 +128,7 @@ def render_inbound_row(
             pass
 
     # Build output with all columns in order
-    for col in columns:
-        val = row.get(col, "")
-        out[col] = _format_value(val)
-
-    return out
+    return row_layout(columns).row([_format_value(val) for val in row_values(row, columns)])
 
 
 def _format_value(val: Any) -> str:
@@ -154,43 +151,58 @@ def _format_value(val: Any) -> str:
     return str(val)
 
 
-def rows_to_tsv(
-    rows: List[Dict[str, Any]],
+def iter_rendered_lines(
+    rows: Iterable[Dict[str, Any]],
     schema: Dict[str, Any],
     mode: str = "transactions",
     country: Optional[str] = None,
-) -> str:
+) -> Iterator[str]:
     """
-    Convert rows to TSV string ready for paste.
-
-    Args:
-        rows: List of normalized row dicts
-        schema: Schema dict with columns
-        mode: "transactions" or "inbound"
-        country: For transactions, which country's column layout to use
+    Render rows one at a time as TSV lines (without line ends), header first.
 
-    Returns:
-        TSV string with header row
+    Args: as rows_to_tsv; rows may be any iterable (e.g. a generator)
     """
+    rows = iter(rows)
+    first = next(rows, None)
     if mode == "transactions":
         # Use country from first row if not specified
-        if not country and rows:
-            country = rows[0].get("Country", "Sweden")
+        if not country and first is not None:
+            country = first.get("Country", "Sweden")
         columns = get_transaction_columns(schema, country or "Sweden")
     else:
         columns = [c["name"] for c in schema["columns"]]
 
-    lines = ["\t".join(columns)]
+    yield "\t".join(columns)
+    if first is None:
+        return
 
-    for row in rows:
+    for row in chain([first], rows):
         if mode == "transactions":
             rendered = render_transaction_row(row, schema, country)
         else:
             rendered = render_inbound_row(row, schema)
-        line = "\t".join(rendered.get(col, "") for col in columns)
-        lines.append(line)
+        yield "\t".join(row_values(rendered, columns))
+
+
+def rows_to_tsv(
+    rows: List[Dict[str, Any]],
+    schema: Dict[str, Any],
+    mode: str = "transactions",
+    country: Optional[str] = None,
+) -> str:
+    """
+    Convert rows to TSV string ready for paste.
+
+    Args:
+        rows: List of normalized row dicts
+        schema: Schema dict with columns
+        mode: "transactions" or "inbound"
+        country: For transactions, which country's column layout to use
 
-    return "\n".join(lines)
+    Returns:
+        TSV string with header row
+    """
+    return "\n".join(iter_rendered_lines(rows, schema, mode, country))
 
 
 def row_to_tsv_line(
@@ -213,7 +225,7 @@ def row_to_tsv_line(
         columns = [c["name"] for c in schema["columns"]]
         rendered = render_inbound_row(row, schema)
 
-    data_line = "\t".join(rendered.get(col, "") for col in columns)
+    data_line = "\t".join(row_values(rendered, columns))
 
     if include_header:
         header_line = "\t".join(columns)
@@ -223,13 +235,24 @@ def row_to_tsv_line(
 
 
 def write_rendered_tsv(
-    rows: List[Dict[str, Any]],
+    rows: Iterable[Dict[str, Any]],
     schema: Dict[str, Any],
     output_path: Path,
     mode: str = "transactions",
     country: Optional[str] = None,
 ) -> None:
-    """Write rendered rows to TSV file."""
-    tsv_content = rows_to_tsv(rows, schema, mode, country)
+    """
+    Write rendered rows to TSV file.
+
+    Rows are rendered and written in batches, so rows may be a generator
+    over more rows than fit in memory. A .gz or .zst output_path is
+    compressed (see src.compressed_io).
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(tsv_content + "\n", encoding="utf-8")
+    lines = iter_rendered_lines(rows, schema, mode, country)
+    with open_text(output_path, "w") as f:
+        while True:
+            batch = list(islice(lines, WRITE_BATCH_ROWS))
+            if not batch:
+                break
+            f.write("\n".join(batch) + "\n")
@@ -0,0 +1,200 @@
+"""
+Process-wide resource registry.
+
+Pipelines used to build a new Extractor (and Anthropic HTTP client), reload
+property_type_map.yml and reparse the schema JSON for every document. The
+registry keeps one instance of each so repeated calls in a loop or a
+long-running process reuse them:
+
+- Extractor: one per (api_key, model), sharing a pooled HTTP client
+- Schemas and mapping files: parsed once, keyed by path, together with
+  their derived lookups (see src.compiled_config, which also caches the
+  compiled form on disk across processes)
+- City and country tables: the built-in maps plus city_names.yml and
+  country_synonyms.yml (normalize_city/normalize_country load them at
+  first use; the watcher's src.mapping_registry reloads them on edit)
+
+File-backed resources are re-read automatically when the file's mtime or
+size changes. Call invalidate() to drop them explicitly.
+
+Returned dicts are shared between callers - treat them as read-only.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.compiled_config import CompiledMapping, CompiledSchema, load_compiled_mapping, load_compiled_schema
+from src.normalize.city_normalizer import compile_city_names
+from src.normalize.country_normalizer import compile_country_synonyms
+from src.normalize.load_mappings import load_overrides, load_yaml
+from src.normalize.memo import VersionedMapping
+from src.paths import (  # noqa: F401 (re-exported)
+    CITY_NAMES_PATH,
+    COUNTRY_SYNONYMS_PATH,
+    INBOUND_SCHEMA_PATH,
+    PROPERTY_MAP_PATH,
+    TRANSACTIONS_SCHEMA_PATH,
+    resolve_config_path,
+)
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    """Cheap change detection: (mtime_ns, size)."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_city_names(path: str) -> VersionedMapping:
+    return compile_city_names(load_overrides(path, "city_names"))
+
+
+def _load_country_synonyms(path: str) -> VersionedMapping:
+    return compile_country_synonyms(load_overrides(path, "country_synonyms"))
+
+
+class ResourceRegistry:
+    """Caches extractors and parsed config files for the whole process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # (resolved path, kind) -> (signature, parsed or compiled value)
+        self._files: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+        # (api_key, model) -> Extractor
+        self._extractors: Dict[Tuple[str, str], Any] = {}
+        self.stats = {"file_hits": 0, "file_loads": 0, "extractor_hits": 0, "extractor_creates": 0}
+
+    def _load_file(self, path: str, loader: Callable[[str], Any], kind: str = "") -> Any:
+        p = resolve_config_path(path)
+        if not p.exists():
+            # Let the loader raise its usual FileNotFoundError
+            return loader(path)
+
+        key = (str(p.resolve()), kind)
+        sig = _file_signature(p)
+
+        with self._lock:
+            cached = self._files.get(key)
+            if cached is not None and cached[0] == sig:
+                self.stats["file_hits"] += 1
+                return cached[1]
+
+        value = loader(path)
+
+        with self._lock:
+            self._files[key] = (sig, value)
+            self.stats["file_loads"] += 1
+        return value
+
+    def compiled_schema(self, path: str) -> CompiledSchema:
+        """Schema JSON with its column lists and type checks, rebuilt only when the file changes."""
+        return self._load_file(path, load_compiled_schema, "compiled_schema")
+
+    def schema(self, path: str) -> Dict[str, Any]:
+        """Parsed schema JSON, re-read only when the file changes."""
+        return self.compiled_schema(path).schema
+
+    def compiled_mapping(self, path: str = PROPERTY_MAP_PATH) -> CompiledMapping:
+        """Property type mapping YAML with its synonym matcher, rebuilt only when the file changes."""
+        return self._load_file(path, load_compiled_mapping, "compiled_mapping")
+
+    def mapping(self, path: str) -> Dict[str, Any]:
+        """Parsed mapping YAML, re-read only when the file changes."""
+        return self._load_file(path, load_yaml, "mapping")
+
+    def property_map(self) -> Dict[str, Any]:
+        """The property type mapping (config/mappings/property_type_map.yml)."""
+        return self.compiled_mapping(PROPERTY_MAP_PATH).activate()
+
+    def city_names(self, path: str = CITY_NAMES_PATH) -> VersionedMapping:
+        """CITY_NAME_MAP plus the city_names.yml overrides, rebuilt only when the file changes."""
+        return self._load_file(path, _load_city_names, "city_names")
+
+    def country_synonyms(self, path: str = COUNTRY_SYNONYMS_PATH) -> VersionedMapping:
+        """COUNTRY_SYNONYMS plus the country_synonyms.yml overrides, rebuilt only when the file changes."""
+        return self._load_file(path, _load_country_synonyms, "country_synonyms")
+
+    def extractor(self, api_key: Optional[str] = None, model: Optional[str] = None) -> Any:
+        """
+        Shared Extractor for this API key and model.
+
+        The key falls back to ANTHROPIC_API_KEY, so the same client is reused
+        whether callers pass the key explicitly or rely on the environment.
+        """
+        from src.extract.extractor import DEFAULT_MODEL, Extractor
+
+        resolved_key = api_key or os.environ.get("ANTHROPIC_API_KEY") or ""
+        model = model or DEFAULT_MODEL
+        key = (resolved_key, model)
+
+        with self._lock:
+            extractor = self._extractors.get(key)
+            if extractor is not None:
+                self.stats["extractor_hits"] += 1
+                return extractor
+
+            # Extractor raises ImportError/ValueError for missing package/key
+            extractor = Extractor(api_key=resolved_key or None, model=model)
+            self._extractors[key] = extractor
+            self.stats["extractor_creates"] += 1
+            return extractor
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop cached resources.
+
+        Args:
+            path: Only drop this config file. If None, drop all files and extractors.
+        """
+        with self._lock:
+            if path is None:
+                self._files.clear()
+                self._extractors.clear()
+            else:
+                resolved = str(resolve_config_path(path).resolve())
+                for key in [k for k in self._files if k[0] == resolved]:
+                    del self._files[key]
+
+
+_registry = ResourceRegistry()
+
+
+def get_registry() -> ResourceRegistry:
+    """The process-wide registry."""
+    return _registry
+
+
+def get_extractor(api_key: Optional[str] = None, model: Optional[str] = None) -> Any:
+    """Shared Extractor (see ResourceRegistry.extractor)."""
+    return _registry.extractor(api_key, model)
+
+
+def get_schema(path: str) -> Dict[str, Any]:
+    """Shared parsed schema (see ResourceRegistry.schema)."""
+    return _registry.schema(path)
+
+
+def get_compiled_schema(path: str) -> CompiledSchema:
+    """Shared compiled schema (see ResourceRegistry.compiled_schema)."""
+    return _registry.compiled_schema(path)
+
+
+def get_city_names() -> VersionedMapping:
+    """Shared city table (see ResourceRegistry.city_names)."""
+    return _registry.city_names()
+
+
+def get_country_synonyms() -> VersionedMapping:
+    """Shared country synonym table (see ResourceRegistry.country_synonyms)."""
+    return _registry.country_synonyms()
+
+
+def get_property_map() -> Dict[str, Any]:
+    """Shared property type mapping (see ResourceRegistry.property_map)."""
+    return _registry.property_map()
+
+
+def invalidate(path: Optional[str] = None) -> None:
+    """Drop cached resources (see ResourceRegistry.invalidate)."""
+    _registry.invalidate(path)
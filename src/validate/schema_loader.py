@@ -1,10 +1,11 @@
 import json
-from pathlib import Path
 from typing import Any, Dict
 
+from src.paths import resolve_config_path
+
 
 def load_schema(path: str) -> Dict[str, Any]:
-    p = Path(path)
+    p = resolve_config_path(path)
     if not p.exists():
         raise FileNotFoundError(f"Schema not found: {p.resolve()}")
-    return json.loads(p.read_text(encoding="utf-8"))
\ No newline at end of file
+    return json.loads(p.read_text(encoding="utf-8"))
@@ -1,18 +1,10 @@
 import re
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 
 DATE_RE = re.compile(r"^\d{4}/\d{2}/\d{2}$")
 
 
-def _is_blank(v: Any) -> bool:
-    if v is None:
-        return True
-    if isinstance(v, str) and v.strip() == "":
-        return True
-    return False
-
-
 def _parse_number(v: Any) -> float:
     """
     Accepts numbers as strings with spaces/commas, e.g. '12 345', '12,345'.
@@ -23,54 +15,141 @@ def _parse_number(v: Any) -> float:
     return float(s)
 
 
-def validate_row(schema: Dict[str, Any], row: Dict[str, Any]) -> Tuple[bool, List[str]]:
+def _check_date(name: str, value: Any, arg: Any) -> Optional[str]:
+    if not DATE_RE.match(str(value).strip()):
+        return f"Invalid date format for {name}: '{value}' (expected yyyy/mm/dd)"
+    return None
+
+
+def _check_number(name: str, value: Any, arg: Any) -> Optional[str]:
+    try:
+        _parse_number(value)
+    except Exception:
+        return f"Invalid number for {name}: '{value}'"
+    return None
+
+
+def _check_integer(name: str, value: Any, arg: Any) -> Optional[str]:
+    try:
+        int(str(value).strip())
+    except Exception:
+        return f"Invalid integer for {name}: '{value}'"
+    return None
+
+
+def _check_boolean(name: str, value: Any, arg: Any) -> Optional[str]:
+    v = str(value).strip().lower()
+    if v not in {"true", "false", "yes", "no", "1", "0"}:
+        return f"Invalid boolean for {name}: '{value}' (use true/false, yes/no, 1/0)"
+    return None
+
+
+def _check_enum(name: str, value: Any, arg: Tuple[FrozenSet[str], List[str]]) -> Optional[str]:
+    allowed_set, allowed = arg
+    if str(value).strip() not in allowed_set:
+        return f"Invalid enum for {name}: '{value}' (allowed: {allowed})"
+    return None
+
+
+# Error type of a missing required value, in row_errors results
+MISSING = "missing"
+
+
+class ColumnCheck:
     """
-    Validate a single row against a schema.
-    Returns: (is_valid, errors)
+    The type check for one schema column, decided once per schema.
+
+    check is None for columns without a type check (strings, unknown types,
+    date formats other than yyyy/mm/dd). Checks are module-level functions,
+    so compiled checks pickle. kind is the column type a failed check
+    reports ("date", "number", "integer", "boolean", "enum").
     """
-    errors: List[str] = []
 
-    for col in schema.get("columns", []):
-        name = col["name"]
-        required = col.get("required", False)
+    __slots__ = ("name", "required", "check", "arg", "kind")
+
+    def __init__(
+        self,
+        name: str,
+        required: bool,
+        check: Optional[Callable[[str, Any, Any], Optional[str]]],
+        arg: Any = None,
+        kind: str = "",
+    ):
+        self.name = name
+        self.required = required
+        self.check = check
+        self.arg = arg
+        self.kind = kind
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return (self.name, self.required, self.check, self.arg, self.kind)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        self.name, self.required, self.check, self.arg, self.kind = state
+
+
+def compile_column_checks(columns: List[Dict[str, Any]]) -> List[ColumnCheck]:
+    """One ColumnCheck per schema column, in schema order (enum values as a frozenset)."""
+    checks = []
+    for col in columns:
         ctype = col.get("type", "string")
-        value = row.get(name, "")
+        check, arg = None, None
+        if ctype == "date":
+            if col.get("format", "yyyy/mm/dd") == "yyyy/mm/dd":
+                check = _check_date
+        elif ctype == "number":
+            check = _check_number
+        elif ctype == "integer":
+            check = _check_integer
+        elif ctype == "boolean":
+            check = _check_boolean
+        elif ctype == "enum":
+            allowed = col.get("allowed_values")
+            if isinstance(allowed, list):
+                check, arg = _check_enum, (frozenset(allowed), allowed)
+        checks.append(ColumnCheck(col["name"], col.get("required", False), check, arg, ctype))
+    return checks
 
-        # Required
-        if required and _is_blank(value):
-            errors.append(f"Missing required field: {name}")
-            continue
 
-        # If blank and not required, skip further checks
-        if _is_blank(value):
+def row_errors(row: Dict[str, Any], checks: List[ColumnCheck]) -> List[Tuple[str, str, str]]:
+    """
+    The problems of one row, for compiled checks.
+
+    Returns:
+        (column, error type, message) per problem, in column order; the
+        error type is MISSING or the column's ColumnCheck.kind
+    """
+    errors: List[Tuple[str, str, str]] = []
+    get = row.get
+    for col in checks:
+        value = get(col.name, "")
+        if value is None or (isinstance(value, str) and not value.strip()):
+            # Required; if blank and not required, skip further checks
+            if col.required:
+                errors.append((col.name, MISSING, f"Missing required field: {col.name}"))
             continue
 
         # Type checks
-        if ctype == "date":
-            fmt = col.get("format", "yyyy/mm/dd")
-            if fmt == "yyyy/mm/dd" and not DATE_RE.match(str(value).strip()):
-                errors.append(f"Invalid date format for {name}: '{value}' (expected yyyy/mm/dd)")
+        if col.check is not None:
+            error = col.check(col.name, value, col.arg)
+            if error:
+                errors.append((col.name, col.kind, error))
+    return errors
 
-        elif ctype == "number":
-            try:
-                _parse_number(value)
-            except Exception:
-                errors.append(f"Invalid number for {name}: '{value}'")
 
-        elif ctype == "integer":
-            try:
-                int(str(value).strip())
-            except Exception:
-                errors.append(f"Invalid integer for {name}: '{value}'")
+def validate_row(
+    schema: Dict[str, Any], row: Dict[str, Any], checks: Optional[List[ColumnCheck]] = None
+) -> Tuple[bool, List[str]]:
+    """
+    Validate a single row against a schema.
 
-        elif ctype == "boolean":
-            v = str(value).strip().lower()
-            if v not in {"true", "false", "yes", "no", "1", "0"}:
-                errors.append(f"Invalid boolean for {name}: '{value}' (use true/false, yes/no, 1/0)")
+    Pass checks (from compile_column_checks, or a CompiledSchema) when
+    validating many rows against the same schema.
 
-        elif ctype == "enum":
-            allowed = col.get("allowed_values")
-            if isinstance(allowed, list) and str(value).strip() not in allowed:
-                errors.append(f"Invalid enum for {name}: '{value}' (allowed: {allowed})")
+    Returns: (is_valid, errors)
+    """
+    if checks is None:
+        checks = compile_column_checks(schema.get("columns", []))
 
+    errors = [message for _, _, message in row_errors(row, checks)]
     return (len(errors) == 0, errors)
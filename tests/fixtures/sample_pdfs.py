@@ -0,0 +1,147 @@
+"""
+Test fixtures: small PDFs generated on the fly with pypdf.
+
+- build_text_pdf: one page per list of lines, real text layer (Helvetica)
+- build_image_pdf: scanned-style pages with an image and no text layer
+- build_table_pdf: key-figure tables, labels and values drawn as separate
+  text objects (as broker IMs do), to check that rows stay together
+"""
+
+from pathlib import Path
+from typing import List, Sequence, Tuple, Union
+
+from pypdf import PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+    NumberObject,
+)
+
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _stream(writer: PdfWriter, data: bytes, **entries):
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    for key, value in entries.items():
+        stream[NameObject(f"/{key}")] = value
+    return writer._add_object(stream)
+
+
+def _font(writer: PdfWriter):
+    return writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+        NameObject("/Encoding"): NameObject("/WinAnsiEncoding"),
+    }))
+
+
+def _image(writer: PdfWriter):
+    return _stream(
+        writer,
+        bytes([128] * 64),
+        Type=NameObject("/XObject"),
+        Subtype=NameObject("/Image"),
+        Width=NumberObject(8),
+        Height=NumberObject(8),
+        ColorSpace=NameObject("/DeviceGray"),
+        BitsPerComponent=NumberObject(8),
+    )
+
+
+def _add_text_page(writer: PdfWriter, font, lines: Sequence[str]) -> None:
+    page = writer.add_blank_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    ops = ["BT", "/F1 10 Tf", "12 TL", f"40 {PAGE_HEIGHT - 40} Td"]
+    ops += [f"({_escape(line)}) '" for line in lines]
+    ops.append("ET")
+    content = "\n".join(ops).encode("cp1252", errors="replace")
+    page[NameObject("/Contents")] = _stream(writer, content)
+    page[NameObject("/Resources")] = DictionaryObject({
+        NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+    })
+
+
+def _add_table_page(writer: PdfWriter, font, rows: Sequence[Tuple[str, str]]) -> None:
+    page = writer.add_blank_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    ops = []
+    # All labels first, then all values: row order only survives extraction
+    # if the engine reassembles lines by position
+    for x, column in ((40, 0), (350, 1)):
+        for i, row in enumerate(rows):
+            y = PAGE_HEIGHT - 40 - 14 * i
+            ops += ["BT", "/F1 10 Tf", f"{x} {y} Td", f"({_escape(row[column])}) Tj", "ET"]
+    content = "\n".join(ops).encode("cp1252", errors="replace")
+    page[NameObject("/Contents")] = _stream(writer, content)
+    page[NameObject("/Resources")] = DictionaryObject({
+        NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+    })
+
+
+def _add_image_page(writer: PdfWriter, image) -> None:
+    page = writer.add_blank_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    content = f"q {PAGE_WIDTH} 0 0 {PAGE_HEIGHT} 0 0 cm /Im1 Do Q".encode("ascii")
+    page[NameObject("/Contents")] = _stream(writer, content)
+    page[NameObject("/Resources")] = DictionaryObject({
+        NameObject("/XObject"): DictionaryObject({NameObject("/Im1"): image}),
+        NameObject("/ProcSet"): ArrayObject([NameObject("/PDF"), NameObject("/ImageC")]),
+    })
+
+
+def build_text_pdf(path: Union[str, Path], pages: List[List[str]]) -> Path:
+    """Write a PDF with one text page per list of lines."""
+    writer = PdfWriter()
+    font = _font(writer)
+    for lines in pages:
+        _add_text_page(writer, font, lines)
+    path = Path(path)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def build_image_pdf(path: Union[str, Path], page_count: int) -> Path:
+    """Write a scanned-style PDF: every page is an image, no text layer."""
+    writer = PdfWriter()
+    image = _image(writer)
+    for _ in range(page_count):
+        _add_image_page(writer, image)
+    path = Path(path)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def build_mixed_pdf(path: Union[str, Path], pages: List[Union[List[str], None]]) -> Path:
+    """Write a PDF mixing text pages (list of lines) and image pages (None)."""
+    writer = PdfWriter()
+    font = _font(writer)
+    image = _image(writer)
+    for lines in pages:
+        if lines is None:
+            _add_image_page(writer, image)
+        else:
+            _add_text_page(writer, font, lines)
+    path = Path(path)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def build_table_pdf(path: Union[str, Path], pages: List[List[Tuple[str, str]]]) -> Path:
+    """Write a PDF with one (label, value) table per page."""
+    writer = PdfWriter()
+    font = _font(writer)
+    for rows in pages:
+        _add_table_page(writer, font, rows)
+    path = Path(path)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
@@ -48,10 +48,10 @@ class TestNonSwedishCities:
     """Test cities that don't need normalization."""
 
     def test_stockholm_unchanged(self):
-        """Test Stockholm stays unchanged (already English-friendly)."""
+        """Test Stockholm stays unchanged (already English-friendly), recognized via the gazetteer."""
         result, conf = normalize_city("Stockholm")
         assert result == "Stockholm"
-        assert conf == "medium"
+        assert conf == "high"
 
     def test_english_city_unchanged(self):
         """Test English city names pass through."""
@@ -60,10 +60,10 @@ class TestNonSwedishCities:
         assert conf == "medium"
 
     def test_already_normalized(self):
-        """Test already-normalized names pass through."""
+        """Test already-normalized names stay unchanged."""
         result, conf = normalize_city("Gothenburg")
         assert result == "Gothenburg"
-        assert conf == "medium"
+        assert conf == "high"
 
 
 class TestEdgeCases:
@@ -126,4 +126,52 @@ class TestNordicCities:
         # Helsinki, Tampere, etc. are the same in Finnish and English
         result, conf = normalize_city("Helsinki")
         assert result == "Helsinki"
-        assert conf == "medium"  # No mapping needed, passes through
+        assert conf == "high"  # No mapping needed, but a known place
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("Visby", "Visby"),
+        ("Rønne", "Ronne"),
+        ("Mo i Rana", "Mo i Rana"),
+        ("Gotland", "Gotland"),
+    ])
+    def test_town_not_its_municipality(self, raw, expected):
+        """Test a town is kept as the town, not replaced by its municipality."""
+        assert normalize_city(raw) == (expected, "high")
+
+
+class TestGazetteerMatching:
+    """Test matching against the Nordic gazetteer."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("Göteborgs kommun", "Gothenburg"),
+        ("Malmö C", "Malmo"),
+        ("Stockholms stad", "Stockholm"),
+        ("Lunds kommun", "Lund"),
+        ("Täby Centrum", "Taby"),
+        ("Upplands-Väsby", "Upplands Vasby"),
+        ("VÄSTERÅS", "Vasteras"),
+        ("Vasteras", "Vasteras"),
+    ])
+    def test_known_place(self, raw, expected):
+        """Test qualified and differently written names of known places."""
+        assert normalize_city(raw) == (expected, "high")
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("Götebrog", "Gothenburg"),
+        ("Jönköpping", "Jonkoping"),
+        ("Helsinborg", "Helsingborg"),
+        ("Sundsval", "Sundsvall"),
+    ])
+    def test_misspelled_place(self, raw, expected):
+        """Test misspellings match the nearest place with medium confidence."""
+        assert normalize_city(raw) == (expected, "medium")
+
+    def test_unknown_place_transliterated(self):
+        """Test places not in the gazetteer are transliterated."""
+        assert normalize_city("Skärholmen") == ("Skarholmen", "medium")
+        assert normalize_city("Kungsholmen, Stockholm") == ("Kungsholmen, Stockholm", "medium")
+
+    def test_short_values_not_fuzzy(self):
+        """Test short values are not matched to a nearby name."""
+        assert normalize_city("Sthlm") == ("Sthlm", "medium")
+        assert normalize_city("Kisa") == ("Kisa", "medium")
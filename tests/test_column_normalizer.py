@@ -0,0 +1,147 @@
+"""
+Tests for column-wise normalization.
+"""
+
+import math
+
+import pytest
+
+from src.normalize.column_normalizer import (
+    factorize_column,
+    normalize_column,
+    normalize_country_column,
+    normalize_date_column,
+    normalize_price_column,
+    normalize_property_type_column,
+    normalize_yield_column,
+    NUMPY_AVAILABLE,
+)
+from src.normalize.date_normalizer import normalize_date
+from src.normalize.number_normalizer import normalize_price, normalize_yield
+from src.normalize.row_normalizer import normalize_inbound_row, normalize_inbound_rows, normalize_transactions_rows
+from src.resources import get_property_map
+from tests.fixtures.sample_numbers import PRICE_TEST_CASES, YIELD_TEST_CASES
+
+
+class TestFactorize:
+    """Test that distinct values are normalized once."""
+
+    def test_each_distinct_value_normalized_once(self):
+        calls = []
+
+        def normalizer(value):
+            calls.append(value)
+            return (str(value).upper(), "high")
+
+        values, confs = normalize_column(["se", "dk", "se", "se", "dk"], normalizer)
+        assert values == ["SE", "DK", "SE", "SE", "DK"]
+        assert confs == ["high"] * 5
+        assert calls == ["se", "dk"]
+
+    def test_distinct_by_type(self):
+        """1, 1.0 and "1" normalize differently, so they are not merged."""
+        results, codes = factorize_column([1, 1.0, "1", 1], lambda v: (v, "high"))
+        assert codes == [0, 1, 2, 0]
+        assert [type(v) for v, _ in results] == [int, float, str]
+
+    def test_unhashable_values(self):
+        values, _ = normalize_column([["a"], ["a"]], lambda v: (len(v), "high"))
+        assert values == [1, 1]
+
+
+class TestColumns:
+    """Column functions must match the scalar normalizers value for value."""
+
+    def test_price_column_matches_scalar(self):
+        raw = [case[0] for case in PRICE_TEST_CASES] * 3
+        values, confs = normalize_price_column(raw)
+        assert list(zip(values, confs)) == [normalize_price(v) for v in raw]
+
+    def test_yield_column_matches_scalar(self):
+        raw = [case[0] for case in YIELD_TEST_CASES] * 3
+        values, confs = normalize_yield_column(raw)
+        assert [(type(v), v, c) for v, c in zip(values, confs)] == [
+            (type(v), v, c) for v, c in map(normalize_yield, raw)
+        ]
+
+    def test_date_column_matches_scalar(self):
+        raw = ["2024-01-15", "2024-1-5", "15/01/2024", "2024-02-30", "", "2024-01-15", "3 mars 2024", None, "soon"]
+        stats = {}
+        values, confs = normalize_date_column(raw, stats)
+        assert list(zip(values, confs)) == [normalize_date.__wrapped__(v) for v in raw]
+        assert stats == {
+            "format": "yyyy-mm-dd", "cells": 9, "blank": 2, "fast": 3, "slow": 4, "failed": 2,
+        }
+
+    def test_date_and_country(self):
+        assert normalize_date_column(["15 januari 2024", "2024-01-15"])[0] == ["2024/01/15", "2024/01/15"]
+        assert normalize_country_column(["Sverige", "DK", "Mars"]) == (
+            ["Sweden", "Denmark", ""],
+            ["high", "high", "low"],
+        )
+
+    def test_property_type(self):
+        values, confs = normalize_property_type_column(["warehouse", "warehouse", "kontor"], get_property_map())
+        assert values[0] == values[1] == "Logistics"
+
+
+class TestArrays:
+    """Test the NumPy-backed numeric path."""
+
+    def test_price_array(self):
+        np = pytest.importorskip("numpy")
+        values, confs = normalize_price_column(["1.5M", "N/A", "1.5M", "500k"], as_array=True)
+        assert isinstance(values, np.ndarray)
+        assert values.dtype == np.float64
+        assert values[0] == values[2] == 1_500_000
+        assert math.isnan(values[1])
+        assert confs == ["high", "low", "high", "high"]
+
+    def test_without_numpy(self, monkeypatch):
+        monkeypatch.setattr("src.normalize.column_normalizer.NUMPY_AVAILABLE", False)
+        with pytest.raises(ImportError, match="pip install numpy"):
+            normalize_price_column(["1"], as_array=True)
+
+    def test_flag_matches_import(self):
+        try:
+            import numpy  # noqa: F401
+            assert NUMPY_AVAILABLE
+        except ImportError:
+            assert not NUMPY_AVAILABLE
+
+
+class TestRows:
+    """Batch row normalization must equal row-by-row normalization."""
+
+    ROWS = [
+        {"Date received": "15 januari 2024", "Country": "Sverige", "Location": "Göteborg", "Use": "warehouse",
+         "Leasable area, sqm": "15 000", "NOI, CCY": "2.5M", "Yield": "4,5 %"},
+        {"Date received": "not a date", "Country": "Mars", "Location": "", "Use": "kontor",
+         "Leasable area, sqm": "N/A", "NOI, CCY": "0", "Yield": ""},
+        {"Date received": "15 januari 2024", "Country": "Sverige", "Use": "warehouse",
+         "Property designation": "Sigtuna Märsta 1:257, Sigtuna Märsta 1:259"},
+        {},
+    ]
+
+    def test_inbound_rows_match_single_rows(self):
+        property_map = get_property_map()
+        rows, metas = normalize_inbound_rows(self.ROWS, property_map)
+        for raw, row, meta in zip(self.ROWS, rows, metas):
+            assert (row, meta) == normalize_inbound_row(raw, property_map)
+
+        assert rows[1]["Date received"] == "not a date"  # unparsed values are kept
+        assert rows[1]["NOI, CCY"] == 0
+        assert "Location_confidence" not in metas[1]  # empty cells are skipped
+
+    def test_input_rows_not_modified(self):
+        raw = [{"Country": "Sverige"}]
+        rows, _ = normalize_transactions_rows(raw, get_property_map())
+        assert rows[0]["Country"] == "Sweden"
+        assert raw[0]["Country"] == "Sverige"
+
+    def test_date_stats_per_field(self):
+        date_stats = {}
+        normalize_inbound_rows(self.ROWS, get_property_map(), date_stats)
+        assert list(date_stats) == ["Date received"]
+        assert date_stats["Date received"]["format"] == "dd month yyyy"
+        assert (date_stats["Date received"]["fast"], date_stats["Date received"]["failed"]) == (2, 1)
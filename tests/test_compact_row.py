@@ -0,0 +1,109 @@
+"""
+Tests for compact rows.
+"""
+
+import pickle
+
+import pytest
+
+from src.compact_row import CompactRow, row_layout, row_values
+from src.ingest.read_tsv import read_tsv
+from src.output.write_tsv import write_tsv
+
+
+@pytest.fixture
+def layout():
+    return row_layout(["Country", "Location", "Yield"])
+
+
+class TestCompactRow:
+    """Test the dict interface."""
+
+    def test_reads_like_dict(self, layout):
+        """Test lookups, membership, iteration order and equality with a dict."""
+        row = layout.row(["Sweden", "Malmö", "4,5 %"])
+        assert row["Location"] == "Malmö"
+        assert row.get("Yield") == "4,5 %"
+        assert row.get("Price", "") == ""
+        assert "Country" in row and "Price" not in row
+        assert list(row) == ["Country", "Location", "Yield"]
+        assert row == {"Country": "Sweden", "Location": "Malmö", "Yield": "4,5 %"}
+        assert dict(row) == {"Country": "Sweden", "Location": "Malmö", "Yield": "4,5 %"}
+
+    def test_unset_columns_missing(self, layout):
+        """Test unset columns behave as missing keys, not empty values."""
+        row = layout.row(["Sweden"])
+        assert len(row) == 1
+        assert "Location" not in row
+        with pytest.raises(KeyError):
+            row["Location"]
+        assert row == {"Country": "Sweden"}
+
+    def test_set_and_delete(self, layout):
+        """Test assignment and deletion of layout columns."""
+        row = layout.row()
+        row["Yield"] = 4.5
+        assert row == {"Yield": 4.5}
+        del row["Yield"]
+        assert row == {}
+        with pytest.raises(KeyError):
+            del row["Yield"]
+
+    def test_extra_keys(self, layout):
+        """Test keys outside the layout are kept per row."""
+        row = layout.row(["Sweden", "", ""])
+        row["NOI"] = 12
+        assert row["NOI"] == 12
+        assert list(row) == ["Country", "Location", "Yield", "NOI"]
+        assert layout.row(["Sweden", "", ""]).get("NOI") is None
+        del row["NOI"]
+        assert "NOI" not in row
+
+    def test_copy_independent(self, layout):
+        """Test copy() shares the layout but not the values."""
+        row = layout.row(["Sweden", "Malmö", ""])
+        copy = row.copy()
+        copy["Location"] = "Malmo"
+        assert row["Location"] == "Malmö"
+        assert isinstance(copy, CompactRow) and copy.layout is row.layout
+
+    def test_pickle_shares_layout(self, layout):
+        """Test unpickled rows use the shared layout."""
+        row = pickle.loads(pickle.dumps(layout.row(["Denmark", "Aarhus", "5 %"])))
+        assert row.layout is layout
+        assert row == {"Country": "Denmark", "Location": "Aarhus", "Yield": "5 %"}
+
+    def test_layouts_shared(self):
+        """Test row_layout returns one layout per column list."""
+        assert row_layout(["A", "B"]) is row_layout(("A", "B"))
+        assert row_layout(["A", "B"]) is not row_layout(["B", "A"])
+
+
+class TestRowValues:
+    """Test reading a column list from dict and compact rows."""
+
+    def test_same_for_dict_and_compact(self, layout):
+        """Test both row kinds give the same values, with defaults for missing columns."""
+        columns = ["Yield", "Price", "Country", "NOI"]
+        data = {"Country": "Sweden", "Yield": "4 %", "NOI": 3}
+        compact = layout.from_mapping(data)
+        assert row_values(compact, columns) == row_values(data, columns) == ["4 %", "", "Sweden", 3]
+
+
+class TestTsvRoundTrip:
+    """Test reading and writing TSVs with compact rows."""
+
+    def test_compact_read_matches_dict_read(self, tmp_path):
+        """Test compact rows equal the dict rows, including padded short lines."""
+        path = tmp_path / "in.tsv"
+        path.write_text("Country\tLocation\tYield\nSweden\tMalmö\t4 %\nDenmark\tAarhus\n", encoding="utf-8")
+        compact = read_tsv(path, compact=True)
+        assert compact == read_tsv(path)
+        assert compact[0].layout is compact[1].layout
+
+    def test_write_compact_rows(self, tmp_path, layout):
+        """Test write_tsv writes compact rows in schema order."""
+        schema = {"columns": [{"name": "Yield"}, {"name": "Country"}, {"name": "Price"}]}
+        out = tmp_path / "out.tsv"
+        write_tsv(out, schema, [layout.row(["Sweden", "Malmö", 4.5])])
+        assert out.read_text(encoding="utf-8") == "Yield\tCountry\tPrice\n4.5\tSweden\t\n"
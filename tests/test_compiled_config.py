@@ -0,0 +1,155 @@
+"""
+Tests for the compiled config cache.
+"""
+
+import json
+import os
+
+import pytest
+
+from src.compiled_config import (
+    CompiledMapping,
+    clear_config_cache,
+    load_compiled,
+    load_compiled_mapping,
+    load_compiled_schema,
+)
+from src.normalize.property_type import normalize_property_type, property_type_matcher
+from src.paths import CONFIG_CACHE_ENV, INBOUND_SCHEMA_PATH, TRANSACTIONS_SCHEMA_PATH, resolve_config_path
+from src.resources import ResourceRegistry
+from src.validate.validators import validate_row
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+@pytest.fixture(autouse=True)
+def config_cache(cache_dir, monkeypatch):
+    # Loads without an explicit cache_dir (the registry's) stay out of the repo cache
+    monkeypatch.setenv(CONFIG_CACHE_ENV, str(cache_dir))
+
+
+@pytest.fixture
+def mapping_file(tmp_path):
+    path = tmp_path / "map.yml"
+    path.write_text("synonyms:\n  Office: [kontor]\n  Retail: [handel]\n", encoding="utf-8")
+    return path
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestLoadCompiled:
+    """Test the on-disk cache and its invalidation."""
+
+    def test_compiled_once(self, mapping_file, cache_dir):
+        stats = {}
+        first = load_compiled_mapping(mapping_file, cache_dir=cache_dir, stats=stats)
+        second = load_compiled_mapping(mapping_file, cache_dir=cache_dir, stats=stats)
+        assert stats == {"compiled": 1, "cache_hits": 1}
+        assert isinstance(second, CompiledMapping)
+        assert second.mapping == first.mapping
+        assert second.property_types.match("kontor och handel") == ["Office", "Retail"]
+
+    def test_edit_recompiles(self, mapping_file, cache_dir):
+        load_compiled_mapping(mapping_file, cache_dir=cache_dir)
+        mapping_file.write_text("synonyms:\n  Hotel: [hotell]\n", encoding="utf-8")
+        _bump_mtime(mapping_file)
+
+        stats = {}
+        compiled = load_compiled_mapping(mapping_file, cache_dir=cache_dir, stats=stats)
+        assert stats == {"compiled": 1}
+        assert list(compiled.mapping["synonyms"]) == ["Hotel"]
+
+    def test_touched_file_rehashed_not_recompiled(self, mapping_file, cache_dir):
+        load_compiled_mapping(mapping_file, cache_dir=cache_dir)
+        _bump_mtime(mapping_file)
+
+        stats = {}
+        load_compiled_mapping(mapping_file, cache_dir=cache_dir, stats=stats)
+        load_compiled_mapping(mapping_file, cache_dir=cache_dir, stats=stats)
+        assert stats == {"cache_rehashed": 1, "cache_hits": 1}
+
+    def test_corrupt_entry_rebuilt(self, mapping_file, cache_dir):
+        load_compiled_mapping(mapping_file, cache_dir=cache_dir)
+        for entry in cache_dir.glob("*.pickle"):
+            entry.write_bytes(b"not a pickle")
+
+        stats = {}
+        compiled = load_compiled_mapping(mapping_file, cache_dir=cache_dir, stats=stats)
+        assert stats == {"compiled": 1}
+        assert "Office" in compiled.mapping["synonyms"]
+
+    def test_disabled_by_env(self, mapping_file, monkeypatch):
+        monkeypatch.setenv(CONFIG_CACHE_ENV, "off")
+        stats = {}
+        load_compiled_mapping(mapping_file, stats=stats)
+        load_compiled_mapping(mapping_file, stats=stats)
+        assert stats == {"compiled": 2}
+
+    def test_unpicklable_not_cached(self, mapping_file, cache_dir):
+        """Test a compiled form that can't be pickled is returned uncached, not raised."""
+        stats = {}
+        for _ in range(2):
+            compiled = load_compiled(mapping_file, lambda data: (lambda: data), "lambda", cache_dir, stats)
+            assert compiled() == mapping_file.read_bytes()
+        assert stats == {"compiled": 2}
+        assert list(cache_dir.iterdir()) == []
+
+    def test_clear(self, mapping_file, cache_dir):
+        load_compiled_mapping(mapping_file, cache_dir=cache_dir)
+        assert clear_config_cache(cache_dir) == 1
+        assert list(cache_dir.iterdir()) == []
+
+    def test_missing_file(self, tmp_path, cache_dir):
+        with pytest.raises(FileNotFoundError, match="Schema not found"):
+            load_compiled_schema(tmp_path / "missing.json", cache_dir=cache_dir)
+
+
+class TestCompiledConfig:
+    """Test the derived lookups."""
+
+    def test_repo_paths_resolve_from_any_cwd(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert resolve_config_path("config/schemas/inbound_purple.schema.json").exists()
+        assert "columns" in ResourceRegistry().schema("config/schemas/inbound_purple.schema.json")
+
+    def test_transaction_columns(self, cache_dir):
+        compiled = load_compiled_schema(TRANSACTIONS_SCHEMA_PATH, cache_dir=cache_dir)
+        sweden = [c["name"] for c in compiled.schema["columns_sweden"]]
+        assert compiled.transaction_columns("Sweden") == sweden
+        assert compiled.transaction_columns("Atlantis") == sweden
+
+    def test_precompiled_checks_match_validate_row(self, tmp_path, cache_dir):
+        path = tmp_path / "s.schema.json"
+        path.write_text(json.dumps({"columns": [
+            {"name": "Date", "type": "date", "required": True},
+            {"name": "Price", "type": "number"},
+            {"name": "Units", "type": "integer"},
+            {"name": "Listed", "type": "boolean"},
+            {"name": "Type", "type": "enum", "allowed_values": ["Office", "Retail"]},
+            {"name": "Quarter", "type": "date", "format": "yyyy-Qn"},
+        ]}), encoding="utf-8")
+        load_compiled_schema(path, cache_dir=cache_dir)
+        compiled = load_compiled_schema(path, cache_dir=cache_dir)  # unpickled checks
+
+        rows = [
+            {"Date": "2024/01/15", "Price": "12 345", "Units": "3", "Listed": "yes", "Type": "Office"},
+            {"Date": "", "Price": "abc", "Units": "3.5", "Listed": "maybe", "Type": "Hotel", "Quarter": "x"},
+        ]
+        for row in rows:
+            assert validate_row(compiled.schema, row, compiled.checks["columns"]) == validate_row(compiled.schema, row)
+
+    def test_registry_reuses_compiled_matcher(self):
+        registry = ResourceRegistry()
+        mapping = registry.property_map()
+        assert property_type_matcher(mapping) is registry.compiled_mapping().property_types
+        assert normalize_property_type("kontor", mapping) == ("Office", "high")
+
+    def test_inbound_columns(self, cache_dir):
+        compiled = load_compiled_schema(INBOUND_SCHEMA_PATH, cache_dir=cache_dir)
+        assert compiled.columns == [c["name"] for c in compiled.schema["columns"]]
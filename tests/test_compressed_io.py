@@ -0,0 +1,103 @@
+"""
+Tests for compressed reading and writing.
+"""
+
+import gzip
+import zlib
+
+import pytest
+
+from src.compressed_io import ZSTD_AVAILABLE, compression_for, open_text, uncompressed_suffix
+from src.ingest.mapped_tsv import MappedTsv
+from src.ingest.read_delimited import read_delimited, sniff_format
+from src.ingest.read_tsv import read_tsv
+from src.output.write_tsv import TsvWriter, write_tsv
+from src.pipelines.normalize_file import normalize_tsv
+from src.render.row_renderer import rows_to_tsv, write_rendered_tsv
+from src.resources import INBOUND_SCHEMA_PATH
+
+SCHEMA = {"columns": [{"name": "Country"}, {"name": "Location"}, {"name": "Yield"}]}
+ROWS = [
+    {"Country": "Sweden", "Location": "Malmö", "Yield": "4,5 %"},
+    {"Country": "Denmark", "Location": "Aarhus", "Yield": ""},
+]
+
+
+class TestCompressionFor:
+    """Test choosing the compression by file name."""
+
+    def test_suffixes(self):
+        """Test .gz and .zst are compressed; other names are plain."""
+        assert compression_for("out/deals.tsv.gz") == "gzip"
+        assert compression_for("deals.tsv.ZST") == "zstd"
+        assert compression_for("deals.tsv") is None
+        assert uncompressed_suffix("deals.csv.gz") == ".csv"
+        assert uncompressed_suffix("deals.csv") == ".csv"
+
+
+class TestGzip:
+    """Test writers and readers round-trip through gzip."""
+
+    def test_write_and_read_tsv(self, tmp_path):
+        """Test write_tsv compresses a .gz path and read_tsv reads it back."""
+        plain, packed = tmp_path / "deals.tsv", tmp_path / "deals.tsv.gz"
+        write_tsv(plain, SCHEMA, ROWS)
+        write_tsv(packed, SCHEMA, iter(ROWS))
+        assert gzip.decompress(packed.read_bytes()) == plain.read_bytes()
+        assert read_tsv(packed) == read_tsv(plain) == ROWS
+
+    def test_flushed_batches_readable(self, tmp_path):
+        """Test every flushed batch decompresses before the file is closed."""
+        path = tmp_path / "deals.tsv.gz"
+        with TsvWriter(path, SCHEMA) as writer:
+            writer.write_rows(ROWS[:1])
+            partial = zlib.decompressobj(wbits=31).decompress(path.read_bytes())
+            assert partial == "Country\tLocation\tYield\nSweden\tMalmö\t4,5 %\n".encode("utf-8")
+
+    def test_rendered_tsv(self, tmp_path):
+        """Test write_rendered_tsv streams a generator to the same text as rows_to_tsv."""
+        path = tmp_path / "rendered.tsv.gz"
+        write_rendered_tsv((row for row in ROWS), SCHEMA, path, mode="inbound")
+        with open_text(path) as f:
+            assert f.read() == rows_to_tsv(ROWS, SCHEMA, mode="inbound") + "\n"
+
+    def test_read_delimited(self, tmp_path):
+        """Test a gzipped CSV export is sniffed and read (comma default from .csv.gz)."""
+        path = tmp_path / "deals.csv.gz"
+        path.write_bytes(gzip.compress('Location,"Price, MSEK"\nMalmö,"1,5"\n'.encode("utf-8")))
+        assert sniff_format(path) == (",", "utf-8")
+        assert read_delimited(path) == [{"Location": "Malmö", "Price, MSEK": "1,5"}]
+
+    def test_normalize_tsv(self, tmp_path):
+        """Test normalize_tsv reads and writes compressed files to the plain files' content."""
+        source = "Country\tLocation\tYield\nSverige\tGöteborg\t4,5 %\n"
+        (tmp_path / "in.tsv").write_text(source, encoding="utf-8")
+        (tmp_path / "in.tsv.gz").write_bytes(gzip.compress(source.encode("utf-8")))
+        normalize_tsv(INBOUND_SCHEMA_PATH, tmp_path / "in.tsv", tmp_path / "out.tsv", "inbound")
+        ok, _ = normalize_tsv(INBOUND_SCHEMA_PATH, tmp_path / "in.tsv.gz", tmp_path / "out.tsv.gz", "inbound")
+        assert ok
+        assert gzip.decompress((tmp_path / "out.tsv.gz").read_bytes()) == (tmp_path / "out.tsv").read_bytes()
+
+    def test_mapped_tsv_rejects_compressed(self, tmp_path):
+        """Test a compressed file can't be memory-mapped."""
+        path = tmp_path / "deals.tsv.gz"
+        write_tsv(path, SCHEMA, ROWS)
+        with pytest.raises(ValueError, match="compressed"):
+            MappedTsv(path)
+
+
+class TestZstd:
+    """Test zstandard output (optional dependency)."""
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+    def test_round_trip(self, tmp_path):
+        """Test write_tsv and read_tsv through a .zst file."""
+        path = tmp_path / "deals.tsv.zst"
+        write_tsv(path, SCHEMA, ROWS)
+        assert read_tsv(path) == ROWS
+
+    @pytest.mark.skipif(ZSTD_AVAILABLE, reason="zstandard installed")
+    def test_missing_dependency(self, tmp_path):
+        """Test a .zst path without zstandard says what to install."""
+        with pytest.raises(ImportError, match="pip install zstandard"):
+            write_tsv(tmp_path / "deals.tsv.zst", SCHEMA, ROWS)
@@ -3,7 +3,7 @@ Tests for date normalization.
 """
 
 import pytest
-from src.normalize.date_normalizer import normalize_date
+from src.normalize.date_normalizer import DATE_FORMATS, infer_date_format, normalize_date, parse_date_as
 from tests.fixtures.sample_dates import DATE_TEST_CASES
 
 
@@ -39,3 +39,32 @@ class TestDateNormalizer:
         result, conf = normalize_date("15 marts 2024")
         assert result == "2024/03/15"
         assert conf == "high"
+
+
+class TestDateFormats:
+    """Test single-format parsing and column format inference."""
+
+    @pytest.mark.parametrize("input_val,expected_output,expected_conf", DATE_TEST_CASES)
+    def test_at_most_one_format_matches(self, input_val, expected_output, expected_conf):
+        """Parsing with the one matching format gives normalize_date's result."""
+        parsed = [p for p in (parse_date_as(input_val, fmt) for fmt in DATE_FORMATS) if p]
+        assert len(parsed) <= 1
+        assert (parsed[0] if parsed else "") == expected_output
+
+    def test_parse_date_as(self):
+        assert parse_date_as("15/01/2024", "dd/mm/yyyy") == "2024/01/15"
+        assert parse_date_as("15/01/2024", "yyyy/mm/dd") is None
+        assert parse_date_as("31.04.2024", "dd.mm.yyyy") is None
+        assert parse_date_as("January 5, 2024", "month dd, yyyy") == "2024/01/05"
+        assert parse_date_as(None, "yyyy-mm-dd") is None
+
+    def test_infer_dominant_format(self):
+        values = ["01.02.2024", "", None, "15.03.2024", "2024-01-15", "17.11.2023"]
+        assert infer_date_format(values) == "dd.mm.yyyy"
+
+    def test_infer_uses_sample_only(self):
+        values = ["2024-01-15"] * 3 + ["15/01/2024"] * 10
+        assert infer_date_format(values, sample_size=3) == "yyyy-mm-dd"
+
+    def test_infer_nothing_parses(self):
+        assert infer_date_format(["n/a", "", "Q3 2024"]) is None
@@ -0,0 +1,128 @@
+"""
+Tests for the Nordic gazetteer index.
+"""
+
+import pytest
+
+from src.normalize.gazetteer import (
+    Gazetteer,
+    compile_gazetteer,
+    get_gazetteer,
+    load_gazetteer,
+    match_key,
+    place_name_candidates,
+    transliterate,
+)
+
+
+@pytest.fixture(autouse=True)
+def _config_cache(tmp_path, monkeypatch):
+    """Keep compiled config out of the repository's cache directory."""
+    monkeypatch.setenv("DEAL_PIPELINE_CONFIG_CACHE", str(tmp_path / "cache"))
+
+
+class TestTransliterate:
+    """Test diacritic transliteration."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("Malmö", "Malmo"),
+        ("Västerås", "Vasteras"),
+        ("Næstved", "Naestved"),
+        ("Hørsholm", "Horsholm"),
+        ("Hafnarfjörður", "Hafnarfjordur"),
+        ("Reykjavík", "Reykjavik"),
+        ("Stockholm", "Stockholm"),
+    ])
+    def test_transliterate(self, raw, expected):
+        """Test Nordic letters and diacritics become ASCII."""
+        assert transliterate(raw) == expected
+
+    def test_match_key(self):
+        """Test match keys ignore case, diacritics, hyphens and extra spaces."""
+        assert match_key("Upplands-Väsby") == match_key(" upplands  VASBY ") == "upplands vasby"
+
+
+class TestPlaceNameCandidates:
+    """Test stripping of place name qualifiers."""
+
+    def test_plain_name(self):
+        """Test a plain name is its only candidate."""
+        assert place_name_candidates("Malmö") == ["malmö"]
+
+    def test_suffix_and_genitive(self):
+        """Test the qualifier and a genitive s are stripped."""
+        assert place_name_candidates("Göteborgs kommun") == ["göteborgs kommun", "göteborgs", "göteborg"]
+
+    def test_central_station(self):
+        """Test "C" (centralstation) is stripped."""
+        assert place_name_candidates("Malmö C.") == ["malmö c", "malmö"]
+
+    def test_suffix_alone_kept(self):
+        """Test a value that is only a qualifier is not emptied."""
+        assert place_name_candidates("City") == ["city"]
+
+
+class TestGazetteer:
+    """Test exact and nearest-name lookups."""
+
+    @pytest.fixture
+    def gazetteer(self):
+        return Gazetteer([
+            ("Göteborg", ["Gothenburg"]),
+            ("Lund", []),
+            ("Linköping", []),
+            ("Jönköping", []),
+            ("Turku", ["Åbo"]),
+        ])
+
+    def test_exact(self, gazetteer):
+        """Test exact lookups ignore case and diacritics and resolve aliases."""
+        assert gazetteer.get("GOTEBORG") == "Göteborg"
+        assert gazetteer.get("Gothenburg") == "Göteborg"
+        assert gazetteer.get("abo") == "Turku"
+        assert gazetteer.get("Lunds") is None
+
+    def test_closest_one_edit(self, gazetteer):
+        """Test substitutions, insertions and transpositions within one edit."""
+        assert gazetteer.closest("Götebrog") == ("Göteborg", 1)
+        assert gazetteer.closest("Linkőpping") == ("Linköping", 1)
+
+    def test_closest_too_far(self, gazetteer):
+        """Test names more edits away than allowed are not matched."""
+        assert gazetteer.closest("Gbteborgxx") is None
+
+    def test_closest_short_value(self, gazetteer):
+        """Test short values are only matched exactly."""
+        assert gazetteer.closest("Lunf") is None
+
+    def test_closest_tie(self):
+        """Test a value equally close to two places is not matched."""
+        gazetteer = Gazetteer([("Borgholm", []), ("Borgholt", [])])
+        assert gazetteer.closest("Borgholx") is None
+
+
+class TestLoading:
+    """Test loading the bundled gazetteer."""
+
+    def test_bundled_file(self):
+        """Test the bundled file covers the Swedish and Danish municipalities."""
+        gazetteer = get_gazetteer()
+        assert len(gazetteer) > 500
+        assert gazetteer.get("Örkelljunga") == "Örkelljunga"
+        assert gazetteer.get("Ringkøbing-Skjern") == "Ringkøbing-Skjern"
+        assert gazetteer.get("Helsingfors") == "Helsinki"
+
+    def test_compiled_cache(self, tmp_path):
+        """Test a second load comes from the compiled config cache."""
+        path = tmp_path / "places.tsv"
+        path.write_text("# test\nMalmö\nTurku\tÅbo\n", encoding="utf-8")
+        stats = {}
+        load_gazetteer(path, stats=stats)
+        gazetteer = load_gazetteer(path, stats=stats)
+        assert stats == {"compiled": 1, "cache_hits": 1}
+        assert gazetteer.get("abo") == "Turku"
+
+    def test_compile(self):
+        """Test comments and blank lines are skipped."""
+        gazetteer = compile_gazetteer("# header\n\nLund\n".encode("utf-8"))
+        assert len(gazetteer) == 1
@@ -0,0 +1,220 @@
+"""
+Tests for the processed-files manifest and incremental folder runs.
+"""
+
+import json
+import os
+
+import pytest
+
+from src.ingest.manifest import (
+    file_sha256,
+    ProcessingManifest,
+    STATUS_SUCCESS,
+    STATUS_FAILED,
+    STATUS_IMAGE_ONLY,
+)
+
+
+class TestProcessingManifest:
+    """Test manifest bookkeeping."""
+
+    def test_new_file_is_pending(self, tmp_path):
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1.4 teaser a")
+        manifest = ProcessingManifest.load(tmp_path / "m.json")
+        assert manifest.pending([pdf]) == [pdf]
+
+    def test_recorded_file_skipped_after_reload(self, tmp_path):
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1.4 teaser a")
+        manifest = ProcessingManifest.load(tmp_path / "m.json")
+        manifest.record(pdf, STATUS_SUCCESS)
+        manifest.save()
+
+        reloaded = ProcessingManifest.load(tmp_path / "m.json")
+        assert reloaded.status(pdf) == STATUS_SUCCESS
+        assert reloaded.pending([pdf]) == []
+
+    def test_changed_file_is_pending(self, tmp_path):
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1.4 teaser a")
+        manifest = ProcessingManifest(tmp_path / "m.json")
+        manifest.record(pdf, STATUS_SUCCESS)
+
+        pdf.write_bytes(b"%PDF-1.4 teaser a, revised")
+        assert manifest.pending([pdf]) == [pdf]
+
+    def test_renamed_file_is_recognised(self, tmp_path):
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1.4 teaser a")
+        manifest = ProcessingManifest(tmp_path / "m.json")
+        manifest.record(pdf, STATUS_SUCCESS)
+
+        renamed = pdf.rename(tmp_path / "Teaser - Solna.pdf")
+        assert manifest.pending([renamed]) == []
+
+    def test_failed_retried_only_on_request(self, tmp_path):
+        failed = tmp_path / "failed.pdf"
+        failed.write_bytes(b"%PDF-1.4 broken")
+        scan = tmp_path / "scan.pdf"
+        scan.write_bytes(b"%PDF-1.4 scan")
+        manifest = ProcessingManifest(tmp_path / "m.json")
+        manifest.record(failed, STATUS_FAILED, "Extraction failed")
+        manifest.record(scan, STATUS_IMAGE_ONLY)
+
+        assert manifest.pending([failed, scan]) == []
+        assert manifest.pending([failed, scan], retry_failed=True) == [failed]
+
+    def test_hash_cached_by_size_and_mtime(self, tmp_path, monkeypatch):
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1.4 teaser a")
+        manifest = ProcessingManifest(tmp_path / "m.json")
+        assert manifest.hash_of(pdf) == file_sha256(pdf)
+
+        calls = []
+        monkeypatch.setattr("src.ingest.manifest.file_sha256", lambda p: calls.append(p) or "x")
+        manifest.hash_of(pdf)
+        assert calls == []
+
+        st = pdf.stat()
+        os.utime(pdf, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert manifest.hash_of(pdf) == "x"
+
+    def test_corrupt_manifest_starts_empty(self, tmp_path):
+        path = tmp_path / "m.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert ProcessingManifest.load(path).entries == {}
+
+    def test_save_is_json(self, tmp_path):
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1.4 teaser a")
+        manifest = ProcessingManifest(tmp_path / "m.json")
+        manifest.record(pdf, STATUS_FAILED, "timeout")
+        manifest.save()
+
+        data = json.loads((tmp_path / "m.json").read_text(encoding="utf-8"))
+        entry = data["entries"][file_sha256(pdf)]
+        assert entry["file"] == "a.pdf"
+        assert entry["status"] == STATUS_FAILED
+        assert entry["message"] == "timeout"
+        assert manifest.counts() == {STATUS_FAILED: 1}
+
+
+class _FakeExtractor:
+    """Stands in for the LLM extractor; fails for files mentioning 'broken'."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def extract_inbound(self, text, date_received=""):
+        from src.extract.extractor import ExtractionError
+
+        self.calls += 1
+        if "broken" in text:
+            raise ExtractionError("model returned no JSON")
+        return {"Property name": text.splitlines()[-1], "City": "Malmö", "Country": "Sweden"}, {}
+
+
+class TestIncrementalFolder:
+    """Test that folder runs only process new or changed PDFs."""
+
+    @pytest.fixture
+    def extractor(self, monkeypatch):
+        pytest.importorskip("pypdf")
+        fake = _FakeExtractor()
+        monkeypatch.setattr("src.pipelines.full_pipeline.get_extractor", lambda api_key=None: fake)
+        return fake
+
+    def _build(self, folder, name, line):
+        from tests.fixtures.sample_pdfs import build_text_pdf
+        return build_text_pdf(folder / name, [[line]])
+
+    def test_rerun_processes_only_new_files(self, tmp_path, extractor):
+        from src.pipelines.full_pipeline import process_pdf_folder
+
+        self._build(tmp_path, "a.pdf", "Kontor i Solna")
+        self._build(tmp_path, "b.pdf", "Lager i Eskilstuna")
+        ok, summary, results = process_pdf_folder(tmp_path)
+        assert ok
+        assert len(results) == 2
+
+        self._build(tmp_path, "c.pdf", "Handel i Uppsala")
+        ok, summary, results = process_pdf_folder(tmp_path)
+        assert [r["file"] for r in results] == ["c.pdf"]
+        assert "2 already processed" in summary
+        assert extractor.calls == 3
+
+        ok, summary, results = process_pdf_folder(tmp_path)
+        assert ok
+        assert results == []
+        assert "Nothing new" in summary
+
+    def test_max_files_pages_through_folder(self, tmp_path, extractor):
+        from src.pipelines.full_pipeline import process_pdf_folder
+
+        for i in range(5):
+            self._build(tmp_path, f"{i}.pdf", f"Fastighet {i}")
+
+        seen = []
+        for _ in range(3):
+            ok, summary, results = process_pdf_folder(tmp_path, max_files=2)
+            seen += [r["file"] for r in results]
+        assert seen == ["0.pdf", "1.pdf", "2.pdf", "3.pdf", "4.pdf"]
+
+    def test_retry_failed(self, tmp_path, extractor):
+        from src.pipelines.full_pipeline import process_pdf_folder
+
+        self._build(tmp_path, "a.pdf", "broken teaser")
+        process_pdf_folder(tmp_path)
+        ok, summary, results = process_pdf_folder(tmp_path)
+        assert results == []
+
+        ok, summary, results = process_pdf_folder(tmp_path, retry_failed=True)
+        assert [r["file"] for r in results] == ["a.pdf"]
+
+    def test_not_incremental(self, tmp_path, extractor):
+        from src.pipelines.full_pipeline import process_pdf_folder, DEAL_MANIFEST_NAME
+
+        self._build(tmp_path, "a.pdf", "Kontor i Solna")
+        process_pdf_folder(tmp_path, incremental=False)
+        ok, summary, results = process_pdf_folder(tmp_path, incremental=False)
+        assert len(results) == 1
+        assert not (tmp_path / DEAL_MANIFEST_NAME).exists()
+
+    def test_text_folder_incremental(self, tmp_path):
+        pytest.importorskip("pypdf")
+        from src.fetch.pdf_reader import extract_text_from_pdf_folder
+
+        self._build(tmp_path, "a.pdf", "Kontor i Solna")
+        assert extract_text_from_pdf_folder(tmp_path)[:2] == (1, 0)
+        assert extract_text_from_pdf_folder(tmp_path)[:2] == (0, 0)
+
+        # A deleted .txt output is re-extracted
+        (tmp_path / "a.txt").unlink()
+        assert extract_text_from_pdf_folder(tmp_path)[:2] == (1, 0)
+
+    def test_recursive_archives_recorded_by_hash(self, tmp_path, extractor):
+        import io
+        import zipfile
+        from src.pipelines.full_pipeline import process_pdf_folder
+
+        pdf = self._build(tmp_path, "a.pdf", "Kontor i Solna").read_bytes()
+        (tmp_path / "a.pdf").unlink()
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("a.pdf", pdf)
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "deals.zip").write_bytes(buf.getvalue())
+
+        ok, summary, results = process_pdf_folder(tmp_path)
+        assert "No PDF files found" in summary
+
+        ok, summary, results = process_pdf_folder(tmp_path, recursive=True, include_archives=True)
+        assert [r["file"] for r in results] == ["sub/deals.zip!a.pdf"]
+
+        # The same document dropped in as a plain file is already processed
+        (tmp_path / "copy.pdf").write_bytes(pdf)
+        ok, summary, results = process_pdf_folder(tmp_path, recursive=True, include_archives=True)
+        assert results == []
+        assert extractor.calls == 1
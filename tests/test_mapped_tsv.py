@@ -0,0 +1,105 @@
+"""
+Tests for the memory-mapped TSV reader.
+"""
+
+import os
+
+import pytest
+
+from src.ingest import mapped_tsv
+from src.ingest.mapped_tsv import MappedTsv, build_row_offsets, index_path_for
+from src.ingest.read_tsv import read_tsv
+
+
+@pytest.fixture
+def deals_tsv(tmp_path):
+    path = tmp_path / "deals.tsv"
+    # Blank lines, CRLF, a short row, and splitlines-only separators (\x0b, \u2028)
+    path.write_text(
+        "\n \nCountry\tLocation\tYield\r\n"
+        "Sweden\tMalmö\t4 %\n\n"
+        "Denmark\tAarhus\n"
+        "Finland\tEspoo\t5 %\x0bNorway\tOslo\t3 %\u2028"
+        "Sweden\tÖrebro\t4,5 %",
+        encoding="utf-8",
+    )
+    return path
+
+
+class TestMappedTsv:
+    """Test random access gives read_tsv's rows."""
+
+    def test_rows_match_read_tsv(self, deals_tsv):
+        """Test every row, ranges and negative indexes."""
+        expected = read_tsv(deals_tsv)
+        with MappedTsv(deals_tsv) as mapped:
+            assert len(mapped) == len(expected) == 5
+            assert mapped.headers == ["Country", "Location", "Yield"]
+            assert [mapped[i] for i in range(len(mapped))] == expected
+            assert mapped[1:4] == expected[1:4]
+            assert mapped.rows(3, 99) == expected[3:]
+            assert mapped[::2] == expected[::2]
+            assert mapped[-1] == {"Country": "Sweden", "Location": "Örebro", "Yield": "4,5 %"}
+            with pytest.raises(IndexError):
+                mapped[5]
+
+    def test_compact_rows(self, deals_tsv):
+        """Test compact rows share the header's layout."""
+        with MappedTsv(deals_tsv, compact=True) as mapped:
+            assert mapped[0:2] == read_tsv(deals_tsv)[0:2]
+            assert mapped[0].layout is mapped[1].layout
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file has no header and no rows."""
+        path = tmp_path / "empty.tsv"
+        path.write_bytes(b"")
+        with MappedTsv(path) as mapped:
+            assert len(mapped) == 0 and mapped.headers == [] and mapped[:] == []
+
+
+class TestRowIndex:
+    """Test the cached row offset index."""
+
+    def test_offsets(self):
+        """Test offsets of non-blank lines, the header's first."""
+        assert list(build_row_offsets(b"A\n\n1\r\n \n2")) == [0, 3, 8]
+
+    def test_offsets_across_scan_blocks(self, deals_tsv, monkeypatch):
+        """Test scanning in small blocks (mixing line end kinds) finds the same lines."""
+        data = deals_tsv.read_bytes()
+        expected = build_row_offsets(data)
+        monkeypatch.setattr(mapped_tsv, "_SCAN_BLOCK", 7)
+        assert build_row_offsets(data) == expected
+
+    def test_cached_beside_file(self, deals_tsv):
+        """Test the index is written beside the file and reused."""
+        stats = {}
+        MappedTsv(deals_tsv, stats=stats).close()
+        assert index_path_for(deals_tsv).exists()
+        MappedTsv(deals_tsv, stats=stats).close()
+        assert stats == {"index_built": 1, "index_hits": 1}
+
+    def test_rebuilt_when_file_changes(self, deals_tsv):
+        """Test a changed size or mtime invalidates the index."""
+        MappedTsv(deals_tsv).close()
+        with open(deals_tsv, "a", encoding="utf-8") as f:
+            f.write("\nDenmark\tOdense\t6 %\n")
+        stats = {}
+        with MappedTsv(deals_tsv, stats=stats) as mapped:
+            assert mapped[-1]["Location"] == "Odense"
+        assert stats == {"index_built": 1}
+
+        # Same size, new mtime
+        st = deals_tsv.stat()
+        os.utime(deals_tsv, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        stats = {}
+        MappedTsv(deals_tsv, stats=stats).close()
+        assert stats == {"index_built": 1}
+
+    def test_corrupt_index_rebuilt(self, deals_tsv):
+        """Test an unreadable index file is rebuilt, not trusted."""
+        index_path_for(deals_tsv).write_bytes(b"garbage")
+        stats = {}
+        with MappedTsv(deals_tsv, stats=stats) as mapped:
+            assert mapped[:] == read_tsv(deals_tsv)
+        assert stats == {"index_built": 1}
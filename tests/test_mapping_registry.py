@@ -0,0 +1,133 @@
+"""
+Tests for hot-reloading normalization mappings.
+"""
+
+import os
+import time
+
+import pytest
+
+from src.mapping_registry import MappingRegistry
+from src.normalize.city_normalizer import install_city_names, normalize_city
+from src.normalize.country_normalizer import install_country_synonyms, normalize_country
+from src.normalize.property_type import normalize_property_type
+from src.paths import CONFIG_CACHE_ENV
+from src.resources import ResourceRegistry
+
+
+@pytest.fixture(autouse=True)
+def restore_tables(tmp_path, monkeypatch):
+    monkeypatch.setenv(CONFIG_CACHE_ENV, str(tmp_path / "cache"))
+    yield
+    install_city_names(None)
+    install_country_synonyms(None)
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = {
+        "property_map_path": tmp_path / "property_type_map.yml",
+        "city_names_path": tmp_path / "city_names.yml",
+        "country_synonyms_path": tmp_path / "country_synonyms.yml",
+    }
+    paths["property_map_path"].write_text("synonyms:\n  Office: [kontor]\n", encoding="utf-8")
+    paths["city_names_path"].write_text("city_names:\n  sthlm: Stockholm\n", encoding="utf-8")
+    return paths
+
+
+def _edit(path, text):
+    path.write_text(text, encoding="utf-8")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def _registry(files):
+    return MappingRegistry(**{k: str(v) for k, v in files.items()}, log=lambda msg: None)
+
+
+class TestOverridesWithoutRegistry:
+    """The override files apply in every command, not only under the watcher."""
+
+    def test_loaded_at_first_use(self, files, monkeypatch):
+        files["country_synonyms_path"].write_text("country_synonyms:\n  ksa: Sweden\n", encoding="utf-8")
+        resources = ResourceRegistry()
+        monkeypatch.setattr("src.resources.get_city_names", lambda: resources.city_names(str(files["city_names_path"])))
+        monkeypatch.setattr(
+            "src.resources.get_country_synonyms",
+            lambda: resources.country_synonyms(str(files["country_synonyms_path"])),
+        )
+        install_city_names(None)
+        install_country_synonyms(None)
+
+        assert normalize_city("sthlm") == ("Stockholm", "high")
+        assert normalize_country("KSA") == ("Sweden", "high")
+        assert normalize_city("Göteborg") == ("Gothenburg", "high")
+
+    def test_missing_file_uses_builtins(self, tmp_path):
+        table = ResourceRegistry().city_names(str(tmp_path / "missing.yml"))
+        assert table.mapping["göteborg"] == "Gothenburg"
+
+
+class TestMappingRegistry:
+    """Test change detection and snapshot swaps."""
+
+    def test_unchanged_files_not_reloaded(self, files):
+        registry = _registry(files)
+        assert registry.check() is False
+        assert registry.version == 1
+
+    def test_property_map_reloaded(self, files):
+        registry = _registry(files)
+        old_map = registry.property_map()
+        assert normalize_property_type("lager", old_map) == ("Other", "low")
+
+        _edit(files["property_map_path"], "synonyms:\n  Office: [kontor]\n  Logistics: [lager]\n")
+        assert registry.check() is True
+        assert registry.version == 2
+        assert normalize_property_type("lager", registry.property_map()) == ("Logistics", "high")
+        # A document that already holds the old snapshot finishes with it
+        assert normalize_property_type("lager", old_map) == ("Other", "low")
+
+    def test_city_overrides_reloaded(self, files):
+        registry = _registry(files)
+        assert normalize_city("STHLM") == ("Stockholm", "high")
+        assert normalize_city("Göteborg") == ("Gothenburg", "high")
+
+        _edit(files["city_names_path"], "city_names:\n  gbg: Gothenburg\n")
+        registry.check()
+        assert normalize_city("STHLM") == ("STHLM", "medium")  # memoized result not reused
+        assert normalize_city("Gbg") == ("Gothenburg", "high")
+
+    def test_country_file_added_later(self, files):
+        registry = _registry(files)
+        assert normalize_country("Norge") == ("", "low")
+
+        files["country_synonyms_path"].write_text("country_synonyms:\n  ruotsi: Sweden\n", encoding="utf-8")
+        assert registry.check() is True
+        assert normalize_country("Ruotsi") == ("Sweden", "high")
+
+    def test_broken_file_keeps_previous_version(self, files):
+        registry = _registry(files)
+        _edit(files["city_names_path"], "city_names: [unclosed\n")
+        assert registry.check() is False
+        assert registry.check() is False
+        assert registry.stats["errors"] == 1  # not retried until the file changes again
+        assert normalize_city("sthlm") == ("Stockholm", "high")
+
+        _edit(files["city_names_path"], "city_names:\n  sthlm: Stockholm City\n")
+        assert registry.check() is True
+        assert registry.version == 2
+        assert normalize_city("sthlm") == ("Stockholm City", "high")
+
+    def test_background_thread_reloads(self, files):
+        registry = _registry(files)
+        registry.start(interval=0.01)
+        try:
+            _edit(files["city_names_path"], "city_names:\n  gbg: Gothenburg\n")
+            deadline = time.monotonic() + 5
+            while registry.version == 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            registry.stop()
+        assert registry.version == 2
+        assert normalize_city("gbg") == ("Gothenburg", "high")
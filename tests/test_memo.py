@@ -0,0 +1,106 @@
+"""
+Tests for normalizer memoization.
+"""
+
+import copy
+
+import pytest
+
+from src.normalize.country_normalizer import normalize_country
+from src.normalize.date_normalizer import normalize_date
+from src.normalize.memo import (
+    clear_memos,
+    format_memo_stats,
+    memo_stats,
+    memoize,
+    versioned_mapping,
+)
+from src.normalize.number_normalizer import normalize_number, normalize_yield
+from src.normalize.property_type import normalize_property_type
+from src.resources import get_property_map
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    clear_memos()
+    yield
+    clear_memos()
+
+
+class TestMemoize:
+    """Test the decorator."""
+
+    def test_counts_hits_and_misses(self):
+        normalize_country("Sverige")
+        normalize_country("Sverige")
+        normalize_country("DK")
+
+        stats = memo_stats()["normalize_country"]
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+    def test_bounded(self):
+        calls = []
+
+        @memoize(maxsize=2, name="test_bounded")
+        def upper(value):
+            calls.append(value)
+            return value.upper()
+
+        for value in ["a", "b", "c", "a"]:
+            upper(value)
+        assert calls == ["a", "b", "c", "a"]  # "a" was evicted by "c"
+        assert memo_stats()["test_bounded"]["size"] == 2
+
+    def test_typed(self):
+        """1 and 1.0 give different results, so they must not share an entry."""
+        assert type(normalize_yield(1)[0]) is int
+        assert type(normalize_yield(1.0)[0]) is float
+
+    def test_unhashable_argument_bypasses_cache(self):
+        assert normalize_date(["2024-01-15"]) == ("", "low")
+
+    def test_same_results_as_uncached(self):
+        for value in ["1.5M", "4,5 %", "N/A", "150 MSEK", "1.5M"]:
+            assert normalize_number(value) == normalize_number.__wrapped__(value)
+
+    def test_format(self):
+        normalize_date("2024-01-15")
+        normalize_date("2024-01-15")
+        assert "normalize_date: 1 hits / 1 misses (50%)" in format_memo_stats()
+        assert "normalize_city" not in format_memo_stats()
+
+    def test_clear_resets_counters(self):
+        normalize_country("SE")
+        clear_memos()
+        assert memo_stats()["normalize_country"]["misses"] == 0
+
+
+class TestPropertyTypeVersioning:
+    """Property type results are keyed by mapping content."""
+
+    def test_cached_per_mapping(self):
+        mapping = get_property_map()
+        assert normalize_property_type("warehouse", mapping) == ("Logistics", "high")
+        assert normalize_property_type("warehouse", mapping) == ("Logistics", "high")
+        assert memo_stats()["normalize_property_type"]["hits"] == 1
+
+    def test_changed_mapping_not_served_from_cache(self):
+        mapping = get_property_map()
+        assert normalize_property_type("warehouse", mapping)[0] == "Logistics"
+
+        edited = copy.deepcopy(mapping)
+        edited["synonyms"]["Industrial"] = ["warehouse"] + list(edited["synonyms"].get("Industrial") or [])
+        del edited["synonyms"]["Logistics"]
+        assert normalize_property_type("warehouse", edited)[0] == "Industrial"
+
+    def test_equal_content_shares_entries(self):
+        mapping = get_property_map()
+        normalize_property_type("kontor", mapping)
+        normalize_property_type("kontor", copy.deepcopy(mapping))
+        assert memo_stats()["normalize_property_type"]["hits"] == 1
+
+    def test_version_computed_once_per_dict(self):
+        mapping = get_property_map()
+        assert versioned_mapping(mapping) is versioned_mapping(mapping)
+        assert versioned_mapping(mapping) == versioned_mapping(copy.deepcopy(mapping))
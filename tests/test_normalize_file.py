@@ -0,0 +1,130 @@
+"""
+Tests for streaming TSV normalization.
+"""
+
+import pytest
+
+from src.ingest.read_tsv import iter_tsv_chunks, read_tsv
+from src.normalize.row_normalizer import inbound_plan, normalize_inbound_rows
+from src.output.write_tsv import TsvWriter, write_tsv
+from src.pipelines.normalize_file import normalize_tsv
+from src.resources import INBOUND_SCHEMA_PATH, get_property_map, get_schema
+
+HEADER = ["Date received", "Country", "Location", "Price, CCY", "Yield"]
+ROWS = [
+    ["2024-03-01", "Sverige", "Göteborg", "1 500,5", "4,5 %"],
+    ["2024-03-02", "Sweden", "Malmö", "1,500", "5 %"],
+    ["2024-03-04", "Denmark", "Aarhus", "2.000", "4.25%"],
+    ["2024-03-05", "Sweden", "Uppsala", "12 000", "3,9 %"],
+]
+
+
+@pytest.fixture
+def deals_tsv(tmp_path):
+    path = tmp_path / "deals.tsv"
+    lines = ["\t".join(HEADER)] + ["\t".join(row) for row in ROWS]
+    # Blank lines and CRLF endings are skipped as read_tsv does
+    path.write_text("\n\n".join(lines) + "\r\n", encoding="utf-8")
+    return path
+
+
+def _whole_file(path, out_path):
+    """The pre-streaming pipeline: read everything, normalize one batch, write."""
+    profiles = {}
+    rows, _ = normalize_inbound_rows(read_tsv(path, compact=True), get_property_map(), None, profiles)
+    write_tsv(out_path, get_schema(INBOUND_SCHEMA_PATH), rows)
+    return profiles
+
+
+class TestReadChunks:
+    """Test streaming a TSV in chunks."""
+
+    def test_chunks_match_read_tsv(self, deals_tsv):
+        """Test the chunks hold read_tsv's rows, in order, sharing one layout."""
+        chunks = list(iter_tsv_chunks(deals_tsv, 2))
+        assert [len(chunk) for chunk in chunks] == [2, 2]
+        assert [row for chunk in chunks for row in chunk] == read_tsv(deals_tsv)
+        assert chunks[0][0].layout is chunks[1][0].layout
+
+
+class TestTsvWriter:
+    """Test incremental TSV writing."""
+
+    def test_batches_flushed(self, tmp_path):
+        """Test each batch is on disk before the writer is closed."""
+        out = tmp_path / "out.tsv"
+        schema = {"columns": [{"name": "A"}, {"name": "B"}]}
+        with TsvWriter(out, schema) as writer:
+            writer.write_rows([{"A": 1, "B": None}])
+            assert out.read_text(encoding="utf-8") == "A\tB\n1\t\n"
+            writer.write_rows([{"B": "x"}])
+        assert out.read_text(encoding="utf-8") == "A\tB\n1\t\n\tx\n"
+        assert writer.rows_written == 2
+
+
+class TestNormalizeTsv:
+    """Test normalize_tsv streams to the same output as one batch."""
+
+    @pytest.mark.parametrize("chunk_rows", [1, 2, 10_000])
+    def test_same_output_as_whole_file(self, deals_tsv, tmp_path, chunk_rows):
+        """Test the output bytes and number profiles don't depend on the chunk size."""
+        expected_profiles = _whole_file(deals_tsv, tmp_path / "expected.tsv")
+        profiles = {}
+        ok, _ = normalize_tsv(
+            INBOUND_SCHEMA_PATH, deals_tsv, tmp_path / "out.tsv", "inbound",
+            number_profiles=profiles, chunk_rows=chunk_rows,
+        )
+        assert ok
+        assert (tmp_path / "out.tsv").read_bytes() == (tmp_path / "expected.tsv").read_bytes()
+        assert {f: p.summary() for f, p in profiles.items()} == {
+            f: p.summary() for f, p in expected_profiles.items()
+        }
+
+    def test_conflict_rows_numbered_across_chunks(self, deals_tsv, tmp_path):
+        """Test a conflicting cell in a later chunk is reported with its file row number."""
+        ok, msg = normalize_tsv(INBOUND_SCHEMA_PATH, deals_tsv, tmp_path / "out.tsv", "inbound", chunk_rows=2)
+        assert ok
+        assert "row 3: '4.25%'" in msg
+
+    def test_date_stats_summed(self, deals_tsv, tmp_path):
+        """Test date stats count every chunk's cells."""
+        stats = {}
+        normalize_tsv(INBOUND_SCHEMA_PATH, deals_tsv, tmp_path / "out.tsv", "inbound", stats, chunk_rows=2)
+        assert stats["Date received"]["cells"] == 4
+        assert stats["Date received"]["format"] == "yyyy-mm-dd"
+
+    @pytest.mark.parametrize("chunk_rows", [1, 3])
+    def test_workers_same_output(self, deals_tsv, tmp_path, chunk_rows):
+        """Test a process pool writes the serial output, in order, with the same diagnostics."""
+        serial_stats, parallel_stats = {}, {}
+        _, serial_msg = normalize_tsv(
+            INBOUND_SCHEMA_PATH, deals_tsv, tmp_path / "serial.tsv", "inbound", serial_stats, chunk_rows=chunk_rows
+        )
+        ok, msg = normalize_tsv(
+            INBOUND_SCHEMA_PATH, deals_tsv, tmp_path / "parallel.tsv", "inbound", parallel_stats,
+            chunk_rows=chunk_rows, workers=2,
+        )
+        assert ok
+        assert (tmp_path / "parallel.tsv").read_bytes() == (tmp_path / "serial.tsv").read_bytes()
+        assert msg.replace("parallel.tsv", "serial.tsv") == serial_msg
+        assert parallel_stats == serial_stats
+
+    def test_no_rows(self, tmp_path):
+        """Test a header-only file is reported and nothing is written."""
+        path = tmp_path / "empty.tsv"
+        path.write_text("\t".join(HEADER) + "\n", encoding="utf-8")
+        ok, msg = normalize_tsv(INBOUND_SCHEMA_PATH, path, tmp_path / "out.tsv", "inbound")
+        assert not ok and "No data rows" in msg
+        assert not (tmp_path / "out.tsv").exists()
+
+    def test_out_is_input(self, deals_tsv, tmp_path):
+        """Test normalizing a file onto itself reads the whole input before replacing it."""
+        _whole_file(deals_tsv, tmp_path / "expected.tsv")
+        ok, _ = normalize_tsv(INBOUND_SCHEMA_PATH, deals_tsv, tmp_path / "." / "deals.tsv", "inbound", chunk_rows=1)
+        assert ok
+        assert deals_tsv.read_bytes() == (tmp_path / "expected.tsv").read_bytes()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["deals.tsv", "expected.tsv"]
+
+    def test_plan_steps_cover_header(self):
+        """Test the fixture's columns are all normalized by the inbound plan."""
+        assert set(HEADER) <= {field for field, _ in inbound_plan()}
@@ -2,7 +2,10 @@
 Tests for number normalization.
 """
 
+import re
+
 import pytest
+from src.normalize import number_normalizer
 from src.normalize.number_normalizer import normalize_number, normalize_price, normalize_yield, normalize_area
 from tests.fixtures.sample_numbers import PRICE_TEST_CASES, YIELD_TEST_CASES, AREA_TEST_CASES
 
@@ -154,3 +157,47 @@ class TestSwedishTransactionFormats:
         result, conf = normalize_price("743 mkr")
         assert result == 743000000
         assert conf == "high"
+
+
+class TestTokenizerMatchesCascade:
+    """The one-pass tokenizer must give exactly what the cascade gives."""
+
+    # Bypass the memo cache, which would return the tokenizer's results
+    parse = staticmethod(normalize_number.__wrapped__)
+
+    VALUES = [
+        "SEK 1 500 000", "150 MSEK", "150MSEK", "1,5 mkr", "€500k", "$1.5M", "1.5M EUR",
+        "4,5 %", "5.25%", "12 400 kvm", "15000 m2", "2,5 år", "1.2 mdr", "300 tkr",
+        "5 kr", "5kr", "kr 5", "5 mills", "5mills", "7,2 procent", "1.500.000,50",
+        "47,696 kvm uthyrningsbar yta", "N/A", "1e3", "-5", "1.2.3", "5 M %",
+    ]
+
+    @pytest.fixture
+    def cascade_only(self, monkeypatch):
+        """Call to send every value down the cascade for the rest of the test."""
+        return lambda: monkeypatch.setattr(number_normalizer, "NUMBER_TOKENS", re.compile(r"(?!)"))
+
+    @pytest.mark.parametrize("as_integer", [True, False])
+    def test_same_results(self, cascade_only, as_integer):
+        fixtures = [c for c, _, _ in PRICE_TEST_CASES + YIELD_TEST_CASES + AREA_TEST_CASES]
+        values = fixtures + self.VALUES
+        tokenized = [self.parse(v, as_integer) for v in values]
+        cascade_only()
+        cascade = [self.parse(v, as_integer) for v in values]
+
+        for value, a, b in zip(values, tokenized, cascade):
+            assert (type(a[0]), a) == (type(b[0]), b), value
+
+    def test_common_shapes_take_tokenizer(self):
+        for value in ["SEK 1 500 000", "150 MSEK", "4,5 %", "12 400 kvm", "1,5 mkr", "€500k"]:
+            assert number_normalizer.NUMBER_TOKENS.fullmatch(value), value
+
+    def test_kr_glued_to_number_is_not_currency(self):
+        """'5kr' is not '5 kr': the cascade leaves it unparsed, so must the tokenizer."""
+        assert normalize_number("5kr") == ("", "low")
+        assert normalize_number("5 kr") == (5, "high")
+
+    def test_plural_multiplier_needs_space(self, cascade_only):
+        cascade_only()
+        assert self.parse("5 mills") == (5_000_000, "high")
+        assert self.parse("5mills") == ("", "low")
@@ -0,0 +1,125 @@
+"""
+Tests for numeric column separator profiling.
+"""
+
+import pytest
+
+from src.normalize.number_normalizer import AMBIGUOUS, normalize_number, separator_evidence
+from src.normalize.number_profile import (
+    format_number_profiles,
+    number_part,
+    profile_number_column,
+    profile_number_columns,
+)
+from src.normalize.row_normalizer import normalize_inbound_row, normalize_inbound_rows, normalize_transactions_row
+from src.resources import get_property_map
+
+
+class TestSeparatorEvidence:
+    """Test what a single number says about its decimal mark."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("1 500,5", ","),
+        ("4,5", ","),
+        ("1.500.000", ","),
+        ("1.500.000,50", ","),
+        ("4.25", "."),
+        ("1,500,000", "."),
+        ("1,500,000.50", "."),
+        ("1.500", AMBIGUOUS),
+        ("1,500", AMBIGUOUS),
+        ("150", None),
+        ("1 500 000", None),
+        ("1.5000", None),
+    ])
+    def test_evidence(self, text, expected):
+        assert separator_evidence(text) == expected
+
+    def test_number_part(self):
+        assert number_part("SEK 1 500,5 m") == "1 500,5"
+        assert number_part(1500.5) is None
+        assert number_part("N/A") is None
+
+
+class TestDecimalArgument:
+    """normalize_number reads ambiguous values with the given decimal mark."""
+
+    @pytest.mark.parametrize("raw, decimal, expected", [
+        ("1,500", None, 1500),
+        ("1,500", ",", 1.5),
+        ("1,500", ".", 1500),
+        ("1.500", ".", 1.5),
+        ("1.500", ",", 1500),
+        ("1,500 MSEK", ",", 1_500_000),
+    ])
+    def test_ambiguous(self, raw, decimal, expected):
+        assert normalize_number(raw, True, decimal)[0] == expected
+
+    def test_unambiguous_values_unaffected(self):
+        for raw in ["1,500,000", "4,5 %", "1.500.000,50", "4.25", "150 MSEK"]:
+            assert normalize_number(raw, False, ",") == normalize_number(raw, False, ".") == normalize_number(raw, False)
+
+
+class TestProfiles:
+    """Test how a column's decimal mark is chosen."""
+
+    def test_majority_of_values(self):
+        profile = profile_number_column(["4,5", "1 500,25", "1,500", "3.75"], "Yield")
+        assert (profile.decimal, profile.source) == (",", "values")
+        assert profile.ambiguous == 1
+        assert profile.conflicts == [(4, "3.75")]
+        assert profile.summary() == "Yield: decimal ',' (values); 1 ambiguous; 1 conflicting (row 4: '3.75')"
+
+    def test_undecided_without_evidence(self):
+        """Test a column with no evidence keeps the thousands reading."""
+        profile = profile_number_column(["1,500"])
+        assert (profile.decimal, profile.source, profile.guessed) == (None, "undecided", 1)
+
+    def test_stray_cell_does_not_decide(self):
+        """Test one decimal comma among many "46,412" prices per sqm leaves the column undecided."""
+        profile = profile_number_column(["43,5"] + ["46,412", "6,916", "10,417"] * 3, "Price, DKK/m2")
+        assert (profile.decimal, profile.source, profile.guessed) == (None, "undecided", 9)
+
+    def test_no_evidence_from_other_columns(self):
+        """Test a column without evidence of its own stays undecided, whatever the other columns say."""
+        columns = {"Area": ([1], ["12.500"]), "Price": ([1], ["1 500,5"]), "Yield": ([1], ["5.25%"])}
+        profiles = profile_number_columns(columns)
+        assert (profiles["Price"].decimal, profiles["Price"].source) == (",", "values")
+        assert (profiles["Area"].decimal, profiles["Area"].source, profiles["Area"].guessed) == (None, "undecided", 1)
+
+    def test_rows_use_column_decimal(self):
+        rows = [
+            {"Country": "Sverige", "Leasable area, sqm": "1,500", "Yield": "4,5 %"},
+            {"Country": "Sverige", "Leasable area, sqm": "2 300,5", "Yield": "5.25"},
+        ]
+        number_profiles = {}
+        out, _ = normalize_inbound_rows(rows, get_property_map(), number_profiles=number_profiles)
+        assert [row["Leasable area, sqm"] for row in out] == [2, 2300]  # 1,5 and 2 300,5 rounded
+        assert number_profiles["Yield"].decimal is None or number_profiles["Yield"].conflicts
+        assert "Leasable area, sqm: decimal ','" in format_number_profiles(number_profiles)
+
+    @pytest.mark.parametrize("row, field, expected", [
+        ({"Country": "Sweden", "Leasable area, sqm": "2,500"}, "Leasable area, sqm", 2500),
+        ({"Country": "Finland", "Leasable area, sqm": "1,250"}, "Leasable area, sqm", 1250),
+        ({"Country": "Denmark", "Leasable area, sqm": "12.500 m2", "Yield": "5.25%"}, "Leasable area, sqm", 12500),
+        (
+            {"Country": "Sweden", "Deal value, CCY": "127,5 MSEK", "Leasable area, sqm": "2,500"},
+            "Leasable area, sqm",
+            2500,
+        ),
+    ])
+    def test_single_row_reads_thousands(self, row, field, expected):
+        """Test an extracted row's ambiguous values keep the thousands reading, whatever the country."""
+        out, _ = normalize_inbound_row(row, get_property_map())
+        assert out[field] == expected
+
+    def test_single_transaction_row(self):
+        row = {"Country": "Sweden", "Area, m2": "3,400", "Price": "120"}
+        out, _ = normalize_transactions_row(row, get_property_map())
+        assert (out["Area, m2"], out["Price"]) == (3400, 120)
+
+    def test_single_transaction_row_mixed_units(self):
+        """Test a price in MSEK with a decimal comma doesn't decide how area and SEK/m2 are read."""
+        row = {"Price, MSEK": "127,5", "Area, m2": "1,131", "Price, SEK/m2": "112,732"}
+        out, _ = normalize_transactions_row(row, get_property_map())
+        assert (out["Area, m2"], out["Price, SEK/m2"]) == (1131, 112732)
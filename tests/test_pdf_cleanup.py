@@ -0,0 +1,155 @@
+"""
+Tests for PDF text cleanup (boilerplate removal).
+"""
+
+import pytest
+from src.fetch.pdf_cleanup import (
+    clean_pdf_pages,
+    clean_pdf_pages_stream,
+    clean_page_text,
+    find_repeated_lines,
+    estimate_tokens,
+    format_cleanup_stats,
+)
+
+
+def _make_pages(n):
+    """Pages with a repeated header/footer around unique content."""
+    return [
+        "Nordic Capital Advisors\n"
+        f"Kontorsfastighet {i} i Göteborg, uthyrningsbar yta {1000 + i} kvm\n"
+        "Strictly private and confidential\n"
+        f"Page {i} of {n}"
+        for i in range(1, n + 1)
+    ]
+
+
+class TestRepeatedLines:
+    """Test cross-page boilerplate detection."""
+
+    def test_header_and_footer_detected(self):
+        repeated = find_repeated_lines(_make_pages(5))
+        assert "nordic capital advisors" in repeated
+        assert "strictly private and confidential" in repeated
+
+    def test_page_x_of_y_detected_despite_numbers(self):
+        repeated = find_repeated_lines(_make_pages(5))
+        assert "page # of #" in repeated
+
+    def test_unique_content_kept(self):
+        repeated = find_repeated_lines(_make_pages(5))
+        assert not any("kontorsfastighet" in key for key in repeated)
+
+    def test_short_documents_skipped(self):
+        assert find_repeated_lines(_make_pages(2)) == set()
+
+    def test_numbered_footer_detected(self):
+        pages = [f"Kontor {i}\nConfidential | {i}" for i in range(1, 6)]
+        assert "confidential | #" in find_repeated_lines(pages)
+
+    def test_years_not_masked(self):
+        """Test per-page data lines ending in a year are not one repeated key."""
+        names = ["Eken", "Asken", "Linden", "Björken", "Almen"]
+        years = [1985, 1992, 1978, 2004, 1965]
+        pages = [f"Kv. {name}\nYear built {year}" for name, year in zip(names, years)]
+        repeated = find_repeated_lines(pages)
+        assert not any(key.startswith("year built") for key in repeated)
+        cleaned, _ = clean_pdf_pages(pages)
+        assert cleaned[0] == "Kv. Eken\nYear built 1985"
+
+
+class TestCleanPages:
+    """Test page cleaning."""
+
+    def test_boilerplate_removed(self):
+        cleaned, stats = clean_pdf_pages(_make_pages(5))
+        assert cleaned[0] == "Kontorsfastighet 1 i Göteborg, uthyrningsbar yta 1001 kvm"
+        assert stats["lines_removed"] == 15
+        assert stats["tokens_after"] < stats["tokens_before"]
+
+    def test_bare_page_number_at_edge_removed(self):
+        cleaned, removed = clean_page_text("Hyresintäkter 12 MSEK\nNOI 9 MSEK\n- 7 -", set(), page_count=10)
+        assert cleaned == "Hyresintäkter 12 MSEK\nNOI 9 MSEK"
+        assert removed == 1
+
+    @pytest.mark.parametrize("line", ["Page 12", "12 / 40", "12 of 40", "12"])
+    def test_page_number_forms_removed(self, line):
+        cleaned, removed = clean_page_text(f"{line}\nNOI 9 MSEK", set(), page_count=40)
+        assert (cleaned, removed) == ("NOI 9 MSEK", 1)
+
+    def test_year_at_edge_kept(self):
+        """Test a bare number higher than the page count is content, not a page number."""
+        cleaned, removed = clean_page_text("Byggår\nNOI 9 MSEK\n1985", set(), page_count=40)
+        assert cleaned == "Byggår\nNOI 9 MSEK\n1985"
+        assert removed == 0
+
+    def test_bare_number_kept_without_page_count(self):
+        cleaned, _ = clean_page_text("NOI 9 MSEK\n12", set())
+        assert cleaned == "NOI 9 MSEK\n12"
+
+    def test_number_in_body_kept(self):
+        text = "Antal fastigheter\nBlock A\n15\nBlock B\nSummary"
+        cleaned, removed = clean_page_text(text, set())
+        assert "15" in cleaned.splitlines()
+        assert removed == 0
+
+    def test_hyphenated_line_break_rejoined(self):
+        cleaned, _ = clean_page_text("Den moderna logistik-\nfastigheten ligger i Malmö", set())
+        assert cleaned == "Den moderna logistikfastigheten ligger i Malmö"
+
+    @pytest.mark.parametrize("text", ["kontors-\noch bostadshus", "logistik-\neller lagerlokal", "office-\nand retail"])
+    def test_hyphen_before_conjunction_kept(self, text):
+        """Test a suspended compound ("kontors- och bostadshus") keeps its hyphen."""
+        cleaned, _ = clean_page_text(text, set())
+        assert cleaned == text
+
+    def test_capitalised_continuation_not_joined(self):
+        cleaned, _ = clean_page_text("Sale-\nLeaseback", set())
+        assert cleaned == "Sale-\nLeaseback"
+
+    def test_whitespace_collapsed(self):
+        cleaned, _ = clean_page_text("NOI   28,5  MSEK\n\n\n\nYield 5,1 %", set())
+        assert cleaned == "NOI 28,5 MSEK\n\nYield 5,1 %"
+
+
+class TestReporting:
+    """Test token estimates and summaries."""
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+
+    def test_format_stats(self):
+        summary = format_cleanup_stats({"lines_removed": 48, "tokens_before": 5200, "tokens_after": 3900})
+        assert summary == "removed 48 boilerplate lines, ~5,200 -> ~3,900 tokens (-25%)"
+
+
+class TestStreamingCleanup:
+    """Test window-based cleanup over a page stream."""
+
+    def test_matches_whole_document_for_short_docs(self):
+        pages = _make_pages(5)
+        batch, batch_stats = clean_pdf_pages(pages)
+        stats = {}
+        streamed = [text for _, text in clean_pdf_pages_stream(enumerate(pages), stats)]
+        assert streamed == batch
+        assert stats == batch_stats
+
+    def test_window_applies_to_later_pages(self):
+        pages = _make_pages(40)
+        cleaned = list(clean_pdf_pages_stream(enumerate(pages, start=1), window=5))
+        assert len(cleaned) == 40
+        assert cleaned[-1] == (40, "Kontorsfastighet 40 i Göteborg, uthyrningsbar yta 1040 kvm")
+
+    def test_consumes_lazily(self):
+        consumed = []
+
+        def pages():
+            for i, text in enumerate(_make_pages(40), start=1):
+                consumed.append(i)
+                yield i, text
+
+        stream = clean_pdf_pages_stream(pages(), window=5)
+        next(stream)
+        assert consumed == [1, 2, 3, 4, 5]
@@ -0,0 +1,186 @@
+"""
+Tests for the pluggable PDF text engines.
+"""
+
+import io
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pypdf")
+
+from src.fetch.pdf_engines import (
+    available_engines,
+    classify_pages,
+    get_engine,
+    ENGINES,
+    DEFAULT_ENGINE,
+    PDF_KIND_TEXT,
+    PDF_KIND_IMAGE_ONLY,
+    PDF_KIND_MIXED,
+    PdfDocument,
+    PdfTextEngine,
+    _PypdfDocument,
+)
+from src.fetch.pdf_reader import extract_text_from_pdf, iter_pdf_pages, probe_pdf_text_layer
+from tests.fixtures.sample_pdfs import build_image_pdf, build_mixed_pdf, build_table_pdf, build_text_pdf
+
+
+KEY_FIGURES = [("Uthyrbar area", "12 400 kvm"), ("Driftnetto", "28,5 MSEK"), ("Direktavkastning", "5,25 %")]
+
+
+class TestEngineLookup:
+    """Test engine selection."""
+
+    def test_default_is_pypdf(self):
+        assert DEFAULT_ENGINE == "pypdf"
+        assert get_engine().name == "pypdf"
+        assert get_engine(None) is ENGINES["pypdf"]
+
+    def test_cli_choices_match_engines(self):
+        from src.cli import DEFAULT_PDF_ENGINE, PDF_ENGINE_NAMES
+
+        assert PDF_ENGINE_NAMES == tuple(sorted(ENGINES))
+        assert DEFAULT_PDF_ENGINE == DEFAULT_ENGINE
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError, match="Unknown PDF engine"):
+            get_engine("acrobat")
+
+    def test_pypdf_always_available(self):
+        assert "pypdf" in available_engines()
+
+    def test_unknown_engine_returns_error(self, tmp_path):
+        path = build_text_pdf(tmp_path / "a.pdf", [["Kontor i Solna"]])
+        ok, msg, text = extract_text_from_pdf(path, engine="acrobat")
+        assert ok is False
+        assert "Unknown PDF engine" in msg
+
+    def test_unavailable_engine_returns_install_hint(self, tmp_path, monkeypatch):
+        engine = ENGINES["pymupdf"]
+        monkeypatch.setattr(type(engine), "is_available", lambda self: False)
+        path = build_text_pdf(tmp_path / "a.pdf", [["Kontor i Solna"]])
+        ok, msg, text = extract_text_from_pdf(path, engine="pymupdf")
+        assert ok is False
+        assert "pip install pymupdf" in msg
+
+
+    def test_incomplete_engine_fails_on_instantiation(self):
+        """Test an engine or document missing a method fails when created, not mid-document."""
+        class NoOpen(PdfTextEngine):
+            name = "broken"
+
+            def is_available(self):
+                return True
+
+        class NoProbe(PdfDocument):
+            def iter_pages(self, indices):
+                return iter(())
+
+        with pytest.raises(TypeError, match="open"):
+            NoOpen()
+        with pytest.raises(TypeError, match="probe"):
+            NoProbe()
+
+class TestClassifyPages:
+    """Test document classification from page layers."""
+
+    def test_kinds(self):
+        assert classify_pages([(True, False), (False, False)]) == PDF_KIND_TEXT
+        assert classify_pages([(False, True), (False, False)]) == PDF_KIND_IMAGE_ONLY
+        assert classify_pages([(True, False), (False, True)]) == PDF_KIND_MIXED
+
+    def test_text_page_with_images_counts_as_text(self):
+        assert classify_pages([(True, True)]) == PDF_KIND_TEXT
+
+
+@pytest.fixture(params=sorted(ENGINES))
+def engine(request):
+    """Every engine; optional ones are skipped when not installed."""
+    if not ENGINES[request.param].is_available():
+        pytest.skip(f"{ENGINES[request.param].package} not installed")
+    return request.param
+
+
+class TestEngines:
+    """Behaviour every engine must share."""
+
+    def test_extracts_pages(self, tmp_path, engine):
+        path = build_text_pdf(tmp_path / "im.pdf", [["Kontor i Solna"], ["Lager i Eskilstuna"]])
+        ok, msg, text = extract_text_from_pdf(path, engine=engine)
+        assert ok, msg
+        assert "--- Page 1 ---" in text
+        assert "Kontor i Solna" in text
+        assert "Lager i Eskilstuna" in text
+
+    def test_reads_from_memory(self, tmp_path, engine):
+        data = build_text_pdf(tmp_path / "im.pdf", [["Kontor i Solna"]]).read_bytes()
+        ok, msg, text = extract_text_from_pdf(io.BytesIO(data), engine=engine)
+        assert ok, msg
+        assert "Kontor i Solna" in text
+
+    def test_page_selection(self, tmp_path, engine):
+        path = build_text_pdf(tmp_path / "im.pdf", [[f"Avsnitt {c}"] for c in "ABCDE"])
+        pages = list(iter_pdf_pages(path, pages="2,4-", engine=engine))
+        assert [num for num, _ in pages] == [2, 4, 5]
+        assert pages[0][1] == "Avsnitt B"
+
+    def test_probe(self, tmp_path, engine):
+        text = build_text_pdf(tmp_path / "text.pdf", [["Kontor"]] * 3)
+        scan = build_image_pdf(tmp_path / "scan.pdf", 5)
+        mixed = build_mixed_pdf(tmp_path / "mixed.pdf", [["Kontor"], None, None])
+        assert probe_pdf_text_layer(text, engine=engine) == PDF_KIND_TEXT
+        assert probe_pdf_text_layer(scan, engine=engine) == PDF_KIND_IMAGE_ONLY
+        assert probe_pdf_text_layer(mixed, engine=engine) == PDF_KIND_MIXED
+
+    def test_image_only_fails_fast(self, tmp_path, engine):
+        path = build_image_pdf(tmp_path / "scan.pdf", 5)
+        stats = {}
+        ok, msg, text = extract_text_from_pdf(path, stats=stats, engine=engine)
+        assert ok is False
+        assert stats["pdf_kind"] == PDF_KIND_IMAGE_ONLY
+
+    def test_table_values_extracted(self, tmp_path, engine):
+        path = build_table_pdf(tmp_path / "table.pdf", [KEY_FIGURES])
+        ok, msg, text = extract_text_from_pdf(path, engine=engine)
+        assert ok, msg
+        for label, value in KEY_FIGURES:
+            assert label in text
+            assert value in text
+
+
+class TestPymupdf:
+    """PyMuPDF-specific layout behaviour."""
+
+    def test_table_rows_stay_together(self, tmp_path):
+        pytest.importorskip("pymupdf")
+        path = build_table_pdf(tmp_path / "table.pdf", [KEY_FIGURES])
+        ok, msg, text = extract_text_from_pdf(path, engine="pymupdf")
+        assert ok, msg
+        lines = text.splitlines()
+        for label, value in KEY_FIGURES:
+            assert f"{label} {value}" in lines
+
+
+class TestPypdf:
+    """pypdf-specific memory handling."""
+
+    class FakePage:
+        def __init__(self, text):
+            self.text = text
+
+        def extract_text(self):
+            return self.text
+
+    def test_object_cache_dropped_after_each_page(self, tmp_path):
+        path = build_text_pdf(tmp_path / "im.pdf", [["Kontor"], ["Lager"]])
+        with get_engine("pypdf").open(path) as doc:
+            pages = doc.iter_pages(range(doc.page_count))
+            assert next(pages) == (1, "Kontor")
+            assert not doc.reader.resolved_objects
+
+    def test_reader_without_object_cache(self, monkeypatch):
+        """Test a pypdf whose reader has no resolved_objects still yields pages."""
+        monkeypatch.setattr("src.fetch.pdf_engines.PYPDF_COLLECT_EVERY_PAGES", 1)
+        reader = SimpleNamespace(pages=[self.FakePage(" Kontor i Solna "), self.FakePage(None)])
+        assert list(_PypdfDocument(reader).iter_pages([0, 1])) == [(1, "Kontor i Solna"), (2, "")]
@@ -0,0 +1,191 @@
+"""
+Tests for PDF text extraction and the image-only probe.
+"""
+
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pypdf")
+
+from src.fetch.pdf_reader import (
+    extract_text_from_pdf,
+    iter_pdf_pages,
+    limit_to_token_budget,
+    parse_page_selection,
+    probe_pdf_text_layer,
+    IMAGE_ONLY_MESSAGE,
+    PDF_KIND_TEXT,
+    PDF_KIND_IMAGE_ONLY,
+    PDF_KIND_MIXED,
+)
+from tests.fixtures.sample_pdfs import build_text_pdf, build_image_pdf, build_mixed_pdf
+
+
+TEASER_PAGES = [
+    ["Nordic Advisors - Strictly confidential", f"Logistikfastighet i {city}", "NOI 28,5 MSEK", f"{i}"]
+    for i, city in enumerate(["Malmö", "Lund", "Helsingborg", "Landskrona"], start=1)
+]
+
+
+class TestProbe:
+    """Test text layer classification."""
+
+    def test_text_pdf(self, tmp_path):
+        path = build_text_pdf(tmp_path / "teaser.pdf", TEASER_PAGES)
+        assert probe_pdf_text_layer(path) == PDF_KIND_TEXT
+
+    def test_image_only_pdf(self, tmp_path):
+        path = build_image_pdf(tmp_path / "scan.pdf", 20)
+        assert probe_pdf_text_layer(path) == PDF_KIND_IMAGE_ONLY
+
+    def test_mixed_pdf(self, tmp_path):
+        path = build_mixed_pdf(tmp_path / "mixed.pdf", [None, ["Kontor i Lund"], None])
+        assert probe_pdf_text_layer(path) == PDF_KIND_MIXED
+
+
+class TestExtraction:
+    """Test extract_text_from_pdf."""
+
+    def test_extracts_text_with_page_markers(self, tmp_path):
+        path = build_text_pdf(tmp_path / "teaser.pdf", TEASER_PAGES)
+        ok, msg, text = extract_text_from_pdf(path)
+        assert ok
+        assert msg == "Extracted 4 pages"
+        assert "--- Page 1 ---" in text
+        assert "Strictly confidential" in text
+
+    def test_clean_removes_boilerplate(self, tmp_path):
+        path = build_text_pdf(tmp_path / "teaser.pdf", TEASER_PAGES)
+        stats = {}
+        ok, msg, text = extract_text_from_pdf(path, clean=True, stats=stats)
+        assert ok
+        assert "Strictly confidential" not in text
+        assert "NOI 28,5 MSEK" not in text  # identical on every page
+        assert "Logistikfastighet i Malmö" in text
+        assert stats["tokens_after"] < stats["tokens_before"]
+        assert "boilerplate lines" in msg
+
+    def test_image_only_fails_fast(self, tmp_path):
+        path = build_image_pdf(tmp_path / "scan.pdf", 5)
+        stats = {}
+        ok, msg, text = extract_text_from_pdf(path, stats=stats)
+        assert not ok
+        assert msg == IMAGE_ONLY_MESSAGE
+        assert stats["pdf_kind"] == PDF_KIND_IMAGE_ONLY
+
+    def test_not_a_pdf(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("hello")
+        ok, msg, _ = extract_text_from_pdf(path)
+        assert not ok
+        assert "not a PDF" in msg
+
+
+class TestFolderReporting:
+    """Test that image-only PDFs are reported separately in batch runs."""
+
+    def test_image_only_counted_separately(self, tmp_path, monkeypatch):
+        pytest.importorskip("anthropic")
+        from src.pipelines.full_pipeline import process_pdf_folder
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+        build_image_pdf(tmp_path / "a_scan.pdf", 3)
+        build_image_pdf(tmp_path / "b_scan.pdf", 4)
+
+        ok, summary, results = process_pdf_folder(tmp_path)
+
+        assert not ok
+        assert "0 failed" in summary
+        assert "2 image-only skipped" in summary
+        assert all(r["image_only"] for r in results)
+
+
+class TestPageSelection:
+    """Test page selection specs."""
+
+    def test_all_pages(self):
+        assert parse_page_selection(None, 4) == [0, 1, 2, 3]
+
+    def test_ranges_and_singles(self):
+        assert parse_page_selection("1-2,4", 10) == [0, 1, 3]
+
+    def test_open_ranges(self):
+        assert parse_page_selection("8-", 10) == [7, 8, 9]
+        assert parse_page_selection("-2", 10) == [0, 1]
+
+    def test_out_of_range_ignored(self):
+        assert parse_page_selection("3-20", 4) == [2, 3]
+
+    @pytest.mark.parametrize("spec", ["1-x", "abc", "0", "5-3", "1--3", "2,,x-"])
+    def test_malformed_spec_named(self, spec):
+        with pytest.raises(ValueError, match=f"Invalid page selection {spec!r}"):
+            parse_page_selection(spec, 10)
+
+    def test_cli_rejects_malformed_spec(self, tmp_path, monkeypatch, capsys):
+        """Test the CLI rejects --pages before opening any PDF."""
+        from src import cli
+
+        opened = []
+        monkeypatch.setattr("src.fetch.pdf_reader.get_engine", lambda name=None: opened.append(name))
+        monkeypatch.setattr("sys.argv", ["cli", "process-pdf-file", "--input", str(tmp_path / "a.pdf"), "--pages", "1-x"])
+        with pytest.raises(SystemExit):
+            cli.main()
+        assert "Invalid page selection '1-x'" in capsys.readouterr().err
+        assert opened == []
+
+
+class TestStreaming:
+    """Test the streaming page iterator and lazy consumers."""
+
+    def test_iter_pdf_pages(self, tmp_path):
+        path = build_text_pdf(tmp_path / "teaser.pdf", TEASER_PAGES)
+        pages = list(iter_pdf_pages(path, pages="2-3"))
+        assert [num for num, _ in pages] == [2, 3]
+        assert "Lund" in pages[0][1]
+
+    def test_token_budget_stops_reading(self):
+        read = []
+
+        def pages():
+            for i in range(1, 100):
+                read.append(i)
+                yield i, "x" * 400  # 100 tokens per page
+
+        stats = {}
+        kept = list(limit_to_token_budget(pages(), 250, stats))
+        assert [num for num, _ in kept] == [1, 2, 3]
+        assert len(kept[2][1]) == 200
+        assert stats["truncated_at_page"] == 3
+        assert read == [1, 2, 3]
+
+    def test_extract_with_budget(self, tmp_path):
+        path = build_text_pdf(tmp_path / "teaser.pdf", TEASER_PAGES)
+        ok, msg, text = extract_text_from_pdf(path, max_tokens=15)
+        assert ok
+        assert "--- Page 1 ---" in text
+        assert "--- Page 3 ---" not in text
+        assert "token budget reached" in msg
+
+    def test_peak_memory_bounded_by_page(self, tmp_path):
+        """Streaming working set must not grow with page count."""
+        def page(i):
+            return [f"Fastighet {i}-{j}: kontor med uthyrningsbar yta {i * j} kvm" for j in range(15)]
+
+        def loop_peak(page_count):
+            path = build_text_pdf(tmp_path / f"im_{page_count}.pdf", [page(i) for i in range(page_count)])
+            pages = iter_pdf_pages(path)
+            tracemalloc.start()
+            try:
+                next(pages)  # open the file and parse the page tree
+                baseline = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                for _ in pages:
+                    pass
+                return tracemalloc.get_traced_memory()[1] - baseline
+            finally:
+                tracemalloc.stop()
+
+        small = loop_peak(10)
+        large = loop_peak(100)
+        assert large < small * 2
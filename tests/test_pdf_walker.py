@@ -0,0 +1,185 @@
+"""
+Tests for bulk PDF discovery (folders, zip archives, saved emails).
+"""
+
+import email.errors
+import io
+import zipfile
+from email.message import EmailMessage
+
+import pytest
+
+pytest.importorskip("pypdf")
+
+from src.fetch.pdf_reader import extract_text_from_pdf
+from src.ingest.pdf_walker import format_walk_stats, iter_pdf_documents, iter_pdf_paths
+from tests.fixtures.sample_pdfs import build_text_pdf
+
+
+def _pdf_bytes(tmp_path, line):
+    return build_text_pdf(tmp_path / "_tmp.pdf", [[line]]).read_bytes()
+
+
+def _zip_bytes(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+def _eml_bytes(attachments):
+    msg = EmailMessage()
+    msg["Subject"] = "Teaser: Logistikfastighet"
+    msg["From"] = "broker@example.com"
+    msg.set_content("Please find the teaser attached.")
+    for filename, data, maintype, subtype in attachments:
+        msg.add_attachment(data, maintype=maintype, subtype=subtype, filename=filename)
+    return msg.as_bytes()
+
+
+class TestFolders:
+    """Test plain folder walking."""
+
+    def test_top_level_only(self, tmp_path):
+        build_text_pdf(tmp_path / "a.pdf", [["Kontor i Solna"]])
+        (tmp_path / "sub").mkdir()
+        build_text_pdf(tmp_path / "sub" / "b.pdf", [["Lager i Eskilstuna"]])
+
+        names = [d.name for d in iter_pdf_documents(tmp_path, recursive=False)]
+        assert names == ["a.pdf"]
+
+    def test_recursive(self, tmp_path):
+        build_text_pdf(tmp_path / "a.pdf", [["Kontor i Solna"]])
+        (tmp_path / "2024" / "Q1").mkdir(parents=True)
+        build_text_pdf(tmp_path / "2024" / "Q1" / "b.pdf", [["Lager i Eskilstuna"]])
+
+        names = [d.name for d in iter_pdf_documents(tmp_path)]
+        assert names == ["a.pdf", "2024/Q1/b.pdf"]
+
+    def test_uppercase_suffix_found_once(self, tmp_path):
+        build_text_pdf(tmp_path / "TEASER.PDF", [["Kontor i Solna"]])
+        assert [p.name for p in iter_pdf_paths(tmp_path)] == ["TEASER.PDF"]
+
+    def test_hidden_entries_skipped(self, tmp_path):
+        (tmp_path / ".cache").mkdir()
+        build_text_pdf(tmp_path / ".cache" / "a.pdf", [["Kontor i Solna"]])
+        build_text_pdf(tmp_path / ".b.pdf", [["Kontor i Solna"]])
+        assert list(iter_pdf_documents(tmp_path)) == []
+
+    def test_duplicates_dropped(self, tmp_path):
+        build_text_pdf(tmp_path / "a.pdf", [["Kontor i Solna"]])
+        (tmp_path / "copy").mkdir()
+        (tmp_path / "copy" / "a (1).pdf").write_bytes((tmp_path / "a.pdf").read_bytes())
+
+        stats = {}
+        docs = list(iter_pdf_documents(tmp_path, stats=stats))
+        assert len(docs) == 1
+        assert stats == {"found": 1, "duplicates": 1, "skipped": 0}
+        assert "1 duplicates dropped" in format_walk_stats(stats)
+
+    def test_disk_documents_are_not_read_into_memory(self, tmp_path):
+        path = build_text_pdf(tmp_path / "a.pdf", [["Kontor i Solna"]])
+        doc = next(iter_pdf_documents(tmp_path))
+        assert not doc.in_memory
+        assert doc.pdf_input() == path
+
+
+class TestArchives:
+    """Test PDFs inside zip archives and emails."""
+
+    def test_zip_members(self, tmp_path):
+        data = _zip_bytes({
+            "teasers/solna.pdf": _pdf_bytes(tmp_path, "Kontor i Solna"),
+            "readme.txt": b"not a pdf",
+        })
+        (tmp_path / "deals.zip").write_bytes(data)
+        (tmp_path / "_tmp.pdf").unlink()
+
+        docs = list(iter_pdf_documents(tmp_path))
+        assert [d.name for d in docs] == ["deals.zip!teasers/solna.pdf"]
+        assert docs[0].in_memory
+
+        ok, msg, text = extract_text_from_pdf(docs[0].pdf_input())
+        assert ok, msg
+        assert "Kontor i Solna" in text
+
+    def test_archives_ignored_unless_requested(self, tmp_path):
+        (tmp_path / "deals.zip").write_bytes(_zip_bytes({"a.pdf": _pdf_bytes(tmp_path, "Kontor")}))
+        (tmp_path / "_tmp.pdf").unlink()
+        assert list(iter_pdf_documents(tmp_path, include_archives=False)) == []
+
+    def test_nested_zip(self, tmp_path):
+        inner = _zip_bytes({"b.pdf": _pdf_bytes(tmp_path, "Lager i Eskilstuna")})
+        (tmp_path / "outer.zip").write_bytes(_zip_bytes({"inner.zip": inner}))
+        (tmp_path / "_tmp.pdf").unlink()
+
+        assert [d.name for d in iter_pdf_documents(tmp_path)] == ["outer.zip!inner.zip!b.pdf"]
+
+    def test_eml_attachments(self, tmp_path):
+        pdf = _pdf_bytes(tmp_path, "Kontor i Solna")
+        zipped = _zip_bytes({"im.pdf": _pdf_bytes(tmp_path, "Lager i Eskilstuna")})
+        (tmp_path / "_tmp.pdf").unlink()
+        (tmp_path / "mail.eml").write_bytes(_eml_bytes([
+            ("Teaser Solna.pdf", pdf, "application", "pdf"),
+            ("IM.zip", zipped, "application", "zip"),
+            ("logo.png", b"\x89PNG", "image", "png"),
+        ]))
+
+        names = [d.name for d in iter_pdf_documents(tmp_path)]
+        assert names == ["mail.eml!Teaser Solna.pdf", "mail.eml!IM.zip!im.pdf"]
+
+    def test_same_pdf_in_folder_zip_and_email_yielded_once(self, tmp_path):
+        pdf = build_text_pdf(tmp_path / "a.pdf", [["Kontor i Solna"]]).read_bytes()
+        (tmp_path / "b.zip").write_bytes(_zip_bytes({"a.pdf": pdf}))
+        (tmp_path / "c.eml").write_bytes(_eml_bytes([("a.pdf", pdf, "application", "pdf")]))
+
+        stats = {}
+        assert [d.name for d in iter_pdf_documents(tmp_path, stats=stats)] == ["a.pdf"]
+        assert stats["duplicates"] == 2
+
+    def test_corrupt_archive_skipped(self, tmp_path):
+        (tmp_path / "broken.zip").write_bytes(b"PK\x03\x04 truncated")
+        (tmp_path / "fake.zip").write_bytes(_zip_bytes({"fake.pdf": b"<html>not a pdf</html>"}))
+        build_text_pdf(tmp_path / "ok.pdf", [["Kontor i Solna"]])
+
+        stats = {}
+        assert [d.name for d in iter_pdf_documents(tmp_path, stats=stats)] == ["ok.pdf"]
+        assert stats["skipped"] == 2
+
+    def test_unreadable_files_skipped(self, tmp_path):
+        """Test files that can't be read are skipped like a corrupt zip, not fatal to the walk."""
+        (tmp_path / "gone.pdf").symlink_to(tmp_path / "missing.pdf")
+        (tmp_path / "gone.eml").symlink_to(tmp_path / "missing.eml")
+        build_text_pdf(tmp_path / "ok.pdf", [["Kontor i Solna"]])
+
+        stats = {}
+        assert [d.name for d in iter_pdf_documents(tmp_path, stats=stats)] == ["ok.pdf"]
+        assert stats["skipped"] == 2
+        assert "2 unreadable files or archive entries skipped" in format_walk_stats(stats)
+
+    def test_malformed_eml_skipped(self, tmp_path, monkeypatch):
+        def broken(*args, **kwargs):
+            raise email.errors.MessageParseError("bad header")
+
+        monkeypatch.setattr("src.ingest.pdf_walker.email.message_from_binary_file", broken)
+        (tmp_path / "mail.eml").write_bytes(b"Subject: x\n\nbody")
+        (tmp_path / "mail.zip").write_bytes(_zip_bytes({"fwd.eml": b"Subject: y\n\nbody"}))
+        build_text_pdf(tmp_path / "ok.pdf", [["Kontor i Solna"]])
+
+        stats = {}
+        assert [d.name for d in iter_pdf_documents(tmp_path, stats=stats)] == ["ok.pdf"]
+        assert stats["skipped"] == 2
+
+    def test_is_lazy(self, tmp_path):
+        for i in range(3):
+            build_text_pdf(tmp_path / f"{i}.pdf", [[f"Fastighet {i}"]])
+        hashed = []
+
+        def hasher(path):
+            hashed.append(path.name)
+            return path.name
+
+        docs = iter_pdf_documents(tmp_path, hasher=hasher)
+        next(docs)
+        assert hashed == ["0.pdf"]
@@ -0,0 +1,106 @@
+"""
+Tests for schema-compiled normalization plans.
+"""
+
+import pytest
+
+from src.normalize.plan import compile_plan
+from src.normalize.row_normalizer import inbound_plan, normalize_rows, transactions_plan
+
+
+def _schema(*columns, **extra):
+    return {"schema_name": "test", "columns": list(columns), **extra}
+
+
+class TestCompilePlan:
+    """Test deriving steps from column types and hints."""
+
+    def test_type_defaults(self):
+        """Test date and number columns are normalized without a hint; others are not."""
+        plan = compile_plan(_schema(
+            {"name": "Date", "type": "date"},
+            {"name": "Area", "type": "number"},
+            {"name": "Index", "type": "integer"},
+            {"name": "Comment", "type": "string"},
+        ))
+        assert plan == [("Date", "date"), ("Area", "number")]
+
+    def test_hints(self):
+        """Test hints override the type default, and "none" turns it off."""
+        plan = compile_plan(_schema(
+            {"name": "Town", "type": "string", "normalize": "city"},
+            {"name": "Yield", "type": "number", "normalize": "yield"},
+            {"name": "Ref no", "type": "number", "normalize": "none"},
+        ))
+        assert plan == [("Town", "city"), ("Yield", "yield")]
+
+    def test_layouts_merged(self):
+        """Test a field in several layouts gets one step."""
+        plan = compile_plan({
+            "columns_sweden": [{"name": "Price, MSEK", "type": "number"}, {"name": "Yield", "type": "number", "normalize": "yield"}],
+            "columns_finland": [{"name": "Yield", "type": "number", "normalize": "yield"}, {"name": "Price, MEUR", "type": "number"}],
+        })
+        assert plan == [("Price, MSEK", "number"), ("Yield", "yield"), ("Price, MEUR", "number")]
+
+    def test_normalize_fields(self):
+        """Test fields outside the column lists."""
+        plan = compile_plan(_schema({"name": "Date", "type": "date"}, normalize_fields={"Price": "number"}))
+        assert plan == [("Date", "date"), ("Price", "number")]
+
+    def test_unknown_hint(self):
+        """Test a misspelled hint is reported with its column."""
+        with pytest.raises(ValueError, match="'Town'.*'cty'"):
+            compile_plan(_schema({"name": "Town", "type": "string", "normalize": "cty"}))
+
+    def test_conflicting_hints(self):
+        """Test one field with two different hints is rejected."""
+        with pytest.raises(ValueError, match="conflicts"):
+            compile_plan({
+                "columns_sweden": [{"name": "Yield", "type": "number", "normalize": "yield"}],
+                "columns_denmark": [{"name": "Yield", "type": "number"}],
+            })
+
+
+class TestBundledPlans:
+    """Test the plans of the bundled schemas."""
+
+    def test_inbound(self):
+        """Test the inbound plan covers the normalized deal list columns."""
+        plan = dict(inbound_plan())
+        assert plan["Date received"] == "date"
+        assert plan["Use"] == "property_type"
+        assert plan["Location"] == "city"
+        assert plan["Property designation"] == "designation"
+        assert plan["Economic occupancy rate, %"] == "yield"
+        assert plan["Price, CCY/sqm"] == "number"
+        assert "Comment" not in plan and "Index" not in plan
+
+    def test_transactions(self):
+        """Test the transactions plan covers every country's columns and the raw Price."""
+        plan = dict(transactions_plan())
+        assert plan["Property type 2"] == "property_type"
+        assert plan["Price"] == "number"
+        assert {"Price, MSEK", "Price, MDKK", "Price, MEUR"} <= set(plan)
+
+
+class TestNormalizeRows:
+    """Test running a plan."""
+
+    def test_new_column_normalized(self):
+        """Test a column added to a plan is normalized with no other change."""
+        plan = compile_plan(_schema(
+            {"name": "Seller city", "type": "string", "normalize": "city"},
+            {"name": "Land area, sqm", "type": "number"},
+        ))
+        out, meta = normalize_rows(
+            [{"Seller city": "Göteborg", "Land area, sqm": "12 500 kvm", "Note": "x"}], plan, {}
+        )
+        assert out == [{"Seller city": "Gothenburg", "Land area, sqm": 12500, "Note": "x"}]
+        assert meta == [{"Seller city_confidence": "high", "Land area, sqm_confidence": "high"}]
+
+    def test_empty_cells_untouched(self):
+        """Test empty and missing cells get no step and no confidence."""
+        plan = [("Yield", "yield"), ("Location", "city")]
+        out, meta = normalize_rows([{"Yield": "", "Other": 1}], plan, {})
+        assert out == [{"Yield": "", "Other": 1}]
+        assert meta == [{}]
@@ -0,0 +1,71 @@
+"""
+Tests for property type matching.
+"""
+
+import pickle
+
+import pytest
+
+from src.normalize.aho_corasick import AhoCorasick
+from src.normalize.property_type import normalize_property_type, property_type_matcher, PropertyTypeMatcher
+from src.resources import get_property_map
+
+
+class TestAhoCorasick:
+    """Test the multi-pattern matcher."""
+
+    def test_finds_all_patterns(self):
+        ac = AhoCorasick([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+        assert ac.search("ushers") == {1, 2, 4}
+        assert ac.search("this") == {3}
+        assert ac.search("xyz") == set()
+
+    def test_pattern_inside_another(self):
+        """Matches reached only through failure links are reported."""
+        ac = AhoCorasick([("kontorsfastighet", "long"), ("fastighet", "short")])
+        assert ac.search("kontorsfastighet") == {"long", "short"}
+        assert ac.search("lagerfastighet") == {"short"}
+
+    def test_shared_and_empty_patterns(self):
+        ac = AhoCorasick([("lager", 1), ("lager", 2), ("", 3)])
+        assert ac.search("lager") == {1, 2}
+        assert len(ac) == 2
+
+    def test_matches_substring_semantics(self):
+        patterns = ["ab", "bab", "abab", "b", "aab", "ba"]
+        ac = AhoCorasick((p, p) for p in patterns)
+        for text in ["", "a", "abab", "babab", "aabba", "bbbb", "cabac"]:
+            assert ac.search(text) == {p for p in patterns if p in text}
+
+    def test_pickles(self):
+        ac = AhoCorasick([("kontor", 1)])
+        assert pickle.loads(pickle.dumps(ac)).search("kontor") == {1}
+
+
+class TestPropertyTypeMatcher:
+    """Test the compiled synonym map."""
+
+    def test_mapping_order(self):
+        mapping = {"synonyms": {"Office": ["kontor"], "Retail": ["handel"], "Mixed Use": ["blandat"]}}
+        matcher = PropertyTypeMatcher(mapping)
+        assert matcher.match("handel och kontor") == ["Office", "Retail"]
+
+    def test_synonyms_normalized(self):
+        matcher = PropertyTypeMatcher({"synonyms": {"Office": ["  KONTOR "], "Other": None, "Hotel": [""]}})
+        assert matcher.match("kontor") == ["Office"]
+        assert matcher.match("") == []
+
+    def test_compiled_once_per_mapping(self):
+        mapping = get_property_map()
+        assert property_type_matcher(mapping) is property_type_matcher(mapping)
+
+    @pytest.mark.parametrize("text, expected", [
+        ("warehouse", ("Logistics", "high")),
+        ("Kontor och handel", ("Office", "medium")),
+        ("mixed use: kontor och handel", ("Mixed Use", "medium")),
+        ("Parkeringshus", ("Other", "low")),
+        ("  ", ("", "low")),
+        (None, ("", "low")),
+    ])
+    def test_semantics(self, text, expected):
+        assert normalize_property_type(text, get_property_map()) == expected
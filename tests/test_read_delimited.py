@@ -0,0 +1,138 @@
+"""
+Tests for the csv-module reader.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.ingest.read_delimited import (
+    detect_delimiter,
+    detect_encoding,
+    iter_delimited,
+    read_columns,
+    read_delimited,
+    sniff_format,
+)
+from src.ingest.read_tsv import read_tsv
+
+EXPORTS = Path(__file__).parent.parent / "data" / "csv_exports"
+
+
+def _write(path, text, encoding="utf-8"):
+    path.write_bytes(text.encode(encoding))
+    return path
+
+
+class TestQuoting:
+    """Test quoted fields."""
+
+    def test_delimiters_and_line_breaks_in_quotes(self, tmp_path):
+        """Test commas, tabs and line breaks inside quotes stay in the cell."""
+        path = _write(tmp_path / "deals.csv", (
+            'Location,"Price, MSEK",Comment\r\n'
+            'Malmö,"1,500","Two lines\nand a\ttab"\r\n'
+            'Lund,900,"He said ""sold"""\r\n'
+        ))
+        assert read_delimited(path) == [
+            {"Location": "Malmö", "Price, MSEK": "1,500", "Comment": "Two lines\nand a\ttab"},
+            {"Location": "Lund", "Price, MSEK": "900", "Comment": 'He said "sold"'},
+        ]
+
+    def test_unquoted_tsv_matches_read_tsv(self, tmp_path):
+        """Test a plain TSV gives read_tsv's rows, blank lines skipped and short lines padded."""
+        path = _write(tmp_path / "deals.tsv", "A\tB\tC\n1\t2\t3\n\n\t \t\n4\t5\n")
+        assert read_delimited(path) == read_tsv(path)
+
+
+class TestDetection:
+    """Test delimiter and encoding detection."""
+
+    @pytest.mark.parametrize("delimiter", ["\t", ",", ";", "|"])
+    def test_delimiter(self, delimiter):
+        """Test the delimiter giving a consistent field count is chosen."""
+        lines = [["Location", "Price, MSEK", "Yield"], ["Malmö", '"1,5"', "4 %"], ["Lund", "2", "5 %"]]
+        if delimiter == ",":
+            lines[0][1] = '"Price, MSEK"'
+        sample = "".join(delimiter.join(line) + "\n" for line in lines)
+        assert detect_delimiter(sample) == delimiter
+
+    def test_single_column_default(self):
+        """Test a sample no candidate splits gives the default."""
+        assert detect_delimiter("Location\nMalmö\n", default=",") == ","
+
+    def test_encodings(self):
+        """Test BOMs, UTF-8 and the cp1252 fallback."""
+        assert detect_encoding("Malmö".encode("utf-8")) == "utf-8"
+        assert detect_encoding("Malmö".encode("utf-8-sig")) == "utf-8-sig"
+        assert detect_encoding("Malmö".encode("utf-16")) == "utf-16"
+        assert detect_encoding("Malmö".encode("cp1252")) == "cp1252"
+        # A character cut off by the sample size is still UTF-8
+        assert detect_encoding("Malmö".encode("utf-8")[:-1]) == "utf-8"
+
+    def test_cp1252_semicolon_file(self, tmp_path):
+        """Test an Excel-style semicolon export in cp1252 is read without arguments."""
+        path = _write(tmp_path / "deals.csv", "Ort;Pris\r\nGöteborg;1 500,5\r\n", "cp1252")
+        assert sniff_format(path) == (";", "cp1252")
+        assert read_delimited(path) == [{"Ort": "Göteborg", "Pris": "1 500,5"}]
+
+    def test_bom_not_in_header(self, tmp_path):
+        """Test a UTF-8 BOM does not end up in the first column name."""
+        path = _write(tmp_path / "deals.csv", "Country,Location\nSweden,Malmö\n", "utf-8-sig")
+        assert read_delimited(path) == [{"Country": "Sweden", "Location": "Malmö"}]
+
+
+class TestRowsAndColumns:
+    """Test the row and columnar modes."""
+
+    @pytest.fixture
+    def export(self, tmp_path):
+        return _write(tmp_path / "deals.csv", (
+            ",,\n"
+            "Deals,,\n"
+            "Country,Location,Price\n"
+            "Sweden,Malmö,10\n"
+            ",,\n"
+            "Denmark,Aarhus\n"
+        ))
+
+    def test_skip_rows(self, export):
+        """Test title rows are skipped before the header and blank records after it."""
+        rows = read_delimited(export, skip_rows=2)
+        assert rows == [
+            {"Country": "Sweden", "Location": "Malmö", "Price": "10"},
+            {"Country": "Denmark", "Location": "Aarhus", "Price": ""},
+        ]
+
+    def test_compact_rows(self, export):
+        """Test compact rows equal the dict rows and share one layout."""
+        compact = list(iter_delimited(export, skip_rows=2, compact=True))
+        assert compact == read_delimited(export, skip_rows=2)
+        assert compact[0].layout is compact[1].layout
+
+    def test_columns(self, export):
+        """Test columnar output, a subset in the requested order, padded."""
+        assert read_columns(export, ["Price", "Country"], skip_rows=2) == {
+            "Price": ["10", ""],
+            "Country": ["Sweden", "Denmark"],
+        }
+        assert list(read_columns(export, skip_rows=2)) == ["Country", "Location", "Price"]
+
+    def test_missing_column(self, export):
+        """Test a requested column not in the header is reported."""
+        with pytest.raises(ValueError, match="'Yield'"):
+            read_columns(export, ["Country", "Yield"], skip_rows=2)
+
+
+class TestDealListExport:
+    """Test the bundled spreadsheet exports."""
+
+    def test_with_im_export(self):
+        """Test the "with IM" sheet: quoted multi-line comments, 28 columns."""
+        path = EXPORTS / "Deal list.xlsx - Deal list (with IM).csv"
+        assert sniff_format(path) == (",", "utf-8")
+        rows = read_delimited(path, skip_rows=2)
+        assert len(rows) == 2587
+        assert len(rows[0]) == 28
+        assert rows[0]["Project name"] == "Project Primavera"
+        assert any("\n" in row["Description/Comment"] for row in rows)
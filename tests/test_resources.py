@@ -0,0 +1,81 @@
+"""
+Tests for the process-wide resource registry.
+"""
+
+import json
+import os
+
+import pytest
+
+from src.paths import CONFIG_CACHE_ENV
+from src.resources import ResourceRegistry, INBOUND_SCHEMA_PATH
+
+
+@pytest.fixture(autouse=True)
+def config_cache(tmp_path, monkeypatch):
+    # Keep compiled entries for temporary schema files out of the repo cache
+    monkeypatch.setenv(CONFIG_CACHE_ENV, str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def schema_file(tmp_path):
+    path = tmp_path / "test.schema.json"
+    path.write_text(json.dumps({"columns": [{"name": "A"}]}), encoding="utf-8")
+    return path
+
+
+class TestFileCaching:
+    """Test schema/mapping caching and invalidation."""
+
+    def test_schema_parsed_once(self, schema_file):
+        registry = ResourceRegistry()
+        first = registry.schema(str(schema_file))
+        second = registry.schema(str(schema_file))
+        assert first is second
+        assert registry.stats["file_loads"] == 1
+        assert registry.stats["file_hits"] == 1
+
+    def test_reload_on_file_change(self, schema_file):
+        registry = ResourceRegistry()
+        first = registry.schema(str(schema_file))
+
+        schema_file.write_text(json.dumps({"columns": [{"name": "A"}, {"name": "B"}]}), encoding="utf-8")
+        st = os.stat(schema_file)
+        os.utime(schema_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        second = registry.schema(str(schema_file))
+        assert second is not first
+        assert [c["name"] for c in second["columns"]] == ["A", "B"]
+
+    def test_explicit_invalidate(self, schema_file):
+        registry = ResourceRegistry()
+        first = registry.schema(str(schema_file))
+        registry.invalidate(str(schema_file))
+        assert registry.schema(str(schema_file)) is not first
+
+    def test_missing_file_raises(self, tmp_path):
+        registry = ResourceRegistry()
+        with pytest.raises(FileNotFoundError):
+            registry.schema(str(tmp_path / "missing.json"))
+
+    def test_repo_config_loads(self):
+        registry = ResourceRegistry()
+        assert "synonyms" in registry.property_map()
+        assert "columns" in registry.schema(INBOUND_SCHEMA_PATH)
+
+
+class TestSharedExtractor:
+    """Test that one Extractor (and client) is reused."""
+
+    def test_same_key_reuses_extractor(self):
+        pytest.importorskip("anthropic")
+        registry = ResourceRegistry()
+        first = registry.extractor(api_key="sk-ant-test")
+        assert registry.extractor(api_key="sk-ant-test") is first
+        assert registry.extractor(api_key="sk-ant-other") is not first
+
+    def test_env_key_shares_with_explicit_key(self, monkeypatch):
+        pytest.importorskip("anthropic")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-env")
+        registry = ResourceRegistry()
+        assert registry.extractor() is registry.extractor(api_key="sk-ant-env")
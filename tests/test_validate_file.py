@@ -0,0 +1,123 @@
+"""
+Tests for streaming TSV validation.
+"""
+
+import pytest
+
+from src.ingest.read_tsv import read_tsv
+from src.pipelines.validate_file import format_error_counts, validate_tsv
+from src.resources import INBOUND_SCHEMA_PATH, get_schema
+from src.validate.validators import compile_column_checks, row_errors, validate_row
+
+HEADER = ["Date received", "Project Name", "Country", "Location", "Use", "Comment", "Price, CCY"]
+VALID = ["2024/03/01", "Kv. Eken", "Sweden", "Göteborg", "Office", "Office in central Göteborg", "1 500 000"]
+
+
+def _write(path, rows):
+    lines = ["\t".join(HEADER)] + ["\t".join(row) for row in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def deals_tsv(tmp_path):
+    rows = [
+        VALID,
+        ["2024-03-02", "Kv. Asken", "Norway", "Oslo", "Retail", "Retail park", "12 000"],
+        ["2024/03/04", "", "Denmark", "Aarhus", "Logistics", "Warehouse", "n/a"],
+        VALID,
+        ["", "Kv. Linden", "Finland", "Espoo", "Office", "Office campus", ""],
+    ]
+    return _write(tmp_path / "deals.tsv", rows)
+
+
+class TestRowErrors:
+    """Test compiled per-row checks."""
+
+    def test_error_types(self):
+        """Test each problem is reported with its column and error type."""
+        checks = compile_column_checks(get_schema(INBOUND_SCHEMA_PATH)["columns"])
+        row = dict(zip(HEADER, ["2024-03-02", "", "Norway", "Oslo", "Retail", "x", "abc"]))
+        assert [(column, kind) for column, kind, _ in row_errors(row, checks)] == [
+            ("Date received", "date"),
+            ("Project Name", "missing"),
+            ("Country", "enum"),
+            ("Price, CCY", "number"),
+        ]
+
+    def test_enum_compiled_to_frozenset(self):
+        """Test enum values are looked up in a frozenset, with the schema's list in messages."""
+        checks = compile_column_checks(
+            [{"name": "Country", "type": "enum", "allowed_values": ["Sweden", "Denmark"]}]
+        )
+        allowed_set, allowed = checks[0].arg
+        assert allowed_set == frozenset(["Sweden", "Denmark"])
+        assert row_errors({"Country": "Norway"}, checks) == [
+            ("Country", "enum", "Invalid enum for Country: 'Norway' (allowed: ['Sweden', 'Denmark'])")
+        ]
+
+
+class TestValidateTsv:
+    """Test validating a whole file."""
+
+    def test_matches_validate_row(self, deals_tsv):
+        """Test the messages are validate_row's over read_tsv's rows."""
+        schema = get_schema(INBOUND_SCHEMA_PATH)
+        expected = [
+            f"Row {i}: {e}"
+            for i, row in enumerate(read_tsv(deals_tsv), start=1)
+            for e in validate_row(schema, row)[1]
+        ]
+        ok, errors = validate_tsv(INBOUND_SCHEMA_PATH, deals_tsv)
+        assert not ok
+        assert errors == expected
+        assert len(errors) == 5
+
+    def test_counts(self, deals_tsv):
+        """Test errors are counted per column and error type."""
+        counts = {}
+        validate_tsv(INBOUND_SCHEMA_PATH, deals_tsv, counts=counts)
+        assert counts == {
+            "Date received": {"date": 1, "missing": 1},
+            "Country": {"enum": 1},
+            "Project Name": {"missing": 1},
+            "Price, CCY": {"number": 1},
+        }
+
+    def test_max_errors(self, deals_tsv):
+        """Test messages stop at max_errors and the rest are still counted."""
+        counts = {}
+        ok, errors = validate_tsv(INBOUND_SCHEMA_PATH, deals_tsv, max_errors=2, counts=counts)
+        assert not ok
+        assert errors[:2] == validate_tsv(INBOUND_SCHEMA_PATH, deals_tsv)[1][:2]
+        assert errors[2] == "... 3 more errors"
+        assert len(errors) == 3
+        assert sum(n for kinds in counts.values() for n in kinds.values()) == 5
+
+    def test_fail_fast(self, deals_tsv):
+        """Test fail_fast stops after the first invalid row's errors."""
+        counts = {}
+        ok, errors = validate_tsv(INBOUND_SCHEMA_PATH, deals_tsv, fail_fast=True, counts=counts)
+        assert not ok
+        assert errors and all(e.startswith("Row 2: ") for e in errors)
+        assert set(counts) == {"Date received", "Country"}
+
+    def test_valid_file(self, tmp_path):
+        path = _write(tmp_path / "ok.tsv", [VALID, VALID])
+        counts = {}
+        assert validate_tsv(INBOUND_SCHEMA_PATH, path, counts=counts) == (True, [])
+        assert counts == {}
+
+    def test_no_rows(self, tmp_path):
+        path = _write(tmp_path / "empty.tsv", [])
+        ok, errors = validate_tsv(INBOUND_SCHEMA_PATH, path)
+        assert not ok
+        assert errors == [f"No data rows found in TSV: {path}"]
+
+    def test_format_counts(self):
+        """Test the summary lists columns with most errors first."""
+        text = format_error_counts({"Country": {"enum": 1}, "Date received": {"date": 3, "missing": 4}})
+        assert text.splitlines() == [
+            "Date received: 7 (missing: 4, date: 3)",
+            "Country: 1 (enum: 1)",
+        ]
@@ -0,0 +1,283 @@
+"""
+Tests for the watch-folder pipeline.
+"""
+
+import threading
+
+import pytest
+
+pytest.importorskip("pypdf")
+pytest.importorskip("openpyxl")
+
+from openpyxl import load_workbook
+
+from src.ingest.manifest import STATUS_SUCCESS
+from src.pipelines.watch import BatchedExcelWriter, FolderWatcher, StableFileTracker
+from src.render.excel_writer import SHEET_DEAL_LIST, append_rows_to_excel
+from tests.fixtures.sample_pdfs import build_image_pdf, build_text_pdf
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FakeExtractor:
+    def __init__(self):
+        self.calls = 0
+
+    def extract_inbound(self, text, date_received=""):
+        self.calls += 1
+        return {"Property name": text.splitlines()[-1], "City": "Malmö", "Country": "Sweden"}, {}
+
+
+class TestStableFileTracker:
+    """Test debouncing of partially written files."""
+
+    def test_ready_after_settle(self, tmp_path):
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF-1.4 part")
+        tracker = StableFileTracker(settle_seconds=2)
+        tracker.observe(path, 0)
+
+        assert tracker.ready(1) == []
+        assert tracker.ready(2) == [(path, 0)]
+        assert len(tracker) == 0
+
+    def test_growing_file_restarts_clock(self, tmp_path):
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF-1.4 part")
+        tracker = StableFileTracker(settle_seconds=2)
+        tracker.observe(path, 0)
+
+        with open(path, "ab") as f:
+            f.write(b" more bytes")
+        assert tracker.ready(1.5) == []
+        assert tracker.ready(3) == []
+        assert tracker.ready(3.5) == [(path, 0)]  # first_seen is kept for latency
+
+    def test_empty_file_never_ready(self, tmp_path):
+        path = tmp_path / "a.pdf"
+        path.touch()
+        tracker = StableFileTracker(settle_seconds=0)
+        tracker.observe(path, 0)
+        assert tracker.ready(10) == []
+
+    def test_deleted_file_dropped(self, tmp_path):
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        tracker = StableFileTracker(settle_seconds=1)
+        tracker.observe(path, 0)
+        path.unlink()
+        assert tracker.ready(5) == []
+        assert path not in tracker
+
+
+class TestBatchedExcelWriter:
+    """Test batched workbook saves."""
+
+    def test_due_by_size_and_age(self, tmp_path):
+        clock = FakeClock()
+        writer = BatchedExcelWriter(tmp_path / "d.xlsx", ["Name"], batch_size=3, flush_interval=30, clock=clock)
+        assert not writer.due()
+
+        writer.add({"Name": "a"}, "a")
+        writer.add({"Name": "b"}, "b")
+        assert not writer.due()
+        clock.advance(30)
+        assert writer.due()
+
+        writer.add({"Name": "c"}, "c")
+        assert writer.flush() == ["a", "b", "c"]
+        assert len(writer) == 0
+
+        wb = load_workbook(tmp_path / "d.xlsx")
+        assert [c.value for c in wb[SHEET_DEAL_LIST]["A"]] == ["Name", "a", "b", "c"]
+
+    def test_flush_empty_writes_nothing(self, tmp_path):
+        writer = BatchedExcelWriter(tmp_path / "d.xlsx", ["Name"])
+        assert writer.flush() == []
+        assert not (tmp_path / "d.xlsx").exists()
+
+
+class TestFolderWatcher:
+    """Test the polling watcher end to end with a fake extractor."""
+
+    @pytest.fixture
+    def extractor(self, monkeypatch):
+        fake = FakeExtractor()
+        monkeypatch.setattr("src.pipelines.watch.get_extractor", lambda api_key=None: fake)
+        return fake
+
+    def _watcher(self, folder, out, clock, **kwargs):
+        options = dict(
+            settle_seconds=2, flush_interval=10, batch_size=5, use_watchdog=False, reload_interval=None,
+            log=lambda msg: None,
+        )
+        options.update(kwargs)
+        return FolderWatcher(folder, out, poll_interval=0, clock=clock, **options)
+
+    def test_new_pdf_processed_and_saved(self, tmp_path, extractor):
+        inbox = tmp_path / "inbox"
+        inbox.mkdir()
+        out = tmp_path / "deals.xlsx"
+        clock = FakeClock()
+        watcher = self._watcher(inbox, out, clock)
+
+        assert watcher.poll() == 0
+        build_text_pdf(inbox / "a.pdf", [["Kontor i Solna"]])
+        assert watcher.poll() == 0  # seen, not settled yet
+
+        clock.advance(2)
+        assert watcher.poll() == 1
+        assert not out.exists()  # waiting for the batch
+
+        clock.advance(10)
+        watcher.poll()
+        assert out.exists()
+        assert watcher.latencies == [12]
+        assert "latency median 12.0s" in watcher.summary()
+        assert extractor.calls == 1
+
+        # Already in the manifest: never processed again
+        clock.advance(60)
+        watcher.poll()
+        clock.advance(60)
+        watcher.poll()
+        assert extractor.calls == 1
+
+    def test_full_batch_saved_immediately(self, tmp_path, extractor):
+        out = tmp_path / "deals.xlsx"
+        for i in range(3):
+            build_text_pdf(tmp_path / f"{i}.pdf", [[f"Fastighet {i}"]])
+        clock = FakeClock()
+        watcher = self._watcher(tmp_path, out, clock, batch_size=3)
+
+        watcher.poll()
+        clock.advance(2)
+        assert watcher.poll() == 3
+        wb = load_workbook(out)
+        assert wb[SHEET_DEAL_LIST].max_row == 4
+
+    def test_restart_skips_processed_files(self, tmp_path, extractor):
+        build_text_pdf(tmp_path / "a.pdf", [["Kontor i Solna"]])
+        clock = FakeClock()
+        watcher = self._watcher(tmp_path, tmp_path / "deals.xlsx", clock)
+        watcher.poll()
+        clock.advance(2)
+        watcher.poll()
+        watcher.close()
+
+        restarted = self._watcher(tmp_path, tmp_path / "deals.xlsx", clock)
+        restarted.poll()
+        clock.advance(2)
+        assert restarted.poll() == 0
+        assert extractor.calls == 1
+
+    def test_unflushed_rows_saved_on_close(self, tmp_path, extractor):
+        out = tmp_path / "deals.xlsx"
+        build_text_pdf(tmp_path / "a.pdf", [["Kontor i Solna"]])
+        clock = FakeClock()
+        watcher = self._watcher(tmp_path, out, clock)
+        watcher.poll()
+        clock.advance(2)
+        watcher.poll()
+        assert not out.exists()
+
+        watcher.close()
+        assert out.exists()
+
+    def test_image_only_skipped(self, tmp_path, extractor):
+        build_image_pdf(tmp_path / "scan.pdf", 3)
+        clock = FakeClock()
+        watcher = self._watcher(tmp_path, tmp_path / "deals.xlsx", clock)
+        watcher.poll()
+        clock.advance(2)
+        watcher.poll()
+        assert watcher.counts["image_only"] == 1
+        assert extractor.calls == 0
+
+    def test_failed_save_retried(self, tmp_path, extractor, monkeypatch):
+        """Test a workbook that can't be written (open in Excel) keeps the rows queued."""
+        out = tmp_path / "deals.xlsx"
+        build_text_pdf(tmp_path / "a.pdf", [["Kontor i Solna"]])
+        clock = FakeClock()
+        watcher = self._watcher(tmp_path, out, clock, batch_size=1)
+
+        def locked(*args, **kwargs):
+            raise PermissionError("deals.xlsx is open in another program")
+
+        monkeypatch.setattr("src.pipelines.watch.append_rows_to_excel", locked)
+        watcher.poll()
+        clock.advance(2)
+        assert watcher.poll() == 1
+        assert len(watcher.writer) == 1
+        assert watcher.errors["flush"] == 1
+        assert watcher.manifest.needs_processing(tmp_path / "a.pdf")
+
+        monkeypatch.setattr("src.pipelines.watch.append_rows_to_excel", append_rows_to_excel)
+        watcher.poll()
+        assert len(watcher.writer) == 0
+        assert out.exists()
+        assert not watcher.manifest.needs_processing(tmp_path / "a.pdf")
+
+    def test_close_reports_unsaved_rows(self, tmp_path, extractor, monkeypatch):
+        def locked(*args, **kwargs):
+            raise PermissionError("locked")
+
+        monkeypatch.setattr("src.pipelines.watch.append_rows_to_excel", locked)
+        build_text_pdf(tmp_path / "a.pdf", [["Kontor i Solna"]])
+        messages = []
+        clock = FakeClock()
+        watcher = self._watcher(tmp_path, tmp_path / "deals.xlsx", clock, log=messages.append)
+        watcher.poll()
+        clock.advance(2)
+        watcher.poll()
+
+        watcher.close()
+        assert "1 rows could not be saved; processed again next run: a.pdf" in messages
+        assert watcher.summary().endswith("; 1 rows not saved")
+
+    def test_file_moved_before_flush(self, tmp_path, extractor):
+        """Test a PDF moved away before its row is flushed is still recorded by the hash that was read."""
+        inbox = tmp_path / "inbox"
+        inbox.mkdir()
+        out = tmp_path / "deals.xlsx"
+        build_text_pdf(inbox / "a.pdf", [["Kontor i Solna"]])
+        clock = FakeClock()
+        watcher = self._watcher(inbox, out, clock)
+        watcher.poll()
+        clock.advance(2)
+        watcher.poll()
+        sha = watcher.manifest.hash_of(inbox / "a.pdf")
+        (inbox / "a.pdf").rename(tmp_path / "a.pdf")
+
+        watcher.close()
+        assert out.exists()
+        assert watcher.manifest.status_of_hash(sha) == STATUS_SUCCESS
+        assert not watcher.manifest.needs_processing(tmp_path / "a.pdf")
+
+    def test_run_survives_failed_poll(self, tmp_path, extractor):
+        messages = []
+        watcher = self._watcher(tmp_path, tmp_path / "deals.xlsx", FakeClock(), log=messages.append)
+        stop = threading.Event()
+        calls = []
+
+        def poll():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("network share went away")
+            stop.set()
+            return 0
+
+        watcher.poll = poll
+        watcher.run(stop)
+        assert len(calls) == 2
+        assert watcher.errors["poll"] == 1
+        assert "Poll failed, continuing: network share went away" in messages